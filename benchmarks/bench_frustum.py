@@ -0,0 +1,70 @@
+"""Frustum test time for many boxes against a camera over a shot
+
+Usage: python benchmarks/bench_frustum.py [boxes] [frames]
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "maya_side"))
+
+from frustum import boxes_visible, camera_planes, world_boxes
+
+
+def dolly(frames: int) -> np.ndarray:
+    """Camera moving down -Z while turning 60° about Y"""
+    matrices = np.zeros((frames, 4, 4))
+    for index, t in enumerate(np.linspace(0.0, 1.0, frames)):
+        angle = np.radians(60.0 * t)
+        c, s = np.cos(angle), np.sin(angle)
+        matrices[index] = [
+            [c, 0, -s, 0],
+            [0, 1, 0, 0],
+            [s, 0, c, 0],
+            [0, 1.7, -400.0 * t, 1],
+        ]
+    return matrices.reshape(frames, 16)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 240
+
+    print("=" * 60)
+    print(f"Frustum culling: {count} boxes, {frames} frames")
+    print("=" * 60)
+
+    # Scattered props of 0.5-4 units over a 2 km square
+    rng = np.random.default_rng(0)
+    size = rng.uniform(0.25, 2.0, (count, 3))
+    matrices = np.tile(np.eye(4), (count, 1, 1))
+    matrices[:, 3, :3] = rng.uniform(-1000.0, 1000.0, (count, 3)) * [1, 0.02, 1]
+
+    start = time.perf_counter()
+    centers, extents = world_boxes(-size, size, matrices.reshape(count, 16))
+    boxes_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    planes = camera_planes(
+        dolly(frames), 35.0, 1.417, 0.945, 0.1, 1000.0, aspect=16 / 9
+    )
+    planes_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    visible = boxes_visible(centers, extents, planes)
+    test_seconds = time.perf_counter() - start
+
+    total = boxes_seconds + planes_seconds + test_seconds
+    print(f"  world boxes: {boxes_seconds * 1000:8.1f} ms")
+    print(f"       planes: {planes_seconds * 1000:8.1f} ms")
+    print(f"         test: {test_seconds * 1000:8.1f} ms")
+    print(
+        f"Culled {count - int(visible.sum())}/{count} boxes in {total * 1000:.1f} ms "
+        f"({count * frames / test_seconds / 1e6:.1f}M box-frames/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
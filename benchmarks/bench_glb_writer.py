@@ -0,0 +1,81 @@
+"""glTF geometry throughput in triangles/second, float and quantized
+
+Usage: python benchmarks/bench_glb_writer.py [meshes] [triangles per mesh]
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "maya_side"))
+
+from geometry_exporter import weld_corners
+from glb_writer import GLBWriter
+
+
+def grid_corners(size: int):
+    """Face-vertex ids of a size x size quad grid with a UV seam down the middle"""
+    rows = np.arange(size)[:, None] * (size + 1)
+    first = (rows + np.arange(size)).ravel()
+    quads = np.stack([first, first + 1, first + size + 2, first + size + 1], axis=1)
+    corner_vertices = quads.ravel()
+    corner_uvs = corner_vertices + np.repeat(
+        (np.arange(size * size) % size >= size // 2) * (size + 1) ** 2, 4
+    )
+    corners = np.arange(len(corner_vertices)).reshape(-1, 4)
+    triangles = corners[:, [0, 1, 2, 0, 2, 3]].ravel()
+    return corner_vertices, corner_uvs, triangles
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    triangles = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+    size = max(1, int(np.sqrt(triangles / 2)))
+
+    print("=" * 60)
+    print(f"glTF geometry: {count} meshes of {2 * size * size} triangles")
+    print("=" * 60)
+
+    corner_vertices, corner_uvs, triangle_corners = grid_corners(size)
+    start = time.perf_counter()
+    keys, indices = weld_corners(
+        corner_vertices, triangle_corners, corner_vertices, corner_uvs
+    )
+    weld_seconds = time.perf_counter() - start
+    print(
+        f"  weld: {len(keys)} vertices from {len(corner_vertices)} corners in "
+        f"{weld_seconds * 1000:.1f} ms "
+        f"({len(indices) // 3 / weld_seconds / 1e6:.1f}M triangles/s)"
+    )
+
+    rng = np.random.default_rng(0)
+    positions = rng.uniform(-100.0, 100.0, (len(keys), 3)).astype(np.float32)
+    normals = rng.normal(size=(len(keys), 3)).astype(np.float32)
+    normals /= np.linalg.norm(normals, axis=1)[:, None]
+    uvs = rng.uniform(0.0, 1.0, (len(keys), 2)).astype(np.float32)
+    identity = np.eye(4).ravel()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for quantize in (False, True):
+            path = Path(temp_dir) / "bench.glb"
+            start = time.perf_counter()
+            with GLBWriter(str(path), quantize=quantize) as writer:
+                for index in range(count):
+                    mesh = writer.add_mesh(
+                        f"mesh{index}", positions, indices, normals, uvs
+                    )
+                    writer.add_node(f"node{index}", mesh, identity)
+            seconds = time.perf_counter() - start
+            stats = writer.stats
+
+            label = "quantized" if quantize else "float"
+            print(
+                f"  {label:>9}: {stats['triangles'] / seconds / 1e6:6.1f}M "
+                f"triangles/s, {stats['bytes'] / 2**20:7.1f} MB in {seconds:.2f} s"
+            )
+
+
+if __name__ == "__main__":
+    main()
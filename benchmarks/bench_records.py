@@ -0,0 +1,85 @@
+"""Memory held by extracted meshes as plain dicts vs slotted records
+
+Usage: python benchmarks/bench_records.py [meshes]
+"""
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "maya_side"))
+
+from records import GeometryRecord, MeshRecord
+
+
+def make_dict(i: int) -> dict:
+    return {
+        "name": f"piece_{i:06d}",
+        "full_path": f"|env|set_{i % 400:03d}|piece_{i:06d}",
+        "shape_name": f"piece_{i:06d}Shape",
+        "transform": [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, i * 0.5, 0.0, 0.0, 1.0],
+        "geometry": {
+            "vertex_count": 482,
+            "face_count": 480,
+            "triangle_count": 960,
+            "uv_sets": ["map1"],
+            "has_uvs": True,
+        },
+        "material": f"kitMat_{i % 500:04d}",
+        "visible": True,
+    }
+
+
+def make_record(i: int) -> MeshRecord:
+    return MeshRecord(
+        name=f"piece_{i:06d}",
+        full_path=f"|env|set_{i % 400:03d}|piece_{i:06d}",
+        shape_name=f"piece_{i:06d}Shape",
+        transform=[1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, i * 0.5, 0.0, 0.0, 1.0],
+        geometry=GeometryRecord(
+            vertex_count=482,
+            face_count=480,
+            triangle_count=960,
+            uv_sets=["map1"],
+            has_uvs=True,
+        ),
+        material=f"kitMat_{i % 500:04d}",
+        visible=True,
+    )
+
+
+def measure(factory, count: int):
+    """Peak traced bytes and build time for count meshes"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    meshes = [factory(i) for i in range(count)]
+    seconds = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del meshes
+    return current, seconds
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    print("=" * 60)
+    print(f"Records: {count} meshes")
+    print("=" * 60)
+
+    dict_bytes, dict_seconds = measure(make_dict, count)
+    record_bytes, record_seconds = measure(make_record, count)
+
+    for label, size, seconds in [
+        ("dict", dict_bytes, dict_seconds),
+        ("record", record_bytes, record_seconds),
+    ]:
+        print(
+            f"{label:>7}: {size / 2**20:8.1f} MB  "
+            f"({size / count:6.0f} B/mesh)  build {seconds:5.2f}s"
+        )
+    print(f"Saved {1 - record_bytes / dict_bytes:.0%} of extraction memory")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Schema validation throughput on a synthetic environment export
+
+Usage: python benchmarks/bench_schema_validator.py [meshes]
+"""
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "maya_side"))
+
+from bench_serializer import make_scene
+from schema_validator import SchemaValidator
+from serializer import SceneSerializer
+
+
+def main():
+    mesh_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    print("=" * 60)
+    print(f"Schema validator: {mesh_count} meshes")
+    print("=" * 60)
+
+    scene_data = make_scene(mesh_count, 500)
+    validator = SchemaValidator()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "export.json"
+        SceneSerializer().write(scene_data, path)
+        megabytes = path.stat().st_size / 2**20
+
+        start = time.perf_counter()
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        load_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        errors = validator.validate(data)
+        check_seconds = time.perf_counter() - start
+        assert not errors, errors[:5]
+
+        start = time.perf_counter()
+        errors = validator.validate_file(str(path))
+        stream_seconds = time.perf_counter() - start
+        assert not errors, errors[:5]
+
+    print(f"Export size:      {megabytes:8.1f} MB")
+    print(f"json.load:        {load_seconds:8.2f}s")
+    print(f"validate (dict):  {check_seconds:8.2f}s  ({megabytes / check_seconds:6.0f} MB/s)")
+    print(
+        f"validate_file:    {stream_seconds:8.2f}s  ({megabytes / stream_seconds:6.0f} MB/s)"
+    )
+    print(f"500 MB export:    {500 / megabytes * stream_seconds:8.1f}s streamed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Export size and write time for a synthetic kitbashed environment
+
+Usage: python benchmarks/bench_serializer.py [meshes] [materials]
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "maya_side"))
+
+from serializer import SceneSerializer
+
+
+def make_scene(mesh_count: int, material_count: int) -> dict:
+    """Many meshes sharing a handful of distinct shader setups"""
+    looks = 8
+    meshes = []
+    for i in range(mesh_count):
+        path = f"|env|kit_{i % 40:02d}|set_{i % 400:03d}|piece_{i:06d}"
+        meshes.append(
+            {
+                "name": f"piece_{i:06d}",
+                "full_path": path,
+                "shape_name": f"piece_{i:06d}Shape",
+                "transform": [1.0, 0, 0, 0, 0, 1.0, 0, 0, 0, 0, 1.0, 0, i * 0.5, 0, 0, 1.0],
+                "geometry": {
+                    "vertex_count": 482,
+                    "face_count": 480,
+                    "triangle_count": 960,
+                    "uv_sets": ["map1"],
+                    "has_uvs": True,
+                },
+                "material": f"kitMat_{i % material_count:04d}",
+                "visible": True,
+            }
+        )
+
+    materials = []
+    for m in range(material_count):
+        look = m % looks
+        materials.append(
+            {
+                "name": f"kitMat_{m:04d}",
+                "shading_engine": f"kitMat_{m:04d}SG",
+                "type": "aiStandardSurface",
+                "assigned_objects": [
+                    meshes[i]["name"] for i in range(m, mesh_count, material_count)
+                ],
+                "properties": {
+                    "color": [0.18 * look, 0.18, 0.18],
+                    "specular": [1.0, 1.0, 1.0],
+                    "roughness": 0.4,
+                    "metalness": 0.0,
+                    "textures": {
+                        "color": f"/projects/show/assets/kit/tex/look{look}_diffuse.<UDIM>.exr",
+                        "normalCamera": f"/projects/show/assets/kit/tex/look{look}_normal.<UDIM>.exr",
+                    },
+                },
+            }
+        )
+
+    return {
+        "schema_version": "0.2.0",
+        "scene_info": {"fps": 24, "frame_range": [1001, 1100]},
+        "cameras": [],
+        "meshes": meshes,
+        "lights": [],
+        "materials": materials,
+    }
+
+
+def main():
+    mesh_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    material_count = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+
+    print("=" * 60)
+    print(f"Serializer: {mesh_count} meshes, {material_count} materials")
+    print("=" * 60)
+
+    scene_data = make_scene(mesh_count, material_count)
+    serializer = SceneSerializer()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        plain_bytes = None
+        for label, options in [
+            ("plain", {}),
+            ("interned", {"intern": True}),
+            ("columnar", {"layout": "columnar"}),
+            ("both", {"intern": True, "layout": "columnar"}),
+        ]:
+            path = Path(temp_dir) / f"{label}.json"
+
+            start = time.perf_counter()
+            stats = serializer.write(scene_data, path, **options)
+            write_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            data = serializer.read(path)
+            meshes = data["scene_data"]["meshes"]
+            names = [meshes[i]["name"] for i in range(len(meshes))]
+            read_seconds = time.perf_counter() - start
+            assert len(names) == mesh_count
+
+            plain_bytes = plain_bytes or stats["bytes"]
+            print(
+                f"{label:>9}: {stats['bytes'] / 2**20:8.2f} MB "
+                f"({1 - stats['bytes'] / plain_bytes:4.0%} smaller)  "
+                f"write {write_seconds:6.2f}s  read {read_seconds:6.2f}s"
+            )
+            if "strings" in stats:
+                print(
+                    f"{'':>9}  {stats['strings']} shared strings, "
+                    f"{stats['property_blocks']} property blocks"
+                )
+
+
+if __name__ == "__main__":
+    main()
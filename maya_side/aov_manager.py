@@ -1,17 +1,38 @@
 import maya.cmds as cmds
-from typing import Dict, List, Any
+import copy
+import os
+from typing import Dict, List, Any, Optional
+
+from attr_cache import AttributeCache
+from records import AOVRecord
+
+
+# Render settings plugs a render layer may override -> key path in render_settings
+LAYER_SETTING_PLUGS = {
+    "defaultResolution.width": ("resolution", "width"),
+    "defaultResolution.height": ("resolution", "height"),
+    "defaultResolution.deviceAspectRatio": ("resolution", "aspect_ratio"),
+    "defaultRenderGlobals.extensionPadding": ("frame_padding",),
+    "defaultRenderGlobals.imageFilePrefix": ("image_prefix",),
+    "defaultRenderGlobals.animation": ("animation",),
+    "defaultRenderGlobals.startFrame": ("start_frame",),
+    "defaultRenderGlobals.endFrame": ("end_frame",),
+    "defaultRenderGlobals.byFrameStep": ("by_frame",),
+}
 
 
 class AOVManager:
     """Extract AOV/render pass information from Maya scene"""
 
-    def __init__(self):
+    def __init__(self, attr_cache: Optional[AttributeCache] = None):
+        self.attrs = attr_cache or AttributeCache()
         self.renderer = self._detect_renderer()
         self.aovs = []
+        self.layer_resolver = None
 
     def _detect_renderer(self) -> str:
         """Detect which renderer is being used"""
-        current_renderer = cmds.getAttr("defaultRenderGlobals.currentRenderer")
+        current_renderer = self.attrs.get("defaultRenderGlobals", "currentRenderer")
 
         renderer_map = {
             "arnold": "Arnold",
@@ -39,9 +60,191 @@ class AOVManager:
         else:
             result["aovs"] = self._get_default_aovs()
 
+        self._attach_file_patterns(result["aovs"], result["render_settings"])
+        self._attach_channel_info(result["aovs"], result["render_settings"])
+        self._attach_proxies(result["aovs"], result["render_settings"])
+
+        result["layers"] = self._get_layer_passes(result["render_settings"])
+
         return result
 
-    def _get_arnold_aovs(self) -> List[Dict[str, Any]]:
+    def _get_layer_passes(self, base_settings: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Render settings and AOVs of every renderable render layer
+
+        Overrides are resolved from the layer definitions, so the visible
+        layer is never switched while extracting.
+        """
+        from render_layers import RenderLayerResolver
+
+        passes = []
+
+        try:
+            self.layer_resolver = RenderLayerResolver(self.attrs)
+
+            for layer in self.layer_resolver.get_layers():
+                if not layer["renderable"]:
+                    continue
+
+                settings = self._get_layer_settings(layer["node"], base_settings)
+                aovs = self._get_layer_aovs(layer["node"])
+
+                self._attach_file_patterns(
+                    aovs, settings, layer=layer["name"], layer_node=layer["node"]
+                )
+                self._attach_channel_info(aovs, settings)
+                self._attach_proxies(aovs, settings)
+
+                passes.append(
+                    {
+                        "name": layer["name"],
+                        "node": layer["node"],
+                        "render_setup": layer["render_setup"],
+                        "overrides": len(
+                            self.layer_resolver.get_overrides(layer["node"])
+                        ),
+                        "render_settings": settings,
+                        "aovs": aovs,
+                    }
+                )
+
+        except Exception as e:
+            print(f"Error extracting render layers: {e}")
+
+        return passes
+
+    def _get_layer_settings(
+        self, layer: str, base_settings: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Render settings with a layer's overrides applied"""
+        settings = copy.deepcopy(base_settings)
+
+        for plug, keys in LAYER_SETTING_PLUGS.items():
+            value = self.layer_resolver.resolve(layer, plug)
+            if value is None:
+                continue
+            target = settings
+            for key in keys[:-1]:
+                target = target[key]
+            target[keys[-1]] = value
+
+        settings["image_prefix"] = settings["image_prefix"] or ""
+        settings["image_format"] = self._get_image_format(
+            self.layer_resolver.resolve(layer, "defaultRenderGlobals.imageFormat")
+        )
+        return settings
+
+    def _get_layer_aovs(self, layer: str) -> List[Dict[str, Any]]:
+        """AOVs enabled in one render layer"""
+        if self.renderer == "Arnold":
+            return self._get_arnold_aovs(layer)
+        elif self.renderer == "Redshift":
+            return self._get_redshift_aovs(layer)
+
+        # Other layers are separate passes, not AOVs of this one
+        return self._get_default_aovs()[:1]
+
+    def _get_layer_value(
+        self, layer: Optional[str], node: str, attr: str, default=None
+    ):
+        """Attribute value as a layer renders it (the open scene if no layer)"""
+        if layer is None:
+            return self._safe_get_attr(node, attr, default)
+        return self.layer_resolver.resolve(layer, f"{node}.{attr}", default)
+
+    def _attach_file_patterns(
+        self,
+        aovs: List[Dict[str, Any]],
+        settings: Dict[str, Any],
+        layer: Optional[str] = None,
+        layer_node: Optional[str] = None,
+    ) -> None:
+        """Expand the output naming of each AOV into a # padded file pattern"""
+        from sequence_index import MASTER_LAYER, expand_pattern
+
+        scene = cmds.file(query=True, sceneName=True, shortName=True) or "untitled"
+        scene = os.path.splitext(scene)[0]
+        cameras = [
+            cam
+            for cam in cmds.ls(type="camera") or []
+            if self._get_layer_value(layer_node, cam, "renderable")
+        ]
+        camera = cmds.listRelatives(cameras[0], parent=True)[0] if cameras else ""
+
+        for aov in aovs:
+            aov["file_pattern"] = expand_pattern(
+                aov, settings, layer=layer or MASTER_LAYER, scene=scene, camera=camera
+            )
+
+    def _attach_channel_info(
+        self, aovs: List[Dict[str, Any]], settings: Dict[str, Any]
+    ) -> None:
+        """Add channel layout from already-rendered EXR frames to each AOV"""
+        if settings["image_format"] != "exr":
+            return
+
+        from exr_inspector import EXRError, aov_channel_info
+
+        frames = [cmds.currentTime(query=True), settings["start_frame"]]
+
+        for aov in aovs:
+            for frame in frames:
+                path = self._get_rendered_frame_path(aov, settings, frame)
+                if not os.path.isfile(path):
+                    continue
+                try:
+                    aov.update(aov_channel_info(path))
+                except (EXRError, OSError) as e:
+                    print(f"Warning: Could not read {path}: {e}")
+                break
+
+    def _attach_proxies(
+        self, aovs: List[Dict[str, Any]], settings: Dict[str, Any]
+    ) -> None:
+        """Reference generated proxy sequences and contact sheets from each AOV"""
+        from proxy_generator import PROXY_DIR, PROXY_SCALES, contact_sheet_path
+
+        for aov in aovs:
+            render_dir, file_name = os.path.split(aov["file_pattern"])
+            name_pattern = os.path.splitext(file_name)[0]
+            stem = name_pattern.split(".#")[0]
+            proxies = []
+
+            for label in PROXY_SCALES:
+                proxy_dir = os.path.join(render_dir, PROXY_DIR, label)
+                if not os.path.isdir(proxy_dir):
+                    continue
+
+                files = os.listdir(proxy_dir)
+                for extension in ("png", "exr"):
+                    if not any(
+                        f.startswith(f"{stem}.") and f.endswith(f".{extension}")
+                        for f in files
+                    ):
+                        continue
+
+                    sheet = contact_sheet_path(render_dir, stem, label)
+                    proxies.append(
+                        {
+                            "size": label,
+                            "path": os.path.join(
+                                proxy_dir, f"{name_pattern}.{extension}"
+                            ),
+                            "contact_sheet": str(sheet) if sheet.exists() else None,
+                        }
+                    )
+
+            if proxies:
+                aov["proxies"] = proxies
+
+    def _get_rendered_frame_path(
+        self, aov: Dict[str, Any], settings: Dict[str, Any], frame: float
+    ) -> str:
+        """Path of one rendered frame of an AOV"""
+        from sequence_index import frame_path
+
+        return frame_path(aov["file_pattern"], frame)
+
+    def _get_arnold_aovs(self, layer: Optional[str] = None) -> List[Dict[str, Any]]:
         """Extract Arnold AOVs"""
         aovs = []
 
@@ -51,33 +254,40 @@ class AOVManager:
                 return []
 
             aov_nodes = cmds.ls(type="aiAOV") or []
+            self.attrs.get_plugs(
+                [
+                    f"{node}.{attr}"
+                    for node in aov_nodes
+                    for attr in ("enabled", "name", "type", "filter")
+                ]
+            )
 
             for aov_node in aov_nodes:
-                enabled = cmds.getAttr(f"{aov_node}.enabled")
+                enabled = self._get_layer_value(layer, aov_node, "enabled", False)
                 if not enabled:
                     continue
 
-                aov_data = {
-                    "name": aov_node,
-                    "type": cmds.getAttr(f"{aov_node}.name"),
-                    "enabled": enabled,
-                    "data_type": self._get_arnold_aov_type(aov_node),
-                    "filter": self._safe_get_attr(aov_node, "filter", "gaussian"),
-                    "output_path": self._get_aov_output_path(aov_node),
-                }
+                aov_data = AOVRecord(
+                    name=aov_node,
+                    type=self.attrs.get(aov_node, "name"),
+                    enabled=enabled,
+                    data_type=self._get_arnold_aov_type(aov_node),
+                    filter=self._safe_get_attr(aov_node, "filter", "gaussian"),
+                    output_path=self._get_aov_output_path(aov_node),
+                )
                 aovs.append(aov_data)
 
             if not any(aov["type"] == "RGBA" for aov in aovs):
                 aovs.insert(
                     0,
-                    {
-                        "name": "beauty",
-                        "type": "RGBA",
-                        "enabled": True,
-                        "data_type": "RGBA",
-                        "filter": "gaussian",
-                        "output_path": self._get_default_output_path(),
-                    },
+                    AOVRecord(
+                        name="beauty",
+                        type="RGBA",
+                        enabled=True,
+                        data_type="RGBA",
+                        filter="gaussian",
+                        output_path=self._get_default_output_path(),
+                    ),
                 )
 
         except Exception as e:
@@ -85,7 +295,7 @@ class AOVManager:
 
         return aovs
 
-    def _get_redshift_aovs(self) -> List[Dict[str, Any]]:
+    def _get_redshift_aovs(self, layer: Optional[str] = None) -> List[Dict[str, Any]]:
         """Extract Redshift AOVs"""
         aovs = []
 
@@ -95,18 +305,25 @@ class AOVManager:
                 return []
 
             aov_nodes = cmds.ls(type="RedshiftAOV") or []
+            self.attrs.get_plugs(
+                [
+                    f"{node}.{attr}"
+                    for node in aov_nodes
+                    for attr in ("enabled", "aovType")
+                ]
+            )
 
             for aov_node in aov_nodes:
-                enabled = self._safe_get_attr(aov_node, "enabled", True)
+                enabled = self._get_layer_value(layer, aov_node, "enabled", True)
                 if not enabled:
                     continue
 
-                aov_data = {
-                    "name": aov_node,
-                    "type": self._safe_get_attr(aov_node, "aovType", "unknown"),
-                    "enabled": enabled,
-                    "output_path": self._get_aov_output_path(aov_node),
-                }
+                aov_data = AOVRecord(
+                    name=aov_node,
+                    type=self._safe_get_attr(aov_node, "aovType", "unknown"),
+                    enabled=enabled,
+                    output_path=self._get_aov_output_path(aov_node),
+                )
                 aovs.append(aov_data)
 
         except Exception as e:
@@ -124,25 +341,25 @@ class AOVManager:
             if layer == "defaultRenderLayer":
                 continue
 
-            renderable = cmds.getAttr(f"{layer}.renderable")
+            renderable = self.attrs.get(layer, "renderable")
             if renderable:
                 aovs.append(
-                    {
-                        "name": layer,
-                        "type": "render_layer",
-                        "enabled": True,
-                        "output_path": self._get_default_output_path(),
-                    }
+                    AOVRecord(
+                        name=layer,
+                        type="render_layer",
+                        enabled=True,
+                        output_path=self._get_default_output_path(),
+                    )
                 )
 
         aovs.insert(
             0,
-            {
-                "name": "beauty",
-                "type": "RGBA",
-                "enabled": True,
-                "output_path": self._get_default_output_path(),
-            },
+            AOVRecord(
+                name="beauty",
+                type="RGBA",
+                enabled=True,
+                output_path=self._get_default_output_path(),
+            ),
         )
 
         return aovs
@@ -155,27 +372,42 @@ class AOVManager:
 
     def _get_render_settings(self) -> Dict[str, Any]:
         """Extract render settings"""
+        globals_ = self.attrs.get_many(
+            "defaultRenderGlobals",
+            [
+                "extensionPadding",
+                "imageFilePrefix",
+                "animation",
+                "startFrame",
+                "endFrame",
+                "byFrameStep",
+            ],
+        )
         settings = {
             "resolution": self._get_resolution(),
-            "frame_padding": cmds.getAttr("defaultRenderGlobals.extensionPadding"),
+            "frame_padding": globals_["extensionPadding"],
             "image_format": self._get_image_format(),
+            "image_prefix": globals_["imageFilePrefix"] or "",
             "output_path": self._get_default_output_path(),
-            "animation": cmds.getAttr("defaultRenderGlobals.animation"),
-            "start_frame": cmds.getAttr("defaultRenderGlobals.startFrame"),
-            "end_frame": cmds.getAttr("defaultRenderGlobals.endFrame"),
-            "by_frame": cmds.getAttr("defaultRenderGlobals.byFrameStep"),
+            "animation": globals_["animation"],
+            "start_frame": globals_["startFrame"],
+            "end_frame": globals_["endFrame"],
+            "by_frame": globals_["byFrameStep"],
         }
         return settings
 
     def _get_resolution(self) -> Dict[str, int]:
         """Get render resolution"""
+        values = self.attrs.get_many(
+            "defaultResolution", ["width", "height", "deviceAspectRatio"]
+        )
         return {
-            "width": cmds.getAttr("defaultResolution.width"),
-            "height": cmds.getAttr("defaultResolution.height"),
-            "aspect_ratio": cmds.getAttr("defaultResolution.deviceAspectRatio"),
+            "width": values["width"],
+            "height": values["height"],
+            "aspect_ratio": values["deviceAspectRatio"],
         }
 
-    def _get_image_format(self) -> str:
+    def _get_image_format(self, format_value: Optional[int] = None) -> str:
         """Get output image format"""
         format_map = {
             0: "iff",
@@ -190,14 +422,13 @@ class AOVManager:
             19: "tif",
             32: "exr",
         }
-        format_value = cmds.getAttr("defaultRenderGlobals.imageFormat")
+        if format_value is None:
+            format_value = self.attrs.get("defaultRenderGlobals", "imageFormat")
         return format_map.get(format_value, "exr")
 
     def _get_default_output_path(self) -> str:
         """Get default render output path"""
-        workspace = cmds.workspace(query=True, rootDirectory=True)
-        project_path = cmds.workspace(fileRuleEntry="images")
-        return f"{workspace}{project_path}"
+        return self.attrs.workspace_path("images")
 
     def _get_aov_output_path(self, aov_node: str) -> str:
         """Get specific AOV output path"""
@@ -205,7 +436,4 @@ class AOVManager:
 
     def _safe_get_attr(self, node: str, attr: str, default=None):
         """Safely get attribute with fallback"""
-        try:
-            return cmds.getAttr(f"{node}.{attr}")
-        except:
-            return default
+        return self.attrs.get(node, attr, default)
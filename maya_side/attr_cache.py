@@ -0,0 +1,202 @@
+import maya.cmds as cmds
+from typing import Dict, List, Any, Tuple
+
+try:
+    import maya.api.OpenMaya as om
+except ImportError:
+    om = None
+
+
+# Stored for plugs that do not exist, so any default can be returned later
+_MISSING = object()
+
+
+def read_plugs(plugs: List[str], default=None) -> Dict[str, Any]:
+    """Read many "node.attr" plugs at once, in the shapes cmds.getAttr returns
+
+    All plugs are resolved through one selection list and read with the API;
+    plugs the API path cannot convert fall back to cmds.getAttr. Missing
+    nodes or attributes give the default instead of raising.
+    """
+    values = {}
+    remaining = list(plugs)
+
+    if om is not None:
+        remaining = []
+        selection = om.MSelectionList()
+        for plug in dict.fromkeys(plugs):
+            count = selection.length()
+            try:
+                selection.add(plug)
+            except RuntimeError:
+                values[plug] = default
+                continue
+            if selection.length() == count:
+                # Merged into an existing item, read it on its own
+                remaining.append(plug)
+                continue
+            try:
+                values[plug] = _plug_value(selection.getPlug(selection.length() - 1))
+            except (RuntimeError, TypeError):
+                remaining.append(plug)
+
+    for plug in remaining:
+        try:
+            values[plug] = cmds.getAttr(plug)
+        except Exception:
+            values[plug] = default
+
+    return values
+
+
+def _plug_value(plug) -> Any:
+    """Convert an MPlug value the way cmds.getAttr would"""
+    if plug.isArray:
+        raise TypeError("array plug")
+
+    if plug.isCompound:
+        children = [_plug_value(plug.child(i)) for i in range(plug.numChildren())]
+        return [tuple(children)]
+
+    attr = plug.attribute()
+    api_type = attr.apiType()
+
+    if api_type == om.MFn.kNumericAttribute:
+        numeric_type = om.MFnNumericAttribute(attr).numericType()
+        if numeric_type == om.MFnNumericData.kBoolean:
+            return plug.asBool()
+        if numeric_type in (
+            om.MFnNumericData.kByte,
+            om.MFnNumericData.kChar,
+            om.MFnNumericData.kShort,
+            om.MFnNumericData.kInt,
+            om.MFnNumericData.kInt64,
+        ):
+            return plug.asInt()
+        return plug.asDouble()
+
+    if api_type == om.MFn.kEnumAttribute:
+        return plug.asInt()
+
+    if api_type in (om.MFn.kDoubleLinearAttribute, om.MFn.kFloatLinearAttribute):
+        return plug.asMDistance().asUnits(om.MDistance.uiUnit())
+
+    if api_type in (om.MFn.kDoubleAngleAttribute, om.MFn.kFloatAngleAttribute):
+        return plug.asMAngle().asUnits(om.MAngle.uiUnit())
+
+    if api_type == om.MFn.kTimeAttribute:
+        return plug.asMTime().asUnits(om.MTime.uiUnit())
+
+    if api_type == om.MFn.kTypedAttribute:
+        if om.MFnTypedAttribute(attr).attrType() == om.MFnData.kString:
+            return plug.asString()
+
+    raise TypeError(f"unsupported attribute type {api_type}")
+
+
+class AttributeCache:
+    """Memoized attribute reads shared by the scene, AOV and material managers
+
+    Values are keyed by (plug, time) and fetched in batches through
+    read_plugs. Cached values are dropped whenever the current time changes:
+    used as a context manager the cache listens to Maya's time change
+    callback for as long as the block runs, otherwise (or where the callback
+    is not available) the time is checked at the start of each batch.
+    Workspace paths are cached separately since they do not depend on time.
+
+    Create one cache per extraction and pass it to every reader and manager.
+    """
+
+    def __init__(self):
+        self._values: Dict[Tuple[str, float], Any] = {}
+        self._workspace: Dict[str, str] = {}
+        self._callback = None
+        self.time = cmds.currentTime(query=True)
+        self.hits = 0
+        self.misses = 0
+
+    def __enter__(self) -> "AttributeCache":
+        if om is not None and self._callback is None:
+            self._check_time()
+            try:
+                self._callback = om.MDGMessage.addTimeChangeCallback(
+                    self._on_time_changed
+                )
+            except Exception as e:
+                print(f"Warning: Time change callback not available: {e}")
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def get(self, node: str, attr: str, default=None) -> Any:
+        """One attribute value"""
+        return self.get_plugs([f"{node}.{attr}"], default)[f"{node}.{attr}"]
+
+    def get_many(self, node: str, attrs: List[str], default=None) -> Dict[str, Any]:
+        """Several attributes of one node, as {attr: value}"""
+        values = self.get_plugs([f"{node}.{attr}" for attr in attrs], default)
+        return {attr: values[f"{node}.{attr}"] for attr in attrs}
+
+    def get_plugs(self, plugs: List[str], default=None) -> Dict[str, Any]:
+        """Many "node.attr" plugs, reading only the ones not cached yet"""
+        if self._callback is None:
+            self._check_time()
+
+        values = {}
+        missing = []
+        for plug in plugs:
+            key = (plug, self.time)
+            if key in self._values:
+                self.hits += 1
+                values[plug] = self._values[key]
+            else:
+                missing.append(plug)
+
+        if missing:
+            self.misses += len(missing)
+            for plug, value in read_plugs(missing, _MISSING).items():
+                self._values[(plug, self.time)] = value
+                values[plug] = value
+
+        return {
+            plug: default if value is _MISSING else value
+            for plug, value in values.items()
+        }
+
+    def workspace_path(self, rule: str) -> str:
+        """Absolute folder of a workspace file rule (e.g. "images")"""
+        if rule not in self._workspace:
+            root = cmds.workspace(query=True, rootDirectory=True)
+            self._workspace[rule] = f"{root}{cmds.workspace(fileRuleEntry=rule)}"
+        return self._workspace[rule]
+
+    def invalidate(self) -> None:
+        """Drop all cached attribute values"""
+        self._values.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters of this cache"""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "cached": len(self._values),
+        }
+
+    def close(self) -> None:
+        """Remove the time change callback"""
+        if self._callback is not None:
+            om.MMessage.removeCallback(self._callback)
+            self._callback = None
+
+    def _on_time_changed(self, time, *args) -> None:
+        self.time = time.asUnits(om.MTime.uiUnit())
+        self.invalidate()
+
+    def _check_time(self) -> None:
+        current = cmds.currentTime(query=True)
+        if current != self.time:
+            self.time = current
+            self.invalidate()
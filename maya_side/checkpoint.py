@@ -0,0 +1,153 @@
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+
+# Journals are written next to the output they checkpoint
+JOURNAL_SUFFIX = ".checkpoint.jsonl"
+JOURNAL_VERSION = 1
+
+# Maximum seconds between two fsyncs of the journal
+SYNC_INTERVAL = 1.0
+
+
+def journal_path(output_path: str) -> Path:
+    """Journal file for an output file or # padded frame pattern"""
+    path = Path(output_path)
+    name = re.sub(r"[._]?#+", "", path.name)
+    return path.with_name(name + JOURNAL_SUFFIX)
+
+
+def scene_stamp(scene_path: str) -> Dict[str, Any]:
+    """Path, size and mtime of a scene, so a journal of an edited scene is dropped"""
+    stat = os.stat(scene_path)
+    return {
+        "path": os.path.abspath(scene_path),
+        "size": stat.st_size,
+        "mtime": stat.st_mtime_ns,
+    }
+
+
+class Checkpoint:
+    """Append-only journal of the finished units (frames) of a long job
+
+    The journal is JSON lines: a header with the job's identity, then one
+    entry per finished unit, flushed as soon as it is recorded and synced
+    to disk at most every SYNC_INTERVAL seconds. A job killed at any point
+    leaves every unit finished before the last sync in the journal.
+
+    begin() completes the job identity (frame range, AOV, camera, ...). On
+    resume, the entries of a journal with the same identity are loaded and
+    done() returns them, so only the remaining units are processed; a
+    journal of a different job (other frames, an edited scene) is ignored
+    and replaced. finish() removes the journal once the output is written.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        job: Dict[str, Any],
+        resume: bool = False,
+        sync_interval: float = SYNC_INTERVAL,
+    ):
+        self.path = Path(path)
+        self.job = dict(job)
+        self.resume = resume
+        self.sync_interval = sync_interval
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._stream = None
+        self._synced = 0.0
+
+    def __enter__(self) -> "Checkpoint":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        # Kept on failure or cancel so the job can be resumed
+        self.close()
+
+    def begin(self, **details) -> int:
+        """Add to the job identity, load a matching journal and start writing
+
+        Returns the number of units already finished.
+        """
+        self.job.update(details)
+        self.job = json.loads(json.dumps(self.job, default=str))
+        if self.resume:
+            self.entries = self._load()
+
+        # Rewrite the journal compactly: drops a torn last line and any
+        # entry replaced by a later one
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"checkpoint": JOURNAL_VERSION, "job": self.job}))
+            f.write("\n")
+            for entry in self.entries.values():
+                f.write(json.dumps(entry) + "\n")
+        os.replace(temp_path, self.path)
+
+        self._stream = open(self.path, "a", encoding="utf-8")
+        self._synced = time.monotonic()
+        return len(self.entries)
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Entries of the journal on disk if it belongs to this job"""
+        if not self.path.is_file():
+            return {}
+
+        entries = {}
+        with open(self.path, "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        try:
+            header = json.loads(lines[0]) if lines else {}
+        except ValueError:
+            header = {}
+        if header.get("checkpoint") != JOURNAL_VERSION or header.get("job") != self.job:
+            print(f"Warning: Ignoring checkpoint {self.path} of a different job")
+            return {}
+
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # A line cut short by a crash
+                continue
+            entries[str(entry["key"])] = entry
+        return entries
+
+    def done(self, key: Any) -> Optional[Dict[str, Any]]:
+        """The recorded entry of a finished unit, or None"""
+        return self.entries.get(str(key))
+
+    def discard(self, key: Any) -> None:
+        """Forget a unit whose output turned out to be incomplete"""
+        self.entries.pop(str(key), None)
+
+    def record(self, key: Any, **data) -> None:
+        """Journal a finished unit"""
+        entry = {"key": str(key), **data}
+        self.entries[entry["key"]] = entry
+        self._stream.write(json.dumps(entry) + "\n")
+        self._stream.flush()
+        if time.monotonic() - self._synced >= self.sync_interval:
+            os.fsync(self._stream.fileno())
+            self._synced = time.monotonic()
+
+    def close(self) -> None:
+        """Sync and close the journal, keeping it for a later resume"""
+        if self._stream:
+            self._stream.flush()
+            os.fsync(self._stream.fileno())
+            self._stream.close()
+            self._stream = None
+
+    def finish(self) -> None:
+        """Remove the journal: the job's output is complete"""
+        self.close()
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,120 @@
+import maya.cmds as cmds
+from typing import Dict, List, Any, Optional
+
+from attr_cache import AttributeCache
+
+
+class DagTable:
+    """Every DAG path of the scene, gathered in one pass
+
+    Three `ls -dag -allPaths` listings (long names with types, shortest
+    unique names, UUIDs) come back in the same order and are zipped into one
+    row per path. Paths sharing a UUID are instances of the same node; the
+    first path listed is the one the readers export. Visibility and the
+    intermediate flag of every path are fetched in one batch.
+
+    With roots (see ExportScope), only those transforms and everything below
+    them are listed, so a scoped export never touches the rest of the DAG.
+    """
+
+    def __init__(
+        self,
+        attr_cache: Optional[AttributeCache] = None,
+        roots: Optional[List[str]] = None,
+    ):
+        self.attrs = attr_cache or AttributeCache()
+        self.roots = roots
+        self.rows: Dict[str, Dict[str, Any]] = {}
+        self._instances: Dict[str, List[str]] = {}
+        self.build()
+
+    def build(self) -> None:
+        """(Re)read the DAG"""
+        self.rows = {}
+        self._instances = {}
+        if self.roots is not None and not self.roots:
+            # ls with an empty object list would list the whole scene
+            return
+
+        scope = [self.roots] if self.roots else []
+        typed = cmds.ls(*scope, dag=True, allPaths=True, long=True, showType=True) or []
+        short = cmds.ls(*scope, dag=True, allPaths=True) or []
+        uuids = cmds.ls(*scope, dag=True, allPaths=True, uuid=True) or []
+        roots = set(self.roots or [])
+
+        for index in range(0, len(typed), 2):
+            path, node_type = typed[index], typed[index + 1]
+            if roots and not _under(path, roots):
+                # Another instance path of a scoped node, outside the scope
+                continue
+            uuid = uuids[index // 2]
+            parent = path.rsplit("|", 1)[0] or None
+
+            self.rows[path] = {
+                "path": path,
+                "name": short[index // 2],
+                "type": node_type,
+                "parent": parent,
+                "children": [],
+                "uuid": uuid,
+            }
+            self._instances.setdefault(uuid, []).append(path)
+
+            if parent in self.rows:
+                self.rows[parent]["children"].append(path)
+
+        flags = self.attrs.get_plugs(
+            [
+                f"{path}.{attr}"
+                for path in self.rows
+                for attr in ("visibility", "intermediateObject")
+            ]
+        )
+        for path, row in self.rows.items():
+            row["visible"] = bool(flags[f"{path}.visibility"])
+            row["intermediate"] = bool(flags[f"{path}.intermediateObject"])
+
+    def nodes_of_type(self, node_types: List[str]) -> List[str]:
+        """First path of every node of the given types (instances listed once)"""
+        node_types = set(node_types)
+        return [
+            path
+            for path, row in self.rows.items()
+            if row["type"] in node_types and self._instances[row["uuid"]][0] == path
+        ]
+
+    def parent(self, path: str) -> Optional[str]:
+        """Full path of the parent transform"""
+        return self.rows[path]["parent"]
+
+    def children(self, path: str) -> List[str]:
+        """Full paths of the direct children"""
+        return self.rows[path]["children"]
+
+    def name(self, path: str) -> str:
+        """Shortest unique name of a path"""
+        return self.rows[path]["name"]
+
+    def node_type(self, path: str) -> str:
+        return self.rows[path]["type"]
+
+    def is_visible(self, path: str) -> bool:
+        return self.rows[path]["visible"]
+
+    def is_intermediate(self, path: str) -> bool:
+        return self.rows[path]["intermediate"]
+
+    def instance_paths(self, path: str) -> List[str]:
+        """All paths of the node at path, the path itself first"""
+        paths = self._instances[self.rows[path]["uuid"]]
+        return [path] + [p for p in paths if p != path]
+
+    def instance_parents(self, path: str) -> List[str]:
+        """Parent transforms of every instance of a shape"""
+        return [self.rows[p]["parent"] for p in self.instance_paths(path)]
+
+
+def _under(path: str, roots: set) -> bool:
+    """Whether path is one of roots or below one of them"""
+    parts = path.split("|")
+    return any("|".join(parts[:i]) in roots for i in range(2, len(parts) + 1))
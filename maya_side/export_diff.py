@@ -0,0 +1,307 @@
+import argparse
+import hashlib
+import json
+import sys
+import time
+from array import array
+from typing import Dict, List, Any, Callable, Iterator, Optional, Tuple
+
+from json_stream import JsonStream
+from serializer import SceneSerializer
+
+
+# Section -> fields tried in order for a row's stable key
+DIFF_KEYS = {
+    "cameras": ["name"],
+    "meshes": ["full_path", "name"],
+    "lights": ["name"],
+    "materials": ["shading_engine", "name"],
+    "aovs": ["name"],
+}
+
+# Field name (last part of a dotted path) -> absolute tolerance
+DEFAULT_TOLERANCES = {
+    "transform": 1e-5,
+    "color": 1e-4,
+}
+
+_NUMBER_TYPES = frozenset([int, float])
+
+
+def flatten(row: Dict[str, Any], prefix: str = "") -> Iterator[Tuple[str, Any]]:
+    """(dotted field, value) pairs, descending into nested objects"""
+    for key, value in row.items():
+        field = f"{prefix}{key}"
+        if isinstance(value, dict) and value:
+            yield from flatten(value, f"{field}.")
+        else:
+            yield field, value
+
+
+def _digest(value: Any) -> Any:
+    """Compact stand-in for a field value used to detect changes"""
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    text = json.dumps(value, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest()
+
+
+def _numbers(value: Any) -> Optional[array]:
+    """Flat list of numbers (or a number) as an array, else None"""
+    if type(value) in _NUMBER_TYPES:
+        return array("d", [value])
+    if type(value) is list and _NUMBER_TYPES.issuperset(map(type, value)):
+        return array("d", value)
+    return None
+
+
+def iter_rows(path: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """(section, row) for every diffed section of an export, in one pass
+
+    Rows are read one at a time; columnar sections are expanded to rows and
+    interned rows are rehydrated (the string tables are read in a first
+    streaming pass, since they follow the sections in the file).
+    """
+    serializer = SceneSerializer()
+    info = _export_info(path)
+    rehydrators = {}
+    if info.get("interned"):
+        rehydrators = serializer.row_rehydrators(_tables(path))
+
+    with JsonStream(path) as stream:
+        for key in stream.iter_object():
+            if key != "scene_data":
+                stream.skip()
+                continue
+            for section in stream.iter_object():
+                rehydrate = rehydrators.get(section)
+                if section == "render_passes":
+                    render_passes = stream.value()
+                    for aov in render_passes.get("aovs", []):
+                        yield "aovs", aov
+                elif section not in DIFF_KEYS:
+                    stream.skip()
+                elif stream.peek() == "[":
+                    for _ in stream.iter_array():
+                        row = stream.value()
+                        yield section, rehydrate(row) if rehydrate else row
+                else:
+                    value = stream.value()
+                    if serializer.is_columnar(value):
+                        for row in serializer.from_columns(value):
+                            yield section, rehydrate(row) if rehydrate else row
+
+
+def _export_info(path: str) -> Dict[str, Any]:
+    with JsonStream(path) as stream:
+        for key in stream.iter_object():
+            if key == "export_info":
+                return stream.value()
+            stream.skip()
+    return {}
+
+
+def _tables(path: str) -> Dict[str, Any]:
+    with JsonStream(path) as stream:
+        for key in stream.iter_object():
+            if key != "scene_data":
+                stream.skip()
+                continue
+            for section in stream.iter_object():
+                if section == "tables":
+                    return stream.value()
+                stream.skip()
+    return {}
+
+
+def row_key(section: str, row: Dict[str, Any]) -> Optional[str]:
+    for field in DIFF_KEYS[section]:
+        value = row.get(field)
+        if isinstance(value, str) and value:
+            return value
+    return None
+
+
+class ExportDiff:
+    """Structural diff of two exports, matched by stable keys
+
+    Rows are matched across files by key (mesh full path, shading engine,
+    AOV/camera/light name), so list order does not matter and matching is
+    O(n). The old export is held only as per-field digests; numeric fields
+    named in the tolerances are kept as compact arrays and compared within
+    their tolerance. Old values of changed fields are read back with one
+    more streaming pass, so neither export is ever loaded whole.
+    """
+
+    def __init__(self, tolerances: Optional[Dict[str, float]] = None):
+        self.tolerances = dict(DEFAULT_TOLERANCES)
+        if tolerances:
+            self.tolerances.update(tolerances)
+        self._field_tolerances: Dict[str, Optional[float]] = {}
+
+    def _tolerance(self, field: str) -> Optional[float]:
+        if field not in self._field_tolerances:
+            name = field.rsplit(".", 1)[-1]
+            self._field_tolerances[field] = self.tolerances.get(name)
+        return self._field_tolerances[field]
+
+    def _fingerprint(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Field -> digest, or number array for fields with a tolerance"""
+        fingerprint = {}
+        for field, value in flatten(row):
+            numbers = _numbers(value) if self._tolerance(field) is not None else None
+            fingerprint[field] = numbers if numbers is not None else _digest(value)
+        return fingerprint
+
+    def _changed_fields(
+        self, old: Dict[str, Any], new: Dict[str, Any]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Field -> {"delta"?} for fields that differ beyond tolerance"""
+        changed = {}
+        for field in old.keys() | new.keys():
+            before = old.get(field)
+            after = new.get(field)
+            if before == after and type(before) is type(after):
+                continue
+            if isinstance(before, array) and isinstance(after, array):
+                if len(before) != len(after):
+                    changed[field] = {}
+                    continue
+                delta = max((abs(a - b) for a, b in zip(before, after)), default=0.0)
+                if delta > self._tolerance(field):
+                    changed[field] = {"delta": delta}
+            else:
+                changed[field] = {}
+        return changed
+
+    def diff(
+        self,
+        old_path: str,
+        new_path: str,
+        on_change: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
+        """Summary of what changed from old_path to new_path
+
+        Each change ({"section", "key", "op", "fields"?}) is passed to
+        on_change as it is found, or listed under "changes" without one.
+        """
+        start = time.perf_counter()
+        changes: List[Dict[str, Any]] = []
+        emit = on_change or changes.append
+        summary = {
+            section: {"added": 0, "removed": 0, "changed": 0, "unchanged": 0}
+            for section in DIFF_KEYS
+        }
+
+        old_index: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for identity, row in self._keyed_rows(old_path):
+            old_index[identity] = self._fingerprint(row)
+
+        pending: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        seen = set()
+        for (section, key), row in self._keyed_rows(new_path):
+            seen.add((section, key))
+            old = old_index.get((section, key))
+            if old is None:
+                summary[section]["added"] += 1
+                emit({"section": section, "key": key, "op": "added"})
+                continue
+
+            new_values = dict(flatten(row))
+            fields = self._changed_fields(old, self._fingerprint(row))
+            if not fields:
+                summary[section]["unchanged"] += 1
+                continue
+
+            summary[section]["changed"] += 1
+            for field, change in fields.items():
+                change["new"] = new_values.get(field)
+            pending[(section, key)] = fields
+
+        for section, key in old_index:
+            if (section, key) not in seen:
+                summary[section]["removed"] += 1
+                emit({"section": section, "key": key, "op": "removed"})
+
+        # Old values of changed fields, from one more pass over the old file
+        if pending:
+            for identity, row in self._keyed_rows(old_path):
+                fields = pending.get(identity)
+                if fields is None:
+                    continue
+                old_values = dict(flatten(row))
+                for field, change in fields.items():
+                    change["old"] = old_values.get(field)
+                section, key = identity
+                emit({"section": section, "key": key, "op": "changed", "fields": fields})
+
+        result = {
+            "old": str(old_path),
+            "new": str(new_path),
+            "summary": summary,
+            "seconds": time.perf_counter() - start,
+        }
+        if on_change is None:
+            result["changes"] = changes
+        return result
+
+    def _keyed_rows(self, path: str) -> Iterator[Tuple[Tuple[str, str], Dict[str, Any]]]:
+        """((section, key), row), numbering repeated keys as key#2, key#3..."""
+        counts: Dict[Tuple[str, str], int] = {}
+        for section, row in iter_rows(path):
+            key = row_key(section, row)
+            if key is None:
+                continue
+            count = counts.get((section, key), 0) + 1
+            counts[(section, key)] = count
+            yield (section, key if count == 1 else f"{key}#{count}"), row
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Diff two exported scenes")
+    parser.add_argument("old", type=str, help="Old export JSON")
+    parser.add_argument("new", type=str, help="New export JSON")
+    parser.add_argument(
+        "-o", "--output", type=str, help="Write changes as JSON lines to this file"
+    )
+    parser.add_argument(
+        "--transform-tolerance", type=float, default=DEFAULT_TOLERANCES["transform"]
+    )
+    parser.add_argument(
+        "--color-tolerance", type=float, default=DEFAULT_TOLERANCES["color"]
+    )
+    args = parser.parse_args()
+
+    differ = ExportDiff(
+        {"transform": args.transform_tolerance, "color": args.color_tolerance}
+    )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            result = differ.diff(
+                args.old,
+                args.new,
+                on_change=lambda change: f.write(json.dumps(change) + "\n"),
+            )
+    else:
+        result = differ.diff(args.old, args.new)
+        for change in result["changes"]:
+            print(json.dumps(change))
+
+    total = 0
+    for section, counts in result["summary"].items():
+        changed = counts["added"] + counts["removed"] + counts["changed"]
+        total += changed
+        if changed or counts["unchanged"]:
+            print(
+                f"{section:>10}: +{counts['added']} -{counts['removed']} "
+                f"~{counts['changed']} ({counts['unchanged']} unchanged)"
+            )
+    status = f"✗ {total} changes" if total else "✓ No changes"
+    print(f"{status} in {result['seconds']:.2f}s")
+
+    sys.exit(1 if total else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+import maya.cmds as cmds
+import re
+from typing import Dict, List, Any, Optional
+
+from utils import get_selected_objects
+
+
+class ExportScope:
+    """Which part of the DAG an export covers
+
+    Objects from the selection, object sets, namespaces and display layers
+    are combined; a regex on the full path then narrows them down (or, on
+    its own, picks matching transforms from the whole scene). The result is
+    a list of root transforms whose subtrees the DagTable lists, so the
+    readers only ever see nodes inside the scope.
+    """
+
+    def __init__(
+        self,
+        selection: bool = False,
+        sets: Optional[List[str]] = None,
+        namespaces: Optional[List[str]] = None,
+        display_layers: Optional[List[str]] = None,
+        pattern: Optional[str] = None,
+    ):
+        self.selection = selection
+        self.sets = list(sets or [])
+        self.namespaces = list(namespaces or [])
+        self.display_layers = list(display_layers or [])
+        self.pattern = pattern
+        self._regex = re.compile(pattern) if pattern else None
+
+    @property
+    def active(self) -> bool:
+        """Whether the scope restricts the export at all"""
+        return bool(
+            self.selection
+            or self.sets
+            or self.namespaces
+            or self.display_layers
+            or self.pattern
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain options, to rebuild the scope in a worker process"""
+        return {
+            "selection": self.selection,
+            "sets": self.sets,
+            "namespaces": self.namespaces,
+            "display_layers": self.display_layers,
+            "pattern": self.pattern,
+        }
+
+    def roots(self) -> Optional[List[str]]:
+        """Long paths of the transforms the export starts from
+
+        None means the whole scene; an empty list means nothing matched.
+        """
+        if not self.active:
+            return None
+
+        if self.selection or self.sets or self.namespaces or self.display_layers:
+            members = self._members()
+        else:
+            members = cmds.ls(type="transform", long=True) or []
+
+        if self._regex:
+            members = [path for path in members if self._regex.search(path)]
+
+        return _outermost(members)
+
+    def _members(self) -> List[str]:
+        """Transforms named by the selection, sets, namespaces and layers"""
+        objects: List[str] = []
+
+        if self.selection:
+            objects.extend(get_selected_objects())
+
+        for object_set in self.sets:
+            if not cmds.objExists(object_set):
+                print(f"Warning: Object set not found: {object_set}")
+                continue
+            objects.extend(cmds.sets(object_set, query=True) or [])
+
+        for namespace in self.namespaces:
+            namespace = namespace.strip(":")
+            if not cmds.namespace(exists=f":{namespace}"):
+                print(f"Warning: Namespace not found: {namespace}")
+                continue
+            objects.extend(
+                cmds.ls(f"{namespace}:*", type="transform", long=True, recursive=True)
+                or []
+            )
+
+        for layer in self.display_layers:
+            if not cmds.objExists(layer):
+                print(f"Warning: Display layer not found: {layer}")
+                continue
+            objects.extend(
+                cmds.editDisplayLayerMembers(layer, query=True, fullNames=True) or []
+            )
+
+        if not objects:
+            return []
+
+        # Components (pCube1.f[0:3]) become their object, shapes their transform
+        objects = cmds.ls(objects, long=True, objectsOnly=True) or []
+        shapes = set(cmds.ls(objects, shapes=True, long=True) or [])
+        transforms = [path for path in objects if path not in shapes]
+        if shapes:
+            transforms.extend(
+                cmds.listRelatives(list(shapes), parent=True, fullPath=True) or []
+            )
+        return [path for path in transforms if path.startswith("|")]
+
+
+def _outermost(paths: List[str]) -> List[str]:
+    """Paths with any path nested under another one of them removed"""
+    unique = set(paths)
+    roots = []
+    for path in dict.fromkeys(paths):
+        parts = path.split("|")
+        if not any("|".join(parts[:i]) in unique for i in range(2, len(parts))):
+            roots.append(path)
+    return roots
@@ -0,0 +1,371 @@
+import math
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Dict, List, Any, Tuple
+
+
+EXR_MAGIC = 20000630
+
+# Version field flags (bits above the 8-bit version number)
+TILED_FLAG = 0x200
+LONG_NAMES_FLAG = 0x400
+NON_IMAGE_FLAG = 0x800
+MULTIPART_FLAG = 0x1000
+
+COMPRESSION_NAMES = {
+    0: "none",
+    1: "rle",
+    2: "zips",
+    3: "zip",
+    4: "piz",
+    5: "pxr24",
+    6: "b44",
+    7: "b44a",
+    8: "dwaa",
+    9: "dwab",
+}
+
+# Scanlines stored per chunk for each compression method
+LINES_PER_CHUNK = {0: 1, 1: 1, 2: 1, 3: 16, 4: 32, 5: 16, 6: 32, 7: 32, 8: 32, 9: 256}
+
+PIXEL_TYPES = {0: "UINT", 1: "HALF", 2: "FLOAT"}
+PIXEL_SIZES = {0: 4, 1: 2, 2: 4}
+
+LINE_ORDERS = {0: "increasing_y", 1: "decreasing_y", 2: "random_y"}
+LEVEL_MODES = {0: "one_level", 1: "mipmap_levels", 2: "ripmap_levels"}
+
+_INT = struct.Struct("<i")
+_BOX2I = struct.Struct("<iiii")
+
+
+class EXRError(Exception):
+    """Raised when a file is not a readable OpenEXR image"""
+
+
+class EXRInspector:
+    """Read OpenEXR headers and check offset tables without decoding pixels
+
+    Only the header and the chunk offset table are touched, plus the few bytes
+    of each chunk header needed to know where the chunk ends, so checking a
+    multi-megabyte render takes microseconds to a few milliseconds.
+    """
+
+    def read_header(self, path: Path) -> Dict[str, Any]:
+        """Parse the header(s) of an EXR file"""
+        with self.open_mapped(path) as data:
+            header, _ = self.parse_headers(data)
+        return header
+
+    def validate(self, path: Path, check_chunks: bool = True) -> Dict[str, Any]:
+        """Check that every chunk in the offset table is present and complete
+
+        A render that was killed mid-write leaves zeros in the offset table or
+        chunks running past the end of the file; both are reported here.
+        """
+        path = Path(path)
+        result = {
+            "path": str(path),
+            "valid": False,
+            "errors": [],
+            "file_size": 0,
+            "chunks": 0,
+            "missing_chunks": 0,
+            "truncated_chunks": 0,
+        }
+
+        if not path.exists():
+            result["errors"].append("File does not exist")
+            return result
+
+        result["file_size"] = path.stat().st_size
+        if result["file_size"] == 0:
+            result["errors"].append("File is empty")
+            return result
+
+        try:
+            with self.open_mapped(path) as data:
+                header, table_start = self.parse_headers(data)
+                self._check_offsets(data, header, table_start, check_chunks, result)
+        except EXRError as e:
+            result["errors"].append(str(e))
+            return result
+
+        result["valid"] = not result["errors"]
+        return result
+
+    def get_channels(self, path: Path, part: int = 0) -> List[Dict[str, Any]]:
+        """Channel list of one part of an EXR file"""
+        return self.read_header(path)["parts"][part]["channels"]
+
+    def open_mapped(self, path: Path) -> mmap.mmap:
+        """Memory-map a file read-only"""
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise EXRError("File is empty")
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def parse_headers(self, data: mmap.mmap) -> Tuple[Dict[str, Any], int]:
+        """Parse version flags and every part header; return the table offset"""
+        if len(data) < 8:
+            raise EXRError("File too small to be an EXR")
+
+        magic, version = struct.unpack_from("<ii", data, 0)
+        if magic != EXR_MAGIC:
+            raise EXRError("Not an OpenEXR file (bad magic number)")
+
+        header = {
+            "version": version & 0xFF,
+            "tiled": bool(version & TILED_FLAG),
+            "long_names": bool(version & LONG_NAMES_FLAG),
+            "deep": bool(version & NON_IMAGE_FLAG),
+            "multipart": bool(version & MULTIPART_FLAG),
+            "parts": [],
+        }
+
+        pos = 8
+        while True:
+            attributes, pos = self._parse_attributes(data, pos)
+            header["parts"].append(self._build_part(attributes, header))
+
+            if not header["multipart"]:
+                break
+            if pos >= len(data):
+                raise EXRError("Header list is truncated")
+            if data[pos] == 0:
+                # An empty header terminates the multipart header list
+                pos += 1
+                break
+
+        return header, pos
+
+    def _parse_attributes(self, data: mmap.mmap, pos: int) -> Tuple[Dict, int]:
+        """Read (name, type, value) triples up to the header's null terminator"""
+        attributes = {}
+        size = len(data)
+
+        while True:
+            end = data.find(b"\x00", pos)
+            if end < 0:
+                raise EXRError("Header is truncated")
+            if end == pos:
+                return attributes, pos + 1
+
+            name = data[pos:end].decode("latin-1")
+            type_end = data.find(b"\x00", end + 1)
+            if type_end < 0 or type_end + 5 > size:
+                raise EXRError(f"Header is truncated in attribute '{name}'")
+
+            attr_type = data[end + 1 : type_end].decode("latin-1")
+            (length,) = _INT.unpack_from(data, type_end + 1)
+            value_start = type_end + 5
+            if length < 0 or value_start + length > size:
+                raise EXRError(f"Header is truncated in attribute '{name}'")
+
+            attributes[name] = self._decode_value(
+                attr_type, data[value_start : value_start + length]
+            )
+            pos = value_start + length
+
+    def _decode_value(self, attr_type: str, raw: bytes) -> Any:
+        """Decode the attribute types the inspector cares about"""
+        if attr_type == "chlist":
+            return self._decode_channels(raw)
+        if attr_type == "box2i":
+            return list(_BOX2I.unpack_from(raw))
+        if attr_type in ("compression", "lineOrder"):
+            return raw[0]
+        if attr_type == "tiledesc":
+            x_size, y_size, mode = struct.unpack_from("<IIB", raw)
+            return {
+                "x_size": x_size,
+                "y_size": y_size,
+                "level_mode": LEVEL_MODES.get(mode & 0x0F, "one_level"),
+                "rounding_mode": "up" if mode >> 4 else "down",
+            }
+        if attr_type == "int":
+            return _INT.unpack_from(raw)[0]
+        if attr_type == "float":
+            return struct.unpack_from("<f", raw)[0]
+        if attr_type == "string":
+            return raw.decode("utf-8", errors="replace")
+        if attr_type in ("v2f", "v2i"):
+            fmt = "<ff" if attr_type == "v2f" else "<ii"
+            return list(struct.unpack_from(fmt, raw))
+        return None
+
+    def _decode_channels(self, raw: bytes) -> List[Dict[str, Any]]:
+        """Decode a chlist attribute"""
+        channels = []
+        pos = 0
+        while pos < len(raw) and raw[pos] != 0:
+            end = raw.index(b"\x00", pos)
+            name = raw[pos:end].decode("latin-1")
+            pixel_type, p_linear, x_sampling, y_sampling = struct.unpack_from(
+                "<iB3xii", raw, end + 1
+            )
+            channels.append(
+                {
+                    "name": name,
+                    "pixel_type": PIXEL_TYPES.get(pixel_type, str(pixel_type)),
+                    "p_linear": bool(p_linear),
+                    "x_sampling": x_sampling,
+                    "y_sampling": y_sampling,
+                }
+            )
+            pos = end + 17
+        return channels
+
+    def _build_part(self, attributes: Dict, header: Dict[str, Any]) -> Dict[str, Any]:
+        """Collect the interesting attributes of one part"""
+        if "channels" not in attributes or "dataWindow" not in attributes:
+            raise EXRError("Header is missing required attributes")
+
+        compression = attributes.get("compression", 0)
+        part_type = attributes.get("type")
+        if part_type is None:
+            part_type = "tiledimage" if header["tiled"] else "scanlineimage"
+
+        part = {
+            "name": attributes.get("name"),
+            "type": part_type,
+            "channels": attributes["channels"],
+            "compression": COMPRESSION_NAMES.get(compression, str(compression)),
+            "data_window": attributes["dataWindow"],
+            "display_window": attributes.get("displayWindow"),
+            "line_order": LINE_ORDERS.get(attributes.get("lineOrder", 0)),
+            "pixel_aspect_ratio": attributes.get("pixelAspectRatio", 1.0),
+            "tiles": attributes.get("tiles"),
+            "chunk_count": attributes.get("chunkCount"),
+        }
+
+        if part["chunk_count"] is None:
+            part["chunk_count"] = self._count_chunks(part, compression)
+        return part
+
+    def _count_chunks(self, part: Dict[str, Any], compression: int) -> int:
+        """Number of offset table entries for a single-part file"""
+        xmin, ymin, xmax, ymax = part["data_window"]
+        width, height = xmax - xmin + 1, ymax - ymin + 1
+
+        tiles = part["tiles"]
+        if not tiles:
+            lines = LINES_PER_CHUNK.get(compression, 1)
+            return (height + lines - 1) // lines
+
+        round_up = tiles["rounding_mode"] == "up"
+        if tiles["level_mode"] == "one_level":
+            x_sizes, y_sizes = [width], [height]
+        elif tiles["level_mode"] == "mipmap_levels":
+            # Mipmap levels shrink both axes together, driven by the larger one
+            count = self._level_count(max(width, height), round_up)
+            x_sizes = self._level_sizes(width, count, round_up)
+            y_sizes = self._level_sizes(height, count, round_up)
+        else:
+            x_sizes = self._level_sizes(
+                width, self._level_count(width, round_up), round_up
+            )
+            y_sizes = self._level_sizes(
+                height, self._level_count(height, round_up), round_up
+            )
+
+        x_tiles = [-(-w // tiles["x_size"]) for w in x_sizes]
+        y_tiles = [-(-h // tiles["y_size"]) for h in y_sizes]
+
+        if tiles["level_mode"] == "ripmap_levels":
+            return sum(x * y for x in x_tiles for y in y_tiles)
+        return sum(x * y for x, y in zip(x_tiles, y_tiles))
+
+    def _level_count(self, size: int, round_up: bool) -> int:
+        log = math.log2(size)
+        return (math.ceil(log) if round_up else math.floor(log)) + 1
+
+    def _level_sizes(self, size: int, count: int, round_up: bool) -> List[int]:
+        sizes = []
+        for level in range(count):
+            scale = 1 << level
+            level_size = -(-size // scale) if round_up else size // scale
+            sizes.append(max(level_size, 1))
+        return sizes
+
+    def _check_offsets(
+        self,
+        data: mmap.mmap,
+        header: Dict[str, Any],
+        table_start: int,
+        check_chunks: bool,
+        result: Dict[str, Any],
+    ) -> None:
+        """Walk each part's offset table and the chunk headers it points to"""
+        file_size = len(data)
+        pos = table_start
+
+        for part_index, part in enumerate(header["parts"]):
+            count = part["chunk_count"]
+            table_end = pos + count * 8
+            if table_end > file_size:
+                result["errors"].append(f"Part {part_index}: offset table is truncated")
+                result["missing_chunks"] += count
+                result["chunks"] += count
+                return
+
+            offsets = struct.unpack_from(f"<{count}Q", data, pos)
+            pos = table_end
+            result["chunks"] += count
+
+            tiled = part["type"] in ("tiledimage", "deeptile")
+            deep = part["type"].startswith("deep")
+            # Chunk header: [part number] + y or tile coords + data size field(s)
+            prefix = 4 if header["multipart"] else 0
+            coords = 16 if tiled else 4
+            size_format = "<QQQ" if deep else "<i"
+            size_fields = struct.calcsize(size_format)
+
+            missing = 0
+            truncated = 0
+            for offset in offsets:
+                if offset < table_end or offset >= file_size:
+                    missing += 1
+                    continue
+                if not check_chunks:
+                    continue
+
+                header_end = offset + prefix + coords + size_fields
+                if header_end > file_size:
+                    truncated += 1
+                    continue
+
+                sizes = struct.unpack_from(size_format, data, offset + prefix + coords)
+                # Deep chunks store the packed offset table and sample sizes,
+                # then the unpacked sample size, which is not in the file
+                if header_end + sum(sizes[:2]) > file_size:
+                    truncated += 1
+
+            if missing:
+                result["errors"].append(
+                    f"Part {part_index}: {missing} of {count} chunks missing from offset table"
+                )
+            if truncated:
+                result["errors"].append(
+                    f"Part {part_index}: {truncated} chunks run past end of file"
+                )
+            result["missing_chunks"] += missing
+            result["truncated_chunks"] += truncated
+
+
+def aov_channel_info(path: Path) -> Dict[str, Any]:
+    """Channel names, pixel type and compression for an AOV entry"""
+    header = EXRInspector().read_header(path)
+    part = header["parts"][0]
+    pixel_types = sorted({c["pixel_type"] for c in part["channels"]})
+
+    xmin, ymin, xmax, ymax = part["data_window"]
+    return {
+        "channels": [c["name"] for c in part["channels"]],
+        "pixel_type": pixel_types[0] if len(pixel_types) == 1 else pixel_types,
+        "compression": part["compression"],
+        "resolution": [xmax - xmin + 1, ymax - ymin + 1],
+        "tiled": part["tiles"] is not None,
+        "parts": len(header["parts"]),
+    }
@@ -0,0 +1,374 @@
+import argparse
+import struct
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+import numpy as np
+
+from exr_inspector import EXRInspector, EXRError, LINES_PER_CHUNK
+
+
+PIXEL_DTYPES = {"UINT": np.dtype("<u4"), "HALF": np.dtype("<f2"), "FLOAT": np.dtype("<f4")}
+PIXEL_TYPE_IDS = {"UINT": 0, "HALF": 1, "FLOAT": 2}
+
+# Only these compressions are decoded/encoded; anything else is rejected.
+COMPRESSION_IDS = {"none": 0, "zips": 2, "zip": 3}
+
+# AOVs written as plain R/G/B/A so AE shows them as the file's main layer
+BEAUTY_NAMES = ("beauty", "RGBA", "rgba")
+
+
+class EXRPacker:
+    """Pack single-AOV EXR frames into one multichannel EXR per frame
+
+    Reads scanline or single-level tiled files stored uncompressed, ZIPS or
+    ZIP, and writes a scanline file whose channels are named
+    ``<aov>.<channel>`` (``diffuse.R``, ``specular.G``...).
+    """
+
+    def __init__(self, compression: str = "zip"):
+        if compression not in ("none", "zip"):
+            raise ValueError(f"Unsupported output compression: {compression}")
+        self.compression = compression
+
+    def read_channels(self, path: Path) -> Dict[str, np.ndarray]:
+        """Decode every channel of a single-part EXR into (height, width) arrays"""
+        inspector = EXRInspector()
+        with inspector.open_mapped(path) as data:
+            header, table_start = inspector.parse_headers(data)
+            if header["multipart"] or header["deep"]:
+                raise EXRError(f"{path}: multipart and deep files are not supported")
+
+            part = header["parts"][0]
+            compression = COMPRESSION_IDS.get(part["compression"])
+            if compression is None:
+                raise EXRError(f"{path}: unsupported compression {part['compression']}")
+
+            tiles = part["tiles"]
+            if tiles and tiles["level_mode"] != "one_level":
+                raise EXRError(f"{path}: mipmapped tiles are not supported")
+
+            xmin, ymin, xmax, ymax = part["data_window"]
+            width, height = xmax - xmin + 1, ymax - ymin + 1
+            channels = part["channels"]
+            dtypes = [PIXEL_DTYPES[c["pixel_type"]] for c in channels]
+            images = {
+                c["name"]: np.zeros((height, width), dtype=dt)
+                for c, dt in zip(channels, dtypes)
+            }
+
+            offsets = struct.unpack_from(f"<{part['chunk_count']}Q", data, table_start)
+            for offset in offsets:
+                if tiles:
+                    tx, ty, _, _, size = struct.unpack_from("<5i", data, offset)
+                    block = data[offset + 20 : offset + 20 + size]
+                    x0 = tx * tiles["x_size"]
+                    y0 = ty * tiles["y_size"]
+                    block_w = min(tiles["x_size"], width - x0)
+                    block_h = min(tiles["y_size"], height - y0)
+                else:
+                    y, size = struct.unpack_from("<ii", data, offset)
+                    block = data[offset + 8 : offset + 8 + size]
+                    x0, y0 = 0, y - ymin
+                    block_w = width
+                    block_h = min(LINES_PER_CHUNK[compression], height - y0)
+
+                raw_size = block_w * block_h * sum(dt.itemsize for dt in dtypes)
+                raw = self._decompress(block, raw_size, compression)
+                self._scatter(raw, images, channels, dtypes, x0, y0, block_w, block_h)
+
+        return images
+
+    def write_channels(
+        self,
+        path: Path,
+        channels: Dict[str, np.ndarray],
+        display_window: Optional[List[int]] = None,
+        data_window: Optional[List[int]] = None,
+    ) -> int:
+        """Write (height, width) arrays as a scanline multichannel EXR
+
+        data_window places the arrays in the image; it defaults to the
+        origin, and the display window defaults to the data window.
+        """
+        names = sorted(channels)
+        shapes = {channels[name].shape for name in names}
+        if len(shapes) != 1:
+            raise ValueError(f"Channels have different sizes: {sorted(shapes)}")
+        height, width = shapes.pop()
+        if data_window is None:
+            data_window = [0, 0, width - 1, height - 1]
+        xmin, ymin, xmax, ymax = data_window
+        if (ymax - ymin + 1, xmax - xmin + 1) != (height, width):
+            raise ValueError(
+                f"Data window {list(data_window)} does not match "
+                f"{width}x{height} pixels"
+            )
+        pixel_types = [self._pixel_type(channels[name].dtype) for name in names]
+        compression = COMPRESSION_IDS[self.compression]
+        lines_per_chunk = LINES_PER_CHUNK[compression]
+
+        window = struct.pack("<iiii", *data_window)
+        display = struct.pack("<iiii", *display_window) if display_window else window
+        chlist = b"".join(
+            name.encode() + b"\x00" + struct.pack("<iB3xii", PIXEL_TYPE_IDS[pt], 0, 1, 1)
+            for name, pt in zip(names, pixel_types)
+        )
+
+        header = bytearray(struct.pack("<ii", 20000630, 2))
+        header += _attribute("channels", "chlist", chlist + b"\x00")
+        header += _attribute("compression", "compression", bytes([compression]))
+        header += _attribute("dataWindow", "box2i", window)
+        header += _attribute("displayWindow", "box2i", display)
+        header += _attribute("lineOrder", "lineOrder", b"\x00")
+        header += _attribute("pixelAspectRatio", "float", struct.pack("<f", 1.0))
+        header += _attribute("screenWindowCenter", "v2f", struct.pack("<ff", 0, 0))
+        header += _attribute("screenWindowWidth", "float", struct.pack("<f", 1.0))
+        header += b"\x00"
+
+        # Interleave to the on-disk layout: for each line, each channel's row
+        planes = [
+            channels[name].astype(PIXEL_DTYPES[pt], copy=False).view(np.uint8)
+            for name, pt in zip(names, pixel_types)
+        ]
+        lines = np.concatenate(planes, axis=1)
+
+        chunk_count = -(-height // lines_per_chunk)
+        chunks = []
+        for index in range(chunk_count):
+            y0 = index * lines_per_chunk
+            data = self._compress(lines[y0 : y0 + lines_per_chunk].tobytes(), compression)
+            chunks.append(struct.pack("<ii", ymin + y0, len(data)) + data)
+
+        offsets = []
+        position = len(header) + chunk_count * 8
+        for chunk in chunks:
+            offsets.append(position)
+            position += len(chunk)
+
+        with open(path, "wb") as f:
+            f.write(header)
+            f.write(struct.pack(f"<{chunk_count}Q", *offsets))
+            for chunk in chunks:
+                f.write(chunk)
+
+        return position
+
+    def pack_frame(self, inputs: Dict[str, Path], output_path: Path) -> Dict[str, Any]:
+        """Merge the AOV files for one frame into a single EXR
+
+        AOVs with different data windows (autocrop, region renders) are placed
+        in the union of their windows; pixels outside an AOV's window are zero.
+        """
+        parts = {
+            aov_name: EXRInspector().read_header(path)["parts"][0]
+            for aov_name, path in inputs.items()
+        }
+        windows = [part["data_window"] for part in parts.values()]
+        data_window = [
+            min(w[0] for w in windows),
+            min(w[1] for w in windows),
+            max(w[2] for w in windows),
+            max(w[3] for w in windows),
+        ]
+        width = data_window[2] - data_window[0] + 1
+        height = data_window[3] - data_window[1] + 1
+        display_window = next(iter(parts.values()))["display_window"]
+
+        merged = {}
+        for aov_name, path in inputs.items():
+            xmin, ymin, _, _ = parts[aov_name]["data_window"]
+            x0, y0 = xmin - data_window[0], ymin - data_window[1]
+            for channel, pixels in self.read_channels(path).items():
+                if pixels.shape != (height, width):
+                    placed = np.zeros((height, width), dtype=pixels.dtype)
+                    rows, columns = pixels.shape
+                    placed[y0 : y0 + rows, x0 : x0 + columns] = pixels
+                    pixels = placed
+                if aov_name in BEAUTY_NAMES:
+                    merged[channel] = pixels
+                else:
+                    merged[f"{aov_name}.{channel}"] = pixels
+
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        size = self.write_channels(output_path, merged, display_window, data_window)
+
+        return {
+            "output_path": str(output_path),
+            "channels": len(merged),
+            "bytes_in": sum(Path(p).stat().st_size for p in inputs.values()),
+            "bytes_out": size,
+        }
+
+    def _decompress(self, block: bytes, raw_size: int, compression: int) -> bytes:
+        """Undo ZIP/ZIPS coding; blocks that did not shrink are stored raw"""
+        if compression == 0 or len(block) == raw_size:
+            return block
+
+        t = np.frombuffer(zlib.decompress(block), dtype=np.uint8)
+
+        # Predictor: each byte was stored as a delta from the previous one
+        deltas = t.astype(np.int64) - 128
+        deltas[0] = t[0]
+        t = (np.cumsum(deltas) & 0xFF).astype(np.uint8)
+
+        # Reorder: first half holds even bytes, second half odd bytes
+        half = (len(t) + 1) // 2
+        out = np.empty_like(t)
+        out[0::2] = t[:half]
+        out[1::2] = t[half:]
+        return out.tobytes()
+
+    def _compress(self, raw: bytes, compression: int) -> bytes:
+        """ZIP-code a block, keeping it raw when compression does not help"""
+        if compression == 0:
+            return raw
+
+        data = np.frombuffer(raw, dtype=np.uint8)
+        half = (len(data) + 1) // 2
+        t = np.empty_like(data)
+        t[:half] = data[0::2]
+        t[half:] = data[1::2]
+
+        deltas = np.empty_like(t)
+        deltas[0] = t[0]
+        deltas[1:] = (t[1:].astype(np.int16) - t[:-1] + 128) & 0xFF
+
+        packed = zlib.compress(deltas.tobytes(), 4)
+        return packed if len(packed) < len(raw) else raw
+
+    def _scatter(self, raw, images, channels, dtypes, x0, y0, block_w, block_h):
+        """Copy one decoded block into the per-channel images"""
+        buffer = np.frombuffer(raw, dtype=np.uint8)
+        row_bytes = sum(dt.itemsize for dt in dtypes) * block_w
+        rows = buffer.reshape(block_h, row_bytes)
+
+        start = 0
+        for channel, dt in zip(channels, dtypes):
+            end = start + block_w * dt.itemsize
+            values = rows[:, start:end].copy().view(dt)
+            images[channel["name"]][y0 : y0 + block_h, x0 : x0 + block_w] = values
+            start = end
+
+    def _pixel_type(self, dtype: np.dtype) -> str:
+        if dtype == np.float16:
+            return "HALF"
+        if dtype == np.uint32:
+            return "UINT"
+        return "FLOAT"
+
+
+def _attribute(name: str, attr_type: str, value: bytes) -> bytes:
+    """Encode one header attribute"""
+    return (
+        name.encode()
+        + b"\x00"
+        + attr_type.encode()
+        + b"\x00"
+        + struct.pack("<i", len(value))
+        + value
+    )
+
+
+def _pack_frame_task(inputs, output_path, compression):
+    """Process pool entry point"""
+    return EXRPacker(compression).pack_frame(inputs, output_path)
+
+
+def pack_sequence(
+    render_dir: Path,
+    aovs: List[str],
+    frames: List[int],
+    output_dir: Path,
+    name: str = "packed",
+    padding: int = 4,
+    compression: str = "zip",
+    workers: int = 1,
+) -> Dict[str, Any]:
+    """Pack <aov>.<frame>.exr files from render_dir into one EXR per frame
+
+    Frames are independent, so they are spread over a process pool. Returns
+    throughput stats (frames per second, bytes read/written).
+    """
+    render_dir = Path(render_dir)
+    output_dir = Path(output_dir)
+
+    jobs = []
+    for frame in frames:
+        inputs = {
+            aov: render_dir / f"{aov}.{int(frame):0{padding}d}.exr" for aov in aovs
+        }
+        missing = [str(p) for p in inputs.values() if not p.exists()]
+        if missing:
+            print(f"Warning: Skipping frame {frame}, missing {', '.join(missing)}")
+            continue
+        output_path = output_dir / f"{name}.{int(frame):0{padding}d}.exr"
+        jobs.append((inputs, output_path))
+
+    start = time.perf_counter()
+    if workers <= 1:
+        packer = EXRPacker(compression)
+        results = [packer.pack_frame(inputs, output) for inputs, output in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_pack_frame_task, inputs, output, compression)
+                for inputs, output in jobs
+            ]
+            results = [future.result() for future in futures]
+    seconds = time.perf_counter() - start
+
+    return {
+        "frames": len(results),
+        "seconds": seconds,
+        "frames_per_second": len(results) / seconds if seconds else 0.0,
+        "bytes_in": sum(r["bytes_in"] for r in results),
+        "bytes_out": sum(r["bytes_out"] for r in results),
+        "outputs": [r["output_path"] for r in results],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack AOV EXRs into multichannel EXRs")
+    parser.add_argument("render_dir", type=str, help="Folder with <aov>.<frame>.exr")
+    parser.add_argument("--aovs", nargs="+", required=True, help="AOV names to pack")
+    parser.add_argument(
+        "--frames", nargs=2, type=int, required=True, help="First and last frame"
+    )
+    parser.add_argument("--output", "-o", type=str, help="Output folder")
+    parser.add_argument("--name", type=str, default="packed", help="Output file name")
+    parser.add_argument("--padding", type=int, default=4, help="Frame number padding")
+    parser.add_argument(
+        "--compression", choices=["none", "zip"], default="zip", help="Output compression"
+    )
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes")
+    args = parser.parse_args()
+
+    output_dir = Path(args.output) if args.output else Path(args.render_dir) / "packed"
+    stats = pack_sequence(
+        args.render_dir,
+        args.aovs,
+        list(range(args.frames[0], args.frames[1] + 1)),
+        output_dir,
+        name=args.name,
+        padding=args.padding,
+        compression=args.compression,
+        workers=args.workers,
+    )
+
+    print(
+        f"✓ Packed {stats['frames']} frames in {stats['seconds']:.2f}s "
+        f"({stats['frames_per_second']:.2f} frames/s)"
+    )
+    print(
+        f"  {stats['bytes_in'] / 1024 / 1024:.1f} MB in, "
+        f"{stats['bytes_out'] / 1024 / 1024:.1f} MB out"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+import hashlib
+import json
+import mmap
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+from records import to_json
+
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / "data" / "cache" / "extraction"
+DEFAULT_MAX_BYTES = 2 * 2**30
+DEFAULT_MAX_ENTRIES = 256
+HASH_CHUNK_SIZE = 8 << 20
+INDEX_FILE_NAME = "index.json"
+
+
+def hash_file(path: str) -> str:
+    """BLAKE2b digest of a file, read through mmap in chunks"""
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as f:
+        try:
+            view = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty files (and some network filesystems) cannot be mapped
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+            return digest.hexdigest()
+        with view:
+            for start in range(0, len(view), HASH_CHUNK_SIZE):
+                digest.update(view[start : start + HASH_CHUNK_SIZE])
+    return digest.hexdigest()
+
+
+def file_stamps(paths: List[str]) -> Dict[str, Optional[List[int]]]:
+    """[size, mtime] of each file or folder, None where it does not exist"""
+    stamps = {}
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            stamps[path] = None
+            continue
+        stamps[path] = [stat.st_size, stat.st_mtime_ns]
+    return stamps
+
+
+def texture_files(
+    textures: List[Dict[str, Any]], workspace_root: str = ""
+) -> List[str]:
+    """Files behind a texture table, plus the folders of tokenized paths
+
+    A folder's mtime changes when a UDIM tile or frame is added or removed.
+    """
+    from texture_manifest import TextureManifest, token_pattern
+
+    manifest = TextureManifest(workspace_root)
+    files = []
+    for texture in textures:
+        resolved, found = manifest.expand(texture.get("path", ""))
+        folder, file_name = os.path.split(resolved)
+        if token_pattern(file_name):
+            files.extend(found + [folder])
+        else:
+            files.append(resolved)
+    return list(dict.fromkeys(files))
+
+
+def code_version() -> str:
+    """Digest of the exporter sources, so code changes invalidate the cache"""
+    digest = hashlib.blake2b(digest_size=8)
+    for source in sorted(Path(__file__).parent.glob("*.py")):
+        digest.update(source.name.encode("utf-8"))
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """On-disk cache of extracted scene data, keyed by scene content
+
+    The key combines the scene file's content hash, the extraction options
+    and the exporter code version. Scene hashes are remembered by path, size
+    and mtime, so an unchanged file is not read again. Entries are evicted
+    least recently used first once the cache exceeds max_bytes or
+    max_entries.
+
+    Only the scene file itself is part of the key. The files it depends on
+    (referenced scenes, textures) are stored with an entry by size and mtime
+    when it is put, and get() treats the entry as a miss once any of them
+    changed, appeared or disappeared.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.hashed = 0
+        self._index_path = self.cache_dir / INDEX_FILE_NAME
+        self._index = self._load_index()
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        index = {"scenes": {}, "entries": {}}
+        if self._index_path.is_file():
+            try:
+                with open(self._index_path, "r", encoding="utf-8") as f:
+                    index.update(json.load(f))
+            except (OSError, ValueError) as e:
+                print(f"Warning: Ignoring extraction cache index {self._index_path}: {e}")
+        return index
+
+    def _save_index(self) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        temp_path = self._index_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self._index, f)
+        os.replace(temp_path, self._index_path)
+
+    def scene_hash(self, scene_path: str) -> str:
+        """Content hash of a scene, reused while its size and mtime match"""
+        path = os.path.abspath(scene_path)
+        stat = os.stat(path)
+        known = self._index["scenes"].get(path)
+        if known and known["size"] == stat.st_size and known["mtime"] == stat.st_mtime_ns:
+            return known["hash"]
+
+        digest = hash_file(path)
+        self.hashed += 1
+        self._index["scenes"][path] = {
+            "size": stat.st_size,
+            "mtime": stat.st_mtime_ns,
+            "hash": digest,
+        }
+        return digest
+
+    def key(self, scene_path: str, options: Dict[str, Any]) -> str:
+        """Cache key for extracting scene_path with the given options"""
+        payload = json.dumps(
+            {
+                "scene": self.scene_hash(scene_path),
+                "options": options,
+                "code": code_version(),
+            },
+            sort_keys=True,
+        )
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Cached {"scene_data", "meta"} for key, or None on a miss"""
+        entry = self._index["entries"].get(key)
+        path = self.cache_dir / f"{key}.json"
+        if entry is None or not path.is_file():
+            self._index["entries"].pop(key, None)
+            self._save_index()
+            return None
+
+        dependencies = entry.get("dependencies", {})
+        changed = [
+            dependency
+            for dependency, stamp in file_stamps(list(dependencies)).items()
+            if stamp != dependencies[dependency]
+        ]
+        if changed:
+            print(f"Extraction cache entry {key} is stale: {changed[0]} changed")
+            self._remove(key)
+            self._save_index()
+            return None
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Dropping unreadable extraction cache entry {path}: {e}")
+            self._remove(key)
+            self._save_index()
+            return None
+
+        entry["last_used"] = time.time()
+        self._save_index()
+        return cached
+
+    def put(
+        self,
+        key: str,
+        scene_data: Dict[str, Any],
+        dependencies: Optional[List[str]] = None,
+        **meta,
+    ) -> None:
+        """Store extracted scene data, then evict down to the size limits
+
+        dependencies are the files the extraction read besides the scene;
+        the entry goes stale when one of them changes.
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.cache_dir / f"{key}.json"
+        temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"meta": meta, "scene_data": scene_data},
+                f,
+                separators=(",", ":"),
+                ensure_ascii=False,
+                default=to_json,
+            )
+        os.replace(temp_path, path)
+
+        self._index["entries"][key] = {
+            "bytes": path.stat().st_size,
+            "last_used": time.time(),
+            "dependencies": file_stamps(dependencies or []),
+        }
+        self.evict()
+        self._save_index()
+
+    def evict(self) -> List[str]:
+        """Drop least recently used entries beyond max_bytes/max_entries"""
+        entries = self._index["entries"]
+        by_age = sorted(entries, key=lambda k: entries[k]["last_used"])
+        total = sum(entry["bytes"] for entry in entries.values())
+        evicted = []
+        for key in by_age:
+            if total <= self.max_bytes and len(entries) <= self.max_entries:
+                break
+            total -= entries[key]["bytes"]
+            self._remove(key)
+            evicted.append(key)
+        return evicted
+
+    def _remove(self, key: str) -> None:
+        self._index["entries"].pop(key, None)
+        try:
+            (self.cache_dir / f"{key}.json").unlink()
+        except FileNotFoundError:
+            pass
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count and total size of the cache"""
+        entries = self._index["entries"].values()
+        return {
+            "entries": len(entries),
+            "bytes": sum(entry["bytes"] for entry in entries),
+        }
@@ -0,0 +1,210 @@
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+MM_PER_INCH = 25.4
+
+# camera.filmFit values
+FILM_FIT_FILL, FILM_FIT_HORIZONTAL, FILM_FIT_VERTICAL, FILM_FIT_OVERSCAN = range(4)
+
+# Plane-distance values tested at once (frames x 6 planes x boxes)
+DEFAULT_BATCH_VALUES = 1 << 22
+
+
+def camera_planes(
+    matrices: np.ndarray,
+    focal_length: np.ndarray,
+    horizontal_aperture: float,
+    vertical_aperture: float,
+    near_clip: float,
+    far_clip: float,
+    aspect: Optional[float] = None,
+    margin: float = 0.0,
+    orthographic_width: Optional[float] = None,
+) -> np.ndarray:
+    """World-space frustum planes of a camera, one set of six per frame
+
+    matrices holds the camera's flat world matrices in Maya's row-vector
+    layout (F x 16) and focal_length its focal length per frame (mm, film
+    apertures in inches). Planes are (a, b, c, d) with a*x + b*y + c*z + d
+    >= 0 inside; their normals are not normalized.
+
+    With the render aspect ratio given, the sides cover every film fit:
+    the aperture is widened to the resolution gate in whichever direction
+    the gate is larger. margin grows the sides by that fraction (motion
+    blur, small film offsets).
+    """
+    matrices = np.asarray(matrices, dtype=np.float64).reshape(-1, 4, 4)
+    frames = len(matrices)
+    focal_length = np.broadcast_to(
+        np.asarray(focal_length, dtype=np.float64), (frames,)
+    )
+
+    width, height = horizontal_aperture, vertical_aperture
+    if aspect:
+        width, height = max(width, height * aspect), max(height, width / aspect)
+    scale = 1.0 + margin
+
+    # Camera space: looking down -Z, inside when near <= -z <= far
+    planes = np.zeros((frames, 6, 4))
+    planes[:, 0] = (0.0, 0.0, -1.0, -near_clip)
+    planes[:, 1] = (0.0, 0.0, 1.0, far_clip)
+    if orthographic_width:
+        half_x = 0.5 * orthographic_width * scale
+        half_y = half_x * height / width
+        planes[:, 2] = (1.0, 0.0, 0.0, half_x)
+        planes[:, 3] = (-1.0, 0.0, 0.0, half_x)
+        planes[:, 4] = (0.0, 1.0, 0.0, half_y)
+        planes[:, 5] = (0.0, -1.0, 0.0, half_y)
+    else:
+        # Half-extent of the image per unit of depth
+        tan_x = 0.5 * width * MM_PER_INCH / focal_length * scale
+        tan_y = 0.5 * height * MM_PER_INCH / focal_length * scale
+        planes[:, 2, 0], planes[:, 2, 2] = 1.0, -tan_x
+        planes[:, 3, 0], planes[:, 3, 2] = -1.0, -tan_x
+        planes[:, 4, 1], planes[:, 4, 2] = 1.0, -tan_y
+        planes[:, 5, 1], planes[:, 5, 2] = -1.0, -tan_y
+
+    # p_world = p_camera @ M, so a camera plane n becomes n @ inv(M).T
+    return np.einsum("fpj,fkj->fpk", planes, np.linalg.inv(matrices))
+
+
+def resolution_gate(
+    horizontal_aperture: float,
+    vertical_aperture: float,
+    aspect: float,
+    film_fit: int = FILM_FIT_FILL,
+) -> Tuple[float, float]:
+    """Width and height (inches) of the film area the rendered image shows
+
+    Maya fits the resolution gate to the film gate: Fill keeps it inside,
+    Overscan around it, Horizontal/Vertical match that side.
+    """
+    if film_fit in (FILM_FIT_FILL, FILM_FIT_OVERSCAN):
+        film_is_wider = horizontal_aperture / vertical_aperture > aspect
+        fit_vertical = film_is_wider == (film_fit == FILM_FIT_FILL)
+        film_fit = FILM_FIT_VERTICAL if fit_vertical else FILM_FIT_HORIZONTAL
+    if film_fit == FILM_FIT_VERTICAL:
+        return vertical_aperture * aspect, vertical_aperture
+    return horizontal_aperture, horizontal_aperture / aspect
+
+
+def project_points(
+    points: np.ndarray,
+    matrices: np.ndarray,
+    focal_length: np.ndarray,
+    horizontal_aperture: float,
+    vertical_aperture: float,
+    width: int,
+    height: int,
+    aspect: Optional[float] = None,
+    film_fit: int = FILM_FIT_FILL,
+    film_offset: Tuple[float, float] = (0.0, 0.0),
+    orthographic_width: Optional[float] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Pixel positions and camera depths of world points, frame by frame
+
+    points is F x N x 3 (N points at each of F frames), matrices the
+    camera's flat world matrices (F x 16) and focal_length one value per
+    frame. Pixels are F x N x 2 with the origin at the top-left corner and
+    y down, as After Effects layer positions are; depth is F x N and only
+    points with a positive depth are in front of the camera (pixels of the
+    others are meaningless).
+    """
+    points = np.asarray(points, dtype=np.float64)
+    matrices = np.asarray(matrices, dtype=np.float64).reshape(-1, 4, 4)
+    frames = len(matrices)
+    focal_length = np.broadcast_to(
+        np.asarray(focal_length, dtype=np.float64), (frames,)
+    )
+    aspect = aspect or width / float(height)
+
+    homogeneous = np.concatenate([points, np.ones(points.shape[:2] + (1,))], axis=2)
+    camera = np.einsum("fnj,fjk->fnk", homogeneous, np.linalg.inv(matrices))
+    depth = -camera[..., 2]
+
+    if orthographic_width:
+        gate_width, gate_height = orthographic_width, orthographic_width / aspect
+        film_x, film_y = camera[..., 0], camera[..., 1]
+    else:
+        gate_width, gate_height = resolution_gate(
+            horizontal_aperture, vertical_aperture, aspect, film_fit
+        )
+        # Film-back position in inches: similar triangles through the lens
+        scale = (focal_length / MM_PER_INCH)[:, None] / np.where(
+            np.abs(depth) > 1e-12, depth, 1e-12
+        )
+        film_x = camera[..., 0] * scale - film_offset[0]
+        film_y = camera[..., 1] * scale - film_offset[1]
+
+    pixels = np.empty(points.shape[:2] + (2,))
+    pixels[..., 0] = (0.5 + film_x / gate_width) * width
+    pixels[..., 1] = (0.5 - film_y / gate_height) * height
+    return pixels, depth
+
+
+def world_boxes(
+    bbox_min: np.ndarray, bbox_max: np.ndarray, matrices: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """World-space axis-aligned boxes as (centers, half extents), N x 3 each
+
+    bbox_min/bbox_max are the local bounds (N x 3) and matrices the flat
+    world matrices (N x 16) in Maya's row-vector layout. The world box
+    encloses the transformed local box.
+    """
+    matrices = np.asarray(matrices, dtype=np.float64).reshape(-1, 4, 4)
+    bbox_min = np.asarray(bbox_min, dtype=np.float64)
+    bbox_max = np.asarray(bbox_max, dtype=np.float64)
+
+    center = 0.5 * (bbox_min + bbox_max)
+    extent = 0.5 * (bbox_max - bbox_min)
+    rotation = matrices[:, :3, :3]
+    centers = np.einsum("nj,njk->nk", center, rotation) + matrices[:, 3, :3]
+    extents = np.einsum("nj,njk->nk", extent, np.abs(rotation))
+    return centers, extents
+
+
+def boxes_visible(
+    centers: np.ndarray,
+    extents: np.ndarray,
+    planes: np.ndarray,
+    batch_values: int = DEFAULT_BATCH_VALUES,
+) -> np.ndarray:
+    """Which boxes intersect the frustum in at least one frame (N bools)
+
+    A box is outside a frame's frustum when it lies entirely behind one of
+    its planes; boxes near a frustum corner may be kept although they are
+    just outside (the test is conservative, never the other way round).
+    Frames are tested in batches of about batch_values plane distances,
+    and boxes already seen are not tested again.
+    """
+    centers = np.asarray(centers, dtype=np.float64)
+    extents = np.asarray(extents, dtype=np.float64)
+    planes = np.asarray(planes, dtype=np.float64).reshape(-1, 6, 4)
+    visible = np.zeros(len(centers), dtype=bool)
+
+    # Signed distance of the box point furthest along each plane normal is
+    # n.center + |n|.extent + d: one matrix product of [n, |n|, d] rows
+    # with [center, extent, 1] columns
+    rows = np.concatenate(
+        [planes[..., :3], np.abs(planes[..., :3]), planes[..., 3:]], axis=2
+    )
+    columns = np.concatenate([centers, extents, np.ones((len(centers), 1))], axis=1)
+
+    start = 0
+    while start < len(planes):
+        pending = np.flatnonzero(~visible)
+        if not len(pending):
+            break
+        step = max(1, batch_values // (6 * len(pending)))
+        batch = rows[start : start + step]
+        start += step
+
+        distance = (batch.reshape(-1, 7) @ columns[pending].T).reshape(
+            len(batch), 6, len(pending)
+        )
+        inside = (distance.min(axis=1) >= 0.0).any(axis=0)
+        visible[pending[inside]] = True
+
+    return visible
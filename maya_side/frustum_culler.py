@@ -0,0 +1,288 @@
+import maya.cmds as cmds
+import time
+from typing import Dict, List, Any, Optional
+
+import numpy as np
+
+from attr_cache import AttributeCache
+from frustum import boxes_visible, camera_planes, world_boxes
+
+
+CULL_MODES = ("drop", "flag")
+DEFAULT_MARGIN = 0.05
+
+# Transform attributes whose incoming connections make a node move over time
+DRIVEN_ATTRS = (
+    "translate",
+    "rotate",
+    "scale",
+    "shear",
+    "offsetParentMatrix",
+    "inheritsTransform",
+)
+
+
+def render_cameras(cameras: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """The shot camera of a shot export, else every renderable camera"""
+    shot_cameras = [cam for cam in cameras if cam.get("is_shot_camera")]
+    if shot_cameras:
+        return shot_cameras
+    return [cam for cam in cameras if cam.get("is_renderable")]
+
+
+def sample_camera(cam: Dict[str, Any], frames: List[float]):
+    """World matrices and focal lengths of a camera record at each frame
+
+    Baked animation covering the frames is reused; otherwise the values are
+    read with getAttr at each time, without moving the timeline.
+    """
+    animation = cam.get("animation")
+    if animation:
+        indices = {frame: i for i, frame in enumerate(animation["frames"])}
+        if all(frame in indices for frame in frames):
+            matrices = [animation["transforms"][indices[f]] for f in frames]
+            focal_length = [animation["focal_length"][indices[f]] for f in frames]
+            return np.array(matrices), np.array(focal_length)
+
+    matrices = [
+        cmds.getAttr(f"{cam['name']}.worldMatrix[0]", time=frame) for frame in frames
+    ]
+    focal_length = [
+        cmds.getAttr(f"{cam['shape_name']}.focalLength", time=frame)
+        for frame in frames
+    ]
+    return np.array(matrices), np.array(focal_length)
+
+
+class FrustumCuller:
+    """Drop or flag meshes the render camera never sees over the frame range
+
+    Every mesh placement (the exported transform and each instance) gets a
+    world-space box from its shape's local bounds and the world matrix
+    already in the record. The render camera's frustum is built for every
+    sampled frame and all boxes are tested against all frames at once with
+    NumPy (see frustum.py).
+
+    Objects are tested at their exported (current frame) placement, so any
+    placement whose transform or ancestors are driven by animation curves,
+    constraints or expressions is always kept. Deformed meshes are tested
+    with their current bounds; raise the margin if they move far.
+    """
+
+    def __init__(
+        self,
+        attr_cache: Optional[AttributeCache] = None,
+        mode: str = "drop",
+        margin: float = DEFAULT_MARGIN,
+        step: int = 1,
+    ):
+        if mode not in CULL_MODES:
+            raise ValueError(
+                f"Unknown cull mode: {mode} (expected one of {CULL_MODES})"
+            )
+        self.attrs = attr_cache or AttributeCache()
+        self.mode = mode
+        self.margin = margin
+        self.step = max(1, step)
+
+    def cull(
+        self,
+        meshes: List[Dict[str, Any]],
+        cameras: List[Dict[str, Any]],
+        frame_range: List[float],
+    ) -> Dict[str, Any]:
+        """Cull meshes in place and return a report for scene_info["culling"]"""
+        start = time.perf_counter()
+        report = {
+            "mode": self.mode,
+            "cameras": [],
+            "frames": 0,
+            "meshes": len(meshes),
+            "tested": 0,
+            "culled": 0,
+            "culled_instances": 0,
+            "animated": 0,
+        }
+
+        cameras = render_cameras(cameras)
+        if not cameras:
+            print("Warning: No renderable camera, skipping frustum culling")
+            report["seconds"] = time.perf_counter() - start
+            return report
+
+        frames = self._frames(frame_range)
+        planes = np.concatenate(
+            [self._camera_planes(cam, frames) for cam in cameras]
+        )
+        report["cameras"] = [cam["name"] for cam in cameras]
+        report["frames"] = len(frames)
+
+        placements = [
+            (mesh, placement)
+            for mesh in meshes
+            for placement in [mesh] + list(mesh.get("instances", []))
+        ]
+        report["tested"] = len(placements)
+        if not placements:
+            report["seconds"] = time.perf_counter() - start
+            return report
+
+        bounds = self._local_bounds(meshes)
+        keep = np.zeros(len(placements), dtype=bool)
+        testable = []
+        for index, (mesh, placement) in enumerate(placements):
+            if bounds.get(id(mesh)) is None:
+                keep[index] = True
+            else:
+                testable.append(index)
+
+        driven = self._driven([placement["full_path"] for _, placement in placements])
+        animated = np.array(
+            [placement["full_path"] in driven for _, placement in placements]
+        )
+        report["animated"] = int(animated.sum())
+        keep |= animated
+
+        if testable:
+            bbox_min = np.array([bounds[id(placements[i][0])][0] for i in testable])
+            bbox_max = np.array([bounds[id(placements[i][0])][1] for i in testable])
+            matrices = np.array([placements[i][1]["transform"] for i in testable])
+            centers, extents = world_boxes(bbox_min, bbox_max, matrices)
+            keep[testable] |= boxes_visible(centers, extents, planes)
+
+        visible = {
+            id(placement): bool(keep[index])
+            for index, (_, placement) in enumerate(placements)
+        }
+        meshes[:] = self._apply(meshes, visible, report)
+
+        report["seconds"] = time.perf_counter() - start
+        return report
+
+    def _frames(self, frame_range: List[float]) -> List[float]:
+        start_frame, end_frame = int(frame_range[0]), int(frame_range[1])
+        frames = list(range(start_frame, end_frame + 1, self.step))
+        if frames[-1] != end_frame:
+            frames.append(end_frame)
+        return frames
+
+    def _camera_planes(self, cam: Dict[str, Any], frames: List[float]) -> np.ndarray:
+        """Frustum planes of one camera at each frame"""
+        matrices, focal_length = sample_camera(cam, frames)
+        shape = cam["shape_name"]
+        ortho = self.attrs.get_many(shape, ["orthographic", "orthographicWidth"])
+        return camera_planes(
+            matrices,
+            focal_length,
+            cam["horizontal_film_aperture"],
+            cam["vertical_film_aperture"],
+            cam["near_clip"],
+            cam["far_clip"],
+            aspect=self.attrs.get("defaultResolution", "deviceAspectRatio"),
+            margin=self.margin,
+            orthographic_width=(
+                ortho["orthographicWidth"] if ortho["orthographic"] else None
+            ),
+        )
+
+    def _local_bounds(self, meshes: List[Dict[str, Any]]) -> Dict[int, Any]:
+        """id(mesh) -> (min, max) of its shape's local bounding box, or None"""
+        shapes = {
+            id(mesh): f"{mesh['full_path']}|{mesh['shape_name']}" for mesh in meshes
+        }
+        values = self.attrs.get_plugs(
+            [
+                f"{shape}.{attr}"
+                for shape in shapes.values()
+                for attr in ("boundingBoxMin", "boundingBoxMax")
+            ]
+        )
+
+        bounds = {}
+        for key, shape in shapes.items():
+            bbox_min = values[f"{shape}.boundingBoxMin"]
+            bbox_max = values[f"{shape}.boundingBoxMax"]
+            if bbox_min is None or bbox_max is None:
+                print(f"Warning: No bounding box for {shape}, keeping it")
+                bounds[key] = None
+            else:
+                bounds[key] = (bbox_min[0], bbox_max[0])
+        return bounds
+
+    def _driven(self, paths: List[str]) -> set:
+        """Paths whose transform or an ancestor's is driven by another node"""
+        ancestors = {
+            path.rsplit("|", depth)[0]
+            for path in paths
+            for depth in range(path.count("|"))
+        }
+        ancestors.discard("")
+        if not ancestors:
+            return set()
+
+        connections = (
+            cmds.listConnections(
+                list(ancestors),
+                source=True,
+                destination=False,
+                connections=True,
+                plugs=False,
+            )
+            or []
+        )
+        driven_nodes = [
+            plug.split(".", 1)[0]
+            for plug in connections[::2]
+            if plug.split(".", 1)[-1].startswith(DRIVEN_ATTRS)
+        ]
+        if not driven_nodes:
+            return set()
+
+        driven = set(cmds.ls(driven_nodes, long=True) or [])
+        return {
+            path
+            for path in paths
+            if any(
+                path.rsplit("|", depth)[0] in driven
+                for depth in range(path.count("|"))
+            )
+        }
+
+    def _apply(
+        self,
+        meshes: List[Dict[str, Any]],
+        visible: Dict[int, bool],
+        report: Dict[str, Any],
+    ) -> List[Dict[str, Any]]:
+        """Flag or remove culled placements; returns the meshes to export"""
+        kept = []
+        for mesh in meshes:
+            instances = list(mesh.get("instances", []))
+            placements = [mesh] + instances
+            seen = [placement for placement in placements if visible[id(placement)]]
+            report["culled_instances"] += sum(
+                1 for instance in instances if not visible[id(instance)]
+            )
+            if not seen:
+                report["culled"] += 1
+
+            if self.mode == "flag":
+                for placement in placements:
+                    placement["culled"] = not visible[id(placement)]
+                kept.append(mesh)
+                continue
+
+            if not seen:
+                continue
+            if seen[0] is not mesh:
+                # Promote the first visible instance to the exported placement
+                for key in ("name", "full_path", "transform", "visible"):
+                    if key in seen[0]:
+                        mesh[key] = seen[0][key]
+            if instances:
+                if len(seen) > 1:
+                    mesh["instances"] = seen[1:]
+                else:
+                    del mesh["instances"]
+            kept.append(mesh)
+        return kept
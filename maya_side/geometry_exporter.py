@@ -0,0 +1,172 @@
+import time
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
+
+from glb_writer import GLBWriter
+from progress import ProgressReporter
+
+try:
+    import maya.api.OpenMaya as om
+except ImportError:
+    om = None
+
+
+def weld_corners(
+    corner_vertices: np.ndarray,
+    triangle_corners: np.ndarray,
+    corner_normals: Optional[np.ndarray] = None,
+    corner_uvs: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Split Maya's face-vertex data into glTF vertices
+
+    Maya keeps normals and UVs per face corner, glTF per vertex, so a vertex
+    is emitted for every distinct (vertex, normal, uv) id triple used by a
+    corner; hard edges and UV seams split, everything else stays shared.
+    Returns the id triples (V x 3, -1 where there is no normal or uv) and
+    the triangle indices into them (flat, 3 per triangle).
+    """
+    corners = np.empty((len(corner_vertices), 3), dtype=np.int64)
+    corners[:, 0] = corner_vertices
+    corners[:, 1] = -1 if corner_normals is None else corner_normals
+    corners[:, 2] = -1 if corner_uvs is None else corner_uvs
+
+    corners = corners[np.asarray(triangle_corners, dtype=np.int64)]
+    if not len(corners):
+        return np.zeros((0, 3), dtype=np.int64), np.zeros(0, dtype=np.uint32)
+
+    # Pack each triple into one int64 (ids + 1, mixed radix) when it fits:
+    # a flat unique is many times faster than a row-wise one
+    radix = corners.max(axis=0) + 2
+    if float(np.prod(radix.astype(np.float64))) < 2**62:
+        packed = corners[:, 0] + 1
+        packed = packed * radix[1] + corners[:, 1] + 1
+        packed = packed * radix[2] + corners[:, 2] + 1
+        unique, indices = np.unique(packed, return_inverse=True)
+        keys = np.empty((len(unique), 3), dtype=np.int64)
+        keys[:, 2] = unique % radix[2] - 1
+        unique //= radix[2]
+        keys[:, 1] = unique % radix[1] - 1
+        keys[:, 0] = unique // radix[1] - 1
+    else:
+        keys, indices = np.unique(corners, axis=0, return_inverse=True)
+    return keys, indices.ravel().astype(np.uint32)
+
+
+def read_mesh_buffers(shape: str) -> Dict[str, np.ndarray]:
+    """Object-space triangle buffers of a mesh shape, read in bulk
+
+    positions/normals (V x 3), uvs of the current UV set (V x 2, v flipped
+    for glTF; None without UVs) and indices (3 per triangle).
+    """
+    selection = om.MSelectionList()
+    selection.add(shape)
+    mesh = om.MFnMesh(selection.getDagPath(0))
+
+    counts, corner_vertices = mesh.getVertices()
+    corner_vertices = np.array(corner_vertices, dtype=np.int64)
+    _, triangle_corners = mesh.getTriangleOffsets()
+    _, corner_normals = mesh.getNormalIds()
+
+    points = np.array(mesh.getFloatPoints(om.MSpace.kObject), dtype=np.float32)
+    normals = np.array(mesh.getNormals(om.MSpace.kObject), dtype=np.float32)
+
+    uv_set = mesh.currentUVSetName()
+    corner_uvs, uvs = None, None
+    if uv_set and mesh.numUVs(uv_set):
+        us, vs = mesh.getUVs(uv_set)
+        uvs = np.stack([us, vs], axis=1).astype(np.float32)
+        uv_counts, uv_ids = mesh.getAssignedUVs(uv_set)
+        # Faces without UVs have no ids at all: give their corners -1
+        corner_uvs = np.full(len(corner_vertices), -1, dtype=np.int64)
+        mapped = np.repeat(np.array(uv_counts) > 0, np.array(counts))
+        corner_uvs[mapped] = np.array(uv_ids, dtype=np.int64)
+
+    keys, indices = weld_corners(
+        corner_vertices,
+        np.array(triangle_corners, dtype=np.int64),
+        np.array(corner_normals, dtype=np.int64),
+        corner_uvs,
+    )
+
+    buffers = {
+        "positions": points[keys[:, 0], :3],
+        "normals": normals[keys[:, 1]],
+        "uvs": None,
+        "indices": indices,
+    }
+    if uvs is not None:
+        buffer_uvs = np.where(keys[:, 2:] >= 0, uvs[keys[:, 2]], 0.0)
+        buffer_uvs[:, 1] = 1.0 - buffer_uvs[:, 1]
+        buffers["uvs"] = buffer_uvs.astype(np.float32)
+    return buffers
+
+
+class GeometryExporter:
+    """Write the exported meshes' geometry to a binary glTF (.glb) file
+
+    Every mesh record's shape is read in bulk (see read_mesh_buffers) and
+    streamed to the file straight away, so only one mesh's buffers are held
+    at a time. Instanced shapes are written once and placed by one node
+    per instance; each record and instance gets the index of its glTF node
+    as gltf_node.
+    """
+
+    def __init__(self, path: str, quantize: bool = False):
+        self.output_path = str(path)
+        self.quantize = quantize
+
+    def export(
+        self,
+        meshes: List[Dict[str, Any]],
+        progress: Optional[ProgressReporter] = None,
+    ) -> Dict[str, Any]:
+        """Write the .glb and return the geometry section of scene_info
+
+        A cancel stops after the current mesh and leaves an existing .glb
+        untouched.
+        """
+        progress = progress or ProgressReporter()
+        start = time.perf_counter()
+        skipped = 0
+
+        with progress.phase("glb", total=len(meshes)), GLBWriter(
+            self.output_path, quantize=self.quantize
+        ) as writer:
+            for mesh_data in meshes:
+                progress.check_cancel()
+                if not self._write_mesh(writer, mesh_data):
+                    skipped += 1
+                progress.advance("glb", item=mesh_data["name"])
+
+        stats = writer.stats
+        return {
+            "path": self.output_path,
+            "quantized": self.quantize,
+            "meshes": stats["meshes"],
+            "nodes": stats["nodes"],
+            "vertices": stats["vertices"],
+            "triangles": stats["triangles"],
+            "skipped": skipped,
+            "bytes": stats["bytes"],
+            "seconds": time.perf_counter() - start,
+        }
+
+    def _write_mesh(self, writer: GLBWriter, mesh_data: Dict[str, Any]) -> bool:
+        """Add a record's shape and a node per placement; False if unreadable"""
+        shape = f"{mesh_data['full_path']}|{mesh_data['shape_name']}"
+        try:
+            buffers = read_mesh_buffers(shape)
+        except RuntimeError as e:
+            print(f"Warning: Could not read geometry of {shape}: {e}")
+            return False
+
+        mesh = writer.add_mesh(mesh_data["shape_name"], **buffers)
+        mesh_data["gltf_node"] = writer.add_node(
+            mesh_data["name"], mesh, mesh_data["transform"]
+        )
+        for instance in mesh_data.get("instances", []):
+            instance["gltf_node"] = writer.add_node(
+                instance["name"], mesh, instance["transform"]
+            )
+        return True
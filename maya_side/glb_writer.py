@@ -0,0 +1,376 @@
+import json
+import os
+import shutil
+import struct
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+import numpy as np
+
+
+GLB_MAGIC = b"glTF"
+GLB_VERSION = 2
+CHUNK_JSON = b"JSON"
+CHUNK_BIN = b"BIN\x00"
+
+# glTF accessor componentType values
+BYTE, UNSIGNED_BYTE, SHORT, UNSIGNED_SHORT, UNSIGNED_INT, FLOAT = (
+    5120,
+    5121,
+    5122,
+    5123,
+    5125,
+    5126,
+)
+ARRAY_BUFFER, ELEMENT_ARRAY_BUFFER = 34962, 34963
+QUANTIZATION_EXTENSION = "KHR_mesh_quantization"
+
+_SHORT_MAX = 32767
+_UNSIGNED_SHORT_MAX = 65535
+_BYTE_MAX = 127
+
+
+def _pad(size: int) -> int:
+    """Bytes needed to bring size to a multiple of 4"""
+    return -size % 4
+
+
+class GLBWriter:
+    """Streaming binary glTF 2.0 writer
+
+    Mesh buffers are appended to a temporary binary file as each mesh is
+    added, so only the glTF JSON (accessors, views, nodes) stays in memory.
+    close() writes the .glb header and JSON chunk and copies the binary
+    chunk behind them.
+
+    Each mesh gets one interleaved vertex buffer view (position, normal,
+    texcoord) and one index view. With quantize, positions are stored as
+    normalized shorts relative to the mesh bounds, normals as normalized
+    bytes and [0, 1] texcoords as normalized unsigned shorts
+    (KHR_mesh_quantization); the bounds go into the matrix of every node
+    using the mesh.
+    """
+
+    def __init__(self, output_path: str, quantize: bool = False):
+        self.output_path = Path(output_path)
+        self.quantize = quantize
+        self.gltf: Dict[str, Any] = {
+            "asset": {"version": "2.0", "generator": "maya-ae-bridge"},
+            "scene": 0,
+            "scenes": [{"nodes": []}],
+            "nodes": [],
+            "meshes": [],
+            "accessors": [],
+            "bufferViews": [],
+        }
+        self.stats = {"meshes": 0, "nodes": 0, "vertices": 0, "triangles": 0}
+        self._dequantize: List[Optional[np.ndarray]] = []
+        self._bin_length = 0
+
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._bin_path = self.output_path.with_suffix(f".{os.getpid()}.bin.tmp")
+        self._bin = open(self._bin_path, "wb")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc_info):
+        if exc_type is None:
+            self.close()
+        else:
+            self._discard()
+
+    def add_mesh(
+        self,
+        name: str,
+        positions: np.ndarray,
+        indices: np.ndarray,
+        normals: Optional[np.ndarray] = None,
+        uvs: Optional[np.ndarray] = None,
+    ) -> int:
+        """Append one triangle mesh and return its glTF mesh index
+
+        positions/normals are N x 3, uvs N x 2 (glTF orientation: v down)
+        and indices a flat list of triangle corners.
+        """
+        positions = np.asarray(positions, dtype=np.float32).reshape(-1, 3)
+        indices = np.asarray(indices).ravel()
+        count = len(positions)
+
+        columns = []  # (attribute, bytes per vertex as N x k uint8, accessor)
+        dequantize = None
+        if self.quantize and count:
+            low, high = positions.min(axis=0), positions.max(axis=0)
+            center = (low + high) / 2.0
+            half = np.maximum((high - low) / 2.0, 1e-12)
+            quantized = np.round((positions - center) / half * _SHORT_MAX)
+            quantized = quantized.astype("<i2")
+            columns.append(
+                (
+                    "POSITION",
+                    _padded(quantized),
+                    {
+                        "componentType": SHORT,
+                        "normalized": True,
+                        "type": "VEC3",
+                        "min": quantized.min(axis=0).tolist(),
+                        "max": quantized.max(axis=0).tolist(),
+                    },
+                )
+            )
+            # Loaders read normalized shorts as [-1, 1]: scale back by half
+            # the bounds and move to their center
+            dequantize = np.diag(np.append(half, 1.0))
+            dequantize[3, :3] = center
+        else:
+            columns.append(
+                (
+                    "POSITION",
+                    positions.astype("<f4").view(np.uint8).reshape(count, 12),
+                    {
+                        "componentType": FLOAT,
+                        "type": "VEC3",
+                        "min": _bounds(positions, np.min),
+                        "max": _bounds(positions, np.max),
+                    },
+                )
+            )
+
+        if normals is not None:
+            normals = np.asarray(normals, dtype=np.float32).reshape(-1, 3)
+            if self.quantize:
+                packed = np.round(np.clip(normals, -1.0, 1.0) * _BYTE_MAX)
+                packed = packed.astype("i1")
+                columns.append(
+                    (
+                        "NORMAL",
+                        _padded(packed),
+                        {"componentType": BYTE, "normalized": True, "type": "VEC3"},
+                    )
+                )
+            else:
+                columns.append(
+                    (
+                        "NORMAL",
+                        normals.astype("<f4").view(np.uint8).reshape(count, 12),
+                        {"componentType": FLOAT, "type": "VEC3"},
+                    )
+                )
+
+        if uvs is not None:
+            uvs = np.asarray(uvs, dtype=np.float32).reshape(-1, 2)
+            if self.quantize and count and uvs.min() >= 0.0 and uvs.max() <= 1.0:
+                packed = np.round(uvs * _UNSIGNED_SHORT_MAX).astype("<u2")
+                columns.append(
+                    (
+                        "TEXCOORD_0",
+                        packed.view(np.uint8).reshape(count, 4),
+                        {
+                            "componentType": UNSIGNED_SHORT,
+                            "normalized": True,
+                            "type": "VEC2",
+                        },
+                    )
+                )
+            else:
+                # UDIM tiles and other coordinates outside [0, 1] stay float
+                columns.append(
+                    (
+                        "TEXCOORD_0",
+                        uvs.astype("<f4").view(np.uint8).reshape(count, 8),
+                        {"componentType": FLOAT, "type": "VEC2"},
+                    )
+                )
+
+        # Interleave the attributes into one vertex buffer view
+        stride = sum(column.shape[1] for _, column, _ in columns)
+        vertices = np.empty((count, stride), dtype=np.uint8)
+        attributes = {}
+        offset = 0
+        vertex_view = self._add_view(b"", ARRAY_BUFFER, stride)
+        for attribute, column, accessor in columns:
+            vertices[:, offset : offset + column.shape[1]] = column
+            attributes[attribute] = self._add_accessor(
+                vertex_view, offset, count, accessor
+            )
+            offset += column.shape[1]
+        self._write_view(vertex_view, vertices.tobytes())
+
+        index_type = UNSIGNED_SHORT if count <= _UNSIGNED_SHORT_MAX else UNSIGNED_INT
+        index_data = indices.astype("<u2" if index_type == UNSIGNED_SHORT else "<u4")
+        index_view = self._add_view(index_data.tobytes(), ELEMENT_ARRAY_BUFFER)
+        primitive = {
+            "attributes": attributes,
+            "indices": self._add_accessor(
+                index_view,
+                0,
+                len(indices),
+                {"componentType": index_type, "type": "SCALAR"},
+            ),
+            "mode": 4,
+        }
+
+        self.gltf["meshes"].append({"name": name, "primitives": [primitive]})
+        self._dequantize.append(dequantize)
+        self.stats["meshes"] += 1
+        self.stats["vertices"] += count
+        self.stats["triangles"] += len(indices) // 3
+        return len(self.gltf["meshes"]) - 1
+
+    def add_node(self, name: str, mesh: int, matrix: List[float]) -> int:
+        """Place a mesh with a flat world matrix; returns the node index
+
+        Maya's row-major matrices with translation in elements 12-14 have
+        the same 16 numbers as glTF's column-major ones, so they are used
+        as they are.
+        """
+        matrix = np.asarray(matrix, dtype=np.float64).reshape(4, 4)
+        dequantize = self._dequantize[mesh]
+        if dequantize is not None:
+            matrix = dequantize @ matrix
+
+        node = {"name": name, "mesh": mesh}
+        if not np.allclose(matrix, np.eye(4)):
+            node["matrix"] = matrix.ravel().tolist()
+        self.gltf["nodes"].append(node)
+        index = len(self.gltf["nodes"]) - 1
+        self.gltf["scenes"][0]["nodes"].append(index)
+        self.stats["nodes"] += 1
+        return index
+
+    def close(self) -> Dict[str, Any]:
+        """Write the .glb file and return counts and sizes"""
+        self._bin.close()
+        if self.quantize and self.gltf["meshes"]:
+            self.gltf["extensionsUsed"] = [QUANTIZATION_EXTENSION]
+            self.gltf["extensionsRequired"] = [QUANTIZATION_EXTENSION]
+        if self._bin_length:
+            self.gltf["buffers"] = [{"byteLength": self._bin_length}]
+        else:
+            del self.gltf["bufferViews"], self.gltf["accessors"]
+
+        json_bytes = json.dumps(self.gltf, separators=(",", ":")).encode("utf-8")
+        json_bytes += b" " * _pad(len(json_bytes))
+        total = 12 + 8 + len(json_bytes)
+        if self._bin_length:
+            total += 8 + self._bin_length
+
+        temp_path = self.output_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temp_path, "wb") as f:
+            f.write(struct.pack("<4sII", GLB_MAGIC, GLB_VERSION, total))
+            f.write(struct.pack("<I4s", len(json_bytes), CHUNK_JSON))
+            f.write(json_bytes)
+            if self._bin_length:
+                f.write(struct.pack("<I4s", self._bin_length, CHUNK_BIN))
+                with open(self._bin_path, "rb") as binary:
+                    shutil.copyfileobj(binary, f, 8 << 20)
+        os.replace(temp_path, self.output_path)
+        self._bin_path.unlink()
+
+        self.stats["bytes"] = total
+        return self.stats
+
+    def _discard(self) -> None:
+        self._bin.close()
+        if self._bin_path.exists():
+            self._bin_path.unlink()
+
+    def _add_view(self, data: bytes, target: int, stride: int = 0) -> int:
+        view = {"buffer": 0, "byteOffset": self._bin_length, "byteLength": 0}
+        if stride:
+            view["byteStride"] = stride
+        view["target"] = target
+        self.gltf["bufferViews"].append(view)
+        index = len(self.gltf["bufferViews"]) - 1
+        if data:
+            self._write_view(index, data)
+        return index
+
+    def _write_view(self, index: int, data: bytes) -> None:
+        """Stream a view's bytes to the binary chunk, padded to 4 bytes"""
+        self.gltf["bufferViews"][index]["byteLength"] = len(data)
+        padding = b"\x00" * _pad(len(data))
+        self._bin.write(data)
+        self._bin.write(padding)
+        self._bin_length += len(data) + len(padding)
+
+    def _add_accessor(
+        self, view: int, offset: int, count: int, accessor: Dict[str, Any]
+    ) -> int:
+        accessor = dict(accessor, bufferView=view, count=count)
+        if offset:
+            accessor["byteOffset"] = offset
+        self.gltf["accessors"].append(accessor)
+        return len(self.gltf["accessors"]) - 1
+
+
+def _bounds(values: np.ndarray, reduce) -> List[float]:
+    """Per-component min or max of a vertex array (zeros when empty)"""
+    if not len(values):
+        return [0.0] * values.shape[1]
+    return reduce(values, axis=0).tolist()
+
+
+def _padded(values: np.ndarray) -> np.ndarray:
+    """Rows of small integers as bytes, padded to a multiple of 4 per vertex"""
+    data = values.view(np.uint8).reshape(len(values), -1)
+    padding = _pad(data.shape[1])
+    if padding:
+        data = np.concatenate(
+            [data, np.zeros((len(values), padding), dtype=np.uint8)], axis=1
+        )
+    return data
+
+
+def read_glb(path: str) -> Dict[str, Any]:
+    """glTF JSON and binary chunk of a .glb file, as {"gltf", "bin"}"""
+    with open(path, "rb") as f:
+        magic, version, total = struct.unpack("<4sII", f.read(12))
+        if magic != GLB_MAGIC or version != GLB_VERSION:
+            raise ValueError(f"Not a glTF 2.0 binary file: {path}")
+        json_length, chunk_type = struct.unpack("<I4s", f.read(8))
+        if chunk_type != CHUNK_JSON:
+            raise ValueError(f"First chunk is not JSON: {path}")
+        gltf = json.loads(f.read(json_length))
+        binary = b""
+        header = f.read(8)
+        if len(header) == 8:
+            bin_length, chunk_type = struct.unpack("<I4s", header)
+            binary = f.read(bin_length)
+    return {"gltf": gltf, "bin": binary, "bytes": total}
+
+
+_COMPONENT_DTYPES = {
+    BYTE: "i1",
+    UNSIGNED_BYTE: "u1",
+    SHORT: "<i2",
+    UNSIGNED_SHORT: "<u2",
+    UNSIGNED_INT: "<u4",
+    FLOAT: "<f4",
+}
+_TYPE_SIZES = {"SCALAR": 1, "VEC2": 2, "VEC3": 3, "VEC4": 4}
+
+
+def read_accessor(glb: Dict[str, Any], index: int) -> np.ndarray:
+    """Decoded values of one accessor (normalized integers become floats)"""
+    gltf = glb["gltf"]
+    accessor = gltf["accessors"][index]
+    view = gltf["bufferViews"][accessor["bufferView"]]
+    dtype = np.dtype(_COMPONENT_DTYPES[accessor["componentType"]])
+    width = _TYPE_SIZES[accessor["type"]]
+    stride = view.get("byteStride", dtype.itemsize * width)
+    start = view.get("byteOffset", 0) + accessor.get("byteOffset", 0)
+    count = accessor["count"]
+
+    size = dtype.itemsize * width
+    data = np.frombuffer(glb["bin"], dtype=np.uint8)
+    rows = np.lib.stride_tricks.as_strided(
+        data[start:], shape=(count, size), strides=(stride, 1)
+    )
+    values = rows.copy().view(dtype).reshape(count, width)
+
+    if accessor.get("normalized"):
+        values = values.astype(np.float64) / np.iinfo(dtype).max
+        if dtype.kind == "i":
+            values = np.maximum(values, -1.0)
+    return values if width > 1 else values.ravel()
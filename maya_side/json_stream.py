@@ -0,0 +1,189 @@
+import json
+import re
+from typing import Any, Iterator
+
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DELIMITERS = frozenset(",:]} \t\n\r")
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+class JsonStream:
+    """Incremental reader for large JSON exports
+
+    Objects and arrays can be walked key by key and element by element, so
+    a section of a multi-GB export is parsed one row at a time instead of
+    loading the whole file. The caller drives the walk: after each key from
+    iter_object() or index from iter_array(), consume that value with
+    value(), iter_object() or iter_array() before asking for the next one.
+
+        stream = JsonStream(path)
+        for key in stream.iter_object():
+            if key == "scene_data":
+                for section in stream.iter_object():
+                    ...
+            else:
+                stream.skip()
+    """
+
+    def __init__(self, path: str, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self._file = open(path, "r", encoding="utf-8")
+        self._chunk_size = chunk_size
+        # The C scanner behind JSONDecoder.raw_decode, without its wrapper
+        self._scan = json.JSONDecoder().scan_once
+        self._buffer = ""
+        self._pos = 0
+        self._offset = 0
+        self._eof = False
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def peek(self) -> str:
+        """Next non-whitespace character, or "" at the end of the file"""
+        self._skip_whitespace()
+        return self._buffer[self._pos] if self._pos < len(self._buffer) else ""
+
+    def value(self) -> Any:
+        """Parse and return the next complete JSON value"""
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = self._scan(self._buffer, self._pos)
+            except (StopIteration, json.JSONDecodeError) as e:
+                if self._eof:
+                    position = e.value if isinstance(e, StopIteration) else e.pos
+                    raise ValueError(
+                        f"Malformed JSON at offset {self._offset + position}"
+                    )
+                self._fill(len(self._buffer) - self._pos)
+                continue
+            # A number cut off mid-way ("0." of "0.25") still decodes, so a
+            # value must be followed by a delimiter unless the file has ended
+            if not self._eof and (
+                end == len(self._buffer) or self._buffer[end] not in _DELIMITERS
+            ):
+                self._fill(len(self._buffer) - self._pos)
+                continue
+            self._pos = end
+            return value
+
+    def skip(self) -> None:
+        """Step over the next value without holding all of it in memory"""
+        char = self.peek()
+        if char == "[":
+            for _ in self.iter_array():
+                self.skip()
+        elif char == "{":
+            for _ in self.iter_object():
+                self.skip()
+        else:
+            self.value()
+
+    def iter_object(self) -> Iterator[str]:
+        """Keys of the next object; consume each key's value before advancing"""
+        self._expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.value()
+            if not isinstance(key, str):
+                raise self._error("an object key", str(key))
+            self._expect(":")
+            yield key
+            if self._separator("}"):
+                return
+
+    def iter_array(self) -> Iterator[int]:
+        """Indices of the next array; consume each element before advancing"""
+        self._expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        index = 0
+        while True:
+            yield index
+            index += 1
+            if self._separator("]"):
+                return
+
+    def tell(self) -> int:
+        """Character offset of the read position in the file"""
+        return self._offset + self._pos
+
+    def _separator(self, closing: str) -> bool:
+        """Consume a comma (False) or the closing bracket (True)"""
+        char = self.peek()
+        if char == ",":
+            self._pos += 1
+            return False
+        if char == closing:
+            self._pos += 1
+            return True
+        raise self._error(f"',' or '{closing}'", char)
+
+    def _expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise self._error(f"'{char}'", found)
+        self._pos += 1
+
+    def _error(self, expected: str, found: str) -> ValueError:
+        if not found:
+            return ValueError(f"Malformed JSON: file ends at offset {self.tell()}")
+        return ValueError(
+            f"Malformed JSON at offset {self.tell()}: expected {expected}, "
+            f"found {found!r}"
+        )
+
+    def _skip_whitespace(self) -> None:
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer) or self._eof:
+                return
+            self._fill()
+
+    def _fill(self, pending: int = 0) -> None:
+        """Drop consumed text and read at least as much again as is pending
+
+        Growing the read with the unparsed tail keeps re-parsing a large
+        value (such as a columnar section) linear overall.
+        """
+        self._offset += self._pos
+        self._buffer = self._buffer[self._pos :]
+        self._pos = 0
+        chunk = self._file.read(max(self._chunk_size, pending))
+        if chunk:
+            self._buffer += chunk
+        else:
+            self._eof = True
+
+
+def iter_section(path: str, section: str) -> Iterator[Any]:
+    """Rows of one scene_data section of an export, read one at a time
+
+    Yields nothing when the section is missing. A non-list section (such
+    as a columnar one) is yielded as a single value.
+    """
+    with JsonStream(path) as stream:
+        for key in stream.iter_object():
+            if key != "scene_data":
+                stream.skip()
+                continue
+            for name in stream.iter_object():
+                if name != section:
+                    stream.skip()
+                elif stream.peek() == "[":
+                    for _ in stream.iter_array():
+                        yield stream.value()
+                    return
+                else:
+                    yield stream.value()
+                    return
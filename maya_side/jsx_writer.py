@@ -0,0 +1,354 @@
+import math
+from pathlib import Path
+from typing import Dict, List, Any
+
+from sequence_index import expand_pattern, frame_path
+
+
+# ExtendScript parses each statement in one go; very long array literals slow
+# the parser down badly and can exhaust its stack, so keys are split into
+# several setValuesAtTimes() calls of at most this many keys each.
+DEFAULT_CHUNK_SIZE = 1000
+
+AE_LIGHT_TYPES = {
+    "pointLight": "LightType.POINT",
+    "directionalLight": "LightType.PARALLEL",
+    "spotLight": "LightType.SPOT",
+    "areaLight": "LightType.POINT",
+    "ambientLight": "LightType.AMBIENT",
+    "volumeLight": "LightType.POINT",
+    "aiAreaLight": "LightType.POINT",
+    "aiSkyDomeLight": "LightType.AMBIENT",
+    "aiPhotometricLight": "LightType.SPOT",
+    "RedshiftPhysicalLight": "LightType.POINT",
+    "RedshiftDomeLight": "LightType.AMBIENT",
+}
+
+
+class JSXWriter:
+    """Write an After Effects ExtendScript that rebuilds the exported scene"""
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE, scale: float = 1.0):
+        self.chunk_size = chunk_size
+        self.scale = scale  # Maya units -> AE pixels
+        self.stats = {}
+
+    def write(
+        self, scene_data: Dict[str, Any], output_path: Path, comp_name: str = None
+    ) -> Dict[str, int]:
+        """Write the .jsx script and return size/key statistics"""
+        output_path = Path(output_path)
+        script = self.build_script(scene_data, comp_name or output_path.stem)
+
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(script)
+
+        self.stats["script_bytes"] = output_path.stat().st_size
+        return self.stats
+
+    def build_script(self, scene_data: Dict[str, Any], comp_name: str) -> str:
+        """Build the full script text for a scene"""
+        self.stats = {
+            "script_bytes": 0,
+            "layers": 0,
+            "keyframes": 0,
+            "set_values_calls": 0,
+            "footage_items": 0,
+        }
+
+        comp = self._get_comp_settings(scene_data)
+        lines = [
+            "// Generated by maya-ae-bridge",
+            "(function () {",
+            'app.beginUndoGroup("Import Maya Scene");',
+            "var comp = app.project.items.addComp("
+            f"{self._string(comp_name)}, {comp['width']}, {comp['height']}, "
+            f"{self._num(comp['pixel_aspect'])}, {self._num(comp['duration'])}, "
+            f"{self._num(comp['fps'])});",
+            "var layer, prop;",
+        ]
+
+        render_passes = scene_data.get("render_passes")
+        if render_passes:
+            lines.extend(self._footage_lines(render_passes, comp))
+
+        for light in scene_data.get("lights", []):
+            lines.extend(self._light_lines(light, comp))
+
+        for camera in scene_data.get("cameras", []):
+            if not camera.get("is_renderable"):
+                continue
+            lines.extend(self._camera_lines(camera, comp))
+
+        screen_tracks = scene_data.get("screen_tracks")
+        if screen_tracks:
+            for track in screen_tracks["tracks"]:
+                lines.extend(self._track_lines(track, screen_tracks, comp))
+
+        lines.extend(["comp.openInViewer();", "app.endUndoGroup();", "})();", ""])
+
+        script = "\n".join(lines)
+        self.stats["script_bytes"] = len(script.encode("utf-8"))
+        return script
+
+    def _get_comp_settings(self, scene_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Derive comp size, rate and duration from the export"""
+        scene_info = scene_data.get("scene_info", {})
+        render_settings = scene_data.get("render_passes", {}).get("render_settings", {})
+        resolution = render_settings.get("resolution", {})
+
+        fps = scene_info.get("fps", 24)
+        start_frame, end_frame = scene_info.get("frame_range", [1.0, 1.0])
+        if render_settings.get("animation"):
+            start_frame = render_settings.get("start_frame", start_frame)
+            end_frame = render_settings.get("end_frame", end_frame)
+
+        width = int(resolution.get("width", 1920))
+        height = int(resolution.get("height", 1080))
+        device_aspect = resolution.get("aspect_ratio") or width / float(height)
+
+        return {
+            "width": width,
+            "height": height,
+            "pixel_aspect": device_aspect * height / float(width),
+            "fps": fps,
+            "start_frame": start_frame,
+            "end_frame": end_frame,
+            "duration": (end_frame - start_frame + 1) / float(fps),
+        }
+
+    def _camera_lines(self, camera: Dict[str, Any], comp: Dict[str, Any]) -> List[str]:
+        """Create a camera layer with its (possibly animated) transform and zoom"""
+        lines = [
+            "layer = comp.layers.addCamera("
+            f"{self._string(camera['name'])}, [{comp['width'] / 2.0}, {comp['height'] / 2.0}]);",
+            "layer.autoOrient = AutoOrientType.NO_AUTO_ORIENT;",
+        ]
+        self.stats["layers"] += 1
+
+        aperture = camera.get("horizontal_film_aperture", 1.417)
+        animation = camera.get("animation")
+
+        if animation:
+            lines.extend(self._transform_key_lines(animation, comp))
+            zooms = [
+                self._zoom(focal, aperture, comp["width"])
+                for focal in animation.get("focal_length", [])
+            ]
+            if zooms and len(set(zooms)) > 1:
+                lines.append('prop = layer.property("Camera Options").property("Zoom");')
+                lines.extend(self._key_lines(animation["frames"], zooms, comp))
+            elif zooms:
+                lines.append(
+                    'layer.property("Camera Options").property("Zoom")'
+                    f".setValue({self._num(zooms[0])});"
+                )
+        else:
+            lines.extend(self._static_transform_lines(camera["transform"], comp))
+            zoom = self._zoom(camera["focal_length"], aperture, comp["width"])
+            lines.append(
+                'layer.property("Camera Options").property("Zoom")'
+                f".setValue({self._num(zoom)});"
+            )
+
+        return lines
+
+    def _light_lines(self, light: Dict[str, Any], comp: Dict[str, Any]) -> List[str]:
+        """Create a light layer with color, intensity and transform"""
+        light_type = AE_LIGHT_TYPES.get(light.get("type"), "LightType.POINT")
+        color = light.get("color", [1.0, 1.0, 1.0])
+        intensity = light.get("intensity", 1.0) * 100.0
+
+        lines = [
+            "layer = comp.layers.addLight("
+            f"{self._string(light['name'])}, [{comp['width'] / 2.0}, {comp['height'] / 2.0}]);",
+            f"layer.lightType = {light_type};",
+            'layer.property("Light Options").property("Color")'
+            f".setValue({self._array(color)});",
+            'layer.property("Light Options").property("Intensity")'
+            f".setValue({self._num(intensity)});",
+            f"layer.enabled = {'true' if light.get('enabled', True) else 'false'};",
+        ]
+        self.stats["layers"] += 1
+
+        animation = light.get("animation")
+        if animation:
+            lines.extend(self._transform_key_lines(animation, comp))
+        else:
+            lines.extend(self._static_transform_lines(light["transform"], comp))
+
+        return lines
+
+    def _track_lines(
+        self, track: Dict[str, Any], screen_tracks: Dict[str, Any], comp: Dict[str, Any]
+    ) -> List[str]:
+        """Create a null keyed along an object's projected pivot
+
+        Frames where the pivot is behind the camera get no key. Positions are
+        rescaled if the comp size differs from the tracked resolution.
+        """
+        width, height = screen_tracks["resolution"]
+        scale_x = comp["width"] / float(width)
+        scale_y = comp["height"] / float(height)
+        pivot_screen = track["pivot_screen"]
+        depth = track.get("depth")
+
+        frames, positions = [], []
+        for index, frame in enumerate(screen_tracks["frames"]):
+            if depth and depth[index] <= 0.0:
+                continue
+            frames.append(frame)
+            positions.append(
+                [
+                    pivot_screen[2 * index] * scale_x,
+                    pivot_screen[2 * index + 1] * scale_y,
+                ]
+            )
+
+        lines = [
+            "layer = comp.layers.addNull();",
+            f"layer.name = {self._string(track['name'] + '_track')};",
+        ]
+        self.stats["layers"] += 1
+        if positions:
+            lines.append('prop = layer.property("Transform").property("Position");')
+            lines.extend(self._key_lines(frames, positions, comp))
+        return lines
+
+    def _footage_lines(
+        self, render_passes: Dict[str, Any], comp: Dict[str, Any]
+    ) -> List[str]:
+        """Import each rendered AOV sequence and add it to the comp"""
+        lines = ["var file, io, footage;"]
+        settings = render_passes.get("render_settings", {})
+
+        for aov in render_passes.get("aovs", []):
+            if not aov.get("enabled", True):
+                continue
+
+            first_frame = self._footage_path(aov, settings, comp["start_frame"])
+            lines.extend(
+                [
+                    f"file = new File({self._string(first_frame)});",
+                    "if (file.exists) {",
+                    "    io = new ImportOptions(file);",
+                    "    io.sequence = true;",
+                    "    footage = app.project.importFile(io);",
+                    f"    footage.mainSource.conformFrameRate = {self._num(comp['fps'])};",
+                    "    layer = comp.layers.add(footage);",
+                    f"    layer.name = {self._string(aov['name'])};",
+                    "}",
+                ]
+            )
+            self.stats["footage_items"] += 1
+
+        return lines
+
+    def _footage_path(
+        self, aov: Dict[str, Any], settings: Dict[str, Any], frame: float
+    ) -> str:
+        """First frame of an AOV sequence, following the renderer's naming"""
+        pattern = aov.get("file_pattern") or expand_pattern(aov, settings)
+        return Path(frame_path(pattern, frame)).as_posix()
+
+    def _transform_key_lines(
+        self, animation: Dict[str, Any], comp: Dict[str, Any]
+    ) -> List[str]:
+        """Key Position and Orientation from baked world matrices"""
+        positions = []
+        orientations = []
+        for matrix in animation["transforms"]:
+            position, orientation = self._matrix_to_ae(matrix, comp)
+            positions.append(position)
+            orientations.append(orientation)
+
+        lines = ['prop = layer.property("Transform").property("Position");']
+        lines.extend(self._key_lines(animation["frames"], positions, comp))
+        lines.append('prop = layer.property("Transform").property("Orientation");')
+        lines.extend(self._key_lines(animation["frames"], orientations, comp))
+        return lines
+
+    def _static_transform_lines(
+        self, matrix: List[float], comp: Dict[str, Any]
+    ) -> List[str]:
+        """Set Position and Orientation once for an unanimated layer"""
+        position, orientation = self._matrix_to_ae(matrix, comp)
+        return [
+            'layer.property("Transform").property("Position")'
+            f".setValue({self._array(position)});",
+            'layer.property("Transform").property("Orientation")'
+            f".setValue({self._array(orientation)});",
+        ]
+
+    def _key_lines(
+        self, frames: List[float], values: List[Any], comp: Dict[str, Any]
+    ) -> List[str]:
+        """Emit chunked setValuesAtTimes calls for one property"""
+        lines = []
+        fps = float(comp["fps"])
+        times = [(frame - comp["start_frame"]) / fps for frame in frames]
+
+        for start in range(0, len(times), self.chunk_size):
+            chunk_times = times[start : start + self.chunk_size]
+            chunk_values = values[start : start + self.chunk_size]
+            lines.append(
+                f"prop.setValuesAtTimes({self._array(chunk_times)}, "
+                f"{self._array(chunk_values)});"
+            )
+            self.stats["set_values_calls"] += 1
+            self.stats["keyframes"] += len(chunk_times)
+
+        return lines
+
+    def _matrix_to_ae(self, matrix: List[float], comp: Dict[str, Any]):
+        """Convert a Maya world matrix to AE position and orientation
+
+        Maya is Y-up with the camera looking down -Z; AE is Y-down with the
+        camera looking down +Z, so both axes are flipped before decomposing.
+        Orientation is returned in AE's X, Y, Z order.
+        """
+        rows = [matrix[0:3], matrix[4:7], matrix[8:11]]
+        rows = [self._normalize(row) for row in rows]
+
+        flip = (1.0, -1.0, -1.0)
+        r = [[rows[i][j] * flip[i] * flip[j] for j in range(3)] for i in range(3)]
+
+        sy = max(-1.0, min(1.0, -r[0][2]))
+        ry = math.asin(sy)
+        if abs(math.cos(ry)) > 1e-6:
+            rx = math.atan2(r[1][2], r[2][2])
+            rz = math.atan2(r[0][1], r[0][0])
+        else:
+            rx = math.atan2(r[1][0] * sy, r[1][1])
+            rz = 0.0
+
+        orientation = [math.degrees(a) % 360.0 for a in (rx, ry, rz)]
+        position = [
+            matrix[12] * self.scale + comp["width"] / 2.0,
+            -matrix[13] * self.scale + comp["height"] / 2.0,
+            -matrix[14] * self.scale,
+        ]
+        return position, orientation
+
+    def _zoom(self, focal_length: float, aperture: float, comp_width: int) -> float:
+        """AE camera zoom in pixels from focal length and film back (inches)"""
+        return comp_width * focal_length / (aperture * 25.4)
+
+    def _normalize(self, vector: List[float]) -> List[float]:
+        length = math.sqrt(sum(v * v for v in vector)) or 1.0
+        return [v / length for v in vector]
+
+    def _num(self, value: float) -> str:
+        text = f"{value:.6f}".rstrip("0").rstrip(".")
+        return "0" if text in ("", "-0") else text
+
+    def _array(self, values: List[Any]) -> str:
+        items = [
+            self._array(v) if isinstance(v, (list, tuple)) else self._num(v)
+            for v in values
+        ]
+        return "[" + ",".join(items) + "]"
+
+    def _string(self, value: str) -> str:
+        escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+        return f'"{escaped}"'
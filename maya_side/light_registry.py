@@ -0,0 +1,127 @@
+import maya.cmds as cmds
+from typing import Dict, List, Any, Optional
+
+from attr_cache import AttributeCache
+from dag_table import DagTable
+from records import LightRecord
+
+
+# Exported key -> attribute, read from every light type that has it
+COMMON_LIGHT_ATTRS = {
+    "color": "color",
+    "intensity": "intensity",
+}
+
+# Light shape node type -> extra exported key -> attribute
+LIGHT_TYPES: Dict[str, Dict[str, str]] = {
+    "pointLight": {"decay_rate": "decayRate", "exposure": "aiExposure"},
+    "directionalLight": {"exposure": "aiExposure", "angle": "aiAngle"},
+    "spotLight": {
+        "cone_angle": "coneAngle",
+        "penumbra_angle": "penumbraAngle",
+        "dropoff": "dropoff",
+        "exposure": "aiExposure",
+    },
+    "areaLight": {"exposure": "aiExposure", "spread": "aiSpread"},
+    "ambientLight": {"ambient_shade": "ambientShade"},
+    "volumeLight": {},
+    "aiAreaLight": {
+        "exposure": "aiExposure",
+        "spread": "aiSpread",
+        "normalize": "aiNormalize",
+        "use_temperature": "aiUseColorTemperature",
+        "temperature": "aiColorTemperature",
+    },
+    "aiSkyDomeLight": {
+        "exposure": "aiExposure",
+        "resolution": "resolution",
+        "format": "format",
+    },
+    "aiPhotometricLight": {"exposure": "aiExposure", "file": "aiFilename"},
+    "RedshiftPhysicalLight": {
+        "exposure": "exposure",
+        "color_mode": "colorMode",
+        "temperature": "temperature",
+        "spread": "areaSpread",
+        "cone_angle": "spotConeAngle",
+        "penumbra_angle": "spotConeFalloffAngle",
+    },
+    "RedshiftDomeLight": {"exposure": "exposure0", "texture": "tex0"},
+}
+
+# Exported key -> (exported key it is computed from, conversion), for
+# attributes whose Maya value does not mean the same as the exported key
+DERIVED_LIGHT_ATTRS = {
+    # Redshift colorMode: 0 color, 1 temperature, 2 color x temperature
+    "use_temperature": ("color_mode", lambda mode: mode != 0),
+}
+
+
+def register_light_type(
+    node_type: str, attrs: Optional[Dict[str, str]] = None
+) -> None:
+    """Add (or extend) a light shape type to extract, with its extra attributes"""
+    LIGHT_TYPES.setdefault(node_type, {}).update(attrs or {})
+
+
+class LightExtractor:
+    """Extract every registered light type in one pass over the DAG table
+
+    Light shapes of all registered types are picked from the DAG table in a
+    single lookup; attributes are then fetched in one batch per type.
+    Attributes a light does not have (e.g. Arnold extension attributes when
+    mtoa is not loaded) are left out of its entry.
+    """
+
+    def __init__(self, dag: DagTable, attr_cache: Optional[AttributeCache] = None):
+        self.dag = dag
+        self.attrs = attr_cache or dag.attrs
+
+    def get_lights(self) -> List[Dict[str, Any]]:
+        """Light entries in DAG order"""
+        shapes = self.dag.nodes_of_type(list(LIGHT_TYPES))
+
+        by_type: Dict[str, List[str]] = {}
+        for shape in shapes:
+            by_type.setdefault(self.dag.node_type(shape), []).append(shape)
+
+        values = {}
+        for light_type, type_shapes in by_type.items():
+            attr_map = {**COMMON_LIGHT_ATTRS, **LIGHT_TYPES[light_type]}
+            values.update(
+                self.attrs.get_plugs(
+                    [f"{s}.{attr}" for s in type_shapes for attr in attr_map.values()]
+                )
+            )
+
+        lights = []
+        for shape in shapes:
+            light_type = self.dag.node_type(shape)
+            transform = self.dag.parent(shape)
+
+            light_data = LightRecord(
+                name=self.dag.name(transform),
+                type=light_type,
+                transform=self._get_transform_matrix(transform),
+                enabled=self.dag.is_visible(transform),
+            )
+
+            attr_map = {**COMMON_LIGHT_ATTRS, **LIGHT_TYPES[light_type]}
+            for key, attr in attr_map.items():
+                value = values[f"{shape}.{attr}"]
+                if isinstance(value, list) and len(value) == 1:
+                    value = list(value[0])
+                if value is not None:
+                    light_data[key] = value
+
+            for key, (source, convert) in DERIVED_LIGHT_ATTRS.items():
+                if key not in light_data and source in light_data:
+                    light_data[key] = convert(light_data[source])
+
+            lights.append(light_data)
+
+        return lights
+
+    def _get_transform_matrix(self, node: str) -> List[float]:
+        """Get world space transform matrix as flat list of 16 floats"""
+        return cmds.xform(node, query=True, worldSpace=True, matrix=True)
@@ -1,23 +1,50 @@
 import maya.cmds as cmds
 from typing import Dict, List, Any, Optional
 
+from attr_cache import AttributeCache
+from progress import ProgressReporter
+from shading_graph import DEFAULT_MAX_DEPTH, ShadingGraph
+
 
 class MaterialManager:
     """Extract material/shader information from scene"""
 
-    def get_all_materials(self) -> List[Dict[str, Any]]:
-        """Get all materials in the scene"""
+    def __init__(
+        self,
+        attr_cache: Optional[AttributeCache] = None,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        progress: Optional[ProgressReporter] = None,
+    ):
+        self.attrs = attr_cache or AttributeCache()
+        self.progress = progress or ProgressReporter()
+        self.graph = ShadingGraph(self.attrs, max_depth)
+
+    @property
+    def textures(self) -> List[Dict[str, Any]]:
+        """Deduplicated texture table the materials' texture_refs index into"""
+        return self.graph.textures
+
+    def get_all_materials(
+        self, shading_engines: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Get all materials in the scene, or those of the given shading engines"""
         materials = []
 
-        shading_engines = cmds.ls(type="shadingEngine") or []
-
-        for sg in shading_engines:
-            if sg in ["initialShadingGroup", "initialParticleSE"]:
-                continue
-
-            material_data = self._extract_material_data(sg)
-            if material_data:
-                materials.append(material_data)
+        if shading_engines is None:
+            shading_engines = cmds.ls(type="shadingEngine") or []
+        shading_engines = [
+            sg
+            for sg in shading_engines
+            if sg not in ["initialShadingGroup", "initialParticleSE"]
+        ]
+
+        with self.progress.phase("materials", total=len(shading_engines)):
+            for sg in shading_engines:
+                self.progress.check_cancel()
+                material_data = self._extract_material_data(sg)
+                if material_data:
+                    materials.append(material_data)
+                self.progress.advance("materials", item=sg)
 
         return materials
 
@@ -40,6 +67,7 @@ class MaterialManager:
             "type": shader_type,
             "assigned_objects": assigned_objects,
             "properties": self._get_shader_properties(shader, shader_type),
+            "texture_refs": self.graph.texture_refs(shading_engine),
         }
 
         return material_data
@@ -74,8 +102,10 @@ class MaterialManager:
             "emission": "emissionColor",
         }
 
+        values = self.attrs.get_many(shader, list(common_attrs.values()))
+
         for prop_name, attr_name in common_attrs.items():
-            value = self._safe_get_attr(shader, attr_name)
+            value = self._flatten(values[attr_name])
             if value is not None:
                 properties[prop_name] = value
 
@@ -95,22 +125,21 @@ class MaterialManager:
                 connections = cmds.listConnections(full_attr, source=True, type="file")
                 if connections:
                     file_node = connections[0]
-                    file_path = cmds.getAttr(f"{file_node}.fileTextureName")
+                    file_path = self.attrs.get(file_node, "fileTextureName")
                     textures[attr] = file_path
 
         return textures
 
     def _safe_get_attr(self, node: str, attr: str, default=None):
         """Safely get attribute with fallback"""
-        try:
-            if cmds.objExists(f"{node}.{attr}"):
-                value = cmds.getAttr(f"{node}.{attr}")
-                if isinstance(value, list) and len(value) == 1:
-                    return list(value[0])
-                return value
-        except:
-            pass
-        return default
+        value = self._flatten(self.attrs.get(node, attr))
+        return default if value is None else value
+
+    def _flatten(self, value):
+        """Unwrap compound values ([(r, g, b)] -> [r, g, b])"""
+        if isinstance(value, list) and len(value) == 1:
+            return list(value[0])
+        return value
 
     def get_material_for_object(self, obj_name: str) -> Optional[str]:
         """Get material assigned to specific object"""
@@ -0,0 +1,171 @@
+import json
+import os
+import signal
+import sys
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, Optional, TextIO
+
+
+# Minimum seconds between two progress events of one phase
+DEFAULT_INTERVAL = 0.25
+
+# Exit code of a run stopped by a cancel request
+CANCELLED_EXIT_CODE = 3
+
+
+class Cancelled(Exception):
+    """Raised at the next item boundary once a cancel was requested"""
+
+
+class ProgressReporter:
+    """JSON-lines progress events and cooperative cancellation
+
+    Every event is one JSON object per line with "event", "time" (epoch
+    seconds) and "elapsed" (seconds since the reporter was made), flushed
+    immediately so a supervisor can tail the stream. Without a stream
+    nothing is written but cancellation still works.
+
+    Long loops call check_cancel() before each item, so a cancel file
+    appearing or SIGINT/SIGTERM arriving stops the run cleanly after the
+    current item by raising Cancelled. A second SIGINT interrupts at once.
+    """
+
+    def __init__(
+        self,
+        stream: Optional[TextIO] = None,
+        cancel_file: Optional[str] = None,
+        interval: float = DEFAULT_INTERVAL,
+    ):
+        self.stream = stream
+        self.cancel_file = cancel_file
+        self.interval = interval
+        self.cancel_reason: Optional[str] = None
+        self._start = time.perf_counter()
+        self._phases: Dict[str, Dict[str, Any]] = {}
+        self._owns_stream = False
+
+    @classmethod
+    def open(
+        cls, path: Optional[str], cancel_file: Optional[str] = None
+    ) -> "ProgressReporter":
+        """Reporter writing to a file, or to stderr for "-" (None: no events)"""
+        if not path:
+            return cls(cancel_file=cancel_file)
+        if path == "-":
+            return cls(sys.stderr, cancel_file)
+        reporter = cls(open(path, "a", encoding="utf-8"), cancel_file)
+        reporter._owns_stream = True
+        return reporter
+
+    def emit(self, event: str, **fields) -> None:
+        """Write one event line"""
+        if self.stream is None:
+            return
+        record = {
+            "event": event,
+            "time": round(time.time(), 3),
+            "elapsed": round(time.perf_counter() - self._start, 3),
+        }
+        record.update(fields)
+        self.stream.write(json.dumps(record, default=str) + "\n")
+        self.stream.flush()
+
+    @contextmanager
+    def phase(self, name: str, total: Optional[int] = None) -> Iterator[None]:
+        """Bracket a phase with phase_start/phase_end events
+
+        phase_end carries the phase's seconds, the items done and a status:
+        ok, cancelled or error.
+        """
+        state = {"start": time.perf_counter(), "done": 0, "total": total, "sent": 0.0}
+        self._phases[name] = state
+        self.emit("phase_start", phase=name, total=total)
+        status = "ok"
+        try:
+            yield
+        except Cancelled:
+            status = "cancelled"
+            raise
+        except BaseException:
+            status = "error"
+            raise
+        finally:
+            self._phases.pop(name, None)
+            self.emit(
+                "phase_end",
+                phase=name,
+                status=status,
+                done=state["done"],
+                seconds=round(time.perf_counter() - state["start"], 3),
+            )
+
+    def advance(self, name: str, item: Optional[str] = None, count: int = 1) -> None:
+        """Count items done in a phase; emits a throttled progress event
+
+        Progress events carry done/total, the item just finished, the rate
+        (items per second) and the estimated seconds left.
+        """
+        state = self._phases.get(name)
+        if state is None:
+            return
+        state["done"] += count
+        now = time.perf_counter()
+        finished = state["total"] is not None and state["done"] >= state["total"]
+        if not finished and now - state["sent"] < self.interval:
+            return
+        state["sent"] = now
+
+        seconds = now - state["start"]
+        rate = state["done"] / seconds if seconds > 0 else None
+        fields = {"phase": name, "done": state["done"], "total": state["total"]}
+        if item is not None:
+            fields["item"] = item
+        if rate:
+            fields["rate"] = round(rate, 3)
+            if state["total"] is not None:
+                fields["eta"] = round((state["total"] - state["done"]) / rate, 3)
+        self.emit("progress", **fields)
+
+    def request_cancel(self, reason: str) -> None:
+        """Stop at the next check_cancel()"""
+        if self.cancel_reason is None:
+            self.cancel_reason = reason
+            self.emit("cancel_requested", reason=reason)
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether a cancel was requested (by signal, file or call)"""
+        if self.cancel_reason is None and self.cancel_file:
+            if os.path.exists(self.cancel_file):
+                self.request_cancel(f"cancel file {self.cancel_file}")
+        return self.cancel_reason is not None
+
+    def check_cancel(self) -> None:
+        """Raise Cancelled if a cancel was requested"""
+        if self.cancelled:
+            raise Cancelled(self.cancel_reason)
+
+    def install_signal_handlers(self) -> None:
+        """Turn SIGINT/SIGTERM (and SIGBREAK on Windows) into cancel requests"""
+
+        def handler(signum, frame):
+            if self.cancel_reason is not None and signum == signal.SIGINT:
+                raise KeyboardInterrupt
+            self.request_cancel(f"signal {signal.Signals(signum).name}")
+
+        for name in ("SIGINT", "SIGTERM", "SIGBREAK"):
+            signum = getattr(signal, name, None)
+            if signum is None:
+                continue
+            try:
+                signal.signal(signum, handler)
+            except (ValueError, OSError):
+                # Not the main thread, or not settable on this platform
+                pass
+
+    def close(self) -> None:
+        """Close the event file if the reporter opened it"""
+        if self._owns_stream and self.stream:
+            self.stream.close()
+            self.stream = None
@@ -0,0 +1,242 @@
+import argparse
+import struct
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+import numpy as np
+
+from exr_packer import EXRPacker
+
+
+PROXY_SCALES = {"half": 2, "quarter": 4}
+PROXY_DIR = "proxies"
+CONTACT_SHEET_FRAMES = 16
+CONTACT_THUMB_WIDTH = 240
+
+
+def proxy_path(source: Path, label: str, output_format: str) -> Path:
+    """Where the proxy of a rendered frame lives: <dir>/proxies/<label>/<name>"""
+    source = Path(source)
+    return source.parent / PROXY_DIR / label / f"{source.stem}.{output_format}"
+
+
+def contact_sheet_path(render_dir: Path, stem: str, label: str) -> Path:
+    """Contact sheet of one AOV sequence"""
+    return Path(render_dir) / PROXY_DIR / label / f"{stem}_contact.png"
+
+
+class ProxyGenerator:
+    """Downsample rendered AOV frames into 8-bit PNG or half-float EXR proxies"""
+
+    def __init__(self, label: str = "half", output_format: str = "png"):
+        if label not in PROXY_SCALES:
+            raise ValueError(f"Unknown proxy size '{label}', use one of {list(PROXY_SCALES)}")
+        if output_format not in ("png", "exr"):
+            raise ValueError(f"Unsupported proxy format: {output_format}")
+        self.label = label
+        self.factor = PROXY_SCALES[label]
+        self.output_format = output_format
+
+    def make_proxy(
+        self,
+        source: Path,
+        force: bool = False,
+        channels: Optional[Dict[str, np.ndarray]] = None,
+    ) -> Optional[Path]:
+        """Write the proxy for one frame; returns None if it was up to date
+
+        channels are the frame's already decoded pixels, if the caller has them.
+        """
+        source = Path(source)
+        output = proxy_path(source, self.label, self.output_format)
+
+        if not force and self.is_up_to_date(source, output):
+            return None
+
+        if channels is None:
+            channels = EXRPacker().read_channels(source)
+        small = {name: self.downsample(pixels, self.factor) for name, pixels in channels.items()}
+
+        output.parent.mkdir(parents=True, exist_ok=True)
+        if self.output_format == "exr":
+            half = {name: pixels.astype(np.float16) for name, pixels in small.items()}
+            EXRPacker("zip").write_channels(output, half)
+        else:
+            write_png(output, to_display(small))
+        return output
+
+    def is_up_to_date(self, source: Path, output: Path) -> bool:
+        """A proxy is current when it is newer than the frame it was made from"""
+        try:
+            return output.stat().st_mtime >= source.stat().st_mtime
+        except FileNotFoundError:
+            return False
+
+    @staticmethod
+    def downsample(pixels: np.ndarray, factor: int) -> np.ndarray:
+        """Box-filter an image by an integer factor (area average)"""
+        height, width = pixels.shape
+        pad_h = -height % factor
+        pad_w = -width % factor
+        if pad_h or pad_w:
+            pixels = np.pad(pixels, ((0, pad_h), (0, pad_w)), mode="edge")
+
+        blocks = pixels.astype(np.float32).reshape(
+            pixels.shape[0] // factor, factor, pixels.shape[1] // factor, factor
+        )
+        return blocks.mean(axis=(1, 3))
+
+
+def to_display(channels: Dict[str, np.ndarray]) -> np.ndarray:
+    """Pick display channels and convert linear values to 8-bit sRGB"""
+    names = {name.split(".")[-1]: name for name in channels}
+    if all(c in names for c in "RGB"):
+        keys = [names[c] for c in "RGB"] + ([names["A"]] if "A" in names else [])
+    elif "Y" in names:
+        keys = [names["Y"]]
+    else:
+        keys = [sorted(channels)[0]]
+
+    image = np.stack([channels[key] for key in keys], axis=-1).astype(np.float32)
+    color = image[..., :3] if image.shape[-1] >= 3 else image
+    color = np.clip(color, 0.0, 1.0)
+    color = np.where(
+        color <= 0.0031308, color * 12.92, 1.055 * np.power(color, 1 / 2.4) - 0.055
+    )
+    if image.shape[-1] == 4:
+        color = np.concatenate([color, np.clip(image[..., 3:], 0.0, 1.0)], axis=-1)
+    return (color * 255.0 + 0.5).astype(np.uint8)
+
+
+def write_png(path: Path, image: np.ndarray) -> None:
+    """Write an 8-bit gray, RGB or RGBA image as PNG"""
+    if image.ndim == 2:
+        image = image[..., None]
+    height, width, depth = image.shape
+    color_type = {1: 0, 3: 2, 4: 6}[depth]
+
+    rows = np.zeros((height, width * depth + 1), dtype=np.uint8)
+    rows[:, 1:] = image.reshape(height, width * depth)
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        crc = zlib.crc32(tag + data) & 0xFFFFFFFF
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", crc)
+
+    with open(path, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, color_type, 0, 0, 0)))
+        f.write(chunk(b"IDAT", zlib.compress(rows.tobytes(), 6)))
+        f.write(chunk(b"IEND", b""))
+
+
+def _proxy_task(source, label, output_format, thumbnail):
+    """Process pool entry point: proxy one frame and optionally thumbnail it"""
+    generator = ProxyGenerator(label, output_format)
+    # Decode the frame once for both the proxy and the thumbnail
+    channels = EXRPacker().read_channels(source) if thumbnail else None
+    written = generator.make_proxy(source, channels=channels)
+
+    thumb = None
+    if thumbnail:
+        width = next(iter(channels.values())).shape[1]
+        factor = max(1, width // CONTACT_THUMB_WIDTH)
+        thumb = to_display(
+            {name: generator.downsample(p, factor) for name, p in channels.items()}
+        )[..., :3]
+    return written is not None, thumb
+
+
+def generate_proxies(
+    render_dir: Path,
+    stem: str,
+    frames: List[int],
+    label: str = "half",
+    output_format: str = "png",
+    padding: int = 4,
+    workers: int = 1,
+) -> Dict[str, Any]:
+    """Proxy every frame of one AOV sequence and build its contact sheet
+
+    Frames whose proxy is newer than the source are skipped, and the contact
+    sheet is only rebuilt when any source frame is newer than it.
+    """
+    render_dir = Path(render_dir)
+    sources = [render_dir / f"{stem}.{int(f):0{padding}d}.exr" for f in frames]
+    sources = [s for s in sources if s.exists()]
+
+    sheet = contact_sheet_path(render_dir, stem, label)
+    newest = max((s.stat().st_mtime for s in sources), default=0)
+    sheet_stale = not sheet.exists() or sheet.stat().st_mtime < newest
+
+    step = max(1, len(sources) // CONTACT_SHEET_FRAMES)
+    sampled = set(sources[::step][:CONTACT_SHEET_FRAMES]) if sheet_stale else set()
+
+    start = time.perf_counter()
+    args = [(s, label, output_format, s in sampled) for s in sources]
+    if workers <= 1:
+        results = [_proxy_task(*a) for a in args]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_proxy_task, *zip(*args))) if args else []
+
+    thumbnails = [thumb for _, thumb in results if thumb is not None]
+    if thumbnails:
+        sheet.parent.mkdir(parents=True, exist_ok=True)
+        write_png(sheet, _tile(thumbnails))
+
+    written = sum(1 for w, _ in results if w)
+    return {
+        "frames": len(sources),
+        "written": written,
+        "skipped": len(sources) - written,
+        "contact_sheet": str(sheet) if sheet.exists() else None,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def _tile(thumbnails: List[np.ndarray], columns: int = 4) -> np.ndarray:
+    """Arrange equally sized thumbnails in a grid"""
+    height, width, depth = thumbnails[0].shape
+    rows = -(-len(thumbnails) // columns)
+    sheet = np.zeros((rows * height, min(columns, len(thumbnails)) * width, depth), np.uint8)
+    for i, thumb in enumerate(thumbnails):
+        y, x = divmod(i, columns)
+        sheet[y * height : (y + 1) * height, x * width : (x + 1) * width] = thumb
+    return sheet
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate proxies for AOV sequences")
+    parser.add_argument("render_dir", type=str, help="Folder with <aov>.<frame>.exr")
+    parser.add_argument("--aovs", nargs="+", required=True, help="AOV names")
+    parser.add_argument(
+        "--frames", nargs=2, type=int, required=True, help="First and last frame"
+    )
+    parser.add_argument("--size", choices=list(PROXY_SCALES), default="half")
+    parser.add_argument("--format", choices=["png", "exr"], default="png")
+    parser.add_argument("--padding", type=int, default=4, help="Frame number padding")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes")
+    args = parser.parse_args()
+
+    frames = list(range(args.frames[0], args.frames[1] + 1))
+    for aov in args.aovs:
+        stats = generate_proxies(
+            args.render_dir,
+            aov,
+            frames,
+            label=args.size,
+            output_format=args.format,
+            padding=args.padding,
+            workers=args.workers,
+        )
+        print(
+            f"✓ {aov}: {stats['written']} written, {stats['skipped']} up to date "
+            f"({stats['seconds']:.2f}s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+from array import array
+from collections.abc import MutableMapping
+from typing import Dict, Any, Iterator, Tuple
+
+
+_UNSET = object()
+
+
+class Record(MutableMapping):
+    """Dict-like extraction result with its known fields in __slots__
+
+    Readers and writers keep using record["key"] and record.get(), but the
+    fixed keys are not stored per object, and numeric vectors such as world
+    matrices are kept in compact arrays. Keys outside FIELDS go into a small
+    overflow dict. Records become plain dicts and lists only when serialized
+    (see to_json).
+    """
+
+    __slots__ = ("_extra",)
+    FIELDS: Tuple[str, ...] = ()
+    ARRAYS: Tuple[str, ...] = ()
+
+    def __init__(self, **values):
+        self._extra = None
+        for field in self.FIELDS:
+            self._set(field, values.pop(field, _UNSET))
+        if values:
+            self._extra = values
+
+    def _set(self, key: str, value: Any) -> None:
+        if key in self.ARRAYS and value is not _UNSET and value is not None:
+            value = array("d", value)
+        object.__setattr__(self, key, value)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.FIELDS:
+            value = getattr(self, key)
+            if value is not _UNSET:
+                return value
+        elif self._extra and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in self.FIELDS:
+            self._set(key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key in self.FIELDS and getattr(self, key) is not _UNSET:
+            object.__setattr__(self, key, _UNSET)
+        elif self._extra and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for field in self.FIELDS:
+            if getattr(self, field) is not _UNSET:
+                yield field
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict in the exported shape (nested records included)"""
+        return {key: _plain(value) for key, value in self.items()}
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, array):
+        return value.tolist()
+    if isinstance(value, list):
+        return [_plain(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _plain(v) for k, v in value.items()}
+    return value
+
+
+def to_json(value: Any) -> Any:
+    """json.dump default hook turning records and arrays into JSON types"""
+    if isinstance(value, Record):
+        return dict(value.items())
+    if isinstance(value, array):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class CameraRecord(Record):
+    __slots__ = FIELDS = (
+        "name",
+        "shape_name",
+        "transform",
+        "focal_length",
+        "horizontal_film_aperture",
+        "vertical_film_aperture",
+        "near_clip",
+        "far_clip",
+        "is_renderable",
+    )
+    ARRAYS = ("transform",)
+
+
+class GeometryRecord(Record):
+    __slots__ = FIELDS = (
+        "vertex_count",
+        "face_count",
+        "triangle_count",
+        "uv_sets",
+        "has_uvs",
+    )
+
+
+class MeshRecord(Record):
+    __slots__ = FIELDS = (
+        "name",
+        "full_path",
+        "shape_name",
+        "transform",
+        "geometry",
+        "material",
+        "visible",
+    )
+    ARRAYS = ("transform",)
+
+
+class LightRecord(Record):
+    __slots__ = FIELDS = (
+        "name",
+        "type",
+        "transform",
+        "enabled",
+        "color",
+        "intensity",
+    )
+    ARRAYS = ("transform",)
+
+
+class AOVRecord(Record):
+    __slots__ = FIELDS = (
+        "name",
+        "type",
+        "enabled",
+        "data_type",
+        "filter",
+        "output_path",
+        "file_pattern",
+    )
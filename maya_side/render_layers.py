@@ -0,0 +1,238 @@
+import maya.cmds as cmds
+from typing import Dict, List, Any, Optional
+
+from attr_cache import AttributeCache
+from sequence_index import MASTER_LAYER
+
+
+DEFAULT_LAYER = "defaultRenderLayer"
+
+
+class RenderLayerResolver:
+    """Resolve per-layer attribute overrides without switching render layers
+
+    Switching the visible layer makes Maya apply and unapply every override
+    and re-evaluate the scene, so instead the overrides are read straight from
+    the render setup model (or the legacy layer's adjustments array) once per
+    layer and cached. Values of attributes a layer does not override fall back
+    to the master layer value, which is cached too.
+
+    When a layer other than the master is visible, the scene holds that
+    layer's values; the master values it replaced are then taken from the
+    original value render setup keeps on each applied override, or from the
+    defaultRenderLayer adjustments Maya keeps while a legacy layer is active.
+    """
+
+    def __init__(self, attr_cache: Optional[AttributeCache] = None):
+        self.attrs = attr_cache or AttributeCache()
+        self._overrides: Dict[str, Dict[str, Any]] = {}
+        self._base_values: Dict[str, Any] = {}
+        self._render_setup_layers = None
+        self.visible_layer = cmds.editRenderLayerGlobals(
+            query=True, currentRenderLayer=True
+        )
+        if self.visible_layer != DEFAULT_LAYER:
+            self._base_values.update(self._read_legacy_adjustments(DEFAULT_LAYER))
+            setup_layers = self._get_render_setup_layers()
+            if self.visible_layer in setup_layers:
+                self._base_values.update(
+                    self._read_applied_originals(setup_layers[self.visible_layer])
+                )
+
+    def get_layers(self) -> List[Dict[str, Any]]:
+        """All render layers with their display name and renderable flag"""
+        layers = []
+        setup_layers = self._get_render_setup_layers()
+
+        for layer in cmds.ls(type="renderLayer") or []:
+            if cmds.referenceQuery(layer, isNodeReferenced=True):
+                continue
+
+            if layer == DEFAULT_LAYER:
+                name = MASTER_LAYER
+            elif layer in setup_layers:
+                name = setup_layers[layer].name()
+            else:
+                name = layer
+
+            layers.append(
+                {
+                    "name": name,
+                    "node": layer,
+                    "renderable": bool(self.attrs.get(layer, "renderable")),
+                    "render_setup": layer in setup_layers,
+                }
+            )
+
+        return layers
+
+    def resolve(self, layer: str, plug: str, default: Any = None) -> Any:
+        """Value of a plug as the given layer would render it"""
+        if layer == self.visible_layer and layer != DEFAULT_LAYER:
+            # The visible layer's overrides are already applied in the scene
+            return self._read_plug(plug, default)
+
+        overrides = self.get_overrides(layer)
+        if plug in overrides:
+            return overrides[plug]
+
+        if plug not in self._base_values:
+            self._base_values[plug] = self._read_plug(plug, default)
+
+        return self._base_values[plug]
+
+    def _read_plug(self, plug: str, default: Any = None) -> Any:
+        value = self.attrs.get_plugs([plug], default)[plug]
+        if isinstance(value, list) and len(value) == 1:
+            value = list(value[0])
+        return value
+
+    def get_overrides(self, layer: str) -> Dict[str, Any]:
+        """All plugs a layer overrides, as {"node.longAttr": value}"""
+        if layer == DEFAULT_LAYER:
+            return {}
+
+        if layer not in self._overrides:
+            setup_layers = self._get_render_setup_layers()
+            if layer in setup_layers:
+                overrides = self._read_render_setup_overrides(setup_layers[layer])
+            else:
+                overrides = self._read_legacy_adjustments(layer)
+            self._overrides[layer] = overrides
+
+        return self._overrides[layer]
+
+    def _get_render_setup_layers(self) -> Dict[str, Any]:
+        """Legacy renderLayer node -> render setup layer model object"""
+        if self._render_setup_layers is None:
+            self._render_setup_layers = {}
+            try:
+                import maya.app.renderSetup.model.renderSetup as renderSetup
+
+                for setup_layer in renderSetup.instance().getRenderLayers():
+                    legacy = self._legacy_layer_node(setup_layer)
+                    self._render_setup_layers[legacy] = setup_layer
+            except Exception as e:
+                print(f"Warning: Render setup not available: {e}")
+
+        return self._render_setup_layers
+
+    def _legacy_layer_node(self, setup_layer) -> str:
+        """renderLayer node a render setup layer drives ("wide" -> "rs_wide")"""
+        name = setup_layer.name()
+        try:
+            legacy = cmds.listConnections(
+                f"{name}.legacyRenderLayer", source=True, destination=False
+            )
+        except Exception:
+            legacy = None
+        return legacy[0] if legacy else f"rs_{name}"
+
+    def _read_render_setup_overrides(self, setup_layer) -> Dict[str, Any]:
+        """Values of a render setup layer's enabled overrides"""
+        overrides = {}
+        for override, plug in self._iter_render_setup_overrides(setup_layer):
+            value = self._override_value(override, plug)
+            if value is not None:
+                overrides[plug] = value
+        return overrides
+
+    def _read_applied_originals(self, setup_layer) -> Dict[str, Any]:
+        """Master values of the plugs the visible render setup layer overrides
+
+        Each applied override node keeps the value it replaced in .original;
+        with several overrides on one plug the first in the chain holds the
+        value from before the layer was made visible.
+        """
+        originals = {}
+        for _, plug in self._iter_render_setup_overrides(setup_layer):
+            if plug in originals:
+                continue
+            node = None
+            sources = cmds.listConnections(
+                plug, source=True, destination=False, plugs=True
+            )
+            while sources:
+                candidate = sources[0].split(".", 1)[0]
+                if not cmds.attributeQuery("original", node=candidate, exists=True):
+                    break
+                node = candidate
+                sources = cmds.listConnections(
+                    f"{node}.original", source=True, destination=False, plugs=True
+                )
+            if node is not None:
+                originals[plug] = self._read_plug(f"{node}.original")
+        return originals
+
+    def _iter_render_setup_overrides(self, setup_layer):
+        """Walk a render setup layer's collections for (override, plug) pairs"""
+        collections = list(setup_layer.getCollections())
+
+        while collections:
+            collection = collections.pop(0)
+            if not collection.isEnabled():
+                continue
+
+            try:
+                nodes = collection.getSelector().getAbsoluteNames()
+            except Exception:
+                nodes = []
+
+            for child in collection.getChildren():
+                if hasattr(child, "getSelector"):
+                    collections.append(child)
+                    continue
+                if not hasattr(child, "attributeName") or not child.isEnabled():
+                    continue
+
+                for node in nodes:
+                    plug = self._long_plug(node, child.attributeName())
+                    if plug is not None:
+                        yield child, plug
+
+    def _override_value(self, override, plug: str) -> Any:
+        """Absolute overrides store the value; relative ones scale the base"""
+        node = override.name()
+        try:
+            if cmds.attributeQuery("attrValue", node=node, exists=True):
+                return self._read_plug(f"{node}.attrValue")
+
+            base = self.resolve(DEFAULT_LAYER, plug)
+            multiply = cmds.getAttr(f"{node}.multiply")
+            offset = cmds.getAttr(f"{node}.offset")
+            if isinstance(base, list):
+                multiply, offset = multiply[0], offset[0]
+                return [b * m + o for b, m, o in zip(base, multiply, offset)]
+            return base * multiply + offset
+        except Exception:
+            return None
+
+    def _read_legacy_adjustments(self, layer: str) -> Dict[str, Any]:
+        """Read a legacy layer's adjustments[] (plug connection + stored value)"""
+        overrides = {}
+        indices = cmds.getAttr(f"{layer}.adjustments", multiIndices=True) or []
+
+        for index in indices:
+            entry = f"{layer}.adjustments[{index}]"
+            sources = cmds.listConnections(
+                f"{entry}.plug", source=True, destination=False, plugs=True
+            )
+            if not sources:
+                continue
+
+            node, attr = sources[0].split(".", 1)
+            plug = self._long_plug(node, attr)
+            if plug is None:
+                continue
+
+            overrides[plug] = self._read_plug(f"{entry}.value")
+
+        return overrides
+
+    def _long_plug(self, node: str, attr: str) -> Optional[str]:
+        """Normalize short attribute names so lookups match ("w" -> "width")"""
+        try:
+            long_name = cmds.attributeQuery(attr, node=node, longName=True)
+        except Exception:
+            return None
+        return f"{node}.{long_name}"
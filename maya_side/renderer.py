@@ -1,8 +1,13 @@
 import maya.cmds as cmds
 import maya.mel as mel
 from pathlib import Path
+from typing import Dict, List, Any, Iterator, Optional
 import os
 
+from checkpoint import Checkpoint
+from progress import ProgressReporter
+from sequence_index import frame_path
+
 
 class SceneRenderer:
     def __init__(self):
@@ -34,6 +39,79 @@ class SceneRenderer:
 
         return str(output_path)
 
+    def render_range(
+        self,
+        aov_name: str,
+        camera: str,
+        frames: List[int],
+        output_pattern: str,
+        checkpoint: Optional[Checkpoint] = None,
+        progress: Optional[ProgressReporter] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Render frames to a # padded pattern, yielding each frame's result
+
+        Results are {frame, path, status, bytes, errors} with status
+        rendered, resumed (journaled and still complete on disk) or failed.
+        Every verified frame is journaled in the checkpoint; a failed frame
+        is not, so a resume renders it again. A cancel stops after the
+        current frame.
+        """
+        progress = progress or ProgressReporter()
+        if checkpoint:
+            resumed = checkpoint.begin(aov=aov_name, camera=camera, frames=list(frames))
+            if resumed:
+                print(f"✓ Resuming render: {resumed}/{len(frames)} frames journaled")
+                progress.emit("resume", phase="render", done=resumed, total=len(frames))
+
+        with progress.phase("render", total=len(frames)):
+            for frame in frames:
+                progress.check_cancel()
+                path = frame_path(output_pattern, frame)
+                status = "rendered"
+
+                check = None
+                if checkpoint and checkpoint.done(frame):
+                    check = self.verify_output(path)
+                    if check["valid"]:
+                        status = "resumed"
+                    else:
+                        print(f"Warning: Re-rendering frame {frame}: {check['errors']}")
+                        checkpoint.discard(frame)
+
+                if status == "rendered":
+                    path = self.render_pass(aov_name, camera, frame, path)
+                    check = self.verify_output(path)
+                    if not check["valid"]:
+                        status = "failed"
+                    elif checkpoint:
+                        checkpoint.record(frame, path=path)
+
+                result = {
+                    "frame": frame,
+                    "path": path,
+                    "status": status,
+                    "bytes": Path(path).stat().st_size if check["valid"] else 0,
+                    "errors": check["errors"],
+                }
+                progress.advance("render", item=str(frame))
+                yield result
+
+    def verify_output(self, output_path: str) -> dict:
+        """Check that a rendered frame was written completely"""
+        output_path = Path(output_path)
+
+        if output_path.suffix.lower() == ".exr":
+            from exr_inspector import EXRInspector
+
+            return EXRInspector().validate(output_path)
+
+        errors = []
+        if not output_path.exists():
+            errors.append("File does not exist")
+        elif output_path.stat().st_size == 0:
+            errors.append("File is empty")
+        return {"path": str(output_path), "valid": not errors, "errors": errors}
+
     def _get_renderer(self):
         return cmds.getAttr("defaultRenderGlobals.currentRenderer")
 
@@ -1,7 +1,100 @@
 import sys
 import argparse
+import json
 from pathlib import Path
 import traceback
+from contextlib import nullcontext
+from typing import Optional
+
+from checkpoint import Checkpoint, journal_path, scene_stamp
+from progress import CANCELLED_EXIT_CODE, Cancelled, ProgressReporter
+from startup import StartupProfile, format_report
+
+
+def write_outputs(
+    args,
+    scene_data: dict,
+    output_path: Path,
+    workspace_root: str,
+    progress: Optional[ProgressReporter] = None,
+) -> None:
+    """Write the export and everything derived from it (JSX, manifest)"""
+    progress = progress or ProgressReporter()
+    if args.dry_run:
+        print("\n✓ Dry run complete - scene is valid")
+    else:
+        from serializer import SceneSerializer
+
+        serializer = SceneSerializer()
+        write_stats = serializer.write(
+            scene_data, output_path, intern=args.intern, layout=args.layout
+        )
+        print(f"✓ Export complete: {output_path}")
+        progress.emit(
+            "output",
+            kind="export",
+            path=str(output_path),
+            bytes=output_path.stat().st_size,
+        )
+        if args.intern:
+            print(
+                f"  {write_stats['strings']} shared strings, "
+                f"{write_stats['property_blocks']} property blocks"
+            )
+
+        size_kb = output_path.stat().st_size / 1024
+        print(f"File size: {size_kb:.2f} KB")
+
+        if not args.no_validate:
+            from schema_validator import SchemaValidator
+
+            errors = SchemaValidator().validate_file(str(output_path))
+            if errors:
+                print(f"✗ Schema: {len(errors)} errors")
+                for error in errors[:10]:
+                    print(f"  {error}")
+            else:
+                print("✓ Schema valid")
+
+        if args.jsx:
+            from jsx_writer import JSXWriter
+
+            stats = JSXWriter().write(scene_data, Path(args.jsx))
+            print(f"✓ JSX written: {args.jsx}")
+            progress.emit(
+                "output", kind="jsx", path=args.jsx, bytes=stats["script_bytes"]
+            )
+            print(
+                f"  {stats['script_bytes'] / 1024:.2f} KB, "
+                f"{stats['layers']} layers, {stats['keyframes']} keys in "
+                f"{stats['set_values_calls']} setValuesAtTimes calls, "
+                f"{stats['footage_items']} footage items"
+            )
+
+        if args.texture_manifest:
+            from texture_manifest import CACHE_FILE_NAME, TextureManifest
+
+            manifest_path = Path(args.texture_manifest)
+            manifest = TextureManifest(
+                workspace_root,
+                str(manifest_path.parent / CACHE_FILE_NAME),
+            ).build(scene_data.get("textures", []))
+            with open(manifest_path, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=2)
+
+            print(f"✓ Texture manifest written: {manifest_path}")
+            progress.emit(
+                "output",
+                kind="texture_manifest",
+                path=str(manifest_path),
+                bytes=manifest_path.stat().st_size,
+            )
+            print(
+                f"  {manifest['files']} files, "
+                f"{manifest['total_bytes'] / 2**20:.1f} MB, "
+                f"{manifest['hashed']} hashed, {manifest['cached']} cached, "
+                f"{len(manifest['missing'])} missing"
+            )
 
 
 def main():
@@ -12,6 +105,19 @@ def main():
     parser.add_argument(
         "--frame", "-f", type=float, help="Frame number (default: current)"
     )
+    parser.add_argument(
+        "--frame-range",
+        type=int,
+        nargs=2,
+        metavar=("START", "END"),
+        help="Render these frames to an --output pattern with # padding",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted bake or frame-range render from its "
+        "checkpoint",
+    )
     parser.add_argument(
         "--dry-run", action="store_true", help="Validate without exporting"
     )
@@ -21,6 +127,143 @@ def main():
         "--no-materials", action="store_true", help="Skip material extraction"
     )
 
+    parser.add_argument(
+        "--bake", action="store_true", help="Bake camera/light animation"
+    )
+
+    parser.add_argument(
+        "--selection",
+        action="store_true",
+        help="Export only the selection saved with the scene",
+    )
+    parser.add_argument(
+        "--set", type=str, action="append", help="Export only this object set's members"
+    )
+    parser.add_argument(
+        "--namespace", type=str, action="append", help="Export only this namespace"
+    )
+    parser.add_argument(
+        "--display-layer",
+        type=str,
+        action="append",
+        help="Export only this display layer's members",
+    )
+    parser.add_argument(
+        "--match", type=str, help="Export only transforms whose full path matches"
+    )
+    parser.add_argument(
+        "--cull",
+        choices=["drop", "flag"],
+        help="Drop or flag meshes outside the render camera's view over the range",
+    )
+    parser.add_argument(
+        "--cull-margin",
+        type=float,
+        default=0.05,
+        help="Widen the camera frustum by this fraction when culling (default: 0.05)",
+    )
+    parser.add_argument(
+        "--cull-step",
+        type=int,
+        default=1,
+        help="Test the camera every N frames when culling (default: 1)",
+    )
+    parser.add_argument(
+        "--track",
+        type=str,
+        action="append",
+        help="Bake screen-space tracks of this object or set (repeatable)",
+    )
+    parser.add_argument(
+        "--track-camera",
+        type=str,
+        help="Camera the tracks are projected through (default: render camera)",
+    )
+    parser.add_argument(
+        "--glb",
+        type=str,
+        help="Also write mesh geometry to this binary glTF file (with --shots: "
+        "one <shot>.glb per shot)",
+    )
+    parser.add_argument(
+        "--glb-quantize",
+        action="store_true",
+        help="Store .glb positions, normals and UVs as quantized integers",
+    )
+    parser.add_argument(
+        "--jsx", type=str, help="Also write an After Effects .jsx import script"
+    )
+    parser.add_argument(
+        "--intern",
+        action="store_true",
+        help="Store repeated strings and material properties once in tables",
+    )
+    parser.add_argument(
+        "--layout",
+        choices=["rows", "columnar"],
+        default="rows",
+        help="Write meshes and lights as rows or as one array per field",
+    )
+    parser.add_argument(
+        "--no-validate",
+        action="store_true",
+        help="Skip the full schema check of the written export",
+    )
+    parser.add_argument(
+        "--startup-profile",
+        action="store_true",
+        help="Skip autoloaded plugins and user prefs; load only what the scene "
+        "and the requested sections need",
+    )
+    parser.add_argument(
+        "--plugin",
+        type=str,
+        action="append",
+        help="Also load this plugin with --startup-profile (repeatable)",
+    )
+    parser.add_argument(
+        "--progress",
+        type=str,
+        help="Write JSON-lines progress events to this file ('-' for stderr)",
+    )
+    parser.add_argument(
+        "--cancel-file",
+        type=str,
+        help="Stop cleanly after the current item once this file exists",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always open the scene instead of reusing a cached extraction",
+    )
+    parser.add_argument(
+        "--cache-dir", type=str, help="Extraction cache folder (default: data/cache)"
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=float,
+        default=2048,
+        help="Extraction cache size limit before LRU eviction (default: 2048)",
+    )
+    parser.add_argument(
+        "--texture-manifest",
+        type=str,
+        help="Also write a manifest of texture files (sizes, hashes, missing)",
+    )
+
+    parser.add_argument(
+        "--shots", action="store_true", help="Export one file per sequencer shot"
+    )
+    parser.add_argument(
+        "--shot", type=str, action="append", help="Export only this shot (repeatable)"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1, help="Worker processes for shot exports"
+    )
+    parser.add_argument(
+        "--render-jobs", action="store_true", help="Write a render job list per shot"
+    )
+
     parser.add_argument("--render", action="store_true", help="Enable Render Mode")
     parser.add_argument(
         "--aov", type=str, help="Specific AOV to render (required for --render)"
@@ -28,29 +271,154 @@ def main():
     parser.add_argument(
         "--camera", type=str, default="persp", help="Camera to render from"
     )
+    parser.add_argument(
+        "--proxy",
+        choices=["half", "quarter"],
+        help="Also write a downsampled PNG proxy of the rendered frame",
+    )
 
     args = parser.parse_args()
 
+    progress = ProgressReporter.open(args.progress, args.cancel_file)
+    if args.progress or args.cancel_file:
+        progress.install_signal_handlers()
+    if args.render:
+        mode = "render"
+    elif args.shots or args.shot:
+        mode = "shots"
+    else:
+        mode = "extract"
+    progress.emit("run_start", mode=mode, scene=args.scene_file)
+
+    status = "error"
+    try:
+        run(args, progress)
+        status = "ok"
+    except Cancelled as e:
+        status = "cancelled"
+        print(f"CANCELLED: {e}")
+        sys.exit(CANCELLED_EXIT_CODE)
+    except SystemExit as e:
+        status = "ok" if not e.code else "error"
+        raise
+    finally:
+        progress.emit("run_end", status=status)
+        progress.close()
+
+
+def run(args, progress: ProgressReporter) -> None:
+    """Export, render or export shots as the parsed arguments ask"""
     scene_path = Path(args.scene_file)
     if not scene_path.exists():
         print(f"ERROR: Scene file not found: {scene_path}")
         sys.exit(1)
 
+    extracting = not (args.render or args.shots or args.shot)
+    if args.render:
+        sections = ["render"]
+    else:
+        sections = [
+            section
+            for section, wanted in [
+                ("aovs", not args.no_aovs),
+                ("materials", not args.no_materials),
+            ]
+            if wanted
+        ]
+    startup_options = {
+        "sections": sections,
+        "plugins": args.plugin,
+        "controlled": args.startup_profile,
+    }
+    startup = StartupProfile(scene_path, **startup_options)
+    scope_options = {
+        "selection": args.selection,
+        "sets": args.set or [],
+        "namespaces": args.namespace or [],
+        "display_layers": args.display_layer or [],
+        "pattern": args.match,
+    }
+    cull_options = None
+    if args.cull:
+        cull_options = {
+            "mode": args.cull,
+            "margin": args.cull_margin,
+            "step": args.cull_step,
+        }
+    track_options = None
+    if args.track:
+        track_options = {"nodes": args.track, "camera": args.track_camera}
+    glb_options = None
+    if args.glb:
+        glb_options = {"path": args.glb, "quantize": args.glb_quantize}
+    if extracting and args.output:
+        output_path = Path(args.output)
+    elif extracting:
+        output_dir = Path(__file__).parent.parent / "data" / "exports"
+        output_dir.mkdir(parents=True, exist_ok=True)
+        output_path = output_dir / "output.json"
+
+    cache = None
+    if extracting and not args.no_cache:
+        from extraction_cache import ExtractionCache
+
+        cache = ExtractionCache(
+            args.cache_dir, max_bytes=int(args.cache_max_mb * 2**20)
+        )
+        cache_key = cache.key(
+            str(scene_path),
+            {
+                "frame": args.frame,
+                "include_aovs": not args.no_aovs,
+                "include_materials": not args.no_materials,
+                "bake_animation": args.bake,
+                "scope": scope_options,
+                "cull": cull_options,
+                "track": track_options,
+                "glb": glb_options,
+            },
+        )
+        cached = cache.get(cache_key)
+        if cached and args.glb and not Path(args.glb).exists():
+            # The cached export points into a .glb that is gone: rebuild both
+            cached = None
+        if cached:
+            # Same scene content and options: no need to start Maya at all
+            print(f"✓ Extraction cache hit: {cache_key}")
+            progress.emit("cache_hit", key=cache_key)
+            scene_data = cached["scene_data"]
+            print(f"✓ Extracted: {len(scene_data.get('meshes', []))} meshes")
+            write_outputs(
+                args,
+                scene_data,
+                output_path,
+                cached["meta"].get("workspace_root", ""),
+                progress,
+            )
+            return
+
     try:
+        with progress.phase("maya_startup"):
+            startup.start()
         import maya.standalone
-
-        maya.standalone.initialize()
         import maya.cmds as cmds
         import maya.mel as mel
 
         print("✓ Maya standalone initialized")
     except Exception as e:
         print(f"ERROR: Failed to initialize Maya standalone: {e}")
+        progress.emit("error", message=str(e), type=type(e).__name__)
+        startup.close()
         sys.exit(1)
 
     try:
         print(f"Opening scene: {scene_path}")
-        cmds.file(str(scene_path), open=True, force=True)
+        with progress.phase("scene_open"):
+            startup.open_scene()
+        report = startup.report()
+        progress.emit("startup", **report)
+        for line in format_report(report):
+            print(line)
 
         if args.frame is not None:
             cmds.currentTime(args.frame)
@@ -73,59 +441,235 @@ def main():
                 )
                 sys.exit(1)
 
-            if args.output:
-                output_path = args.output
+            temp_dir = Path(__file__).parent.parent / "data" / "temp_render"
+            checkpoint = None
+            if args.frame_range:
+                start_frame, end_frame = args.frame_range
+                frames = list(range(start_frame, end_frame + 1))
+                output_pattern = args.output or str(temp_dir / f"{args.aov}.####.exr")
+                if "#" not in Path(output_pattern).name:
+                    print("ERROR: --output needs a # frame token with --frame-range")
+                    sys.exit(1)
+                checkpoint = Checkpoint(
+                    journal_path(output_pattern),
+                    {"kind": "render", "scene": scene_stamp(str(scene_path))},
+                    resume=args.resume,
+                )
             else:
-                temp_dir = Path(__file__).parent.parent / "data" / "temp_render"
-                output_path = temp_dir / f"{args.aov}.{int(args.frame):04d}.exr"
+                frames = [args.frame]
+                output_pattern = args.output or str(
+                    temp_dir / f"{args.aov}.{int(args.frame):04d}.exr"
+                )
 
             r = SceneRenderer()
-            final_path = r.render_pass(
-                aov_name=args.aov,
-                camera=args.camera,
-                frame=args.frame,
-                output_path=str(output_path),
-            )
+            failed = 0
+            with checkpoint or nullcontext():
+                for result in r.render_range(
+                    aov_name=args.aov,
+                    camera=args.camera,
+                    frames=frames,
+                    output_pattern=output_pattern,
+                    checkpoint=checkpoint,
+                    progress=progress,
+                ):
+                    final_path = result["path"]
+                    if result["status"] == "failed":
+                        failed += 1
+                        print(
+                            f"RENDER_FAILED:{final_path}:{'; '.join(result['errors'])}"
+                        )
+                        progress.emit(
+                            "error",
+                            message="Render failed",
+                            path=final_path,
+                            errors=result["errors"],
+                        )
+                        continue
 
-            print(f"RENDER_COMPLETE:{final_path}")
+                    print(f"RENDER_COMPLETE:{final_path}")
+                    progress.emit(
+                        "render_complete",
+                        aov=args.aov,
+                        frame=result["frame"],
+                        path=final_path,
+                        bytes=result["bytes"],
+                        resumed=result["status"] == "resumed",
+                    )
 
-        else:
-            print("--- STARTING METADATA EXTRACTION ---")
+                    if args.proxy and Path(final_path).suffix.lower() == ".exr":
+                        from proxy_generator import ProxyGenerator, proxy_path
 
-            from scene_reader import SceneReader
-            from serializer import SceneSerializer
+                        # A resumed frame's proxy is only redone if it is stale
+                        generator = ProxyGenerator(args.proxy)
+                        proxy = generator.make_proxy(
+                            final_path, force=result["status"] == "rendered"
+                        ) or proxy_path(
+                            Path(final_path), generator.label, generator.output_format
+                        )
+                        print(f"PROXY_COMPLETE:{proxy}")
+
+                if failed:
+                    sys.exit(1)
+                if checkpoint:
+                    checkpoint.finish()
+
+        elif args.shots or args.shot:
+            print("--- STARTING SHOT EXPORT ---")
+
+            from shot_manager import ShotManager, export_shots
 
             if args.output:
-                output_path = Path(args.output)
+                output_dir = Path(args.output)
             else:
-                output_dir = Path(__file__).parent.parent / "data" / "exports"
-                output_dir.mkdir(parents=True, exist_ok=True)
-                output_path = output_dir / "output.json"
+                output_dir = (
+                    Path(__file__).parent.parent / "data" / "exports" / scene_path.stem
+                )
 
-            reader = SceneReader()
-            scene_data = reader.extract_scene(
-                include_aovs=not args.no_aovs, include_materials=not args.no_materials
-            )
-
-            print(f"✓ Extracted: {len(scene_data.get('meshes', []))} meshes")
+            shots = ShotManager().get_shots(names=args.shot)
+            print(f"✓ Found {len(shots)} shots")
 
             if args.dry_run:
+                for shot in shots:
+                    print(
+                        f"  {shot['shot_name']}: {shot['camera']} "
+                        f"[{shot['start_frame']}-{shot['end_frame']}]"
+                    )
                 print("\n✓ Dry run complete - scene is valid")
             else:
-                serializer = SceneSerializer()
-                serializer.write(scene_data, output_path)
-                print(f"✓ Export complete: {output_path}")
+                options = {
+                    "include_aovs": not args.no_aovs,
+                    "include_materials": not args.no_materials,
+                    "bake_animation": args.bake,
+                    "render_jobs": args.render_jobs,
+                    "scope": scope_options,
+                    "cull": cull_options,
+                    "track": track_options,
+                    "glb": glb_options,
+                    "resume": args.resume,
+                }
+                results = export_shots(
+                    scene_path,
+                    shots,
+                    output_dir,
+                    options,
+                    workers=args.workers,
+                    startup=startup_options,
+                    progress=progress,
+                )
+                failed = [r for r in results if "error" in r]
+                print(
+                    f"✓ Exported {len(results) - len(failed)}/{len(results)} shots "
+                    f"to {output_dir}"
+                )
+                if failed:
+                    sys.exit(1)
+
+        else:
+            print("--- STARTING METADATA EXTRACTION ---")
+
+            from attr_cache import AttributeCache
+            from export_scope import ExportScope
+            from scene_reader import SceneReader
+
+            attrs = AttributeCache()
+            reader = SceneReader(attrs, progress=progress)
+            culler, tracker, exporter = None, None, None
+            if cull_options:
+                from frustum_culler import FrustumCuller
+
+                culler = FrustumCuller(attrs, **cull_options)
+            if track_options:
+                from screen_tracks import ScreenTracker
+
+                tracker = ScreenTracker(attrs, **track_options)
+            if glb_options:
+                from geometry_exporter import GeometryExporter
+
+                exporter = GeometryExporter(**glb_options)
+            checkpoint = None
+            if args.bake:
+                checkpoint = Checkpoint(
+                    journal_path(str(output_path)),
+                    {"kind": "bake", "scene": scene_stamp(str(scene_path))},
+                    resume=args.resume,
+                )
+
+            with attrs, checkpoint or nullcontext():
+                scene_data = reader.extract_scene(
+                    include_aovs=not args.no_aovs,
+                    include_materials=not args.no_materials,
+                    bake_animation=args.bake,
+                    scope=ExportScope(**scope_options),
+                    culler=culler,
+                    tracker=tracker,
+                    geometry=exporter,
+                    checkpoint=checkpoint,
+                )
+
+            print(f"✓ Extracted: {len(scene_data.get('meshes', []))} meshes")
+            culling = scene_data["scene_info"].get("culling")
+            if culling:
+                print(
+                    f"✓ Frustum culling ({culling['mode']}): {culling['culled']}/"
+                    f"{culling['meshes']} meshes, {culling['culled_instances']} "
+                    f"instances culled over {culling['frames']} frames in "
+                    f"{culling['seconds'] * 1000:.1f} ms"
+                )
+            geometry = scene_data["scene_info"].get("geometry")
+            if geometry:
+                print(
+                    f"✓ glTF geometry: {geometry['path']} ({geometry['meshes']} "
+                    f"meshes, {geometry['nodes']} nodes, {geometry['triangles']} "
+                    f"triangles, {geometry['bytes'] / 2**20:.1f} MB) in "
+                    f"{geometry['seconds']:.2f} s"
+                )
+            screen_tracks = scene_data.get("screen_tracks")
+            if screen_tracks:
+                print(
+                    f"✓ Screen tracks: {len(screen_tracks['tracks'])} objects over "
+                    f"{len(screen_tracks['frames'])} frames through "
+                    f"{screen_tracks['camera']}"
+                )
+            attr_stats = attrs.stats()
+            print(
+                f"✓ Attribute cache: {attr_stats['hits']} hits, "
+                f"{attr_stats['misses']} reads ({attr_stats['hit_rate']:.0%} hit rate)"
+            )
+
+            workspace_root = cmds.workspace(query=True, rootDirectory=True)
+            if cache:
+                from extraction_cache import texture_files
+
+                # References and textures are not in the key: record them so
+                # the entry goes stale when one of them is edited
+                dependencies = cmds.file(
+                    query=True, list=True, withoutCopyNumber=True
+                ) or []
+                dependencies += texture_files(
+                    scene_data.get("textures", []), workspace_root
+                )
+                cache.put(
+                    cache_key,
+                    scene_data,
+                    dependencies=dependencies,
+                    workspace_root=workspace_root,
+                )
 
-                size_kb = output_path.stat().st_size / 1024
-                print(f"File size: {size_kb:.2f} KB")
+            write_outputs(args, scene_data, output_path, workspace_root, progress)
+            if checkpoint:
+                checkpoint.finish()
 
+    except Cancelled:
+        raise
     except Exception as e:
+        progress.emit("error", message=str(e), type=type(e).__name__)
         print(f"\nCRITICAL ERROR: {e}")
         traceback.print_exc()
         sys.exit(1)
 
     finally:
         maya.standalone.uninitialize()
+        startup.close()
         print("\n✓ Maya standalone shut down")
 
 
@@ -1,17 +1,77 @@
 import maya.cmds as cmds
-from typing import Dict, List, Any
+from typing import TYPE_CHECKING, Dict, List, Any, Optional
+
+from attr_cache import AttributeCache
+from checkpoint import Checkpoint
+from dag_table import DagTable
+from export_scope import ExportScope
+from progress import ProgressReporter
+from records import CameraRecord, GeometryRecord, MeshRecord
+
+if TYPE_CHECKING:
+    # NumPy-backed helpers, imported by callers only when they are used
+    from frustum_culler import FrustumCuller
+    from geometry_exporter import GeometryExporter
+    from screen_tracks import ScreenTracker
+
+
+CAMERA_ATTRS = [
+    "focalLength",
+    "horizontalFilmAperture",
+    "verticalFilmAperture",
+    "nearClipPlane",
+    "farClipPlane",
+    "renderable",
+]
 
 
 class SceneReader:
     """Extract scene data from the current Maya scene"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        attr_cache: Optional[AttributeCache] = None,
+        progress: Optional[ProgressReporter] = None,
+    ):
         self.scene_data = {}
+        self.attrs = attr_cache or AttributeCache()
+        self.progress = progress or ProgressReporter()
+        self.dag = None
 
     def extract_scene(
-        self, include_aovs: bool = True, include_materials: bool = True
+        self,
+        include_aovs: bool = True,
+        include_materials: bool = True,
+        bake_animation: bool = False,
+        shot: Optional[Dict[str, Any]] = None,
+        scope: Optional[ExportScope] = None,
+        culler: Optional["FrustumCuller"] = None,
+        tracker: Optional["ScreenTracker"] = None,
+        geometry: Optional["GeometryExporter"] = None,
+        checkpoint: Optional[Checkpoint] = None,
     ) -> Dict[str, Any]:
-        """Extract all relevant scene data"""
+        """Extract all relevant scene data, optionally scoped to one sequencer shot
+
+        With an active scope only the scoped part of the DAG is listed and
+        only the materials assigned to the scoped meshes are extracted. A
+        culler drops or flags the meshes the render camera never sees over
+        the (shot's) frame range, a tracker adds the screen-space tracks of
+        its objects and a geometry exporter writes the remaining meshes to a
+        .glb file.
+
+        Each step is reported as a phase of the progress reporter, with
+        per-item counts for meshes, materials, baked frames and .glb
+        meshes; a requested cancel stops the extraction after the current
+        item by raising progress.Cancelled.
+
+        With a checkpoint each baked frame is journaled; when resuming, the
+        frames already in the journal are taken from it instead of being
+        sampled again.
+        """
+        scoped = scope is not None and scope.active
+        roots = scope.roots() if scoped else None
+        with self.progress.phase("dag"):
+            self.dag = DagTable(self.attrs, roots)
         self.scene_data = {
             "schema_version": "0.2.0",  # Updated version
             "scene_info": self._get_scene_info(),
@@ -20,20 +80,80 @@ class SceneReader:
             "lights": self._get_lights(),
         }
 
+        if scoped:
+            self.scene_data["scene_info"]["scope"] = dict(
+                scope.to_dict(), roots=len(roots)
+            )
+
+        if shot:
+            self._apply_shot(shot)
+
+        if bake_animation:
+            self._bake_animation(
+                self.scene_data["cameras"],
+                self.scene_data["lights"],
+                self.scene_data["scene_info"]["frame_range"],
+                checkpoint,
+            )
+
+        if culler:
+            with self.progress.phase("culling"):
+                self.scene_data["scene_info"]["culling"] = culler.cull(
+                    self.scene_data["meshes"],
+                    self.scene_data["cameras"],
+                    self.scene_data["scene_info"]["frame_range"],
+                )
+
+        if geometry:
+            self.scene_data["scene_info"]["geometry"] = geometry.export(
+                self.scene_data["meshes"], self.progress
+            )
+
+        if tracker:
+            with self.progress.phase("screen_tracks"):
+                screen_tracks = tracker.track(
+                    self.scene_data["cameras"],
+                    self.scene_data["scene_info"]["frame_range"],
+                )
+            if screen_tracks:
+                self.scene_data["screen_tracks"] = screen_tracks
+
         if include_aovs:
             from aov_manager import AOVManager
 
-            aov_manager = AOVManager()
-            self.scene_data["render_passes"] = aov_manager.get_all_aovs()
+            self.progress.check_cancel()
+            with self.progress.phase("aovs"):
+                aov_manager = AOVManager(self.attrs)
+                self.scene_data["render_passes"] = aov_manager.get_all_aovs()
+
+            if shot:
+                render_settings = self.scene_data["render_passes"]["render_settings"]
+                render_settings["start_frame"] = shot["start_frame"]
+                render_settings["end_frame"] = shot["end_frame"]
 
         if include_materials:
             from material_manager import MaterialManager
 
-            material_manager = MaterialManager()
-            self.scene_data["materials"] = material_manager.get_all_materials()
+            material_manager = MaterialManager(self.attrs, progress=self.progress)
+            self.scene_data["materials"] = material_manager.get_all_materials(
+                self._scoped_shading_engines() if scoped else None
+            )
+            self.scene_data["textures"] = material_manager.textures
 
         return self.scene_data
 
+    def _scoped_shading_engines(self) -> List[str]:
+        """Shading engines assigned to the meshes in the DAG table"""
+        shapes = [
+            shape
+            for shape in self.dag.nodes_of_type(["mesh"])
+            if not self.dag.is_intermediate(shape)
+        ]
+        if not shapes:
+            return []
+        engines = cmds.listConnections(shapes, type="shadingEngine") or []
+        return list(dict.fromkeys(engines))
+
     def _get_scene_info(self) -> Dict[str, Any]:
         """Get basic scene metadata"""
         current_frame = cmds.currentTime(query=True)
@@ -51,6 +171,17 @@ class SceneReader:
             "angular_unit": cmds.currentUnit(query=True, angle=True),
         }
 
+    def _apply_shot(self, shot: Dict[str, Any]) -> None:
+        """Narrow the frame range to a shot and flag the shot's camera"""
+        self.scene_data["scene_info"]["frame_range"] = [
+            shot["start_frame"],
+            shot["end_frame"],
+        ]
+        self.scene_data["shot"] = dict(shot)
+
+        for cam in self.scene_data["cameras"]:
+            cam["is_shot_camera"] = cam["name"] == shot.get("camera")
+
     def _get_fps(self) -> float:
         """Get frames per second from time unit"""
         time_unit = cmds.currentUnit(query=True, time=True)
@@ -68,26 +199,27 @@ class SceneReader:
         """Extract camera data"""
         cameras = []
 
-        cam_shapes = cmds.ls(type="camera") or []
+        cam_shapes = self.dag.nodes_of_type(["camera"])
+        values = self.attrs.get_plugs(
+            [f"{shape}.{attr}" for shape in cam_shapes for attr in CAMERA_ATTRS]
+        )
 
         for cam_shape in cam_shapes:
-            cam_transform = cmds.listRelatives(cam_shape, parent=True)[0]
-
-            cam_data = {
-                "name": cam_transform,
-                "shape_name": cam_shape,
-                "transform": self._get_transform_matrix(cam_transform),
-                "focal_length": cmds.getAttr(f"{cam_shape}.focalLength"),
-                "horizontal_film_aperture": cmds.getAttr(
+            cam_transform = self.dag.name(self.dag.parent(cam_shape))
+
+            cam_data = CameraRecord(
+                name=cam_transform,
+                shape_name=self.dag.name(cam_shape),
+                transform=self._get_transform_matrix(cam_transform),
+                focal_length=values[f"{cam_shape}.focalLength"],
+                horizontal_film_aperture=values[
                     f"{cam_shape}.horizontalFilmAperture"
-                ),
-                "vertical_film_aperture": cmds.getAttr(
-                    f"{cam_shape}.verticalFilmAperture"
-                ),
-                "near_clip": cmds.getAttr(f"{cam_shape}.nearClipPlane"),
-                "far_clip": cmds.getAttr(f"{cam_shape}.farClipPlane"),
-                "is_renderable": cmds.getAttr(f"{cam_shape}.renderable"),
-            }
+                ],
+                vertical_film_aperture=values[f"{cam_shape}.verticalFilmAperture"],
+                near_clip=values[f"{cam_shape}.nearClipPlane"],
+                far_clip=values[f"{cam_shape}.farClipPlane"],
+                is_renderable=values[f"{cam_shape}.renderable"],
+            )
             cameras.append(cam_data)
 
         return cameras
@@ -96,30 +228,50 @@ class SceneReader:
         """Extract mesh geometry and transforms"""
         meshes = []
 
-        mesh_shapes = cmds.ls(type="mesh", long=True) or []
+        mesh_shapes = [
+            shape
+            for shape in self.dag.nodes_of_type(["mesh"])
+            if not self.dag.is_intermediate(shape)
+        ]
 
-        for mesh_shape in mesh_shapes:
-            if cmds.getAttr(f"{mesh_shape}.intermediateObject"):
-                continue
+        with self.progress.phase("meshes", total=len(mesh_shapes)):
+            for mesh_shape in mesh_shapes:
+                self.progress.check_cancel()
+                meshes.append(self._get_mesh(mesh_shape))
+                self.progress.advance("meshes", item=meshes[-1]["name"])
 
-            mesh_transform = cmds.listRelatives(mesh_shape, parent=True, fullPath=True)[
-                0
-            ]
+        return meshes
 
-            material = self._get_mesh_material(mesh_shape)
+    def _get_mesh(self, mesh_shape: str) -> Dict[str, Any]:
+        """One mesh record, with the shape's other transforms as instances"""
+        transforms = self.dag.instance_parents(mesh_shape)
+        mesh_transform = transforms[0]
+
+        material = self._get_mesh_material(mesh_shape)
+
+        mesh_data = MeshRecord(
+            name=mesh_transform.split("|")[-1],
+            full_path=mesh_transform,
+            shape_name=mesh_shape.split("|")[-1],
+            transform=self._get_transform_matrix(mesh_transform),
+            geometry=self._get_mesh_geometry(mesh_shape),
+            material=material,
+            visible=self.dag.is_visible(mesh_transform),
+        )
 
-            mesh_data = {
-                "name": mesh_transform.split("|")[-1],
-                "full_path": mesh_transform,
-                "shape_name": mesh_shape.split("|")[-1],
-                "transform": self._get_transform_matrix(mesh_transform),
-                "geometry": self._get_mesh_geometry(mesh_shape),
-                "material": material,
-                "visible": cmds.getAttr(f"{mesh_transform}.visibility"),
-            }
-            meshes.append(mesh_data)
+        if len(transforms) > 1:
+            # Instanced shape: geometry is exported once, placed per transform
+            mesh_data["instances"] = [
+                {
+                    "name": transform.split("|")[-1],
+                    "full_path": transform,
+                    "transform": self._get_transform_matrix(transform),
+                    "visible": self.dag.is_visible(transform),
+                }
+                for transform in transforms[1:]
+            ]
 
-        return meshes
+        return mesh_data
 
     def _get_mesh_material(self, mesh_shape: str) -> str:
         """Get material name assigned to mesh"""
@@ -147,45 +299,98 @@ class SceneReader:
 
         uv_sets = cmds.polyUVSet(mesh_shape, query=True, allUVSets=True) or []
 
-        geometry = {
-            "vertex_count": num_vertices,
-            "face_count": num_faces,
-            "triangle_count": num_triangles,
-            "uv_sets": uv_sets,
-            "has_uvs": len(uv_sets) > 0,
-        }
+        geometry = GeometryRecord(
+            vertex_count=num_vertices,
+            face_count=num_faces,
+            triangle_count=num_triangles,
+            uv_sets=uv_sets,
+            has_uvs=len(uv_sets) > 0,
+        )
 
         return geometry
 
     def _get_lights(self) -> List[Dict[str, Any]]:
-        """Extract light data"""
-        lights = []
-
-        light_types = [
-            "pointLight",
-            "directionalLight",
-            "spotLight",
-            "areaLight",
-            "ambientLight",
-        ]
-
-        for light_type in light_types:
-            light_shapes = cmds.ls(type=light_type) or []
+        """Extract light data for every registered light type"""
+        from light_registry import LightExtractor
+
+        return LightExtractor(self.dag, self.attrs).get_lights()
+
+    def _bake_animation(
+        self,
+        cameras: List[Dict[str, Any]],
+        lights: List[Dict[str, Any]],
+        frame_range: List[float],
+        checkpoint: Optional[Checkpoint] = None,
+    ) -> None:
+        """Sample camera and light transforms over the frame range"""
+        start_frame, end_frame = int(frame_range[0]), int(frame_range[1])
+        frames = list(range(start_frame, end_frame + 1))
+        original_frame = cmds.currentTime(query=True)
+
+        for item in cameras + lights:
+            item["animation"] = {"frames": frames, "transforms": []}
+        for cam in cameras:
+            cam["animation"]["focal_length"] = []
+
+        if checkpoint:
+            resumed = checkpoint.begin(
+                frames=[start_frame, end_frame],
+                cameras=[cam["name"] for cam in cameras],
+                lights=[light["name"] for light in lights],
+            )
+            if resumed:
+                print(f"✓ Resuming bake: {resumed}/{len(frames)} frames journaled")
+                self.progress.emit(
+                    "resume", phase="bake", done=resumed, total=len(frames)
+                )
 
-            for light_shape in light_shapes:
-                light_transform = cmds.listRelatives(light_shape, parent=True)[0]
+        try:
+            with self.progress.phase("bake", total=len(frames)):
+                for frame in frames:
+                    samples = checkpoint.done(frame) if checkpoint else None
+                    if samples is None:
+                        samples = self._bake_frame(frame, cameras, lights)
+                        if checkpoint:
+                            checkpoint.record(frame, **samples)
+                    self._add_samples(samples, cameras, lights)
+                    self.progress.advance("bake", item=str(frame))
+        finally:
+            cmds.currentTime(original_frame, update=True)
+
+    def _bake_frame(
+        self,
+        frame: int,
+        cameras: List[Dict[str, Any]],
+        lights: List[Dict[str, Any]],
+    ) -> Dict[str, List[Any]]:
+        """One frame's camera [matrix, focal length] and light matrix samples"""
+        self.progress.check_cancel()
+        cmds.currentTime(frame, update=True)
 
-                light_data = {
-                    "name": light_transform,
-                    "type": light_type,
-                    "transform": self._get_transform_matrix(light_transform),
-                    "color": list(cmds.getAttr(f"{light_shape}.color")[0]),
-                    "intensity": cmds.getAttr(f"{light_shape}.intensity"),
-                    "enabled": not cmds.getAttr(f"{light_transform}.visibility") == 0,
-                }
-                lights.append(light_data)
+        return {
+            "cameras": [
+                [
+                    self._get_transform_matrix(cam["name"]),
+                    self.attrs.get(cam["shape_name"], "focalLength"),
+                ]
+                for cam in cameras
+            ],
+            "lights": [self._get_transform_matrix(light["name"]) for light in lights],
+        }
 
-        return lights
+    def _add_samples(
+        self,
+        samples: Dict[str, List[Any]],
+        cameras: List[Dict[str, Any]],
+        lights: List[Dict[str, Any]],
+    ) -> None:
+        """Append one frame's samples to the camera and light animation"""
+        for cam, (matrix, focal_length) in zip(cameras, samples["cameras"]):
+            cam["animation"]["transforms"].append(matrix)
+            cam["animation"]["focal_length"].append(focal_length)
+
+        for light, matrix in zip(lights, samples["lights"]):
+            light["animation"]["transforms"].append(matrix)
 
     def _get_transform_matrix(self, node: str) -> List[float]:
         """Get world space transform matrix as flat list of 16 floats"""
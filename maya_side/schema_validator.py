@@ -0,0 +1,674 @@
+import argparse
+import os
+import sys
+import time
+from typing import Dict, List, Any, Callable, Optional, Tuple
+
+from json_stream import JsonStream
+
+
+# Schema of docs/json_format.md in a small spec language:
+#   "string", "number", "int", "bool", "matrix", "object", "any"
+#   ("list", spec)        list of spec
+#   ("numbers", n)        list of numbers (n of them unless n is None)
+#   ("map", spec)         object with spec values
+#   ("interned", spec)    spec, or a table index in interned exports
+#   ("rows", spec)        list of spec, or the columnar layout of that list
+#   ("nullable", spec)    spec or null
+#   ("either", (a, b))    spec a or spec b
+#   {"required": {...}, "optional": {...}}  object; other keys are allowed
+INTERNED_STRING = ("interned", "string")
+
+ANIMATION_SCHEMA = {
+    "required": {
+        "frames": ("numbers", None),
+        "transforms": ("list", "matrix"),
+    },
+    "optional": {"focal_length": ("numbers", None)},
+}
+
+SCENE_INFO_SCHEMA = {
+    "required": {
+        "frame_range": ("numbers", 2),
+        "fps": "number",
+    },
+    "optional": {
+        "current_frame": "number",
+        "scene_file": "string",
+        "up_axis": "string",
+        "linear_unit": "string",
+        "angular_unit": "string",
+        "culling": "object",
+        "geometry": "object",
+    },
+}
+
+SHOT_SCHEMA = {
+    "required": {
+        "name": "string",
+        "camera": "string",
+        "start_frame": "number",
+        "end_frame": "number",
+    },
+    "optional": {
+        "shot_name": "string",
+        "sequence_start_frame": "number",
+        "sequence_end_frame": "number",
+        "track": "int",
+        "muted": "bool",
+    },
+}
+
+CAMERA_SCHEMA = {
+    "required": {
+        "name": "string",
+        "transform": "matrix",
+        "focal_length": "number",
+        "horizontal_film_aperture": "number",
+        "vertical_film_aperture": "number",
+        "near_clip": "number",
+        "far_clip": "number",
+    },
+    "optional": {
+        "shape_name": "string",
+        "is_renderable": "bool",
+        "is_shot_camera": "bool",
+        "animation": ANIMATION_SCHEMA,
+    },
+}
+
+GEOMETRY_SCHEMA = {
+    "required": {
+        "vertex_count": "int",
+        "face_count": "int",
+        "triangle_count": "int",
+    },
+    "optional": {
+        "uv_sets": ("list", "string"),
+        "has_uvs": "bool",
+    },
+}
+
+INSTANCE_SCHEMA = {
+    "required": {
+        "name": "string",
+        "transform": "matrix",
+    },
+    "optional": {
+        "full_path": "string",
+        "visible": "bool",
+        "culled": "bool",
+        "gltf_node": "int",
+    },
+}
+
+MESH_SCHEMA = {
+    "required": {
+        "name": INTERNED_STRING,
+        "transform": "matrix",
+        "material": INTERNED_STRING,
+    },
+    "optional": {
+        "full_path": INTERNED_STRING,
+        "shape_name": INTERNED_STRING,
+        "geometry": GEOMETRY_SCHEMA,
+        "visible": "bool",
+        "culled": "bool",
+        "gltf_node": "int",
+        "instances": ("list", INSTANCE_SCHEMA),
+    },
+}
+
+LIGHT_SCHEMA = {
+    "required": {
+        "name": "string",
+        "type": "string",
+        "transform": "matrix",
+    },
+    "optional": {
+        "enabled": "bool",
+        "color": ("numbers", 3),
+        "intensity": "number",
+        "exposure": "number",
+        "temperature": "number",
+        "use_temperature": "bool",
+        "color_mode": "int",
+        "spread": "number",
+        "cone_angle": "number",
+        "penumbra_angle": "number",
+        "dropoff": "number",
+        "decay_rate": "number",
+        "resolution": "number",
+        "animation": ANIMATION_SCHEMA,
+    },
+}
+
+RENDER_SETTINGS_SCHEMA = {
+    "required": {},
+    "optional": {
+        "resolution": {
+            "required": {"width": "int", "height": "int"},
+            "optional": {"aspect_ratio": "number"},
+        },
+        "frame_padding": "int",
+        "image_format": "string",
+        "output_path": "string",
+        "image_prefix": "string",
+        "animation": "bool",
+        "start_frame": "number",
+        "end_frame": "number",
+        "by_frame": "number",
+    },
+}
+
+AOV_SCHEMA = {
+    "required": {
+        "name": "string",
+        "type": "string",
+        "enabled": "bool",
+    },
+    "optional": {
+        "data_type": "string",
+        "filter": "string",
+        "output_path": "string",
+        "file_pattern": "string",
+        "channels": ("list", "string"),
+        "pixel_type": ("either", ("string", ("list", "string"))),
+        "compression": "string",
+        "resolution": ("numbers", 2),
+        "tiled": "bool",
+        "parts": "int",
+        "proxies": (
+            "list",
+            {
+                "required": {"size": "string", "path": "string"},
+                "optional": {"contact_sheet": ("nullable", "string")},
+            },
+        ),
+    },
+}
+
+LAYER_SCHEMA = {
+    "required": {
+        "name": "string",
+        "render_settings": RENDER_SETTINGS_SCHEMA,
+        "aovs": ("list", AOV_SCHEMA),
+    },
+    "optional": {
+        "node": "string",
+        "render_setup": "bool",
+        "overrides": "int",
+    },
+}
+
+RENDER_PASSES_SCHEMA = {
+    "required": {
+        "renderer": "string",
+        "aovs": ("list", AOV_SCHEMA),
+        "render_settings": RENDER_SETTINGS_SCHEMA,
+    },
+    "optional": {"layers": ("list", LAYER_SCHEMA)},
+}
+
+MATERIAL_SCHEMA = {
+    "required": {
+        "name": "string",
+        "type": "string",
+        "properties": (
+            "interned",
+            {"required": {}, "optional": {"textures": ("map", INTERNED_STRING)}},
+        ),
+    },
+    "optional": {
+        "shading_engine": "string",
+        "assigned_objects": ("list", INTERNED_STRING),
+        "texture_refs": ("list", "int"),
+    },
+}
+
+TEXTURE_SCHEMA = {
+    "required": {"node": "string", "path": INTERNED_STRING},
+    "optional": {"type": "string", "color_space": ("nullable", "string")},
+}
+
+TABLES_SCHEMA = {
+    "required": {},
+    "optional": {
+        "strings": ("list", "string"),
+        "properties": ("list", "object"),
+    },
+}
+
+TRACK_SCHEMA = {
+    "required": {
+        "name": "string",
+        "pivot": ("numbers", None),
+        "pivot_screen": ("numbers", None),
+    },
+    "optional": {
+        "full_path": "string",
+        "type": "string",
+        "depth": ("numbers", None),
+        "bbox": ("numbers", None),
+        "bbox_screen": ("numbers", None),
+    },
+}
+
+SCREEN_TRACKS_SCHEMA = {
+    "required": {
+        "camera": "string",
+        "resolution": ("numbers", 2),
+        "frames": ("numbers", None),
+        "tracks": ("list", TRACK_SCHEMA),
+    },
+    "optional": {"seconds": "number"},
+}
+
+SCENE_SCHEMA = {
+    "required": {
+        "schema_version": "string",
+        "scene_info": SCENE_INFO_SCHEMA,
+        "cameras": ("list", CAMERA_SCHEMA),
+        "meshes": ("rows", MESH_SCHEMA),
+    },
+    "optional": {
+        "shot": SHOT_SCHEMA,
+        "lights": ("rows", LIGHT_SCHEMA),
+        "render_passes": RENDER_PASSES_SCHEMA,
+        "materials": ("list", MATERIAL_SCHEMA),
+        "textures": ("list", TEXTURE_SCHEMA),
+        "tables": TABLES_SCHEMA,
+        "screen_tracks": SCREEN_TRACKS_SCHEMA,
+    },
+}
+
+EXPORT_INFO_SCHEMA = {
+    "required": {"timestamp": "string", "exporter_version": "string"},
+    "optional": {"interned": "bool", "layout": "string"},
+}
+
+DEFAULT_MAX_ERRORS = 100
+
+_NUMBER_TYPES = (int, float)
+_NUMBER_TYPE_SET = frozenset(_NUMBER_TYPES)
+_MATRIX_SIZE = 16
+
+# (value, path, errors) -> None, appending "path: message" strings
+Check = Callable[[Any, Any, List[str]], None]
+
+
+def format_path(path) -> str:
+    """JSON path string from a (parent, key) chain"""
+    parts = []
+    while path is not None:
+        path, key = path
+        parts.append(f"[{key}]" if isinstance(key, int) else f".{key}")
+    return "".join(reversed(parts)).lstrip(".") or "$"
+
+
+def _describe(value: Any) -> str:
+    return "null" if value is None else type(value).__name__
+
+
+# Primitive -> (accepted exact types, description). Maya returns some
+# boolean plugs as 0/1, so ints are accepted as booleans when 0 or 1.
+PRIMITIVES = {
+    "string": (frozenset([str]), "a string"),
+    "number": (_NUMBER_TYPE_SET, "a number"),
+    "int": (frozenset([int]), "an integer"),
+    "bool": (frozenset([bool, int]), "a boolean"),
+    "object": (frozenset([dict]), "an object"),
+}
+
+
+def _numbers_check(count: Optional[int]) -> Check:
+    expected = f"{count} numbers" if count else "a list of numbers"
+
+    def check(value, path, errors):
+        if type(value) is not list or (count and len(value) != count):
+            size = f"{len(value)} values" if type(value) is list else _describe(value)
+            errors.append(f"{format_path(path)}: expected {expected}, got {size}")
+        elif not _NUMBER_TYPE_SET.issuperset(map(type, value)):
+            errors.append(f"{format_path(path)}: expected {expected}")
+
+    return check
+
+
+def compile_schema(spec: Any, interned: bool = False) -> Check:
+    """Turn a schema spec into one check function, specialized per node"""
+    if spec == "any":
+        return lambda value, path, errors: None
+
+    if spec == "matrix":
+        return _numbers_check(_MATRIX_SIZE)
+
+    if isinstance(spec, str):
+        types, expected = PRIMITIVES[spec]
+        strict_bool = spec == "bool"
+
+        def check(value, path, errors):
+            if type(value) not in types or (
+                strict_bool and type(value) is int and value not in (0, 1)
+            ):
+                errors.append(
+                    f"{format_path(path)}: expected {expected}, got {_describe(value)}"
+                )
+
+        return check
+
+    if isinstance(spec, dict):
+        return _object_check(spec, interned)
+
+    kind, inner = spec
+
+    if kind == "numbers":
+        return _numbers_check(inner)
+
+    if kind == "interned":
+        check_value = compile_schema(inner, interned)
+        if not interned:
+            return check_value
+
+        def check(value, path, errors):
+            if type(value) is not int:
+                check_value(value, path, errors)
+
+        return check
+
+    if kind == "nullable":
+        check_value = compile_schema(inner, interned)
+
+        def check(value, path, errors):
+            if value is not None:
+                check_value(value, path, errors)
+
+        return check
+
+    if kind == "either":
+        checks = [compile_schema(option, interned) for option in inner]
+
+        def check(value, path, errors):
+            failures = []
+            for check_option in checks:
+                option_errors = []
+                check_option(value, path, option_errors)
+                if not option_errors:
+                    return
+                failures.append(option_errors)
+            # Report the alternative the value's type matched, if any: its
+            # errors are inside the value rather than about the value itself
+            node = f"{format_path(path)}:"
+            inside = [f for f in failures if not f[0].startswith(node)]
+            errors.extend((inside or failures)[0])
+
+        return check
+
+    if kind == "map":
+        check_value = compile_schema(inner, interned)
+
+        def check(value, path, errors):
+            if type(value) is not dict:
+                errors.append(
+                    f"{format_path(path)}: expected an object, got {_describe(value)}"
+                )
+                return
+            for key, item in value.items():
+                check_value(item, (path, key), errors)
+
+        return check
+
+    if kind in ("list", "rows"):
+        check_item = compile_schema(inner, interned)
+        check_columns = _columnar_check(inner, interned) if kind == "rows" else None
+
+        def check(value, path, errors):
+            if type(value) is not list:
+                if check_columns and type(value) is dict:
+                    check_columns(value, path, errors)
+                    return
+                errors.append(
+                    f"{format_path(path)}: expected a list, got {_describe(value)}"
+                )
+                return
+            for index, item in enumerate(value):
+                check_item(item, (path, index), errors)
+
+        return check
+
+    raise ValueError(f"Unknown schema spec: {spec!r}")
+
+
+def _object_check(spec: Dict[str, Any], interned: bool) -> Check:
+    required = [
+        (key, compile_schema(sub, interned))
+        for key, sub in spec.get("required", {}).items()
+    ]
+    optional = [
+        (key, compile_schema(sub, interned))
+        for key, sub in spec.get("optional", {}).items()
+    ]
+
+    def check(value, path, errors):
+        if type(value) is not dict:
+            errors.append(
+                f"{format_path(path)}: expected an object, got {_describe(value)}"
+            )
+            return
+        for key, check_field in required:
+            if key in value:
+                check_field(value[key], (path, key), errors)
+            else:
+                errors.append(f"{format_path(path)}: missing '{key}'")
+        for key, check_field in optional:
+            if key in value:
+                check_field(value[key], (path, key), errors)
+
+    return check
+
+
+def _columnar_check(spec: Dict[str, Any], interned: bool) -> Check:
+    """Check for the layout="columnar" form of a list of spec objects"""
+    fields = [
+        (key, compile_schema(sub, interned), sub, True)
+        for key, sub in spec.get("required", {}).items()
+    ] + [
+        (key, compile_schema(sub, interned), sub, False)
+        for key, sub in spec.get("optional", {}).items()
+    ]
+
+    def check(value, path, errors):
+        count = value.get("count")
+        columns = value.get("columns")
+        strides = value.get("strides", {})
+        if value.get("layout") != "columnar" or type(count) is not int:
+            errors.append(f"{format_path(path)}: expected a list or a columnar section")
+            return
+        if type(columns) is not dict:
+            errors.append(f"{format_path(path)}: missing 'columns'")
+            return
+        columns_path = (path, "columns")
+
+        for key, check_field, sub, required in fields:
+            column = columns.get(key)
+            column_path = (columns_path, key)
+            if column is None:
+                if required:
+                    errors.append(f"{format_path(columns_path)}: missing '{key}'")
+                continue
+            stride = strides.get(key, 1)
+            if type(column) is not list or len(column) != count * stride:
+                errors.append(
+                    f"{format_path(column_path)}: expected {count * stride} values"
+                )
+                continue
+            if stride > 1:
+                if sub == "matrix" and stride != _MATRIX_SIZE:
+                    errors.append(f"{format_path(column_path)}: expected stride 16")
+                elif not _NUMBER_TYPE_SET.issuperset(map(type, column)):
+                    errors.append(f"{format_path(column_path)}: expected numbers")
+                continue
+            for index, item in enumerate(column):
+                if item is None:
+                    if required:
+                        errors.append(f"{format_path((column_path, index))}: is null")
+                else:
+                    check_field(item, (column_path, index), errors)
+
+    return check
+
+
+class SchemaValidator:
+    """Validate exports against the full schema in docs/json_format.md
+
+    The schema is compiled once into nested check functions (one variant
+    for interned exports, where string fields may be table indices). All
+    errors are collected, up to max_errors, as "json.path: message" strings.
+    validate_file streams an export section by section and row by row, so
+    large exports are never held in memory as a whole.
+    """
+
+    def __init__(self, max_errors: int = DEFAULT_MAX_ERRORS):
+        self.max_errors = max_errors
+        self._checks = {
+            interned: self._compile_sections(interned) for interned in (False, True)
+        }
+        self._export_info = compile_schema(EXPORT_INFO_SCHEMA)
+
+    @staticmethod
+    def _compile_sections(interned: bool) -> Dict[str, Tuple[Check, Optional[Check], bool]]:
+        """Section -> (whole-value check, per-row check for lists, required)"""
+        sections = {}
+        for group, required in (("required", True), ("optional", False)):
+            for section, spec in SCENE_SCHEMA[group].items():
+                row_check = None
+                if isinstance(spec, tuple) and spec[0] in ("list", "rows"):
+                    row_check = compile_schema(spec[1], interned)
+                sections[section] = (compile_schema(spec, interned), row_check, required)
+        return sections
+
+    def validate(self, data: Dict[str, Any]) -> List[str]:
+        """Errors in an export already loaded as a dict (empty when valid)"""
+        errors: List[str] = []
+        export_info = data.get("export_info")
+        scene_data = data.get("scene_data")
+
+        if export_info is None:
+            errors.append("$: missing 'export_info'")
+        else:
+            self._export_info(export_info, (None, "export_info"), errors)
+        if not isinstance(scene_data, dict):
+            errors.append("$: missing 'scene_data'")
+            return errors
+
+        interned = bool(isinstance(export_info, dict) and export_info.get("interned"))
+        scene_path = (None, "scene_data")
+        for section, (check, _, required) in self._checks[interned].items():
+            if section in scene_data:
+                check(scene_data[section], (scene_path, section), errors)
+            elif required:
+                errors.append(f"scene_data: missing '{section}'")
+            if len(errors) >= self.max_errors:
+                break
+
+        return errors[: self.max_errors]
+
+    def validate_file(self, path: str) -> List[str]:
+        """Errors in an export file, read incrementally (empty when valid)
+
+        Relies on export_info preceding scene_data, as SceneSerializer
+        writes it, to know whether the export is interned.
+        """
+        errors: List[str] = []
+        interned = False
+        found = set()
+
+        try:
+            with JsonStream(path) as stream:
+                for key in stream.iter_object():
+                    found.add(key)
+                    if key == "export_info":
+                        export_info = stream.value()
+                        self._export_info(export_info, (None, key), errors)
+                        interned = isinstance(export_info, dict) and bool(
+                            export_info.get("interned")
+                        )
+                    elif key == "scene_data":
+                        self._validate_sections(stream, interned, errors)
+                    else:
+                        stream.skip()
+        except ValueError as e:
+            errors.append(f"$: {e}")
+
+        for key in ("export_info", "scene_data"):
+            if key not in found:
+                errors.append(f"$: missing '{key}'")
+
+        return errors[: self.max_errors]
+
+    def _validate_sections(
+        self, stream: JsonStream, interned: bool, errors: List[str]
+    ) -> None:
+        checks = self._checks[interned]
+        scene_path = (None, "scene_data")
+        found = set()
+
+        for section in stream.iter_object():
+            found.add(section)
+            if len(errors) >= self.max_errors or section not in checks:
+                stream.skip()
+                continue
+
+            check, row_check, _ = checks[section]
+            section_path = (scene_path, section)
+            if row_check and stream.peek() == "[":
+                for index in stream.iter_array():
+                    if len(errors) >= self.max_errors:
+                        stream.skip()
+                    else:
+                        row_check(stream.value(), (section_path, index), errors)
+            else:
+                check(stream.value(), section_path, errors)
+
+        for section, (_, _, required) in checks.items():
+            if required and section not in found:
+                errors.append(f"scene_data: missing '{section}'")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate exports against the schema")
+    parser.add_argument(
+        "paths", nargs="+", help="Export JSON files, or folders of shot exports"
+    )
+    parser.add_argument("--max-errors", type=int, default=DEFAULT_MAX_ERRORS)
+    args = parser.parse_args()
+
+    files = []
+    for path in args.paths:
+        if os.path.isdir(path):
+            files.extend(
+                os.path.join(path, name)
+                for name in sorted(os.listdir(path))
+                if name.endswith(".json") and not name.endswith("_jobs.json")
+            )
+        else:
+            files.append(path)
+
+    validator = SchemaValidator(args.max_errors)
+    failed = 0
+    for path in files:
+        start = time.perf_counter()
+        errors = validator.validate_file(path)
+        seconds = time.perf_counter() - start
+        if errors:
+            failed += 1
+            print(f"✗ {path}: {len(errors)} errors")
+            for error in errors:
+                print(f"  {error}")
+        else:
+            print(f"✓ {path} ({seconds:.2f}s)")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
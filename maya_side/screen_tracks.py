@@ -0,0 +1,245 @@
+import maya.cmds as cmds
+import time
+from typing import Dict, List, Any, Optional
+
+import numpy as np
+
+from attr_cache import AttributeCache
+from frustum import project_points
+from frustum_culler import render_cameras, sample_camera
+
+
+# Shape types whose local bounds are tracked with the transform
+TRACKED_SHAPES = ["mesh", "locator", "nurbsSurface", "nurbsCurve"]
+
+WORLD_DECIMALS = 6
+PIXEL_DECIMALS = 3
+
+# Unit cube corners, as 0/1 picks between a box's min and max
+_CORNERS = np.array(
+    [[x, y, z] for x in (0, 1) for y in (0, 1) for z in (0, 1)], dtype=np.float64
+)
+
+
+class ScreenTracker:
+    """Bake world boxes and pivots of chosen objects and project them to pixels
+
+    Every tracked transform's world matrix, rotate pivot and shape bounds are
+    sampled at each frame of the range with getAttr(time=...), so the
+    timeline is never moved. All frames and points are then projected
+    through the render camera in one batch (see frustum.project_points) and
+    stored as flat per-object arrays: pivot (3 per frame), pivot_screen (2),
+    depth (1), bbox (min xyz, max xyz: 6) and bbox_screen (x0, y0, x1, y1: 4).
+    """
+
+    def __init__(
+        self,
+        attr_cache: Optional[AttributeCache] = None,
+        nodes: Optional[List[str]] = None,
+        camera: Optional[str] = None,
+    ):
+        self.attrs = attr_cache or AttributeCache()
+        self.nodes = list(nodes or [])
+        self.camera = camera
+
+    def resolve(self, names: List[str]) -> List[str]:
+        """Long paths of the transforms named (wildcards and object sets too)"""
+        transforms: List[str] = []
+        for name in names:
+            nodes = cmds.ls(name, long=True) or []
+            if not nodes:
+                print(f"Warning: Nothing to track matches {name}")
+            for node in nodes:
+                if cmds.nodeType(node) == "objectSet":
+                    members = cmds.sets(node, query=True) or []
+                    transforms.extend(self.resolve(members))
+                elif cmds.objectType(node, isAType="shape"):
+                    transforms.extend(
+                        cmds.listRelatives(node, parent=True, fullPath=True) or []
+                    )
+                elif cmds.objectType(node, isAType="transform"):
+                    transforms.append(node)
+        return list(dict.fromkeys(transforms))
+
+    def track(
+        self, cameras: List[Dict[str, Any]], frame_range: List[float]
+    ) -> Optional[Dict[str, Any]]:
+        """The screen_tracks section of the export, or None without a camera
+
+        Tracks go through the named camera, else the shot camera or the
+        first renderable camera.
+        """
+        start = time.perf_counter()
+        if self.camera:
+            candidates = [cam for cam in cameras if cam["name"] == self.camera]
+        else:
+            candidates = render_cameras(cameras)
+        if not candidates:
+            print(
+                f"Warning: No {self.camera or 'render'} camera, skipping screen tracks"
+            )
+            return None
+        cam = candidates[0]
+        if len(candidates) > 1:
+            print(f"Warning: Several render cameras, tracking through {cam['name']}")
+
+        transforms = self.resolve(self.nodes)
+        frames = list(range(int(frame_range[0]), int(frame_range[1]) + 1))
+        resolution = self.attrs.get_many(
+            "defaultResolution", ["width", "height", "deviceAspectRatio"]
+        )
+        width, height = int(resolution["width"]), int(resolution["height"])
+
+        objects = [self._sample(transform, frames) for transform in transforms]
+        section = {
+            "camera": cam["name"],
+            "resolution": [width, height],
+            "frames": frames,
+            "tracks": [],
+        }
+        if not objects:
+            section["seconds"] = time.perf_counter() - start
+            return section
+
+        # Frame-major arrays: F x N x 4 x 4 world matrices, F x N x 3 points
+        count = len(objects)
+        world = np.stack([obj["matrices"] for obj in objects], axis=1).reshape(
+            len(frames), count, 4, 4
+        )
+        pivots = np.stack([obj["pivots"] for obj in objects], axis=1)
+        bbox_min = np.stack([obj["bbox_min"] for obj in objects], axis=1)
+        bbox_max = np.stack([obj["bbox_max"] for obj in objects], axis=1)
+
+        # Local pivots and box corners (F x N x 8 x 3) to world space
+        corners = bbox_min[:, :, None] + (bbox_max - bbox_min)[:, :, None] * _CORNERS
+        corners = (
+            np.einsum("fncj,fnjk->fnck", corners, world[..., :3, :3])
+            + world[:, :, None, 3, :3]
+        )
+        world_pivots = (
+            np.einsum("fnj,fnjk->fnk", pivots, world[..., :3, :3]) + world[:, :, 3, :3]
+        )
+
+        points = np.concatenate(
+            [world_pivots, corners.reshape(len(frames), count * 8, 3)], axis=1
+        )
+        cam_matrices, focal_length = sample_camera(cam, frames)
+        shape = cam["shape_name"]
+        settings = self.attrs.get_many(
+            shape,
+            [
+                "filmFit",
+                "horizontalFilmOffset",
+                "verticalFilmOffset",
+                "orthographic",
+                "orthographicWidth",
+            ],
+        )
+        pixels, depth = project_points(
+            points,
+            cam_matrices,
+            focal_length,
+            cam["horizontal_film_aperture"],
+            cam["vertical_film_aperture"],
+            width,
+            height,
+            aspect=resolution["deviceAspectRatio"],
+            film_fit=settings["filmFit"] or 0,
+            film_offset=(
+                settings["horizontalFilmOffset"] or 0.0,
+                settings["verticalFilmOffset"] or 0.0,
+            ),
+            orthographic_width=(
+                settings["orthographicWidth"] if settings["orthographic"] else None
+            ),
+        )
+
+        pivot_pixels, corner_pixels = pixels[:, :count], pixels[:, count:]
+        corner_pixels = corner_pixels.reshape(len(frames), count, 8, 2)
+        corner_depth = depth[:, count:].reshape(len(frames), count, 8)
+        boxes = self._screen_boxes(corner_pixels, corner_depth, width, height)
+        world_min, world_max = corners.min(axis=2), corners.max(axis=2)
+
+        for index, obj in enumerate(objects):
+            section["tracks"].append(
+                {
+                    "name": obj["name"],
+                    "full_path": obj["full_path"],
+                    "type": obj["type"],
+                    "pivot": _flat(world_pivots[:, index], WORLD_DECIMALS),
+                    "pivot_screen": _flat(pivot_pixels[:, index], PIXEL_DECIMALS),
+                    "depth": _flat(depth[:, index], WORLD_DECIMALS),
+                    "bbox": _flat(
+                        np.concatenate(
+                            [world_min[:, index], world_max[:, index]], axis=1
+                        ),
+                        WORLD_DECIMALS,
+                    ),
+                    "bbox_screen": _flat(boxes[:, index], PIXEL_DECIMALS),
+                }
+            )
+
+        section["seconds"] = time.perf_counter() - start
+        return section
+
+    def _sample(self, transform: str, frames: List[float]) -> Dict[str, Any]:
+        """World matrices, local pivot and local shape bounds at each frame"""
+        shapes = [
+            shape
+            for shape in cmds.listRelatives(
+                transform, shapes=True, fullPath=True, noIntermediate=True
+            )
+            or []
+            if cmds.nodeType(shape) in TRACKED_SHAPES
+        ]
+        shape = shapes[0] if shapes else None
+
+        matrices, pivots, bbox_min, bbox_max = [], [], [], []
+        for frame in frames:
+            matrices.append(cmds.getAttr(f"{transform}.worldMatrix[0]", time=frame))
+            pivot = cmds.getAttr(f"{transform}.rotatePivot", time=frame)[0]
+            pivots.append(pivot)
+            if shape:
+                bbox_min.append(
+                    cmds.getAttr(f"{shape}.boundingBoxMin", time=frame)[0]
+                )
+                bbox_max.append(
+                    cmds.getAttr(f"{shape}.boundingBoxMax", time=frame)[0]
+                )
+            else:
+                # No shape: the box collapses onto the pivot
+                bbox_min.append(pivot)
+                bbox_max.append(pivot)
+
+        return {
+            "name": transform.split("|")[-1],
+            "full_path": transform,
+            "type": cmds.nodeType(shape) if shape else "transform",
+            "matrices": np.array(matrices),
+            "pivots": np.array(pivots),
+            "bbox_min": np.array(bbox_min),
+            "bbox_max": np.array(bbox_max),
+        }
+
+    def _screen_boxes(
+        self, corners: np.ndarray, depth: np.ndarray, width: int, height: int
+    ) -> np.ndarray:
+        """Image-clamped pixel boxes (F x N x 4) of projected box corners
+
+        A box crossing the camera plane covers the whole image; one fully
+        behind the camera collapses to an empty box at the origin.
+        """
+        boxes = np.concatenate([corners.min(axis=2), corners.max(axis=2)], axis=2)
+        boxes[..., [0, 2]] = boxes[..., [0, 2]].clip(0, width)
+        boxes[..., [1, 3]] = boxes[..., [1, 3]].clip(0, height)
+
+        in_front = depth > 0.0
+        crossing = in_front.any(axis=2) & ~in_front.all(axis=2)
+        boxes[crossing] = (0.0, 0.0, width, height)
+        boxes[~in_front.any(axis=2)] = 0.0
+        return boxes
+
+
+def _flat(values: np.ndarray, decimals: int) -> List[float]:
+    """Frame-major flat list of rounded values"""
+    return np.round(values, decimals).ravel().tolist()
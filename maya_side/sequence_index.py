@@ -0,0 +1,222 @@
+import argparse
+import json
+import os
+import re
+from typing import Dict, List, Any, Optional, Tuple
+
+
+# Prefix tokens understood by Maya/Arnold/Redshift, matched case-insensitively
+TOKEN_ALIASES = {
+    "renderlayer": "layer",
+    "layer": "layer",
+    "aov": "aov",
+    "renderpass": "aov",
+    "scene": "scene",
+    "camera": "camera",
+    "version": "version",
+}
+TOKEN_PATTERN = re.compile(r"<(\w+)>")
+
+# The bridge's own renders are written as <aov>.<frame>.<ext>
+DEFAULT_PREFIX = "<AOV>"
+MASTER_LAYER = "masterLayer"
+
+
+def aov_file_stem(aov: Dict[str, Any]) -> str:
+    """Name renders of this AOV are written under"""
+    stem = aov["name"] if aov.get("type") == "render_layer" else aov["type"]
+    return "beauty" if stem == "RGBA" else stem
+
+
+def expand_pattern(
+    aov: Dict[str, Any],
+    settings: Dict[str, Any],
+    layer: str = MASTER_LAYER,
+    scene: str = "",
+    camera: str = "",
+    version: str = "",
+) -> str:
+    """Expand an AOV's output naming into a path pattern with # frame padding
+
+    The prefix may contain sub-folders and tokens; it is resolved relative to
+    the AOV's output folder unless it is absolute. A prefix without an AOV
+    token gets the AOV name appended (except for the beauty pass) so passes
+    do not overwrite each other.
+    """
+    prefix = settings.get("image_prefix") or DEFAULT_PREFIX
+    values = {
+        "layer": layer,
+        "aov": aov_file_stem(aov),
+        "scene": scene,
+        "camera": camera.split("|")[-1].split(":")[-1],
+        "version": version,
+    }
+
+    has_aov_token = False
+
+    def replace(match):
+        nonlocal has_aov_token
+        key = TOKEN_ALIASES.get(match.group(1).lower())
+        if key is None:
+            return match.group(0)
+        has_aov_token = has_aov_token or key == "aov"
+        return values[key]
+
+    name = TOKEN_PATTERN.sub(replace, prefix)
+    if not has_aov_token and values["aov"] != "beauty":
+        name = f"{name}_{values['aov']}"
+
+    hashes = "#" * int(settings.get("frame_padding", 4))
+    extension = settings.get("image_format", "exr")
+    directory = aov.get("output_path") or settings.get("output_path", "")
+
+    return os.path.join(directory, f"{name}.{hashes}.{extension}")
+
+
+def frame_path(pattern: str, frame: float) -> str:
+    """Substitute a frame number into a # padded pattern"""
+    match = re.search(r"#+", os.path.basename(pattern))
+    if not match:
+        return pattern
+    hashes = match.group(0)
+    head, tail = pattern.rsplit(hashes, 1)
+    return f"{head}{int(frame):0{len(hashes)}d}{tail}"
+
+
+def frame_ranges(frames: List[int]) -> str:
+    """Compact a frame list into '1-10,12,15-20'"""
+    parts = []
+    frames = sorted(frames)
+    i = 0
+    while i < len(frames):
+        j = i
+        while j + 1 < len(frames) and frames[j + 1] == frames[j] + 1:
+            j += 1
+        parts.append(str(frames[i]) if i == j else f"{frames[i]}-{frames[j]}")
+        i = j + 1
+    return ",".join(parts)
+
+
+class SequenceIndex:
+    """Find which rendered frames exist without globbing huge folders
+
+    Each folder is listed once with os.scandir and kept in memory keyed by the
+    folder's mtime, so repeated queries only cost one stat call until a file
+    is added, removed or renamed. Zero-byte files (renders still being
+    written, or killed) are re-checked on every query because growing a file
+    does not touch its folder's mtime.
+    """
+
+    def __init__(self):
+        self._folders: Dict[str, Tuple[int, Dict[str, int]]] = {}
+        self.scans = 0
+        self.hits = 0
+
+    def list_folder(self, folder: str) -> Dict[str, int]:
+        """File name -> size for one folder (cached by folder mtime)"""
+        folder = os.path.normpath(folder)
+        try:
+            mtime = os.stat(folder).st_mtime_ns
+        except FileNotFoundError:
+            self._folders.pop(folder, None)
+            return {}
+
+        cached = self._folders.get(folder)
+        if cached and cached[0] == mtime:
+            self.hits += 1
+            files = cached[1]
+            for name, size in files.items():
+                if size == 0:
+                    try:
+                        files[name] = os.stat(os.path.join(folder, name)).st_size
+                    except FileNotFoundError:
+                        pass
+            return files
+
+        files = {}
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    files[entry.name] = entry.stat().st_size
+        self._folders[folder] = (mtime, files)
+        self.scans += 1
+        return files
+
+    def index_pattern(self, pattern: str, frames: List[int]) -> Dict[str, Any]:
+        """Report present, missing and zero-byte frames of one sequence"""
+        folder = os.path.dirname(pattern)
+        files = self.list_folder(folder)
+
+        present, missing, zero_byte = [], [], []
+        for frame in frames:
+            size = files.get(os.path.basename(frame_path(pattern, frame)))
+            if size is None:
+                missing.append(frame)
+            elif size == 0:
+                zero_byte.append(frame)
+            else:
+                present.append(frame)
+
+        return {
+            "pattern": pattern,
+            "expected": len(frames),
+            "present": present,
+            "missing": missing,
+            "zero_byte": zero_byte,
+            "complete": not missing and not zero_byte,
+        }
+
+    def index_render_passes(
+        self, render_passes: Dict[str, Any], frames: Optional[List[int]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Index every enabled AOV of an export's render_passes"""
+        settings = render_passes.get("render_settings", {})
+        if frames is None:
+            frames = self.frames_from_settings(settings)
+
+        report = {}
+        for aov in render_passes.get("aovs", []):
+            if not aov.get("enabled", True):
+                continue
+            pattern = aov.get("file_pattern") or expand_pattern(aov, settings)
+            report[aov["name"]] = self.index_pattern(pattern, frames)
+        return report
+
+    def frames_from_settings(self, settings: Dict[str, Any]) -> List[int]:
+        """Frames a render covers according to its render settings"""
+        start = int(settings.get("start_frame", 1))
+        end = int(settings.get("end_frame", start))
+        step = max(1, int(settings.get("by_frame") or 1))
+        return list(range(start, end + 1, step))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report rendered frames per AOV")
+    parser.add_argument("export", type=str, help="Exported scene JSON")
+    parser.add_argument(
+        "--frames", nargs=2, type=int, help="Frame range (default: render settings)"
+    )
+    args = parser.parse_args()
+
+    with open(args.export, "r", encoding="utf-8") as f:
+        scene_data = json.load(f)["scene_data"]
+
+    frames = None
+    if args.frames:
+        frames = list(range(args.frames[0], args.frames[1] + 1))
+
+    index = SequenceIndex()
+    report = index.index_render_passes(scene_data.get("render_passes", {}), frames)
+
+    for name, entry in report.items():
+        status = "✓" if entry["complete"] else "✗"
+        print(f"{status} {name}: {len(entry['present'])}/{entry['expected']} frames")
+        print(f"    {entry['pattern']}")
+        if entry["missing"]:
+            print(f"    missing: {frame_ranges(entry['missing'])}")
+        if entry["zero_byte"]:
+            print(f"    zero-byte: {frame_ranges(entry['zero_byte'])}")
+
+
+if __name__ == "__main__":
+    main()
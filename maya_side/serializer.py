@@ -1,8 +1,69 @@
 import json
+from collections import Counter
+from collections.abc import Sequence
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, List, Any, Callable, Tuple
 from datetime import datetime
 
+from records import to_json
+
+
+# Section -> string fields replaced by string table IDs in interned exports
+INTERNED_STRING_FIELDS = {
+    "meshes": ["name", "full_path", "shape_name", "material"],
+    "textures": ["path"],
+}
+
+# Sections written as one array per field with layout="columnar"
+COLUMNAR_SECTIONS = ["meshes", "lights"]
+
+# Fixed-size vector fields flattened into one array in columnar sections
+FLAT_COLUMNS = {"transform": 16}
+
+
+class ValueTable:
+    """Values stored once, in first-seen order, and referenced by index
+
+    Only values in `shared` are tabled when it is given; anything else is
+    returned unchanged, so a value used once stays inline.
+    """
+
+    def __init__(self, key: Callable[[Any], Any] = None, shared=None):
+        self.values: List[Any] = []
+        self._ids: Dict[Any, int] = {}
+        self._key = key
+        self._shared = shared
+
+    def id(self, value: Any) -> Any:
+        key = self._key(value) if self._key else value
+        if self._shared is not None and key not in self._shared:
+            return value
+        if key not in self._ids:
+            self._ids[key] = len(self.values)
+            self.values.append(value)
+        return self._ids[key]
+
+
+class InternedRows(Sequence):
+    """Rows of an interned section, rehydrated the first time each is read"""
+
+    def __init__(self, rows: List[Dict[str, Any]], rehydrate: Callable):
+        self._rows = rows
+        self._rehydrate = rehydrate
+        self._cache: Dict[int, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self._rows)
+        if index not in self._cache:
+            self._cache[index] = self._rehydrate(self._rows[index])
+        return self._cache[index]
+
 
 class SceneSerializer:
     """Serialize Maya scene data to JSON format"""
@@ -10,27 +71,93 @@ class SceneSerializer:
     def __init__(self):
         self.indent = 2  # Pretty print by default
 
-    def write(self, scene_data: Dict[str, Any], output_path: Path) -> None:
-        """Write scene data to JSON file"""
+    def write(
+        self,
+        scene_data: Dict[str, Any],
+        output_path: Path,
+        intern: bool = False,
+        layout: str = "rows",
+    ) -> Dict[str, Any]:
+        """Write scene data to JSON file
+
+        With intern=True, repeated strings (mesh names and paths, material
+        assignments, texture paths) and identical material property blocks
+        are stored once in scene_data["tables"] and referenced by index.
+        With layout="columnar", meshes and lights are written as one array
+        per field (after interning) instead of one object per row.
+        """
+        if layout not in ("rows", "columnar"):
+            raise ValueError(f"Unknown layout '{layout}' (expected rows or columnar)")
+
         output_path = Path(output_path)
+        stats = {}
+
+        export_info = {
+            "timestamp": datetime.now().isoformat(),
+            "exporter_version": "0.1.0",
+        }
+
+        if intern:
+            scene_data, stats = self._intern(scene_data)
+            export_info["interned"] = True
+
+        if layout == "columnar":
+            scene_data = dict(scene_data)
+            for section in COLUMNAR_SECTIONS:
+                if isinstance(scene_data.get(section), list):
+                    scene_data[section] = self._to_columns(scene_data[section])
+            export_info["layout"] = "columnar"
 
         export_data = {
-            "export_info": {
-                "timestamp": datetime.now().isoformat(),
-                "exporter_version": "0.1.0",
-            },
+            "export_info": export_info,
             "scene_data": scene_data,
         }
 
         with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(export_data, f, indent=self.indent, ensure_ascii=False)
+            json.dump(
+                export_data,
+                f,
+                indent=self.indent,
+                ensure_ascii=False,
+                default=to_json,
+            )
 
-    def read(self, input_path: Path) -> Dict[str, Any]:
-        """Read JSON file back into dict (for validation/testing)"""
+        stats["bytes"] = output_path.stat().st_size
+        return stats
+
+    def read(
+        self, input_path: Path, rehydrate: bool = True, columns: bool = False
+    ) -> Dict[str, Any]:
+        """Read JSON file back into dict (for validation/testing)
+
+        Interned sections are returned as InternedRows that rehydrate each
+        row on first access, unless rehydrate is False. Columnar sections are
+        turned back into row dicts, or left as columns with columns=True
+        (interned string columns are still resolved when rehydrating).
+        """
         input_path = Path(input_path)
 
         with open(input_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+            data = json.load(f)
+
+        scene_data = data.get("scene_data", {})
+        export_info = data.get("export_info", {})
+        interned = rehydrate and export_info.get("interned")
+
+        if export_info.get("layout") == "columnar":
+            strings = scene_data.get("tables", {}).get("strings", [])
+            for section in COLUMNAR_SECTIONS:
+                if not self.is_columnar(scene_data.get(section)):
+                    continue
+                if not columns:
+                    scene_data[section] = self.from_columns(scene_data[section])
+                elif interned:
+                    self._resolve_columns(section, scene_data[section], strings)
+
+        if interned:
+            self._rehydrate(scene_data)
+
+        return data
 
     def validate_schema(self, data: Dict[str, Any]) -> bool:
         """Basic validation of scene data structure"""
@@ -48,4 +175,191 @@ class SceneSerializer:
             print("Validation error: Invalid schema_version")
             return False
 
+        for section in COLUMNAR_SECTIONS:
+            value = scene_data.get(section, [])
+            if self.is_columnar(value):
+                error = self._columns_error(value)
+                if error:
+                    print(f"Validation error: '{section}' {error}")
+                    return False
+            elif not isinstance(value, Sequence) or isinstance(value, str):
+                print(f"Validation error: '{section}' must be a list or columnar")
+                return False
+
         return True
+
+    @staticmethod
+    def is_columnar(section: Any) -> bool:
+        return isinstance(section, dict) and section.get("layout") == "columnar"
+
+    def _to_columns(self, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """One array per field; fields a row lacks are null in its slot"""
+        columns: Dict[str, List[Any]] = {}
+        for index, row in enumerate(rows):
+            for key, value in row.items():
+                if key not in columns:
+                    columns[key] = [None] * index
+                columns[key].append(value)
+            for column in columns.values():
+                if len(column) <= index:
+                    column.append(None)
+
+        strides = {}
+        for field, stride in FLAT_COLUMNS.items():
+            column = columns.get(field)
+            if column and all(v is not None and len(v) == stride for v in column):
+                columns[field] = [x for value in column for x in value]
+                strides[field] = stride
+
+        section = {"layout": "columnar", "count": len(rows), "columns": columns}
+        if strides:
+            section["strides"] = strides
+        return section
+
+    def from_columns(self, section: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Row dicts from a columnar section, dropping null slots"""
+        count = section["count"]
+        strides = section.get("strides", {})
+        columns = {}
+        for field, column in section["columns"].items():
+            stride = strides.get(field)
+            if stride:
+                column = [column[i : i + stride] for i in range(0, len(column), stride)]
+            columns[field] = column
+
+        return [
+            {
+                field: column[index]
+                for field, column in columns.items()
+                if column[index] is not None
+            }
+            for index in range(count)
+        ]
+
+    def _columns_error(self, section: Dict[str, Any]) -> str:
+        """Why a columnar section is malformed, or an empty string"""
+        count = section.get("count")
+        columns = section.get("columns")
+        if not isinstance(count, int) or not isinstance(columns, dict):
+            return "columnar section needs an integer count and a columns object"
+        strides = section.get("strides", {})
+        for field, column in columns.items():
+            expected = count * strides.get(field, 1)
+            if not isinstance(column, list) or len(column) != expected:
+                return f"column '{field}' should hold {expected} values"
+        return ""
+
+    @staticmethod
+    def _resolve_columns(
+        section: str, columnar: Dict[str, Any], strings: List[str]
+    ) -> None:
+        """Swap string table IDs in an interned columnar section for strings"""
+        for field in INTERNED_STRING_FIELDS.get(section, []):
+            column = columnar["columns"].get(field)
+            if column is not None:
+                columnar["columns"][field] = [
+                    strings[v] if isinstance(v, int) else v for v in column
+                ]
+
+    def _intern(
+        self, scene_data: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Copy of scene_data with shared strings and property blocks tabled"""
+        strings = ValueTable(shared=self._repeated_strings(scene_data))
+        properties = ValueTable(key=lambda block: json.dumps(block, sort_keys=True))
+        interned = dict(scene_data)
+
+        for section, fields in INTERNED_STRING_FIELDS.items():
+            if section not in scene_data:
+                continue
+            rows = []
+            for row in scene_data[section]:
+                row = dict(row)
+                for field in fields:
+                    if isinstance(row.get(field), str):
+                        row[field] = strings.id(row[field])
+                rows.append(row)
+            interned[section] = rows
+
+        if "materials" in scene_data:
+            materials = []
+            for material in scene_data["materials"]:
+                material = dict(material)
+                block = dict(material.get("properties", {}))
+                if "textures" in block:
+                    block["textures"] = {
+                        attr: strings.id(path)
+                        for attr, path in block["textures"].items()
+                    }
+                material["properties"] = properties.id(block)
+                material["assigned_objects"] = [
+                    strings.id(name) for name in material.get("assigned_objects", [])
+                ]
+                materials.append(material)
+            interned["materials"] = materials
+
+        interned["tables"] = {
+            "strings": strings.values,
+            "properties": properties.values,
+        }
+
+        return interned, {
+            "strings": len(strings.values),
+            "property_blocks": len(properties.values),
+        }
+
+    def _repeated_strings(self, scene_data: Dict[str, Any]) -> set:
+        """Strings used more than once across the interned fields"""
+        counts = Counter()
+        for section, fields in INTERNED_STRING_FIELDS.items():
+            for row in scene_data.get(section, []):
+                counts.update(row[f] for f in fields if isinstance(row.get(f), str))
+        for material in scene_data.get("materials", []):
+            counts.update(material.get("assigned_objects", []))
+            counts.update(material.get("properties", {}).get("textures", {}).values())
+        return {value for value, count in counts.items() if count > 1}
+
+    def _rehydrate(self, scene_data: Dict[str, Any]) -> None:
+        """Swap interned sections for lazily rehydrated rows"""
+        rehydrators = self.row_rehydrators(scene_data.pop("tables", {}))
+
+        for section, rehydrate in rehydrators.items():
+            if section in scene_data and not self.is_columnar(scene_data[section]):
+                scene_data[section] = InternedRows(scene_data[section], rehydrate)
+
+    @staticmethod
+    def row_rehydrators(tables: Dict[str, Any]) -> Dict[str, Callable]:
+        """Section -> function turning an interned row back into a plain row"""
+        strings = tables.get("strings", [])
+        properties = tables.get("properties", [])
+
+        def strings_of(fields):
+            def rehydrate(row):
+                row = dict(row)
+                for field in fields:
+                    if isinstance(row.get(field), int):
+                        row[field] = strings[row[field]]
+                return row
+
+            return rehydrate
+
+        def material(row):
+            row = dict(row)
+            block = dict(properties[row["properties"]])
+            if "textures" in block:
+                block["textures"] = {
+                    attr: strings[i] if isinstance(i, int) else i
+                    for attr, i in block["textures"].items()
+                }
+            row["properties"] = block
+            row["assigned_objects"] = [
+                strings[i] if isinstance(i, int) else i for i in row["assigned_objects"]
+            ]
+            return row
+
+        rehydrators = {
+            section: strings_of(fields)
+            for section, fields in INTERNED_STRING_FIELDS.items()
+        }
+        rehydrators["materials"] = material
+        return rehydrators
@@ -0,0 +1,122 @@
+import maya.cmds as cmds
+from typing import Dict, List, Any, Optional, Set
+
+from attr_cache import AttributeCache
+
+
+# Texture node type -> attribute holding its file path
+TEXTURE_NODE_TYPES = {
+    "file": "fileTextureName",
+    "psdFileTex": "fileTextureName",
+    "aiImage": "filename",
+    "RedshiftNormalMap": "tex0",
+}
+
+# Upstream connections into these types are not part of a shading network
+STOP_NODE_TYPES = {
+    "transform",
+    "mesh",
+    "nurbsSurface",
+    "shadingEngine",
+    "time",
+    "colorManagementGlobals",
+    "renderLayer",
+    "defaultShaderList",
+    "defaultTextureList",
+    "defaultRenderUtilityList",
+}
+
+DEFAULT_MAX_DEPTH = 32
+
+
+class ShadingGraph:
+    """Walk shading networks upstream and collect the texture nodes they use
+
+    Results are memoized per node for the lifetime of the walker, so shared
+    sub-networks (a texture feeding several shaders, a common bump chain) are
+    queried once. Nodes already on the current path are skipped to break
+    cycles, and walks deeper than max_depth stop early; neither is memoized,
+    so a node reached later through a shorter path is walked in full.
+    """
+
+    def __init__(
+        self,
+        attr_cache: Optional[AttributeCache] = None,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+    ):
+        self.attrs = attr_cache or AttributeCache()
+        self.max_depth = max_depth
+        self.textures: List[Dict[str, Any]] = []
+        self._texture_index: Dict[str, int] = {}
+        self._upstream: Dict[str, List[int]] = {}
+        self._types: Dict[str, str] = {}
+        self.cycles = 0
+        self.truncated = 0
+
+    def texture_refs(self, node: str) -> List[int]:
+        """Indices into self.textures of every texture upstream of a node"""
+        return sorted(self._walk(node, set(), 0))
+
+    def _walk(self, node: str, path: Set[str], depth: int) -> Set[int]:
+        if node in self._upstream:
+            return set(self._upstream[node])
+        if node in path:
+            self.cycles += 1
+            return set()
+        if depth > self.max_depth:
+            self.truncated += 1
+            return set()
+
+        refs = set()
+        if self._node_type(node) in TEXTURE_NODE_TYPES:
+            refs.add(self._add_texture(node))
+
+        path.add(node)
+        cycles, truncated = self.cycles, self.truncated
+        for source in self._sources(node):
+            refs |= self._walk(source, path, depth + 1)
+        path.discard(node)
+
+        # A walk cut short by a cycle or the depth limit may be incomplete
+        if self.cycles == cycles and self.truncated == truncated:
+            self._upstream[node] = sorted(refs)
+        return refs
+
+    def _sources(self, node: str) -> List[str]:
+        """Upstream nodes feeding a node, skipping non-shading nodes"""
+        sources = (
+            cmds.listConnections(
+                node, source=True, destination=False, skipConversionNodes=True
+            )
+            or []
+        )
+        sources = list(dict.fromkeys(sources))
+
+        unknown = [s for s in sources if s not in self._types]
+        if unknown:
+            typed = cmds.ls(unknown, showType=True) or []
+            for index in range(0, len(typed), 2):
+                self._types[typed[index]] = typed[index + 1]
+
+        return [s for s in sources if self._types.get(s) not in STOP_NODE_TYPES]
+
+    def _node_type(self, node: str) -> str:
+        if node not in self._types:
+            self._types[node] = cmds.nodeType(node)
+        return self._types[node]
+
+    def _add_texture(self, node: str) -> int:
+        """Add a texture node to the table once, returning its index"""
+        if node not in self._texture_index:
+            node_type = self._node_type(node)
+            path_attr = TEXTURE_NODE_TYPES[node_type]
+            self._texture_index[node] = len(self.textures)
+            self.textures.append(
+                {
+                    "node": node,
+                    "type": node_type,
+                    "path": self.attrs.get(node, path_attr, "") or "",
+                    "color_space": self.attrs.get(node, "colorSpace"),
+                }
+            )
+        return self._texture_index[node]
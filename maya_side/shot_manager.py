@@ -0,0 +1,266 @@
+import maya.cmds as cmds
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+import json
+import multiprocessing
+import time
+
+from checkpoint import Checkpoint, journal_path, scene_stamp
+from progress import Cancelled, ProgressReporter
+
+
+class ShotManager:
+    """Read Camera Sequencer shots and export them one file per shot"""
+
+    def get_shots(self, names: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Get all sequencer shots, ordered by their position in the sequence"""
+        shots = []
+
+        for shot in cmds.ls(type="shot") or []:
+            shot_name = cmds.getAttr(f"{shot}.shotName") or shot
+            if names and shot not in names and shot_name not in names:
+                continue
+
+            shots.append(
+                {
+                    "name": shot,
+                    "shot_name": shot_name,
+                    "camera": self._get_shot_camera(shot),
+                    "start_frame": cmds.getAttr(f"{shot}.startFrame"),
+                    "end_frame": cmds.getAttr(f"{shot}.endFrame"),
+                    "sequence_start_frame": cmds.getAttr(
+                        f"{shot}.sequenceStartFrame"
+                    ),
+                    "sequence_end_frame": cmds.getAttr(f"{shot}.sequenceEndFrame"),
+                    "track": cmds.getAttr(f"{shot}.track"),
+                    "muted": bool(cmds.shot(shot, query=True, mute=True)),
+                }
+            )
+
+        shots.sort(key=lambda s: (s["sequence_start_frame"], s["track"]))
+        return shots
+
+    def _get_shot_camera(self, shot: str) -> Optional[str]:
+        """Get the transform of the camera a shot looks through"""
+        camera = cmds.shot(shot, query=True, currentCamera=True)
+        if not camera:
+            return None
+
+        if cmds.nodeType(camera) == "camera":
+            camera = cmds.listRelatives(camera, parent=True)[0]
+        return camera
+
+    def build_render_jobs(
+        self, shot: Dict[str, Any], render_passes: Dict[str, Any], output_dir: Path
+    ) -> List[Dict[str, Any]]:
+        """One render job per enabled AOV per frame of the shot"""
+        from sequence_index import aov_file_stem
+
+        jobs = []
+        settings = render_passes.get("render_settings", {})
+        padding = settings.get("frame_padding", 4)
+        extension = settings.get("image_format", "exr")
+        step = settings.get("by_frame") or 1.0
+
+        frames = []
+        frame = shot["start_frame"]
+        while frame <= shot["end_frame"]:
+            frames.append(frame)
+            frame += step
+
+        for aov in render_passes.get("aovs", []):
+            if not aov.get("enabled", True):
+                continue
+
+            aov_name = aov_file_stem(aov)
+            for frame in frames:
+                file_name = f"{aov_name}.{int(frame):0{padding}d}.{extension}"
+                jobs.append(
+                    {
+                        "shot": shot["shot_name"],
+                        "aov": aov_name,
+                        "camera": shot["camera"],
+                        "frame": frame,
+                        "output_path": str(
+                            Path(output_dir) / shot["shot_name"] / file_name
+                        ),
+                    }
+                )
+
+        return jobs
+
+
+def export_shot(
+    shot: Dict[str, Any],
+    output_dir: Path,
+    options: Dict[str, Any],
+    progress: Optional[ProgressReporter] = None,
+) -> Dict[str, Any]:
+    """Extract and write one shot's export from the currently open scene"""
+    from attr_cache import AttributeCache
+    from export_scope import ExportScope
+    from scene_reader import SceneReader
+    from serializer import SceneSerializer
+
+    start = time.perf_counter()
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    output_path = output_dir / f"{shot['shot_name']}.json"
+    attrs = AttributeCache()
+    reader = SceneReader(attrs, progress=progress)
+    culler, tracker, exporter = None, None, None
+    if options.get("cull"):
+        from frustum_culler import FrustumCuller
+
+        culler = FrustumCuller(attrs, **options["cull"])
+    if options.get("track"):
+        from screen_tracks import ScreenTracker
+
+        tracker = ScreenTracker(attrs, **options["track"])
+    if options.get("glb"):
+        from geometry_exporter import GeometryExporter
+
+        exporter = GeometryExporter(
+            output_dir / f"{shot['shot_name']}.glb", options["glb"]["quantize"]
+        )
+
+    checkpoint = None
+    if options.get("bake_animation"):
+        scene_path = cmds.file(query=True, sceneName=True)
+        checkpoint = Checkpoint(
+            journal_path(str(output_path)),
+            {"kind": "bake", "scene": scene_stamp(scene_path), "shot": shot["name"]},
+            resume=options.get("resume", False),
+        )
+
+    with attrs, checkpoint or nullcontext():
+        scene_data = reader.extract_scene(
+            include_aovs=options.get("include_aovs", True),
+            include_materials=options.get("include_materials", True),
+            bake_animation=options.get("bake_animation", False),
+            shot=shot,
+            scope=ExportScope(**options.get("scope", {})),
+            culler=culler,
+            tracker=tracker,
+            geometry=exporter,
+            checkpoint=checkpoint,
+        )
+
+    SceneSerializer().write(scene_data, output_path)
+    if checkpoint:
+        checkpoint.finish()
+
+    result = {
+        "shot": shot["shot_name"],
+        "output_path": str(output_path),
+        "meshes": len(scene_data.get("meshes", [])),
+    }
+
+    if options.get("render_jobs") and "render_passes" in scene_data:
+        jobs = ShotManager().build_render_jobs(
+            shot, scene_data["render_passes"], options.get("render_dir", output_dir)
+        )
+        jobs_path = output_dir / f"{shot['shot_name']}_jobs.json"
+        with open(jobs_path, "w", encoding="utf-8") as f:
+            json.dump(jobs, f, indent=2)
+        result["jobs_path"] = str(jobs_path)
+        result["jobs"] = len(jobs)
+
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def _shot_done(
+    progress: ProgressReporter, shot: Dict[str, Any], result: Dict[str, Any]
+) -> None:
+    """Report one exported shot"""
+    print(f"✓ Shot {shot['shot_name']} exported")
+    progress.emit(
+        "output", kind="shot", shot=shot["shot_name"], path=result["output_path"]
+    )
+    progress.advance("shots", item=shot["shot_name"])
+
+
+def _init_worker(scene_path: str, startup: Optional[Dict[str, Any]] = None) -> None:
+    """Start Maya in a worker process and open the scene once"""
+    import atexit
+    from startup import StartupProfile
+
+    options = startup or {"sections": [], "controlled": False}
+    profile = StartupProfile(scene_path, **options)
+    atexit.register(profile.close)
+    profile.start()
+    profile.open_scene()
+
+
+def export_shots(
+    scene_path: Path,
+    shots: List[Dict[str, Any]],
+    output_dir: Path,
+    options: Dict[str, Any],
+    workers: int = 1,
+    startup: Optional[Dict[str, Any]] = None,
+    progress: Optional[ProgressReporter] = None,
+) -> List[Dict[str, Any]]:
+    """Export shots, in worker processes when workers > 1
+
+    Each worker runs its own Maya standalone session and opens the scene once,
+    then exports whichever shots it is handed, started with the same startup
+    profile options as this process (see startup.StartupProfile). With
+    workers == 1 the shots are exported from the scene already open in this
+    process.
+
+    A cancel stops after the current shot; with workers, shots not yet
+    started are dropped and running ones are finished first.
+    """
+    progress = progress or ProgressReporter()
+    with progress.phase("shots", total=len(shots)):
+        if workers <= 1 or len(shots) <= 1:
+            results = []
+            for shot in shots:
+                progress.check_cancel()
+                try:
+                    results.append(export_shot(shot, output_dir, options, progress))
+                except Cancelled:
+                    raise
+                except Exception as e:
+                    print(f"ERROR: Shot {shot['shot_name']} failed: {e}")
+                    progress.emit("error", shot=shot["shot_name"], message=str(e))
+                    results.append({"shot": shot["shot_name"], "error": str(e)})
+                else:
+                    _shot_done(progress, shot, results[-1])
+            return results
+
+        results = []
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(shots)),
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(str(scene_path), startup),
+        ) as pool:
+            futures = {
+                pool.submit(export_shot, shot, output_dir, options): shot
+                for shot in shots
+            }
+            for future in as_completed(futures):
+                shot = futures[future]
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    print(f"ERROR: Shot {shot['shot_name']} failed: {e}")
+                    progress.emit("error", shot=shot["shot_name"], message=str(e))
+                    results.append({"shot": shot["shot_name"], "error": str(e)})
+                else:
+                    _shot_done(progress, shot, results[-1])
+                if progress.cancelled:
+                    for pending in futures:
+                        pending.cancel()
+                    raise Cancelled(progress.cancel_reason)
+
+    order = {shot["shot_name"]: i for i, shot in enumerate(shots)}
+    results.sort(key=lambda r: order.get(r["shot"], 0))
+    return results
@@ -0,0 +1,340 @@
+import os
+import re
+import shlex
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+
+# Renderer plugins only the sections that read or drive the renderer need.
+# Every other plugin the scene requires is loaded.
+PLUGIN_SECTIONS = {
+    "mtoa": ["aovs", "materials", "render"],
+    "redshift4maya": ["aovs", "materials", "render"],
+}
+
+# requires lines that do not name a plugin
+CORE_REQUIREMENTS = {"maya"}
+
+# requires flags that take a value before the plugin name
+_REQUIRES_FLAGS = {"-nodeType", "-nt", "-dataType", "-dt"}
+
+# Bytes read from the top of the scene when looking for requirements
+SCAN_BYTES = 4 << 20
+
+# Statements that come after the requires block in .ma files
+_AFTER_REQUIRES = re.compile(r"^\s*(currentUnit|fileInfo|createNode)\b", re.M)
+_REQUIRES = re.compile(r"^\s*requires\s+([^;]*);", re.M)
+# .mb: a PLUG chunk holds "<plugin>\0<version>\0" after its size field
+_BINARY_PLUG = re.compile(rb"PLUG.{4,12}?([A-Za-z_][\w.\-]*)\x00[^\x00]*\x00", re.S)
+
+
+def scene_requirements(scene_path: str) -> List[str]:
+    """Plugins named by a scene's requires lines, in file order
+
+    .ma files are parsed up to the first node; .mb files are scanned for
+    their PLUG chunks. Maya itself is left out.
+    """
+    with open(scene_path, "rb") as f:
+        head = f.read(SCAN_BYTES)
+
+    if str(scene_path).lower().endswith(".ma"):
+        text = head.decode("utf-8", errors="replace")
+        end = _AFTER_REQUIRES.search(text)
+        plugins = _ascii_requirements(text[: end.start()] if end else text)
+    else:
+        plugins = [
+            match.group(1).decode("utf-8", errors="replace")
+            for match in _BINARY_PLUG.finditer(head)
+        ]
+
+    return [p for p in dict.fromkeys(plugins) if p not in CORE_REQUIREMENTS]
+
+
+def _ascii_requirements(text: str) -> List[str]:
+    """Plugin names of every requires statement in .ma text"""
+    plugins = []
+    for match in _REQUIRES.finditer(text):
+        try:
+            tokens = shlex.split(match.group(1))
+        except ValueError:
+            continue
+        skip = False
+        for token in tokens:
+            if skip:
+                skip = False
+            elif token in _REQUIRES_FLAGS:
+                skip = True
+            elif not token.startswith("-"):
+                plugins.append(token)
+                break
+    return plugins
+
+
+def read_maya_env(path: str) -> Dict[str, str]:
+    """VAR = value lines of a Maya.env file, $VAR / %VAR% references expanded"""
+    values = {}
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith(("//", "#")) or "=" not in line:
+                continue
+            name, value = (part.strip() for part in line.split("=", 1))
+            if name:
+                values[name] = os.path.expandvars(value)
+    return values
+
+
+def apply_maya_env(values: Dict[str, str]) -> None:
+    """Set Maya.env variables the way Maya does
+
+    Variables already in the environment win, except path lists (names
+    ending in PATH), which get the Maya.env entries appended.
+    """
+    for name, value in values.items():
+        current = os.environ.get(name)
+        if current is None:
+            os.environ[name] = value
+        elif name.endswith("PATH"):
+            paths = current.split(os.pathsep)
+            paths += [p for p in value.split(os.pathsep) if p and p not in paths]
+            os.environ[name] = os.pathsep.join(paths)
+
+
+def maya_version() -> Optional[str]:
+    """Year version of the running Maya (e.g. "2024"), from its install path"""
+    for path in [os.environ.get("MAYA_LOCATION", ""), sys.executable]:
+        match = re.search(r"[Mm]aya(\d{4})", path)
+        if match:
+            return match.group(1)
+    return None
+
+
+def plan_plugins(
+    requirements: List[str], sections: List[str], extra: Optional[List[str]] = None
+) -> Tuple[List[str], List[str]]:
+    """Split required plugins into (to load, deferred) for the sections
+
+    A plugin listed in PLUGIN_SECTIONS is loaded only when one of its
+    sections is requested; extra plugins are always loaded.
+    """
+    load, deferred = [], []
+    for plugin in requirements:
+        needed_by = PLUGIN_SECTIONS.get(plugin)
+        if needed_by is None or set(needed_by) & set(sections):
+            load.append(plugin)
+        else:
+            deferred.append(plugin)
+    load.extend(p for p in extra or [] if p not in load)
+    deferred = [p for p in deferred if p not in load]
+    return load, deferred
+
+
+def process_age() -> Optional[float]:
+    """Seconds since this process started, or None where it is unknown"""
+    try:
+        if sys.platform.startswith("linux"):
+            with open("/proc/self/stat", "rb") as f:
+                # Field 22 (after the parenthesized command name) is the start
+                # time in clock ticks since boot
+                fields = f.read().rsplit(b")", 1)[1].split()
+            with open("/proc/uptime", "rb") as f:
+                uptime = float(f.read().split()[0])
+            return uptime - int(fields[19]) / os.sysconf("SC_CLK_TCK")
+
+        if sys.platform == "win32":
+            import ctypes
+            from ctypes import wintypes
+
+            creation, exit_time, kernel, user, now = (
+                wintypes.FILETIME() for _ in range(5)
+            )
+            kernel32 = ctypes.windll.kernel32
+            kernel32.GetProcessTimes(
+                kernel32.GetCurrentProcess(),
+                ctypes.byref(creation),
+                ctypes.byref(exit_time),
+                ctypes.byref(kernel),
+                ctypes.byref(user),
+            )
+            kernel32.GetSystemTimeAsFileTime(ctypes.byref(now))
+
+            def ticks(filetime):
+                return (filetime.dwHighDateTime << 32) | filetime.dwLowDateTime
+
+            return (ticks(now) - ticks(creation)) / 1e7
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    return None
+
+
+class StartupProfile:
+    """Start Maya standalone with only the plugins an export needs, timed
+
+    Without control this is a plain maya.standalone.initialize() (user prefs,
+    autoloaded plugins, userSetup) that is timed. With control, Maya starts
+    with an empty MAYA_APP_DIR, so nothing the user's plugin prefs mark for
+    autoload is loaded and no userSetup runs. The user's Maya.env is applied
+    to the environment first and their modules folder stays on
+    MAYA_MODULE_PATH, so plugin and renderer paths are still found. The
+    plugins the scene requires are then loaded one by one, leaving out
+    renderer plugins no requested section needs (see plan_plugins). Maya may
+    still load a deferred plugin itself when it reads the scene's requires
+    lines; report() lists the plugins actually loaded after the scene is open.
+    """
+
+    def __init__(
+        self,
+        scene_path: str,
+        sections: List[str],
+        plugins: Optional[List[str]] = None,
+        controlled: bool = True,
+    ):
+        self.scene_path = str(scene_path)
+        self.sections = list(sections)
+        self.extra_plugins = list(plugins or [])
+        self.controlled = controlled
+        self.timings: Dict[str, Any] = {"interpreter": process_age()}
+        self.requirements: List[str] = []
+        self.deferred: List[str] = []
+        self.loaded: List[str] = []
+        self._app_dir: Optional[str] = None
+
+    def start(self) -> None:
+        """Initialize maya.standalone, then load the planned plugins"""
+        if self.controlled:
+            self._isolate_prefs()
+
+        start = time.perf_counter()
+        import maya.standalone
+
+        maya.standalone.initialize()
+        self.timings["standalone"] = time.perf_counter() - start
+
+        if self.controlled:
+            self.load_plugins()
+
+    def load_plugins(self) -> Dict[str, float]:
+        """Load the plugins the scene and sections need, timing each"""
+        import maya.cmds as cmds
+
+        start = time.perf_counter()
+        self.requirements = scene_requirements(self.scene_path)
+        load, self.deferred = plan_plugins(
+            self.requirements, self.sections, self.extra_plugins
+        )
+        self.timings["requirements"] = time.perf_counter() - start
+
+        plugin_timings = {}
+        for plugin in load:
+            start = time.perf_counter()
+            try:
+                cmds.loadPlugin(plugin, quiet=True)
+            except RuntimeError as e:
+                print(f"Warning: Could not load plugin {plugin}: {e}")
+                continue
+            plugin_timings[plugin] = time.perf_counter() - start
+        self.timings["plugins"] = plugin_timings
+        return plugin_timings
+
+    def open_scene(self) -> None:
+        """Open the scene, timed"""
+        import maya.cmds as cmds
+
+        start = time.perf_counter()
+        cmds.file(self.scene_path, open=True, force=True)
+        self.timings["scene_open"] = time.perf_counter() - start
+        self.loaded = cmds.pluginInfo(query=True, listPlugins=True) or []
+
+    def report(self) -> Dict[str, Any]:
+        """Startup timings (seconds), requirements and loaded plugins"""
+        timings = dict(self.timings)
+        timings["total"] = sum(
+            sum(value.values()) if isinstance(value, dict) else value or 0.0
+            for value in timings.values()
+        )
+        return {
+            "controlled": self.controlled,
+            "timings": timings,
+            "requirements": self.requirements,
+            "deferred": self.deferred,
+            "loaded": self.loaded,
+        }
+
+    def close(self) -> None:
+        """Remove the empty prefs folder"""
+        if self._app_dir:
+            shutil.rmtree(self._app_dir, ignore_errors=True)
+            self._app_dir = None
+
+    def _isolate_prefs(self) -> None:
+        """Point Maya at an empty prefs folder before it starts"""
+        user_app_dir = os.environ.get("MAYA_APP_DIR") or _default_app_dir()
+
+        # Maya would read Maya.env from the user's folder: plugin, module and
+        # renderer paths defined there are needed to load the plugins
+        version = maya_version()
+        candidates = [Path(user_app_dir) / "Maya.env"]
+        if version:
+            candidates.insert(0, Path(user_app_dir) / version / "Maya.env")
+        for maya_env in candidates:
+            if maya_env.is_file():
+                apply_maya_env(read_maya_env(str(maya_env)))
+                break
+
+        self._app_dir = tempfile.mkdtemp(prefix="maya_ae_prefs_")
+        os.environ["MAYA_APP_DIR"] = self._app_dir
+
+        # Modules installed in the user's folder still provide plugins
+        modules = Path(user_app_dir) / "modules"
+        if modules.is_dir():
+            paths = [p for p in [str(modules), os.environ.get("MAYA_MODULE_PATH")] if p]
+            os.environ["MAYA_MODULE_PATH"] = os.pathsep.join(paths)
+
+        os.environ["MAYA_SKIP_USERSETUP_PY"] = "1"
+        os.environ.setdefault("MAYA_DISABLE_CIP", "1")
+        os.environ.setdefault("MAYA_DISABLE_CER", "1")
+
+
+def _default_app_dir() -> str:
+    """Maya's per-user folder when MAYA_APP_DIR is not set"""
+    home = Path.home()
+    if sys.platform == "win32":
+        return str(home / "Documents" / "maya")
+    if sys.platform == "darwin":
+        return str(home / "Library" / "Preferences" / "Autodesk" / "maya")
+    return str(home / "maya")
+
+
+def format_report(report: Dict[str, Any]) -> List[str]:
+    """Printable lines of a startup report"""
+    timings = report["timings"]
+    rows = [
+        (label, timings.get(key))
+        for label, key in [
+            ("interpreter", "interpreter"),
+            ("standalone init", "standalone"),
+            ("requires scan", "requirements"),
+        ]
+    ]
+    rows += [
+        (f"plugin {plugin}", seconds)
+        for plugin, seconds in (timings.get("plugins") or {}).items()
+    ]
+    rows += [("scene open", timings.get("scene_open")), ("total", timings["total"])]
+
+    lines = ["Startup time:"]
+    lines += [
+        f"  {label + ':':<24}{seconds:7.2f} s"
+        for label, seconds in rows
+        if seconds is not None
+    ]
+    if report["deferred"]:
+        lines.append(f"  deferred plugins: {', '.join(report['deferred'])}")
+        reloaded = [p for p in report["deferred"] if p in report["loaded"]]
+        if reloaded:
+            lines.append(f"  loaded by the scene anyway: {', '.join(reloaded)}")
+    return lines
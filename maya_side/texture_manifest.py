@@ -0,0 +1,244 @@
+import argparse
+import hashlib
+import json
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple
+
+from sequence_index import SequenceIndex
+
+
+# Tile and frame tokens used in texture paths -> regex matching the value
+TEXTURE_TOKENS = [
+    (re.compile(r"<udim>", re.IGNORECASE), r"\d{4}"),
+    (re.compile(r"<uvtile>", re.IGNORECASE), r"u\d+_v\d+"),
+    (re.compile(r"u<u>_v<v>", re.IGNORECASE), r"u\d+_v\d+"),
+    (re.compile(r"<f\d*>|<frame>", re.IGNORECASE), r"\d+"),
+    (re.compile(r"%0?\d*d"), r"\d+"),
+    (re.compile(r"#+"), r"\d+"),
+]
+
+HASH_CHUNK_SIZE = 1 << 20
+DEFAULT_WORKERS = 16
+CACHE_FILE_NAME = ".texture_hashes.json"
+
+
+def resolve_path(path: str, workspace_root: str = "") -> str:
+    """Absolute path of a texture, relative paths taken from the workspace root"""
+    path = os.path.expandvars(path)
+    if not os.path.isabs(path) and workspace_root:
+        path = os.path.join(workspace_root, path)
+    return os.path.normpath(path)
+
+
+def load_textures(export_path: str) -> List[Dict[str, Any]]:
+    """Texture table of an export, with interned paths turned back into strings"""
+    from serializer import SceneSerializer
+
+    scene_data = SceneSerializer().read(export_path)["scene_data"]
+    return list(scene_data.get("textures", []))
+
+
+def token_pattern(file_name: str) -> Optional[re.Pattern]:
+    """Regex matching every tile/frame a tokenized file name expands to"""
+    parts = [(0, len(file_name), None)]
+    for token, value in TEXTURE_TOKENS:
+        expanded = []
+        for start, end, regex in parts:
+            if regex is not None:
+                expanded.append((start, end, regex))
+                continue
+            position = start
+            for match in token.finditer(file_name, start, end):
+                expanded.append((position, match.start(), None))
+                expanded.append((match.start(), match.end(), value))
+                position = match.end()
+            expanded.append((position, end, None))
+        parts = expanded
+
+    if all(regex is None for _, _, regex in parts):
+        return None
+    return re.compile(
+        "".join(
+            re.escape(file_name[start:end]) if regex is None else regex
+            for start, end, regex in parts
+        )
+        + "$"
+    )
+
+
+class TextureManifest:
+    """Stat and content-hash every file the exported textures point to
+
+    Tokenized paths (<UDIM>, <UVTILE>, u<U>_v<V>, frame numbers) are
+    expanded by listing each folder once. Files are stat'ed and hashed in a
+    thread pool since the work is I/O bound, and hashes are kept in an
+    on-disk cache keyed by path, size and mtime so unchanged tiles are never
+    read twice.
+    """
+
+    def __init__(
+        self,
+        workspace_root: str = "",
+        cache_path: Optional[str] = None,
+        workers: int = DEFAULT_WORKERS,
+    ):
+        self.workspace_root = workspace_root
+        self.cache_path = cache_path
+        self.workers = workers
+        self.index = SequenceIndex()
+        self._cache: Dict[str, Tuple[int, int, str]] = {}
+        self.hashed = 0
+        self.cached = 0
+
+        if cache_path and os.path.isfile(cache_path):
+            try:
+                with open(cache_path, "r", encoding="utf-8") as f:
+                    self._cache = {k: tuple(v) for k, v in json.load(f).items()}
+            except (OSError, ValueError) as e:
+                print(f"Warning: Ignoring texture hash cache {cache_path}: {e}")
+
+    def expand(self, path: str) -> Tuple[str, List[str]]:
+        """Resolved path and the files it stands for (may be empty)"""
+        resolved = resolve_path(path, self.workspace_root)
+        folder, file_name = os.path.split(resolved)
+        pattern = token_pattern(file_name)
+
+        if pattern is None:
+            exists = file_name in self.index.list_folder(folder)
+            return resolved, [resolved] if exists else []
+
+        files = sorted(
+            name for name in self.index.list_folder(folder) if pattern.match(name)
+        )
+        return resolved, [os.path.join(folder, name) for name in files]
+
+    def build(self, textures: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Manifest of the files behind a scene's texture table"""
+        start = time.perf_counter()
+        entries = []
+        all_files = []
+
+        for texture in textures:
+            resolved, files = self.expand(texture.get("path", ""))
+            entries.append(
+                {
+                    "node": texture.get("node"),
+                    "path": texture.get("path", ""),
+                    "resolved_path": resolved,
+                    "files": files,
+                }
+            )
+            all_files.extend(files)
+
+        unique_files = list(dict.fromkeys(all_files))
+        if self.workers > 1 and len(unique_files) > 1:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                results = list(pool.map(self._file_info, unique_files))
+        else:
+            results = [self._file_info(path) for path in unique_files]
+
+        infos = {}
+        for path, (info, from_cache) in zip(unique_files, results):
+            if info is None:
+                continue
+            infos[path] = info
+            if from_cache:
+                self.cached += 1
+            else:
+                self.hashed += 1
+
+        for entry in entries:
+            entry["files"] = [infos[path] for path in entry["files"] if path in infos]
+            entry["missing"] = not entry["files"]
+            entry["bytes"] = sum(info["size"] for info in entry["files"])
+
+        self.save_cache()
+
+        return {
+            "textures": entries,
+            "missing": [e["path"] for e in entries if e["missing"]],
+            "files": len(infos),
+            "total_bytes": sum(info["size"] for info in infos.values()),
+            "hashed": self.hashed,
+            "cached": self.cached,
+            "seconds": time.perf_counter() - start,
+        }
+
+    def _file_info(self, path: str) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """Size, mtime and hash of one file, and whether the hash was cached"""
+        try:
+            stat = os.stat(path)
+            cached = self._cache.get(path)
+            from_cache = bool(
+                cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns
+            )
+            if from_cache:
+                digest = cached[2]
+            else:
+                digest = self.hash_file(path)
+                self._cache[path] = (stat.st_size, stat.st_mtime_ns, digest)
+        except FileNotFoundError:
+            # Removed between the folder listing and the stat
+            return None, False
+
+        info = {
+            "path": path,
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+            "hash": digest,
+        }
+        return info, from_cache
+
+    @staticmethod
+    def hash_file(path: str) -> str:
+        """BLAKE2b digest of a file's contents"""
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def save_cache(self) -> None:
+        """Write the hash cache back to disk"""
+        if not self.cache_path:
+            return
+        temp_path = f"{self.cache_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self._cache, f)
+        os.replace(temp_path, self.cache_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stat and hash exported textures")
+    parser.add_argument("export", type=str, help="Exported scene JSON")
+    parser.add_argument("-o", "--output", type=str, help="Manifest JSON path")
+    parser.add_argument("--root", type=str, default="", help="Workspace root")
+    parser.add_argument("--cache", type=str, help="Hash cache file")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    args = parser.parse_args()
+
+    cache = args.cache or os.path.join(
+        os.path.dirname(os.path.abspath(args.export)), CACHE_FILE_NAME
+    )
+    manifest = TextureManifest(args.root, cache, args.workers).build(
+        load_textures(args.export)
+    )
+
+    print(
+        f"✓ {manifest['files']} files, {manifest['total_bytes'] / 2**20:.1f} MB "
+        f"({manifest['hashed']} hashed, {manifest['cached']} cached) "
+        f"in {manifest['seconds']:.2f}s"
+    )
+    for path in manifest["missing"]:
+        print(f"✗ missing: {path}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
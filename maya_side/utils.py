@@ -22,10 +22,9 @@ def print_scene_stats():
 
 def safe_get_attr(node: str, attr: str, default=None):
     """Safely get Maya attribute with fallback"""
-    try:
-        return cmds.getAttr(f"{node}.{attr}")
-    except:
-        return default
+    from attr_cache import read_plugs
+
+    return read_plugs([f"{node}.{attr}"], default)[f"{node}.{attr}"]
 
 
 def is_valid_maya_scene(file_path: str) -> bool:
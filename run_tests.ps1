@@ -25,7 +25,21 @@ if (-not $mayapy) {
 $tests = @(
     "tests\test_serializer.py",
     "tests\test_scene_reader.py",
-    "tests\test_aov_manager.py"
+    "tests\test_aov_manager.py",
+    "tests\test_jsx_writer.py",
+    "tests\test_exr_inspector.py",
+    "tests\test_exr_packer.py",
+    "tests\test_proxy_generator.py",
+    "tests\test_sequence_index.py",
+    "tests\test_texture_manifest.py",
+    "tests\test_schema_validator.py",
+    "tests\test_export_diff.py",
+    "tests\test_extraction_cache.py",
+    "tests\test_frustum.py",
+    "tests\test_glb_writer.py",
+    "tests\test_startup.py",
+    "tests\test_progress.py",
+    "tests\test_checkpoint.py"
 )
 
 $totalPassed = 0
@@ -142,6 +142,78 @@ def test_arnold_aovs():
         print(f"⚠ Arnold test skipped: {e}")
 
 
+def test_render_layers():
+    """Test per-layer overrides are resolved without switching layers"""
+    print("\n=== Test: Render Layers ===")
+
+    import maya.cmds as cmds
+    import maya.app.renderSetup.model.renderSetup as renderSetup
+    from aov_manager import AOVManager
+
+    cmds.file(new=True, force=True)
+    cmds.setAttr("defaultResolution.width", 1920)
+
+    setup_layer = renderSetup.instance().createRenderLayer("wide")
+    setup_layer.setRenderable(True)
+    settings = setup_layer.renderSettingsCollectionInstance()
+    override = settings.createAbsoluteOverride("defaultResolution", "width")
+    override.setAttrValue(4096)
+
+    visible = cmds.editRenderLayerGlobals(query=True, currentRenderLayer=True)
+
+    result = AOVManager().get_all_aovs()
+    layers = {layer["name"]: layer for layer in result["layers"]}
+
+    assert "wide" in layers, "Renderable layer should get its own entry"
+    assert layers["wide"]["render_settings"]["resolution"]["width"] == 4096, (
+        "Layer resolution override should be applied"
+    )
+    assert result["render_settings"]["resolution"]["width"] == 1920, (
+        "Master settings should be unchanged"
+    )
+    assert (
+        cmds.editRenderLayerGlobals(query=True, currentRenderLayer=True) == visible
+    ), "Visible layer should not be switched"
+
+    print(f"✓ {len(layers)} layers, 'wide' renders at 4096")
+
+
+def test_visible_render_layer():
+    """Test master settings are recovered while a render setup layer is visible"""
+    print("\n=== Test: Visible Render Layer ===")
+
+    import maya.cmds as cmds
+    import maya.app.renderSetup.model.renderSetup as renderSetup
+    from aov_manager import AOVManager
+
+    cmds.file(new=True, force=True)
+    cmds.setAttr("defaultResolution.width", 1920)
+
+    setup = renderSetup.instance()
+    setup_layer = setup.createRenderLayer("wide")
+    setup_layer.setRenderable(True)
+    settings = setup_layer.renderSettingsCollectionInstance()
+    override = settings.createAbsoluteOverride("defaultResolution", "width")
+    override.setAttrValue(4096)
+    setup.switchToLayer(setup_layer)
+
+    try:
+        assert cmds.getAttr("defaultResolution.width") == 4096, "Layer is applied"
+
+        result = AOVManager().get_all_aovs()
+        layers = {layer["name"]: layer for layer in result["layers"]}
+
+        master = layers["masterLayer"]["render_settings"]
+        assert layers["wide"]["render_settings"]["resolution"]["width"] == 4096
+        assert master["resolution"]["width"] == 1920, (
+            "Master should report its own width while 'wide' is visible"
+        )
+    finally:
+        setup.switchToLayer(setup.getDefaultRenderLayer())
+
+    print("✓ Master renders at 1920 while 'wide' is visible")
+
+
 def run_all_tests():
     """Run all AOV tests"""
     print("\n" + "=" * 60)
@@ -154,6 +226,8 @@ def run_all_tests():
         test_get_render_settings,
         test_default_aovs,
         test_arnold_aovs,
+        test_render_layers,
+        test_visible_render_layer,
     ]
 
     passed = 0
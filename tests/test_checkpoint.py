@@ -0,0 +1,157 @@
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "maya_side"))
+
+from checkpoint import Checkpoint, journal_path, scene_stamp
+
+
+JOB = {"kind": "render", "scene": {"path": "/proj/shot.ma", "size": 10, "mtime": 1}}
+
+
+def test_journal_path():
+    """Test journals sit next to the output, without frame tokens"""
+    print("\n=== Test: Journal Path ===")
+
+    assert journal_path("/renders/beauty.####.exr") == Path(
+        "/renders/beauty.exr.checkpoint.jsonl"
+    )
+    assert journal_path("/renders/beauty_###.exr").name == (
+        "beauty.exr.checkpoint.jsonl"
+    )
+    assert journal_path("exports/shot010.json").name == (
+        "shot010.json.checkpoint.jsonl"
+    )
+
+    print("✓ beauty.####.exr -> beauty.exr.checkpoint.jsonl")
+
+
+def test_resume():
+    """Test a resumed journal returns the units recorded before the crash"""
+    print("\n=== Test: Resume ===")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "beauty.exr.checkpoint.jsonl"
+
+        first = Checkpoint(path, JOB)
+        assert first.begin(aov="beauty", frames=[1, 2, 3, 4]) == 0
+        first.record(1, path="beauty.0001.exr")
+        first.record(2, path="beauty.0002.exr")
+        first.close()  # The process died here
+
+        second = Checkpoint(path, JOB, resume=True)
+        assert second.begin(aov="beauty", frames=[1, 2, 3, 4]) == 2
+        assert second.done(2) == {"key": "2", "path": "beauty.0002.exr"}
+        assert second.done(3) is None
+        second.record(3, path="beauty.0003.exr")
+        second.close()
+
+        third = Checkpoint(path, JOB, resume=True)
+        assert third.begin(aov="beauty", frames=[1, 2, 3, 4]) == 3
+        third.finish()
+        assert not path.exists(), "Journal removed once the output is complete"
+
+    print("✓ Resumed after 2, then 3 of 4 frames")
+
+
+def test_other_job():
+    """Test a journal of another job or without --resume starts over"""
+    print("\n=== Test: Other Job ===")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "shot.json.checkpoint.jsonl"
+        with Checkpoint(path, JOB) as checkpoint:
+            checkpoint.begin(frames=[1, 10])
+            checkpoint.record(1, lights=[])
+
+        edited = dict(JOB, scene=dict(JOB["scene"], mtime=2))
+        with Checkpoint(path, edited, resume=True) as checkpoint:
+            assert checkpoint.begin(frames=[1, 10]) == 0, "Scene was edited"
+
+        with Checkpoint(path, edited, resume=True) as checkpoint:
+            assert checkpoint.begin(frames=[1, 20]) == 0, "Frame range changed"
+            checkpoint.record(1, lights=[])
+
+        with Checkpoint(path, edited) as checkpoint:
+            assert checkpoint.begin(frames=[1, 20]) == 0, "Not resuming"
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 1 and json.loads(lines[0])["job"]["frames"] == [1, 20]
+
+    print("✓ Stale journals replaced")
+
+
+def test_torn_journal():
+    """Test a line cut short by a crash and replaced units are dropped"""
+    print("\n=== Test: Torn Journal ===")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "cam.json.checkpoint.jsonl"
+        samples = {"cameras": [[[1.0, 0.1 + 0.2], 35.0]], "lights": []}
+        with Checkpoint(path, JOB) as checkpoint:
+            checkpoint.begin()
+            checkpoint.record(1, **samples)
+            checkpoint.record(2, **samples)
+            checkpoint.discard(2)
+            checkpoint.record(2, cameras=[], lights=[])
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"key": "3", "cameras": [[[1.0, ')
+
+        with Checkpoint(path, JOB, resume=True) as checkpoint:
+            assert checkpoint.begin() == 2
+            assert checkpoint.done(1)["cameras"] == samples["cameras"], "Exact floats"
+            assert checkpoint.done(2)["cameras"] == []
+            checkpoint.record(3, **samples)
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line).get("key") for line in lines] == [None, "1", "2", "3"]
+
+        stamp = scene_stamp(str(path))
+        assert stamp["size"] == path.stat().st_size
+        assert Path(stamp["path"]).is_absolute()
+
+    print("✓ Torn last line dropped, journal compacted")
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("\n" + "=" * 60)
+    print("Running Checkpoint Tests")
+    print("=" * 60)
+
+    tests = [
+        test_journal_path,
+        test_resume,
+        test_other_job,
+        test_torn_journal,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"✗ ERROR: {e}")
+            import traceback
+
+            traceback.print_exc()
+            failed += 1
+
+    print("\n" + "=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
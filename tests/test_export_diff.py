@@ -0,0 +1,159 @@
+import sys
+import json
+from pathlib import Path
+import tempfile
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "maya_side"))
+
+from export_diff import ExportDiff
+from serializer import SceneSerializer
+
+
+def _scene(count=30):
+    """Scene with meshes, a light, a material and AOVs"""
+    return {
+        "schema_version": "0.2.0",
+        "scene_info": {"fps": 24, "frame_range": [1.0, 48.0]},
+        "cameras": [{"name": "shotCam", "focal_length": 35.0}],
+        "meshes": [
+            {
+                "name": f"rock{i}",
+                "full_path": f"|env|rock{i}",
+                "transform": [1.0, 0, 0, 0, 0, 1.0, 0, 0, 0, 0, 1.0, 0, i, 0, 0, 1.0],
+                "geometry": {"vertex_count": 8, "face_count": 6},
+                "material": "rockMat",
+                "visible": True,
+            }
+            for i in range(count)
+        ],
+        "lights": [{"name": "key", "type": "spotLight", "intensity": 2.0}],
+        "materials": [
+            {
+                "name": "rockMat",
+                "shading_engine": "rockMatSG",
+                "type": "aiStandardSurface",
+                "assigned_objects": [f"rock{i}" for i in range(count)],
+                "properties": {"color": [0.5, 0.5, 0.5]},
+            }
+        ],
+        "render_passes": {
+            "renderer": "Arnold",
+            "aovs": [
+                {"name": "beauty", "type": "RGBA", "enabled": True},
+                {"name": "diffuse", "type": "diffuse", "enabled": True},
+            ],
+            "render_settings": {},
+        },
+    }
+
+
+def _write_pair(temp_dir, old, new, old_options=None, new_options=None):
+    serializer = SceneSerializer()
+    old_path = Path(temp_dir) / "old.json"
+    new_path = Path(temp_dir) / "new.json"
+    serializer.write(old, old_path, **(old_options or {}))
+    serializer.write(new, new_path, **(new_options or {}))
+    return str(old_path), str(new_path)
+
+
+def test_identical_reordered():
+    """Test reordered lists and sub-tolerance jitter are not changes"""
+    print("\n=== Test: Reordered Export ===")
+
+    old = _scene()
+    new = _scene()
+    new["meshes"].reverse()
+    new["meshes"][0]["transform"][12] += 1e-7
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        result = ExportDiff().diff(*_write_pair(temp_dir, old, new))
+
+    assert result["changes"] == [], result["changes"]
+    assert result["summary"]["meshes"]["unchanged"] == 30
+    print("✓ Reordered export has no changes")
+
+
+def test_change_set():
+    """Test added, removed and changed rows with field-level old/new values"""
+    print("\n=== Test: Change Set ===")
+
+    old = _scene()
+    new = _scene()
+    new["meshes"][4]["transform"][13] = 2.5
+    new["meshes"][5]["geometry"]["vertex_count"] = 10
+    new["meshes"].append(dict(new["meshes"][0], name="rock99", full_path="|env|rock99"))
+    del new["lights"][0]
+    new["materials"][0]["properties"]["color"] = [0.5, 0.1, 0.5]
+    new["render_passes"]["aovs"][1]["enabled"] = False
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Layout and interning must not matter
+        paths = _write_pair(
+            temp_dir, old, new, {"intern": True}, {"layout": "columnar"}
+        )
+        result = ExportDiff().diff(*paths)
+
+    changes = {(c["section"], c["key"]): c for c in result["changes"]}
+    assert changes[("meshes", "|env|rock99")]["op"] == "added"
+    assert changes[("lights", "key")]["op"] == "removed"
+
+    moved = changes[("meshes", "|env|rock4")]["fields"]
+    assert list(moved) == ["transform"], moved
+    assert moved["transform"]["delta"] == 2.5
+    assert moved["transform"]["old"][13] == 0 and moved["transform"]["new"][13] == 2.5
+
+    geometry = changes[("meshes", "|env|rock5")]["fields"]["geometry.vertex_count"]
+    assert geometry == {"old": 8, "new": 10}, geometry
+
+    color = changes[("materials", "rockMatSG")]["fields"]["properties.color"]
+    assert abs(color["delta"] - 0.4) < 1e-9
+
+    aov = changes[("aovs", "diffuse")]["fields"]["enabled"]
+    assert aov == {"old": True, "new": False}, aov
+
+    summary = result["summary"]
+    assert summary["meshes"] == {"added": 1, "removed": 0, "changed": 2, "unchanged": 28}
+    assert len(result["changes"]) == 6
+    json.dumps(result)
+
+    print(f"✓ {len(result['changes'])} changes found")
+
+
+def run_all_tests():
+    """Run all export diff tests"""
+    print("\n" + "=" * 60)
+    print("Running Export Diff Tests")
+    print("=" * 60)
+
+    tests = [
+        test_identical_reordered,
+        test_change_set,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"✗ ERROR: {e}")
+            import traceback
+
+            traceback.print_exc()
+            failed += 1
+
+    print("\n" + "=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
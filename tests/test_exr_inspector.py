@@ -0,0 +1,244 @@
+import sys
+import struct
+from pathlib import Path
+import tempfile
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "maya_side"))
+
+from exr_inspector import EXRInspector, EXRError, aov_channel_info
+
+
+SAMPLE_EXR = Path(__file__).parent.parent / "data" / "temp_render" / "diffuse.0010.exr"
+
+
+def _attribute(name, attr_type, value):
+    return (
+        name.encode() + b"\x00" + attr_type.encode() + b"\x00"
+        + struct.pack("<i", len(value)) + value
+    )
+
+
+def _write_scanline_exr(path, width=4, height=3, channels=("R",)):
+    """Write a minimal uncompressed HALF scanline EXR"""
+    chlist = b"".join(
+        name.encode() + b"\x00" + struct.pack("<iB3xii", 1, 0, 1, 1)
+        for name in sorted(channels)
+    ) + b"\x00"
+    window = struct.pack("<iiii", 0, 0, width - 1, height - 1)
+
+    header = struct.pack("<ii", 20000630, 2)
+    header += _attribute("channels", "chlist", chlist)
+    header += _attribute("compression", "compression", b"\x00")
+    header += _attribute("dataWindow", "box2i", window)
+    header += _attribute("displayWindow", "box2i", window)
+    header += _attribute("lineOrder", "lineOrder", b"\x00")
+    header += _attribute("pixelAspectRatio", "float", struct.pack("<f", 1.0))
+    header += b"\x00"
+
+    line_bytes = width * 2 * len(channels)
+    table_start = len(header)
+    first_chunk = table_start + height * 8
+    chunk_size = 8 + line_bytes
+
+    offsets = [first_chunk + y * chunk_size for y in range(height)]
+    chunks = b"".join(
+        struct.pack("<ii", y, line_bytes) + b"\x00" * line_bytes for y in range(height)
+    )
+
+    with open(path, "wb") as f:
+        f.write(header + struct.pack(f"<{height}Q", *offsets) + chunks)
+
+    return table_start
+
+
+def test_read_header():
+    """Test header parsing of a scanline file"""
+    print("\n=== Test: EXR Header ===")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "beauty.0001.exr"
+        _write_scanline_exr(path, channels=("R", "G", "B"))
+
+        header = EXRInspector().read_header(path)
+        part = header["parts"][0]
+
+        assert not header["tiled"], "Should be a scanline file"
+        assert [c["name"] for c in part["channels"]] == ["B", "G", "R"]
+        assert part["channels"][0]["pixel_type"] == "HALF", "Should be HALF"
+        assert part["data_window"] == [0, 0, 3, 2], "Data window should be 4x3"
+        assert part["compression"] == "none", "Should be uncompressed"
+        assert part["chunk_count"] == 3, "One chunk per scanline"
+
+        print(f"✓ Channels: {[c['name'] for c in part['channels']]}")
+
+
+def test_validate_complete_file():
+    """Test that a complete file validates"""
+    print("\n=== Test: EXR Validate Complete ===")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "beauty.0001.exr"
+        _write_scanline_exr(path)
+
+        result = EXRInspector().validate(path)
+        assert result["valid"], f"File should be valid: {result['errors']}"
+        assert result["chunks"] == 3, "Should count 3 chunks"
+
+        print("✓ Complete file is valid")
+
+
+def test_validate_truncated_file():
+    """Test that truncation and zeroed offsets are detected"""
+    print("\n=== Test: EXR Validate Truncated ===")
+
+    inspector = EXRInspector()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "beauty.0001.exr"
+        table_start = _write_scanline_exr(path)
+
+        data = path.read_bytes()
+        path.write_bytes(data[:-4])
+        result = inspector.validate(path)
+        assert not result["valid"], "Truncated file should be invalid"
+        assert result["truncated_chunks"] == 1, "Last chunk should be truncated"
+
+        zeroed = data[:table_start] + b"\x00" * 24 + data[table_start + 24 :]
+        path.write_bytes(zeroed)
+        result = inspector.validate(path)
+        assert not result["valid"], "Zeroed offset table should be invalid"
+        assert result["missing_chunks"] == 3, "All chunks should be missing"
+
+        path.write_bytes(b"not an exr file")
+        result = inspector.validate(path)
+        assert not result["valid"], "Garbage should be invalid"
+
+        try:
+            inspector.read_header(path)
+            assert False, "read_header should raise on garbage"
+        except EXRError:
+            pass
+
+        print("✓ Truncated, zeroed and garbage files rejected")
+
+
+def _write_deep_exr(path, width=4, height=3):
+    """Write a minimal uncompressed deep scanline EXR with one HALF channel"""
+    chlist = b"R\x00" + struct.pack("<iB3xii", 1, 0, 1, 1) + b"\x00"
+    window = struct.pack("<iiii", 0, 0, width - 1, height - 1)
+
+    header = struct.pack("<ii", 20000630, 2 | 0x800)
+    header += _attribute("channels", "chlist", chlist)
+    header += _attribute("chunkCount", "int", struct.pack("<i", height))
+    header += _attribute("compression", "compression", b"\x00")
+    header += _attribute("dataWindow", "box2i", window)
+    header += _attribute("displayWindow", "box2i", window)
+    header += _attribute("lineOrder", "lineOrder", b"\x00")
+    header += _attribute("pixelAspectRatio", "float", struct.pack("<f", 1.0))
+    header += _attribute("type", "string", b"deepscanline")
+    header += b"\x00"
+
+    # One sample per pixel: a cumulative count per pixel, then the samples;
+    # the unpacked size is what the samples would take decompressed
+    table_bytes = width * 4
+    sample_bytes = width * 2
+    unpacked_bytes = sample_bytes * 8
+    chunk_size = 28 + table_bytes + sample_bytes
+    first_chunk = len(header) + height * 8
+
+    offsets = [first_chunk + y * chunk_size for y in range(height)]
+    chunks = b"".join(
+        struct.pack("<iQQQ", y, table_bytes, sample_bytes, unpacked_bytes)
+        + b"\x00" * (table_bytes + sample_bytes)
+        for y in range(height)
+    )
+
+    with open(path, "wb") as f:
+        f.write(header + struct.pack(f"<{height}Q", *offsets) + chunks)
+
+
+def test_validate_deep_file():
+    """Test deep chunks are sized by their packed data only"""
+    print("\n=== Test: EXR Validate Deep ===")
+
+    inspector = EXRInspector()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "deep.0001.exr"
+        _write_deep_exr(path)
+
+        header = inspector.read_header(path)
+        assert header["deep"], "Should be a deep file"
+        assert header["parts"][0]["type"] == "deepscanline"
+
+        result = inspector.validate(path)
+        assert result["valid"], f"Deep file should be valid: {result['errors']}"
+        assert result["chunks"] == 3, "Should count 3 chunks"
+
+        path.write_bytes(path.read_bytes()[:-2])
+        result = inspector.validate(path)
+        assert not result["valid"], "Truncated deep file should be invalid"
+        assert result["truncated_chunks"] == 1, "Last chunk should be truncated"
+
+        print("✓ Deep file with the last chunk at EOF is valid")
+
+
+def test_sample_render():
+    """Test the tiled Arnold render shipped in data/temp_render"""
+    print("\n=== Test: Sample Render ===")
+
+    if not SAMPLE_EXR.exists():
+        print("⚠ Sample render not found, skipping")
+        return
+
+    result = EXRInspector().validate(SAMPLE_EXR)
+    assert result["valid"], f"Sample render should be valid: {result['errors']}"
+
+    info = aov_channel_info(SAMPLE_EXR)
+    assert info["tiled"], "Arnold render should be tiled"
+    assert sorted(info["channels"]) == ["A", "B", "G", "R"], "Should be RGBA"
+
+    print(f"✓ {result['chunks']} tiles, channels {info['channels']}")
+
+
+def run_all_tests():
+    """Run all EXR inspector tests"""
+    print("\n" + "=" * 60)
+    print("Running EXR Inspector Tests")
+    print("=" * 60)
+
+    tests = [
+        test_read_header,
+        test_validate_complete_file,
+        test_validate_truncated_file,
+        test_validate_deep_file,
+        test_sample_render,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"✗ ERROR: {e}")
+            import traceback
+
+            traceback.print_exc()
+            failed += 1
+
+    print("\n" + "=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
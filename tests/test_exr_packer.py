@@ -0,0 +1,153 @@
+import sys
+from pathlib import Path
+import tempfile
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "maya_side"))
+
+from exr_inspector import EXRInspector
+from exr_packer import EXRPacker, pack_sequence
+
+
+def _channels(width=37, height=21, seed=0):
+    rng = np.random.default_rng(seed)
+    return {
+        "R": rng.random((height, width)).astype(np.float16),
+        "G": rng.random((height, width)).astype(np.float32),
+        "B": np.zeros((height, width), dtype=np.float16),
+    }
+
+
+def test_round_trip():
+    """Test that written channels decode back bit-exact"""
+    print("\n=== Test: EXR Round Trip ===")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for compression in ("none", "zip"):
+            path = Path(temp_dir) / f"frame_{compression}.exr"
+            source = _channels()
+
+            EXRPacker(compression).write_channels(path, source)
+            assert EXRInspector().validate(path)["valid"], "Output should validate"
+
+            decoded = EXRPacker().read_channels(path)
+            for name, pixels in source.items():
+                assert decoded[name].dtype == pixels.dtype, f"{name} dtype changed"
+                assert np.array_equal(decoded[name], pixels), f"{name} differs"
+
+            print(f"✓ {compression}: {len(source)} channels round-trip")
+
+
+def test_pack_sequence():
+    """Test packing AOV frames into one multichannel file per frame"""
+    print("\n=== Test: Pack Sequence ===")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        render_dir = Path(temp_dir)
+        writer = EXRPacker("zip")
+        for frame in (1, 2):
+            for index, aov in enumerate(["beauty", "diffuse", "specular"]):
+                writer.write_channels(
+                    render_dir / f"{aov}.{frame:04d}.exr", _channels(seed=index)
+                )
+
+        stats = pack_sequence(
+            render_dir, ["beauty", "diffuse", "specular"], [1, 2, 3], render_dir / "out"
+        )
+
+        assert stats["frames"] == 2, "Frame 3 has no renders and should be skipped"
+        assert stats["frames_per_second"] > 0, "Should report throughput"
+
+        channels = EXRInspector().get_channels(stats["outputs"][0])
+        names = [c["name"] for c in channels]
+        assert "R" in names, "Beauty should stay as plain RGB"
+        assert "diffuse.R" in names and "specular.G" in names, "AOVs should be prefixed"
+        assert names == sorted(names), "Channels must be stored alphabetically"
+
+        print(f"✓ {stats['frames']} frames packed, channels: {names}")
+
+
+def test_data_windows():
+    """Test AOVs with different, offset data windows keep their placement"""
+    print("\n=== Test: Data Windows ===")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        render_dir = Path(temp_dir)
+        writer = EXRPacker("zip")
+        display = [0, 0, 63, 35]
+        beauty = _channels(width=20, height=10, seed=1)
+        diffuse = _channels(width=8, height=16, seed=2)
+        writer.write_channels(
+            render_dir / "beauty.0001.exr", beauty, display, [10, 5, 29, 14]
+        )
+        writer.write_channels(
+            render_dir / "diffuse.0001.exr", diffuse, display, [30, 12, 37, 27]
+        )
+
+        assert EXRInspector().validate(render_dir / "beauty.0001.exr")["valid"]
+        decoded = EXRPacker().read_channels(render_dir / "diffuse.0001.exr")
+        assert np.array_equal(decoded["G"], diffuse["G"]), "Offset window round-trip"
+
+        stats = pack_sequence(
+            render_dir, ["beauty", "diffuse"], [1], render_dir / "out"
+        )
+        output = stats["outputs"][0]
+        part = EXRInspector().read_header(output)["parts"][0]
+        assert part["data_window"] == [10, 5, 37, 27], "Should be the union"
+        assert part["display_window"] == display, "Display window is kept"
+
+        packed = EXRPacker().read_channels(output)
+        assert packed["R"].shape == (23, 28)
+        assert np.array_equal(packed["R"][0:10, 0:20], beauty["R"]), "Beauty moved"
+        assert np.array_equal(packed["diffuse.G"][7:23, 20:28], diffuse["G"])
+        assert not packed["diffuse.G"][:7].any(), "Outside the window is zero"
+
+        try:
+            writer.write_channels(render_dir / "bad.exr", {**beauty, "Z": diffuse["R"]})
+            assert False, "Mismatched channel sizes should raise"
+        except ValueError:
+            pass
+
+        print(f"✓ Union window {part['data_window']}")
+
+
+def run_all_tests():
+    """Run all EXR packer tests"""
+    print("\n" + "=" * 60)
+    print("Running EXR Packer Tests")
+    print("=" * 60)
+
+    tests = [
+        test_round_trip,
+        test_pack_sequence,
+        test_data_windows,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"✗ ERROR: {e}")
+            import traceback
+
+            traceback.print_exc()
+            failed += 1
+
+    print("\n" + "=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
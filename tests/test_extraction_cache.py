@@ -0,0 +1,146 @@
+import os
+import sys
+from pathlib import Path
+import tempfile
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "maya_side"))
+
+from extraction_cache import ExtractionCache, hash_file, texture_files
+
+
+OPTIONS = {"frame": None, "include_aovs": True, "include_materials": True}
+
+
+def test_scene_keys():
+    """Test keys follow scene content and options, with a stat precheck"""
+    print("\n=== Test: Scene Keys ===")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        scene = Path(temp_dir) / "shot.ma"
+        scene.write_bytes(b"//Maya ASCII 2024 scene\n" * 1000)
+        empty = Path(temp_dir) / "empty.ma"
+        empty.write_bytes(b"")
+        assert len(hash_file(str(empty))) == 40, "Empty files hash without mmap"
+
+        cache = ExtractionCache(Path(temp_dir) / "cache")
+        key = cache.key(str(scene), OPTIONS)
+        assert cache.key(str(scene), OPTIONS) == key
+        assert cache.hashed == 1, "Unchanged size and mtime should skip hashing"
+
+        assert cache.key(str(scene), dict(OPTIONS, include_aovs=False)) != key
+        assert cache.key(str(scene), dict(OPTIONS, frame=12.0)) != key
+
+        os.utime(scene, ns=(0, 10**9))
+        assert cache.key(str(scene), OPTIONS) == key, "Touched file, same content"
+        assert cache.hashed == 2, "A new mtime means one re-hash"
+
+        scene.write_bytes(b"//Maya ASCII 2024 scene\n" * 1001)
+        assert cache.key(str(scene), OPTIONS) != key, "New content, new key"
+
+    print("✓ Keys track content and options")
+
+
+def test_hit_and_eviction():
+    """Test round trip through the cache and least recently used eviction"""
+    print("\n=== Test: Hits and Eviction ===")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache_dir = Path(temp_dir) / "cache"
+        cache = ExtractionCache(cache_dir, max_entries=2)
+        scene_data = {"schema_version": "0.2.0", "meshes": [{"name": "rock"}]}
+
+        assert cache.get("a") is None, "Empty cache misses"
+        cache.put("a", scene_data, workspace_root="/projects/show")
+        cache.put("b", scene_data)
+
+        # A fresh instance (next runner call) reads the same index
+        cached = ExtractionCache(cache_dir, max_entries=2).get("a")
+        assert cached["scene_data"] == scene_data
+        assert cached["meta"] == {"workspace_root": "/projects/show"}
+
+        cache = ExtractionCache(cache_dir, max_entries=2)
+        cache.put("c", scene_data)
+        assert cache.get("b") is None, "Least recently used entry is evicted"
+        assert cache.get("a") is not None and cache.get("c") is not None
+        assert not (cache_dir / "b.json").exists(), "Evicted files are removed"
+
+        size = cache.stats()["bytes"] // 2
+        cache = ExtractionCache(cache_dir, max_bytes=size)
+        cache.evict()
+        assert cache.stats()["entries"] == 1, "Size limit keeps one entry"
+        assert cache.get("c") is not None, "The most recently used entry is kept"
+
+    print("✓ Cached data returned, LRU entries evicted")
+
+
+def test_dependencies():
+    """Test entries go stale when a reference or texture tile changes"""
+    print("\n=== Test: Dependencies ===")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        (root / "sourceimages").mkdir()
+        for tile in (1001, 1002):
+            (root / "sourceimages" / f"rock.{tile}.exr").write_bytes(b"tile")
+        reference = root / "rock_rig.ma"
+        reference.write_text("// rig", encoding="utf-8")
+
+        textures = [{"node": "file1", "path": "sourceimages/rock.<UDIM>.exr"}]
+        files = texture_files(textures, str(root))
+        assert len(files) == 3, "Both tiles and their folder"
+
+        cache = ExtractionCache(root / "cache")
+        scene_data = {"schema_version": "0.2.0", "meshes": []}
+        cache.put("a", scene_data, dependencies=[str(reference)] + files)
+        assert cache.get("a") is not None, "Unchanged dependencies hit"
+
+        reference.write_text("// rig, edited", encoding="utf-8")
+        assert cache.get("a") is None, "Edited reference misses"
+
+        cache.put("a", scene_data, dependencies=[str(reference)] + files)
+        (root / "sourceimages" / "rock.1011.exr").write_bytes(b"new tile")
+        os.utime(root / "sourceimages", ns=(0, 10**9))
+        assert cache.get("a") is None, "Added UDIM tile misses"
+
+    print("✓ Stale entries dropped")
+
+
+def run_all_tests():
+    """Run all extraction cache tests"""
+    print("\n" + "=" * 60)
+    print("Running Extraction Cache Tests")
+    print("=" * 60)
+
+    tests = [
+        test_scene_keys,
+        test_hit_and_eviction,
+        test_dependencies,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"✗ ERROR: {e}")
+            import traceback
+
+            traceback.print_exc()
+            failed += 1
+
+    print("\n" + "=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
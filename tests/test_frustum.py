@@ -0,0 +1,224 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "maya_side"))
+
+from frustum import (
+    FILM_FIT_FILL,
+    FILM_FIT_HORIZONTAL,
+    FILM_FIT_OVERSCAN,
+    FILM_FIT_VERTICAL,
+    boxes_visible,
+    camera_planes,
+    project_points,
+    resolution_gate,
+    world_boxes,
+)
+
+
+IDENTITY = [1.0, 0, 0, 0, 0, 1.0, 0, 0, 0, 0, 1.0, 0, 0, 0, 0, 1.0]
+
+
+def _translation(x, y, z):
+    return IDENTITY[:12] + [x, y, z, 1.0]
+
+
+def _yaw(degrees, x=0.0, y=0.0, z=0.0):
+    """Rotation about Y, in Maya's row-vector layout"""
+    angle = np.radians(degrees)
+    c, s = np.cos(angle), np.sin(angle)
+    return [c, 0, -s, 0, 0, 1.0, 0, 0, s, 0, c, 0, x, y, z, 1.0]
+
+
+def _unit_boxes(positions):
+    count = len(positions)
+    return world_boxes(
+        np.full((count, 3), -0.5),
+        np.full((count, 3), 0.5),
+        np.array([_translation(*p) for p in positions]),
+    )
+
+
+def test_static_camera():
+    """Test boxes in front, behind, beside and past the clip planes"""
+    print("\n=== Test: Static Camera ===")
+
+    # 35mm on a 36x24mm gate: half-width 0.514 per unit of depth
+    planes = camera_planes(np.array([IDENTITY]), 35.0, 1.417, 0.945, 0.1, 100.0)
+    positions = {
+        "ahead": (0, 0, -10),
+        "behind": (0, 0, 10),
+        "left_edge": (-5.5, 0, -10),
+        "far_left": (-8, 0, -10),
+        "above": (0, 8, -10),
+        "past_far": (0, 0, -120),
+        "straddles_near": (0, 0, 0),
+    }
+    centers, extents = _unit_boxes(list(positions.values()))
+    visible = dict(zip(positions, boxes_visible(centers, extents, planes)))
+
+    assert visible == {
+        "ahead": True,
+        "behind": False,
+        "left_edge": True,
+        "far_left": False,
+        "above": False,
+        "past_far": False,
+        "straddles_near": True,
+    }, visible
+
+    print(f"✓ {sum(visible.values())}/{len(visible)} boxes visible")
+
+
+def test_camera_over_frames():
+    """Test a panning camera sees a box in any frame, in small batches"""
+    print("\n=== Test: Camera Over Frames ===")
+
+    matrices = np.array([_yaw(angle) for angle in range(0, 91, 10)])
+    planes = camera_planes(matrices, 35.0, 1.417, 0.945, 0.1, 1000.0)
+    assert planes.shape == (10, 6, 4), planes.shape
+
+    # Ahead at the start, to the camera's left (-X) once it has turned 90°
+    centers, extents = _unit_boxes([(0, 0, -10), (-10, 0, 0), (10, 0, 0)])
+    visible = boxes_visible(centers, extents, planes, batch_values=6)
+    assert visible.tolist() == [True, True, False], visible.tolist()
+
+    still = np.repeat(matrices[:1], 2, axis=0)
+    zoomed = camera_planes(still, [35.0, 200.0], 1.417, 0.945, 0.1, 1000.0)
+    assert zoomed.shape == (2, 6, 4)
+    centers, extents = _unit_boxes([(4, 0, -10)])
+    assert boxes_visible(centers, extents, zoomed[:1]).tolist() == [True]
+    assert boxes_visible(centers, extents, zoomed[1:]).tolist() == [False]
+
+    print("✓ Panning and zooming cameras tested per frame")
+
+
+def test_aspect_margin_and_ortho():
+    """Test the resolution gate, the margin and orthographic cameras"""
+    print("\n=== Test: Aspect, Margin, Orthographic ===")
+
+    camera = np.array([IDENTITY])
+    # Just outside the aperture's half-width at the box's far side (0.514 * 10.5)
+    centers, extents = _unit_boxes([(6.0, 0, -10)])
+
+    plain = camera_planes(camera, 35.0, 1.417, 0.945, 0.1, 100.0)
+    assert not boxes_visible(centers, extents, plain)[0]
+    wide = camera_planes(camera, 35.0, 1.417, 0.945, 0.1, 100.0, aspect=2.0)
+    assert boxes_visible(centers, extents, wide)[0], "2:1 gate is wider"
+    margin = camera_planes(camera, 35.0, 1.417, 0.945, 0.1, 100.0, margin=0.2)
+    assert boxes_visible(centers, extents, margin)[0], "Margin widens the view"
+
+    ortho = camera_planes(
+        camera, 35.0, 1.417, 0.945, 0.1, 100.0, orthographic_width=10.0
+    )
+    centers, extents = _unit_boxes([(5.2, 0, -50), (6.0, 0, -50)])
+    assert boxes_visible(centers, extents, ortho).tolist() == [True, False]
+
+    print("✓ Gate, margin and orthographic width respected")
+
+
+def test_world_boxes():
+    """Test rotated and scaled boxes enclose the transformed local bounds"""
+    print("\n=== Test: World Boxes ===")
+
+    scaled = _yaw(45, 1, 2, 3)
+    scaled[:3] = [2 * v for v in scaled[:3]]
+    centers, extents = world_boxes(
+        np.array([[-1.0, -1.0, -1.0]]), np.array([[1.0, 1.0, 1.0]]), np.array([scaled])
+    )
+
+    corners = np.array(
+        [[x, y, z, 1.0] for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)]
+    ) @ np.array(scaled).reshape(4, 4)
+    assert np.allclose(centers[0], [1, 2, 3])
+    assert np.allclose(centers[0] - extents[0], corners[:, :3].min(axis=0))
+    assert np.allclose(centers[0] + extents[0], corners[:, :3].max(axis=0))
+
+    print(f"✓ World extents {np.round(extents[0], 3).tolist()}")
+
+
+def test_resolution_gate():
+    """Test the film area shown for each film fit"""
+    print("\n=== Test: Resolution Gate ===")
+
+    # 1.5:1 film back rendered at 16:9
+    aspect = 16 / 9
+    fill = resolution_gate(1.5, 1.0, aspect, FILM_FIT_FILL)
+    overscan = resolution_gate(1.5, 1.0, aspect, FILM_FIT_OVERSCAN)
+    assert np.allclose(fill, (1.5, 1.5 / aspect)), "Fill crops the film vertically"
+    assert np.allclose(overscan, (aspect, 1.0)), "Overscan shows more than the film"
+    assert np.allclose(resolution_gate(1.5, 1.0, aspect, FILM_FIT_HORIZONTAL), fill)
+    assert np.allclose(resolution_gate(1.5, 1.0, aspect, FILM_FIT_VERTICAL), overscan)
+
+    print(f"✓ Fill {np.round(fill, 3).tolist()}, overscan {np.round(overscan, 3)}")
+
+
+def test_project_points():
+    """Test pixel positions over frames with a moving camera"""
+    print("\n=== Test: Project Points ===")
+
+    # The camera steps 1 unit along +X per frame; the points stay put
+    matrices = np.array([_translation(frame, 0, 0) for frame in range(3)])
+    points = np.tile([[0.0, 0.0, -10.0], [0.0, 1.0, -10.0], [0.0, 0.0, 5.0]], (3, 1, 1))
+    pixels, depth = project_points(points, matrices, 35.0, 1.417, 0.945, 1920, 1080)
+
+    assert pixels.shape == (3, 3, 2) and depth.shape == (3, 3)
+    assert np.allclose(pixels[0, 0], [960, 540]), "Centered point at frame 0"
+    # 1 unit at depth 10 through 35mm on a 1.417" gate
+    offset = 0.1 * 35.0 / 25.4 / 1.417 * 1920
+    assert np.allclose(pixels[:, 0, 0], [960, 960 - offset, 960 - 2 * offset])
+    assert np.allclose(pixels[0, 1], [960, 540 - offset]), "Up is toward y = 0"
+    assert np.allclose(depth[:, 2], -5.0), "Point behind the camera"
+
+    ortho, _ = project_points(
+        points, matrices, 35.0, 1.417, 0.945, 1920, 1080, orthographic_width=20.0
+    )
+    assert np.allclose(ortho[1, 0], [960 - 1920 / 20.0, 540])
+
+    print(f"✓ Pan of {offset:.1f} px per frame")
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("\n" + "=" * 60)
+    print("Running Frustum Tests")
+    print("=" * 60)
+
+    tests = [
+        test_static_camera,
+        test_camera_over_frames,
+        test_aspect_margin_and_ortho,
+        test_world_boxes,
+        test_resolution_gate,
+        test_project_points,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"✗ ERROR: {e}")
+            import traceback
+
+            traceback.print_exc()
+            failed += 1
+
+    print("\n" + "=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
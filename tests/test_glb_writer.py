@@ -0,0 +1,229 @@
+import struct
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "maya_side"))
+
+from geometry_exporter import weld_corners
+from glb_writer import GLBWriter, read_accessor, read_glb
+
+
+IDENTITY = [1.0, 0, 0, 0, 0, 1.0, 0, 0, 0, 0, 1.0, 0, 0, 0, 0, 1.0]
+
+
+def _translation(x, y, z):
+    return IDENTITY[:12] + [x, y, z, 1.0]
+
+
+def _quad(width=2.0, height=1.0):
+    """Two triangles in the XY plane, facing +Z"""
+    positions = np.array(
+        [[0, 0, 0], [width, 0, 0], [width, height, 0], [0, height, 0]],
+        dtype=np.float32,
+    )
+    normals = np.tile([0.0, 0.0, 1.0], (4, 1)).astype(np.float32)
+    uvs = np.array([[0, 1], [1, 1], [1, 0], [0, 0]], dtype=np.float32)
+    return positions, np.array([0, 1, 2, 0, 2, 3]), normals, uvs
+
+
+def _world_points(glb, node_index):
+    """Positions of a node's mesh after its node matrix, N x 3"""
+    node = glb["gltf"]["nodes"][node_index]
+    primitive = glb["gltf"]["meshes"][node["mesh"]]["primitives"][0]
+    local = read_accessor(glb, primitive["attributes"]["POSITION"])
+    matrix = np.array(node.get("matrix", IDENTITY)).reshape(4, 4)
+    return np.concatenate([local, np.ones((len(local), 1))], axis=1) @ matrix
+
+
+def test_round_trip():
+    """Test buffers, nodes and the GLB container read back unchanged"""
+    print("\n=== Test: Round Trip ===")
+
+    positions, indices, normals, uvs = _quad()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "scene.glb"
+        with GLBWriter(str(path)) as writer:
+            quad = writer.add_mesh("quadShape", positions, indices, normals, uvs)
+            first = writer.add_node("quad", quad, IDENTITY)
+            second = writer.add_node("quad1", quad, _translation(5, 0, 0))
+            bare = writer.add_mesh("pointsShape", positions[:3], [0, 1, 2])
+            writer.add_node("tri", bare, IDENTITY)
+        stats = writer.stats
+
+        raw = path.read_bytes()
+        assert raw[:4] == b"glTF" and struct.unpack("<I", raw[8:12])[0] == len(raw)
+        assert len(raw) % 4 == 0, "GLB length is 4-byte aligned"
+        assert not list(Path(temp_dir).glob("*.tmp")), "Temporary files removed"
+        glb = read_glb(str(path))
+
+    gltf = glb["gltf"]
+    assert (first, second) == (0, 1)
+    assert stats["meshes"] == 2 and stats["nodes"] == 3 and stats["triangles"] == 3
+    assert gltf["scenes"][0]["nodes"] == [0, 1, 2]
+    assert gltf["nodes"][0]["mesh"] == gltf["nodes"][1]["mesh"] == quad
+    assert "matrix" not in gltf["nodes"][0], "Identity matrices are left out"
+    assert "extensionsRequired" not in gltf
+
+    # One interleaved vertex view and one index view per mesh
+    views = gltf["bufferViews"]
+    assert len(views) == 4
+    assert views[0]["byteStride"] == 32 and views[2]["byteStride"] == 12
+    assert all(view["byteOffset"] % 4 == 0 for view in views)
+
+    attributes = gltf["meshes"][quad]["primitives"][0]["attributes"]
+    assert np.allclose(read_accessor(glb, attributes["POSITION"]), positions)
+    assert np.allclose(read_accessor(glb, attributes["NORMAL"]), normals)
+    assert np.allclose(read_accessor(glb, attributes["TEXCOORD_0"]), uvs)
+    index_accessor = gltf["meshes"][quad]["primitives"][0]["indices"]
+    assert read_accessor(glb, index_accessor).tolist() == indices.tolist()
+    assert gltf["accessors"][attributes["POSITION"]]["max"] == [2.0, 1.0, 0.0]
+    assert np.allclose(_world_points(glb, second)[:, 0], positions[:, 0] + 5)
+
+    print(f"✓ {stats['meshes']} meshes, {stats['nodes']} nodes, {len(raw)} bytes")
+
+
+def test_quantized():
+    """Test quantized attributes decode close to the source and in place"""
+    print("\n=== Test: Quantized ===")
+
+    rng = np.random.default_rng(0)
+    positions = rng.uniform(-50.0, 150.0, (500, 3)).astype(np.float32)
+    normals = rng.normal(size=(500, 3))
+    normals = (normals / np.linalg.norm(normals, axis=1)[:, None]).astype(np.float32)
+    uvs = rng.uniform(0.0, 1.0, (500, 2)).astype(np.float32)
+    udim = uvs + [1.0, 0.0]
+    indices = rng.integers(0, 500, 900)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "quantized.glb"
+        with GLBWriter(str(path), quantize=True) as writer:
+            mesh = writer.add_mesh("shape", positions, indices, normals, uvs)
+            node = writer.add_node("obj", mesh, _translation(0, 10, 0))
+            tiled = writer.add_mesh("udimShape", positions, indices, normals, udim)
+        quantized_bytes = path.stat().st_size
+
+        float_path = Path(temp_dir) / "float.glb"
+        with GLBWriter(str(float_path)) as writer:
+            writer.add_mesh("shape", positions, indices, normals, uvs)
+        float_bytes = float_path.stat().st_size
+
+        glb = read_glb(str(path))
+
+    gltf = glb["gltf"]
+    assert gltf["extensionsRequired"] == ["KHR_mesh_quantization"]
+    attributes = gltf["meshes"][mesh]["primitives"][0]["attributes"]
+    position = gltf["accessors"][attributes["POSITION"]]
+    assert position["componentType"] == 5122 and position["normalized"]
+    assert gltf["bufferViews"][0]["byteStride"] == 16, "8 + 4 + 4 bytes"
+
+    # Quantization error: half a step of 200 units over 65534 steps
+    world = _world_points(glb, node)[:, :3]
+    assert np.abs(world - (positions + [0, 10, 0])).max() < 200.0 / 65534
+    decoded = read_accessor(glb, attributes["NORMAL"])
+    assert np.abs(decoded - normals).max() < 1.0 / 127
+    assert np.abs(read_accessor(glb, attributes["TEXCOORD_0"]) - uvs).max() < 1e-4
+    udim_uvs = gltf["meshes"][tiled]["primitives"][0]["attributes"]["TEXCOORD_0"]
+    assert gltf["accessors"][udim_uvs]["componentType"] == 5126, "UDIMs stay float"
+    assert quantized_bytes < float_bytes * 2, "Two quantized meshes in < 2 floats"
+
+    print(f"✓ {quantized_bytes} bytes for two quantized meshes, {float_bytes} float")
+
+
+def test_weld_corners():
+    """Test face corners split only at hard edges and UV seams"""
+    print("\n=== Test: Weld Corners ===")
+
+    # Two quads sharing the edge 1-4: corners 0-3 and 4-7
+    corner_vertices = np.array([0, 1, 4, 3, 1, 2, 5, 4])
+    triangles = np.array([0, 1, 2, 0, 2, 3, 4, 5, 6, 4, 6, 7])
+
+    keys, indices = weld_corners(corner_vertices, triangles)
+    assert len(keys) == 6, "Smooth and seamless: one vertex per point"
+    assert len(indices) == 12 and indices.dtype == np.uint32
+    assert np.array_equal(keys[indices, 0], corner_vertices[triangles])
+
+    # A UV seam on the shared edge splits its two points
+    corner_uvs = np.array([0, 1, 2, 3, 4, 5, 6, 7])
+    corner_normals = np.zeros(8, dtype=int)
+    keys, indices = weld_corners(corner_vertices, triangles, corner_normals, corner_uvs)
+    assert len(keys) == 8
+    assert (keys[:, 1] == 0).all()
+
+    keys, _ = weld_corners(corner_vertices, triangles[:6])
+    assert sorted(keys[:, 0].tolist()) == [0, 1, 3, 4], "Only used corners"
+
+    # Ids too large to pack into one integer take the row-wise path
+    large = corner_uvs + 2**60
+    keys, indices = weld_corners(corner_vertices, triangles, corner_normals, large)
+    assert len(keys) == 8 and keys[:, 2].min() == 2**60
+    assert np.array_equal(keys[indices, 2], large[triangles])
+
+    print("✓ 6 welded vertices, 8 with a UV seam")
+
+
+def test_empty_and_errors():
+    """Test an empty file and that a failed export leaves nothing behind"""
+    print("\n=== Test: Empty and Errors ===")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "empty.glb"
+        GLBWriter(str(path)).close()
+        glb = read_glb(str(path))
+        assert glb["bin"] == b"" and "buffers" not in glb["gltf"]
+
+        broken = Path(temp_dir) / "broken.glb"
+        try:
+            with GLBWriter(str(broken)) as writer:
+                writer.add_mesh("shape", *_quad()[:2])
+                raise RuntimeError("interrupted")
+        except RuntimeError:
+            pass
+        assert not broken.exists()
+        assert [p.name for p in Path(temp_dir).iterdir()] == ["empty.glb"]
+
+    print("✓ Empty scene written, interrupted export discarded")
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("\n" + "=" * 60)
+    print("Running GLB Writer Tests")
+    print("=" * 60)
+
+    tests = [
+        test_round_trip,
+        test_quantized,
+        test_weld_corners,
+        test_empty_and_errors,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"✗ ERROR: {e}")
+            import traceback
+
+            traceback.print_exc()
+            failed += 1
+
+    print("\n" + "=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
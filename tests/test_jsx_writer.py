@@ -0,0 +1,212 @@
+import sys
+from pathlib import Path
+import tempfile
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "maya_side"))
+
+from jsx_writer import JSXWriter
+
+
+IDENTITY = [1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1]
+
+
+def _make_scene(frame_count=10):
+    frames = list(range(1, frame_count + 1))
+    transforms = []
+    for frame in frames:
+        matrix = list(IDENTITY)
+        matrix[12] = float(frame)
+        transforms.append(matrix)
+
+    return {
+        "schema_version": "0.2.0",
+        "scene_info": {"fps": 24, "frame_range": [1.0, float(frame_count)]},
+        "cameras": [
+            {
+                "name": "shotCam",
+                "shape_name": "shotCamShape",
+                "transform": IDENTITY,
+                "focal_length": 35.0,
+                "horizontal_film_aperture": 1.417,
+                "vertical_film_aperture": 0.945,
+                "is_renderable": True,
+                "animation": {
+                    "frames": frames,
+                    "transforms": transforms,
+                    "focal_length": [35.0] * frame_count,
+                },
+            },
+            {
+                "name": "top",
+                "shape_name": "topShape",
+                "transform": IDENTITY,
+                "focal_length": 35.0,
+                "is_renderable": False,
+            },
+        ],
+        "meshes": [],
+        "lights": [
+            {
+                "name": "keyLight",
+                "type": "directionalLight",
+                "transform": IDENTITY,
+                "color": [1.0, 0.5, 0.25],
+                "intensity": 1.5,
+                "enabled": True,
+            }
+        ],
+        "render_passes": {
+            "renderer": "Arnold",
+            "aovs": [
+                {
+                    "name": "aiAOV_diffuse",
+                    "type": "diffuse",
+                    "enabled": True,
+                    "output_path": "/renders/",
+                }
+            ],
+            "render_settings": {
+                "resolution": {"width": 1280, "height": 720, "aspect_ratio": 1.778},
+                "frame_padding": 4,
+                "image_format": "exr",
+                "animation": False,
+            },
+        },
+    }
+
+
+def test_jsx_comp_and_layers():
+    """Test comp creation and layer count"""
+    print("\n=== Test: JSX Comp and Layers ===")
+
+    writer = JSXWriter()
+    script = writer.build_script(_make_scene(), "shot010")
+
+    assert 'addComp("shot010", 1280, 720' in script, "Comp should use resolution"
+    assert 'addCamera("shotCam"' in script, "Renderable camera should be added"
+    assert 'addCamera("top"' not in script, "Non-renderable camera should be skipped"
+    assert "LightType.PARALLEL" in script, "Directional light should map to parallel"
+    assert "/renders/diffuse.0001.exr" in script, "Footage should point at AOV frames"
+    assert writer.stats["layers"] == 2, "Should create camera and light layers"
+
+    print(f"✓ {writer.stats['layers']} layers, {writer.stats['script_bytes']} bytes")
+
+
+def test_jsx_bulk_keys_are_chunked():
+    """Test that animation is written with chunked setValuesAtTimes calls"""
+    print("\n=== Test: JSX Chunked Keys ===")
+
+    writer = JSXWriter(chunk_size=4)
+    script = writer.build_script(_make_scene(frame_count=10), "shot")
+
+    assert "setValueAtTime(" not in script, "Should not key one value at a time"
+    # Position + Orientation, 10 keys each in chunks of 4 -> 3 calls each
+    assert writer.stats["set_values_calls"] == 6, "Keys should be split in chunks"
+    assert writer.stats["keyframes"] == 20, "Should key every frame"
+    assert script.count("setValuesAtTimes(") == 6, "Script should match stats"
+
+    print(f"✓ {writer.stats['keyframes']} keys in {writer.stats['set_values_calls']} calls")
+
+
+def test_jsx_write_file():
+    """Test writing the script to disk"""
+    print("\n=== Test: JSX Write ===")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_path = Path(temp_dir) / "scene.jsx"
+        stats = JSXWriter().write(_make_scene(), output_path)
+
+        assert output_path.exists(), "Script should be written"
+        assert stats["script_bytes"] == output_path.stat().st_size, "Size should match"
+
+        print(f"✓ Wrote {stats['script_bytes']} bytes")
+
+
+def test_matrix_conversion():
+    """Test Maya -> AE position conversion"""
+    print("\n=== Test: Matrix Conversion ===")
+
+    writer = JSXWriter()
+    comp = {"width": 1000, "height": 500}
+
+    matrix = list(IDENTITY)
+    matrix[12:15] = [10.0, 20.0, 30.0]
+    position, orientation = writer._matrix_to_ae(matrix, comp)
+
+    assert position == [510.0, 230.0, -30.0], f"Unexpected position {position}"
+    assert orientation == [0.0, 0.0, 0.0], f"Unexpected orientation {orientation}"
+
+    print(f"✓ Position: {position}")
+
+
+def test_track_nulls():
+    """Test screen tracks become nulls keyed in comp pixels"""
+    print("\n=== Test: Track Nulls ===")
+
+    scene = _make_scene(frame_count=3)
+    scene["screen_tracks"] = {
+        "camera": "shotCam",
+        "resolution": [1920, 1080],
+        "frames": [1, 2, 3],
+        "tracks": [
+            {
+                "name": "hero",
+                "pivot": [0.0] * 9,
+                "pivot_screen": [960.0, 540.0, 1920.0, 0.0, 0.0, 1080.0],
+                "depth": [10.0, 10.0, -1.0],
+            }
+        ],
+    }
+
+    writer = JSXWriter()
+    script = writer.build_script(scene, "shot")
+
+    assert 'layer.name = "hero_track";' in script, "Track should become a null"
+    assert writer.stats["layers"] == 3, "Camera, light and track null"
+    # Rescaled from 1920x1080 to the 1280x720 comp; frame 3 is behind the camera
+    assert "prop.setValuesAtTimes([0,0.041667], [[640,360],[1280,0]]);" in script
+
+    print(f"✓ Null keyed on {writer.stats['keyframes'] - 6} frames")
+
+
+def run_all_tests():
+    """Run all JSX writer tests"""
+    print("\n" + "=" * 60)
+    print("Running JSX Writer Tests")
+    print("=" * 60)
+
+    tests = [
+        test_jsx_comp_and_layers,
+        test_jsx_bulk_keys_are_chunked,
+        test_jsx_write_file,
+        test_matrix_conversion,
+        test_track_nulls,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"✗ ERROR: {e}")
+            import traceback
+
+            traceback.print_exc()
+            failed += 1
+
+    print("\n" + "=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
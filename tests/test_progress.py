@@ -0,0 +1,193 @@
+import io
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "maya_side"))
+
+from progress import Cancelled, ProgressReporter
+
+
+def _events(stream):
+    """Parse the JSON lines written to a stream"""
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_event_lines():
+    """Test every event is one flushed JSON line with time fields"""
+    print("\n=== Test: Event Lines ===")
+
+    stream = io.StringIO()
+    progress = ProgressReporter(stream)
+    progress.emit("run_start", mode="export", scene="shot.ma")
+    progress.emit("output", kind="export", path=Path("scene.json"))
+
+    events = _events(stream)
+    assert [e["event"] for e in events] == ["run_start", "output"]
+    assert events[0]["scene"] == "shot.ma"
+    assert events[1]["path"] == "scene.json", "Paths are written as strings"
+    assert all(e["elapsed"] >= 0.0 and e["time"] > 0.0 for e in events)
+
+    ProgressReporter().emit("run_start")  # No stream: nothing to write
+
+    print(f"✓ {len(events)} events")
+
+
+def test_phases():
+    """Test phases are bracketed and progress carries rate and eta"""
+    print("\n=== Test: Phases ===")
+
+    stream = io.StringIO()
+    progress = ProgressReporter(stream, interval=0.0)
+    with progress.phase("bake", total=4):
+        for frame in range(4):
+            progress.advance("bake", item=str(frame + 1))
+    progress.advance("bake")  # Outside the phase: ignored
+
+    events = _events(stream)
+    assert events[0] == {**events[0], "event": "phase_start", "total": 4}
+    updates = [e for e in events if e["event"] == "progress"]
+    assert [e["done"] for e in updates] == [1, 2, 3, 4]
+    assert updates[-1]["item"] == "4" and updates[-1]["eta"] == 0.0
+    assert all(e["rate"] > 0.0 for e in updates)
+    end = events[-1]
+    assert end["event"] == "phase_end" and end["status"] == "ok"
+    assert end["done"] == 4
+
+    print(f"✓ {len(updates)} progress events")
+
+
+def test_throttling():
+    """Test progress events are throttled but the last one is always sent"""
+    print("\n=== Test: Throttling ===")
+
+    stream = io.StringIO()
+    progress = ProgressReporter(stream, interval=3600.0)
+    with progress.phase("meshes", total=1000):
+        for _ in range(1000):
+            progress.advance("meshes")
+
+    updates = [e for e in _events(stream) if e["event"] == "progress"]
+    assert len(updates) == 2, updates
+    assert updates[-1]["done"] == 1000
+
+    print("✓ 1000 items, 2 events")
+
+
+def test_cancel_file():
+    """Test a cancel file stops the run at the next check"""
+    print("\n=== Test: Cancel File ===")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cancel_file = Path(temp_dir) / "cancel"
+        stream = io.StringIO()
+        progress = ProgressReporter(stream, cancel_file=str(cancel_file))
+
+        done = 0
+        try:
+            with progress.phase("bake", total=10):
+                for frame in range(10):
+                    progress.check_cancel()
+                    if frame == 3:
+                        cancel_file.touch()
+                    done += 1
+                    progress.advance("bake")
+            assert False, "Cancelled not raised"
+        except Cancelled as e:
+            assert str(cancel_file) in str(e)
+
+    assert done == 4, "The current item finishes"
+    events = _events(stream)
+    assert [e["event"] for e in events].count("cancel_requested") == 1
+    assert events[-1]["status"] == "cancelled" and events[-1]["done"] == 4
+
+    print("✓ Stopped after frame 4")
+
+
+def test_request_cancel():
+    """Test request_cancel keeps the first reason and errors end phases"""
+    print("\n=== Test: Request Cancel ===")
+
+    stream = io.StringIO()
+    progress = ProgressReporter(stream)
+    assert not progress.cancelled
+    progress.check_cancel()
+
+    progress.request_cancel("signal SIGTERM")
+    progress.request_cancel("signal SIGINT")
+    assert progress.cancelled and progress.cancel_reason == "signal SIGTERM"
+
+    try:
+        with progress.phase("render"):
+            raise RuntimeError("renderer crashed")
+    except RuntimeError:
+        pass
+    assert _events(stream)[-1]["status"] == "error"
+
+    print("✓ First reason kept")
+
+
+def test_open():
+    """Test reporters opened on a path append to a file they close"""
+    print("\n=== Test: Open ===")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "events.jsonl"
+        for run in range(2):
+            progress = ProgressReporter.open(str(path))
+            progress.emit("run_start", run=run)
+            progress.close()
+            assert progress.stream is None
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["run"] for line in lines] == [0, 1]
+
+    assert ProgressReporter.open("-").stream is sys.stderr
+    assert ProgressReporter.open(None).stream is None
+
+    print("✓ Events appended across runs")
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("\n" + "=" * 60)
+    print("Running Progress Tests")
+    print("=" * 60)
+
+    tests = [
+        test_event_lines,
+        test_phases,
+        test_throttling,
+        test_cancel_file,
+        test_request_cancel,
+        test_open,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"✗ ERROR: {e}")
+            import traceback
+
+            traceback.print_exc()
+            failed += 1
+
+    print("\n" + "=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
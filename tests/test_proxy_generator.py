@@ -0,0 +1,136 @@
+import sys
+import os
+from pathlib import Path
+import tempfile
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "maya_side"))
+
+from exr_packer import EXRPacker
+from proxy_generator import ProxyGenerator, generate_proxies, proxy_path
+
+
+def _write_frames(render_dir, frames, width=64, height=36):
+    writer = EXRPacker("zip")
+    for frame in frames:
+        value = np.full((height, width), frame / 10.0, dtype=np.float16)
+        writer.write_channels(
+            render_dir / f"diffuse.{frame:04d}.exr", {"R": value, "G": value, "B": value}
+        )
+
+
+def test_downsample():
+    """Test box filter averaging and edge padding"""
+    print("\n=== Test: Downsample ===")
+
+    pixels = np.arange(16, dtype=np.float32).reshape(4, 4)
+    small = ProxyGenerator.downsample(pixels, 2)
+    assert small.shape == (2, 2), "Should halve both axes"
+    assert small[0, 0] == (0 + 1 + 4 + 5) / 4.0, "Should average 2x2 blocks"
+
+    odd = ProxyGenerator.downsample(np.ones((5, 7), dtype=np.float16), 4)
+    assert odd.shape == (2, 2), "Odd sizes should be padded up"
+    assert np.allclose(odd, 1.0), "Edge padding should not darken borders"
+
+    print(f"✓ 4x4 -> {small.shape}, 5x7 -> {odd.shape}")
+
+
+def test_generate_proxies():
+    """Test proxy generation, contact sheet and skip-if-up-to-date"""
+    print("\n=== Test: Generate Proxies ===")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        render_dir = Path(temp_dir)
+        _write_frames(render_dir, [1, 2, 3])
+
+        stats = generate_proxies(render_dir, "diffuse", [1, 2, 3], label="quarter")
+        assert stats["written"] == 3, "All proxies should be written"
+        assert stats["contact_sheet"], "Contact sheet should be written"
+
+        proxy = proxy_path(render_dir / "diffuse.0001.exr", "quarter", "png")
+        assert proxy.read_bytes()[:8] == b"\x89PNG\r\n\x1a\n", "Proxy should be a PNG"
+
+        stats = generate_proxies(render_dir, "diffuse", [1, 2, 3], label="quarter")
+        assert stats["skipped"] == 3, "Up-to-date proxies should be skipped"
+
+        source = render_dir / "diffuse.0002.exr"
+        future = proxy.stat().st_mtime + 10
+        os.utime(source, (future, future))
+        stats = generate_proxies(render_dir, "diffuse", [1, 2, 3], label="quarter")
+        assert stats["written"] == 1, "Only the touched frame should be redone"
+
+        exr = ProxyGenerator("half", "exr").make_proxy(source)
+        channels = EXRPacker().read_channels(exr)
+        assert channels["R"].shape == (18, 32), "Half proxy should be 32x18"
+        assert channels["R"].dtype == np.float16, "EXR proxy should be half float"
+
+        print("✓ Proxies written, skipped and refreshed by mtime")
+
+
+def test_single_decode():
+    """Test each frame is decoded once for its proxy and thumbnail"""
+    print("\n=== Test: Single Decode ===")
+
+    read_channels = EXRPacker.read_channels
+    decoded = []
+
+    def counting_read(self, path, *args, **kwargs):
+        decoded.append(Path(path).name)
+        return read_channels(self, path, *args, **kwargs)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        render_dir = Path(temp_dir)
+        _write_frames(render_dir, [1, 2, 3])
+
+        EXRPacker.read_channels = counting_read
+        try:
+            stats = generate_proxies(render_dir, "diffuse", [1, 2, 3])
+        finally:
+            EXRPacker.read_channels = read_channels
+
+        assert stats["written"] == 3 and stats["contact_sheet"]
+        assert sorted(decoded) == [f"diffuse.000{f}.exr" for f in (1, 2, 3)], decoded
+
+    print(f"✓ {len(decoded)} decodes for 3 proxies and thumbnails")
+
+
+def run_all_tests():
+    """Run all proxy generator tests"""
+    print("\n" + "=" * 60)
+    print("Running Proxy Generator Tests")
+    print("=" * 60)
+
+    tests = [
+        test_downsample,
+        test_generate_proxies,
+        test_single_decode,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"✗ ERROR: {e}")
+            import traceback
+
+            traceback.print_exc()
+            failed += 1
+
+    print("\n" + "=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
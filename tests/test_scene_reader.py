@@ -200,6 +200,488 @@ def test_schema_version():
     print(f"✓ Schema version: {scene_data['schema_version']}")
 
 
+def test_shot_export():
+    """Test shot enumeration and shot-scoped extraction"""
+    print("\n=== Test: Shot Export ===")
+
+    import maya.cmds as cmds
+    from scene_reader import SceneReader
+    from shot_manager import ShotManager
+
+    cmds.file(new=True, force=True)
+
+    cam = cmds.camera(name="shotCam")[0]
+    cmds.shot(
+        "sh010",
+        startTime=1001,
+        endTime=1048,
+        sequenceStartTime=1,
+        sequenceEndTime=48,
+        currentCamera=cam,
+    )
+
+    shots = ShotManager().get_shots()
+    assert len(shots) == 1, "Should find one shot"
+    assert shots[0]["camera"] == cam, "Shot camera should be shotCam"
+    assert shots[0]["start_frame"] == 1001.0, "Shot should start at 1001"
+
+    reader = SceneReader()
+    scene_data = reader.extract_scene(
+        include_aovs=False, include_materials=False, shot=shots[0]
+    )
+
+    assert scene_data["scene_info"]["frame_range"] == [1001.0, 1048.0]
+    shot_cam = next(c for c in scene_data["cameras"] if c["name"] == cam)
+    assert shot_cam["is_shot_camera"], "Shot camera should be flagged"
+
+    print(f"✓ Shot {shots[0]['shot_name']}: {scene_data['scene_info']['frame_range']}")
+
+
+def test_attribute_cache():
+    """Test batched reads are memoized and dropped on frame change"""
+    print("\n=== Test: Attribute Cache ===")
+
+    import maya.cmds as cmds
+    from attr_cache import AttributeCache
+
+    cmds.file(new=True, force=True)
+
+    cube = cmds.polyCube(name="cacheCube")[0]
+    cmds.setKeyframe(cube, attribute="translateX", time=1, value=0)
+    cmds.setKeyframe(cube, attribute="translateX", time=10, value=9)
+    cmds.currentTime(1)
+
+    with AttributeCache() as cache:
+        assert cache._callback is not None, "Listens to time changes in the block"
+        values = cache.get_many(cube, ["translateX", "visibility", "doesNotExist"])
+        assert values["translateX"] == 0.0, "Should read translateX at frame 1"
+        assert values["visibility"] is True, "Should read booleans as bool"
+        assert values["doesNotExist"] is None, "Missing attributes give the default"
+        assert cache.get(cube, "doesNotExist", 5) == 5, "Default should not be cached"
+
+        cache.get(cube, "translateX")
+        assert cache.stats()["hits"] >= 2, "Repeated reads should hit the cache"
+
+        cmds.currentTime(10)
+        assert cache.get(cube, "translateX") == 9.0, "Frame change should invalidate"
+        assert cache.get("defaultResolution", "width") == cmds.getAttr(
+            "defaultResolution.width"
+        )
+    assert cache._callback is None, "Callback removed when the block ends"
+
+    cache = AttributeCache()
+    assert cache._callback is None, "No callback outside a with block"
+    cmds.currentTime(1)
+    assert cache.get(cube, "translateX") == 0.0
+    cmds.currentTime(10)
+    assert cache.get(cube, "translateX") == 9.0, "Time is checked per batch"
+
+    print(f"✓ Cache stats: {cache.stats()}")
+
+
+def test_instanced_meshes():
+    """Test instanced shapes are exported once with every instance transform"""
+    print("\n=== Test: Instanced Meshes ===")
+
+    import maya.cmds as cmds
+    from scene_reader import SceneReader
+
+    cmds.file(new=True, force=True)
+
+    cube = cmds.polyCube(name="instCube")[0]
+    cmds.instance(cube, name="instCube2")
+    cmds.instance(cube, name="instCube3")
+
+    reader = SceneReader()
+    scene_data = reader.extract_scene(include_aovs=False, include_materials=False)
+
+    cubes = [m for m in scene_data["meshes"] if m["shape_name"] == "instCubeShape"]
+    assert len(cubes) == 1, "Instanced shape should be exported once"
+    names = [cubes[0]["name"]] + [i["name"] for i in cubes[0]["instances"]]
+    assert sorted(names) == ["instCube", "instCube2", "instCube3"], names
+
+    print(f"✓ 1 mesh with {len(cubes[0]['instances'])} extra instances")
+
+
+def test_light_extraction():
+    """Test registered light types are extracted with per-type attributes"""
+    print("\n=== Test: Light Extraction ===")
+
+    import maya.cmds as cmds
+    from scene_reader import SceneReader
+
+    cmds.file(new=True, force=True)
+
+    spot = cmds.spotLight(name="keySpot", coneAngle=30)
+    point = cmds.pointLight(name="fillPoint")
+
+    area = None
+    try:
+        if cmds.pluginInfo("mtoa", query=True, loaded=True) or cmds.loadPlugin(
+            "mtoa", quiet=True
+        ):
+            area = cmds.createNode("aiAreaLight", name="rimAreaShape")
+            cmds.setAttr(f"{area}.aiExposure", 2.0)
+    except:
+        print("⚠ Arnold not available, skipping aiAreaLight")
+
+    physical = None
+    try:
+        if cmds.pluginInfo(
+            "redshift4maya", query=True, loaded=True
+        ) or cmds.loadPlugin("redshift4maya", quiet=True):
+            physical = cmds.createNode("RedshiftPhysicalLight", name="rsKeyShape")
+            cmds.setAttr(f"{physical}.colorMode", 2)
+    except:
+        print("⚠ Redshift not available, skipping RedshiftPhysicalLight")
+
+    scene_data = SceneReader().extract_scene(
+        include_aovs=False, include_materials=False
+    )
+    lights = {light["type"]: light for light in scene_data["lights"]}
+
+    assert lights["spotLight"]["cone_angle"] == 30.0, "Spot cone angle missing"
+    assert "cone_angle" not in lights["pointLight"], "Point lights have no cone"
+    if area:
+        assert lights["aiAreaLight"]["exposure"] == 2.0, "Arnold exposure missing"
+    if physical:
+        redshift = lights["RedshiftPhysicalLight"]
+        assert redshift["color_mode"] == 2 and redshift["use_temperature"] is True
+
+    print(f"✓ Lights: {sorted(lights)}")
+
+
+def test_texture_graph():
+    """Test textures behind utility nodes are found and shared by index"""
+    print("\n=== Test: Texture Graph ===")
+
+    import maya.cmds as cmds
+    from scene_reader import SceneReader
+
+    cmds.file(new=True, force=True)
+
+    layered = cmds.shadingNode("layeredTexture", asTexture=True)
+    for index, name in enumerate(["base.png", "dirt.png"]):
+        file_node = cmds.shadingNode("file", asTexture=True)
+        cmds.setAttr(f"{file_node}.fileTextureName", name, type="string")
+        cmds.connectAttr(f"{file_node}.outColor", f"{layered}.inputs[{index}].color")
+
+    for name in ("matA", "matB"):
+        shader = cmds.shadingNode("lambert", asShader=True, name=name)
+        sg = cmds.sets(renderable=True, noSurfaceShader=True, name=f"{name}SG")
+        cmds.connectAttr(f"{shader}.outColor", f"{sg}.surfaceShader")
+        cmds.connectAttr(f"{layered}.outColor", f"{shader}.color")
+
+    scene_data = SceneReader().extract_scene(include_aovs=False)
+
+    paths = sorted(t["path"] for t in scene_data["textures"])
+    assert paths == ["base.png", "dirt.png"], "Textures should be listed once"
+    refs = [m["texture_refs"] for m in scene_data["materials"]]
+    assert refs[0] == refs[1] and len(refs[0]) == 2, "Both materials share refs"
+
+    print(f"✓ {len(paths)} textures shared by {len(refs)} materials")
+
+
+def test_scoped_export():
+    """Test scopes limit the DAG listing to sets, namespaces and patterns"""
+    print("\n=== Test: Scoped Export ===")
+
+    import maya.cmds as cmds
+    from export_scope import ExportScope
+    from scene_reader import SceneReader
+
+    cmds.file(new=True, force=True)
+
+    hero = cmds.polyCube(name="hero")[0]
+    cmds.polySphere(name="crowd1")
+    cmds.namespace(add="env")
+    rock = cmds.polyCube(name="env:rock")[0]
+    group = cmds.group(rock, name="env:rocks")
+    cmds.sets(hero, name="heroSet")
+    layer = cmds.createDisplayLayer(["crowd1"], name="crowdLayer", noRecurse=True)
+
+    shader = cmds.shadingNode("lambert", asShader=True, name="crowdMat")
+    sg = cmds.sets(renderable=True, noSurfaceShader=True, name="crowdMatSG")
+    cmds.connectAttr(f"{shader}.outColor", f"{sg}.surfaceShader")
+    cmds.sets("crowd1", edit=True, forceElement=sg)
+
+    def mesh_names(scope):
+        scene_data = SceneReader().extract_scene(
+            include_aovs=False, include_materials=True, scope=scope
+        )
+        return sorted(m["name"] for m in scene_data["meshes"]), scene_data
+
+    names, scene_data = mesh_names(ExportScope(sets=["heroSet"]))
+    assert names == ["hero"], names
+    assert scene_data["scene_info"]["scope"]["roots"] == 1
+    assert scene_data["materials"] == [], "Only materials of scoped meshes"
+
+    assert mesh_names(ExportScope(namespaces=["env"]))[0] == ["env:rock"]
+    names, scene_data = mesh_names(ExportScope(display_layers=[layer]))
+    assert names == ["crowd1"], names
+    assert [m["name"] for m in scene_data["materials"]] == ["crowdMat"]
+    assert mesh_names(ExportScope(pattern=r"\|env:rocks\|"))[0] == ["env:rock"]
+    assert mesh_names(ExportScope(pattern="nothing_matches"))[0] == []
+
+    cmds.select(group)
+    assert mesh_names(ExportScope(selection=True))[0] == ["env:rock"]
+    assert len(mesh_names(None)[0]) == 3, "No scope exports everything"
+
+    print("✓ Sets, namespaces, layers, patterns and selection scope the export")
+
+
+def test_frustum_culling():
+    """Test meshes outside the render camera's view are dropped or flagged"""
+    print("\n=== Test: Frustum Culling ===")
+
+    import maya.cmds as cmds
+    from frustum_culler import FrustumCuller
+    from scene_reader import SceneReader
+
+    cmds.file(new=True, force=True)
+    cmds.playbackOptions(minTime=1, maxTime=10)
+    cmds.setAttr("perspShape.renderable", False)
+    camera = cmds.camera(name="shotCam")[0]
+
+    cmds.move(0, 0, -10, cmds.polyCube(name="inView")[0])
+    cmds.move(100, 0, -10, cmds.polyCube(name="farSide")[0])
+    behind = cmds.polyCube(name="behind")[0]
+    cmds.move(0, 0, 10, behind)
+    cmds.move(0, 2, -10, cmds.instance(behind, name="behindInst")[0])
+
+    # Keyed into view later in the range: tested where it is now, so kept
+    moving = cmds.polyCube(name="moving")[0]
+    cmds.setKeyframe(moving, attribute="translateX", time=1, value=100)
+    cmds.setKeyframe(moving, attribute="translateX", time=10, value=0)
+    cmds.currentTime(1)
+
+    reader = SceneReader()
+    scene_data = reader.extract_scene(
+        include_aovs=False,
+        include_materials=False,
+        culler=FrustumCuller(reader.attrs, mode="drop"),
+    )
+    names = sorted(m["name"] for m in scene_data["meshes"])
+    assert names == ["behindInst", "inView", "moving"], names
+    culling = scene_data["scene_info"]["culling"]
+    assert culling["cameras"] == [camera], culling["cameras"]
+    assert culling["frames"] == 10 and culling["culled"] == 1, culling
+    assert culling["animated"] == 1, "Keyed transform should be kept"
+
+    reader = SceneReader()
+    scene_data = reader.extract_scene(
+        include_aovs=False,
+        include_materials=False,
+        culler=FrustumCuller(reader.attrs, mode="flag"),
+    )
+    culled = {m["name"]: m["culled"] for m in scene_data["meshes"]}
+    assert culled == {
+        "inView": False,
+        "farSide": True,
+        "behind": True,
+        "moving": False,
+    }, culled
+
+    print(
+        f"✓ {culling['culled']}/{culling['meshes']} meshes culled in "
+        f"{culling['seconds'] * 1000:.1f} ms"
+    )
+
+
+def test_screen_tracks():
+    """Test tracked objects are projected through the render camera per frame"""
+    print("\n=== Test: Screen Tracks ===")
+
+    import maya.cmds as cmds
+    from scene_reader import SceneReader
+    from screen_tracks import ScreenTracker
+
+    cmds.file(new=True, force=True)
+    cmds.playbackOptions(minTime=1, maxTime=3)
+    cmds.setAttr("perspShape.renderable", False)
+    cmds.setAttr("defaultResolution.width", 1920)
+    cmds.setAttr("defaultResolution.height", 1080)
+    cmds.setAttr("defaultResolution.deviceAspectRatio", 1920 / 1080.0)
+    camera = cmds.camera(name="trackCam")[0]
+
+    hero = cmds.polyCube(name="hero")[0]
+    cmds.setKeyframe(hero, attribute="translateZ", time=1, value=-10)
+    cmds.setKeyframe(hero, attribute="translateZ", time=3, value=-10)
+    cmds.setKeyframe(hero, attribute="translateX", time=1, value=0)
+    cmds.setKeyframe(hero, attribute="translateX", time=3, value=2)
+    locator = cmds.spaceLocator(name="marker")[0]
+    cmds.move(0, 1, -10, locator)
+    cmds.sets(locator, name="trackSet")
+
+    reader = SceneReader()
+    scene_data = reader.extract_scene(
+        include_aovs=False,
+        include_materials=False,
+        tracker=ScreenTracker(reader.attrs, nodes=["hero", "trackSet"]),
+    )
+    screen_tracks = scene_data["screen_tracks"]
+    tracks = {track["name"]: track for track in screen_tracks["tracks"]}
+
+    assert screen_tracks["camera"] == camera
+    assert screen_tracks["resolution"] == [1920, 1080]
+    assert sorted(tracks) == ["hero", "marker"], sorted(tracks)
+    assert tracks["marker"]["type"] == "locator"
+
+    hero_track = tracks["hero"]
+    assert len(hero_track["pivot"]) == 9 and len(hero_track["bbox_screen"]) == 12
+    assert hero_track["pivot_screen"][:2] == [960.0, 540.0], "Centered on frame 1"
+    assert hero_track["pivot_screen"][4] > 960.0, "Moves right by frame 3"
+    x0, y0, x1, y1 = hero_track["bbox_screen"][:4]
+    assert x0 < 960.0 < x1 and y0 < 540.0 < y1, "Box surrounds the pivot"
+    assert tracks["marker"]["pivot_screen"][1] < 540.0, "Above center is y < 540"
+
+    print(f"✓ {len(tracks)} tracks over {len(screen_tracks['frames'])} frames")
+
+
+def test_glb_geometry():
+    """Test mesh buffers go to a .glb with one node per placement"""
+    print("\n=== Test: glTF Geometry ===")
+
+    import tempfile
+    import maya.cmds as cmds
+    from geometry_exporter import GeometryExporter
+    from glb_writer import read_accessor, read_glb
+    from scene_reader import SceneReader
+
+    cmds.file(new=True, force=True)
+    cube = cmds.polyCube(name="box")[0]
+    cmds.instance(cube, name="boxCopy")
+    cmds.move(5, 0, 0, "boxCopy")
+    cmds.polyPlane(name="floor", subdivisionsX=4, subdivisionsY=4)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = f"{temp_dir}/scene.glb"
+        reader = SceneReader()
+        scene_data = reader.extract_scene(
+            include_aovs=False,
+            include_materials=False,
+            geometry=GeometryExporter(path, quantize=False),
+        )
+        glb = read_glb(path)
+
+    geometry = scene_data["scene_info"]["geometry"]
+    meshes = {mesh["name"]: mesh for mesh in scene_data["meshes"]}
+    assert geometry["meshes"] == 2 and geometry["nodes"] == 3, geometry
+    assert geometry["triangles"] == 12 + 32
+
+    gltf = glb["gltf"]
+    box = gltf["nodes"][meshes["box"]["gltf_node"]]
+    copy = gltf["nodes"][meshes["box"]["instances"][0]["gltf_node"]]
+    assert box["mesh"] == copy["mesh"], "Instances share one glTF mesh"
+    assert copy["matrix"][12] == 5.0
+
+    # Hard cube edges: 4 corners per face, 24 vertices
+    primitive = gltf["meshes"][box["mesh"]]["primitives"][0]
+    positions = read_accessor(glb, primitive["attributes"]["POSITION"])
+    assert len(positions) == 24, len(positions)
+    assert sorted(primitive["attributes"]) == ["NORMAL", "POSITION", "TEXCOORD_0"]
+    floor = gltf["nodes"][meshes["floor"]["gltf_node"]]
+    floor_primitive = gltf["meshes"][floor["mesh"]]["primitives"][0]
+    floor_positions = read_accessor(glb, floor_primitive["attributes"]["POSITION"])
+    assert len(floor_positions) == 25, "Smooth, seamless plane stays welded"
+
+    print(f"✓ {geometry['triangles']} triangles in {geometry['bytes']} bytes")
+
+
+def test_cancel_bake():
+    """Test a cancel stops the bake after the current frame and keeps time"""
+    print("\n=== Test: Cancel Bake ===")
+
+    import io
+    import json
+    import maya.cmds as cmds
+    from progress import Cancelled, ProgressReporter
+    from scene_reader import SceneReader
+
+    class CancelAtFrame(ProgressReporter):
+        def advance(self, name, item=None, count=1):
+            super().advance(name, item, count)
+            if name == "bake" and item == "3":
+                self.request_cancel("test")
+
+    cmds.file(new=True, force=True)
+    cmds.camera(name="shotCam")
+    cmds.playbackOptions(minTime=1, maxTime=24)
+    cmds.currentTime(10)
+
+    stream = io.StringIO()
+    reader = SceneReader(progress=CancelAtFrame(stream))
+    try:
+        reader.extract_scene(
+            include_aovs=False, include_materials=False, bake_animation=True
+        )
+        assert False, "Cancelled not raised"
+    except Cancelled:
+        pass
+
+    assert cmds.currentTime(query=True) == 10, "Current time restored"
+    events = [json.loads(line) for line in stream.getvalue().splitlines()]
+    bake_end = [
+        e for e in events if e["event"] == "phase_end" and e["phase"] == "bake"
+    ][0]
+    assert bake_end["status"] == "cancelled" and bake_end["done"] == 3, bake_end
+
+    print("✓ Stopped after 3 of 24 frames")
+
+
+def test_resume_bake():
+    """Test a resumed bake reuses journaled frames and matches a full bake"""
+    print("\n=== Test: Resume Bake ===")
+
+    import tempfile
+    import maya.cmds as cmds
+    from checkpoint import Checkpoint
+    from progress import Cancelled, ProgressReporter
+    from scene_reader import SceneReader
+
+    class CancelAtFrame(ProgressReporter):
+        def advance(self, name, item=None, count=1):
+            super().advance(name, item, count)
+            if name == "bake" and item == "5":
+                self.request_cancel("test")
+
+    cmds.file(new=True, force=True)
+    cam = cmds.camera(name="shotCam")[0]
+    cmds.setKeyframe(cam, attribute="translateX", time=1, value=0)
+    cmds.setKeyframe(cam, attribute="translateX", time=12, value=11)
+    cmds.playbackOptions(minTime=1, maxTime=12)
+
+    def bake(journal, resume, progress=None):
+        reader = SceneReader(progress=progress)
+        with Checkpoint(journal, {"kind": "bake"}, resume=resume) as checkpoint:
+            scene_data = reader.extract_scene(
+                include_aovs=False,
+                include_materials=False,
+                bake_animation=True,
+                checkpoint=checkpoint,
+            )
+        return [c for c in scene_data["cameras"] if c["name"] == cam][0]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        journal = f"{temp_dir}/cam.json.checkpoint.jsonl"
+        full = bake(f"{temp_dir}/full.checkpoint.jsonl", False)["animation"]
+        try:
+            bake(journal, False, CancelAtFrame())
+            assert False, "Cancelled not raised"
+        except Cancelled:
+            pass
+
+        lines = open(journal, encoding="utf-8").read().splitlines()
+        assert len(lines) == 1 + 5, "Header and 5 frames journaled"
+
+        resumed = bake(journal, True)["animation"]
+
+    assert resumed == full, "Resumed bake matches an uninterrupted one"
+    assert resumed["transforms"][11][12] == 11.0
+
+    print("✓ 5 frames reused, 7 baked")
+
+
 def run_all_tests():
     """Run all tests"""
     print("\n" + "=" * 60)
@@ -214,6 +696,17 @@ def run_all_tests():
         test_material_extraction,
         test_transform_matrix,
         test_schema_version,
+        test_shot_export,
+        test_attribute_cache,
+        test_instanced_meshes,
+        test_light_extraction,
+        test_texture_graph,
+        test_scoped_export,
+        test_frustum_culling,
+        test_screen_tracks,
+        test_glb_geometry,
+        test_cancel_bake,
+        test_resume_bake,
     ]
 
     passed = 0
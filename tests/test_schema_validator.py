@@ -0,0 +1,224 @@
+import sys
+import json
+from pathlib import Path
+import tempfile
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "maya_side"))
+
+from json_stream import JsonStream, iter_section
+from schema_validator import SchemaValidator
+from serializer import SceneSerializer
+
+
+IDENTITY = [1.0, 0, 0, 0, 0, 1.0, 0, 0, 0, 0, 1.0, 0, 0, 0, 0, 1.0]
+
+
+def _sample_scene(count=20):
+    """Small scene covering every section of the schema"""
+    return {
+        "schema_version": "0.2.0",
+        "scene_info": {"fps": 24, "frame_range": [1.0, 48.0], "up_axis": "y"},
+        "cameras": [
+            {
+                "name": "shotCam",
+                "shape_name": "shotCamShape",
+                "transform": IDENTITY,
+                "focal_length": 35.0,
+                "horizontal_film_aperture": 1.417,
+                "vertical_film_aperture": 0.945,
+                "near_clip": 0.1,
+                "far_clip": 10000.0,
+                "is_renderable": True,
+            }
+        ],
+        "meshes": [
+            {
+                "name": f"rock{i}",
+                "full_path": f"|env|rock{i}",
+                "shape_name": f"rock{i}Shape",
+                "transform": IDENTITY,
+                "geometry": {
+                    "vertex_count": 8,
+                    "face_count": 6,
+                    "triangle_count": 12,
+                    "uv_sets": ["map1"],
+                    "has_uvs": True,
+                },
+                "material": "rockMat",
+                "visible": True,
+            }
+            for i in range(count)
+        ],
+        "lights": [
+            {"name": "key", "type": "spotLight", "transform": IDENTITY, "enabled": 1},
+            {
+                "name": "rim",
+                "type": "RedshiftPhysicalLight",
+                "transform": IDENTITY,
+                "color_mode": 2,
+                "use_temperature": True,
+                "temperature": 5600.0,
+            },
+        ],
+        "render_passes": {
+            "renderer": "Arnold",
+            "aovs": [
+                {"name": "beauty", "type": "RGBA", "enabled": True},
+                {
+                    "name": "diffuse",
+                    "type": "RGB",
+                    "enabled": True,
+                    "channels": ["B", "G", "R", "Z"],
+                    "pixel_type": ["FLOAT", "HALF"],
+                    "proxies": [
+                        {"size": "half", "path": "proxies/half/diffuse.####.png"},
+                        {
+                            "size": "quarter",
+                            "path": "proxies/quarter/diffuse.####.png",
+                            "contact_sheet": None,
+                        },
+                    ],
+                },
+            ],
+            "render_settings": {"resolution": {"width": 1920, "height": 1080}},
+        },
+        "materials": [
+            {
+                "name": "rockMat",
+                "type": "aiStandardSurface",
+                "assigned_objects": [f"rock{i}" for i in range(count)],
+                "properties": {"textures": {"color": "rock.<UDIM>.exr"}},
+            }
+        ],
+        "textures": [{"node": "file1", "path": "rock.<UDIM>.exr"}],
+    }
+
+
+def test_valid_exports():
+    """Test rows, interned and columnar exports all validate"""
+    print("\n=== Test: Valid Exports ===")
+
+    serializer = SceneSerializer()
+    validator = SchemaValidator()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "export.json"
+        for options in [
+            {},
+            {"intern": True},
+            {"layout": "columnar"},
+            {"intern": True, "layout": "columnar"},
+        ]:
+            serializer.write(_sample_scene(), path, **options)
+            assert validator.validate_file(str(path)) == [], f"{options} failed"
+            with open(path, "r", encoding="utf-8") as f:
+                assert validator.validate(json.load(f)) == [], f"{options} failed"
+
+    print("✓ All four export variants validate")
+
+
+def test_error_paths():
+    """Test every error is collected with its JSON path"""
+    print("\n=== Test: Error Paths ===")
+
+    scene_data = _sample_scene()
+    scene_data["meshes"][3]["transform"] = IDENTITY[:12]
+    scene_data["meshes"][5]["visible"] = "yes"
+    del scene_data["render_passes"]["aovs"][0]["enabled"]
+    scene_data["render_passes"]["aovs"][1]["pixel_type"] = ["FLOAT", 16]
+    del scene_data["cameras"]
+    data = {
+        "export_info": {"timestamp": "2025-01-15T10:00:00", "exporter_version": "0.1.0"},
+        "scene_data": scene_data,
+    }
+
+    errors = SchemaValidator().validate(data)
+    assert errors == [
+        "scene_data: missing 'cameras'",
+        "scene_data.meshes[3].transform: expected 16 numbers, got 12 values",
+        "scene_data.meshes[5].visible: expected a boolean, got str",
+        "scene_data.render_passes.aovs[0]: missing 'enabled'",
+        "scene_data.render_passes.aovs[1].pixel_type[1]: "
+        "expected a string, got int",
+    ], errors
+
+    scene_data["meshes"] = [{"name": i} for i in range(500)]
+    assert len(SchemaValidator(max_errors=10).validate(data)) == 10, "Errors capped"
+
+    print(f"✓ {len(errors)} errors reported with paths")
+
+
+def test_streaming_matches():
+    """Test file validation streams rows and matches in-memory results"""
+    print("\n=== Test: Streaming Validation ===")
+
+    scene_data = _sample_scene(50)
+    scene_data["meshes"][42]["material"] = None
+    scene_data["lights"][0]["transform"] = IDENTITY[:9]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "export.json"
+        SceneSerializer().write(scene_data, path)
+        with open(path, "r", encoding="utf-8") as f:
+            expected = SchemaValidator().validate(json.load(f))
+
+        assert len(expected) == 2, expected
+        assert SchemaValidator().validate_file(str(path)) == expected
+
+        rows = list(iter_section(str(path), "meshes"))
+        assert [row["name"] for row in rows] == [f"rock{i}" for i in range(50)]
+
+        # Tiny chunks force values to straddle buffer refills
+        with JsonStream(str(path), chunk_size=3) as stream:
+            keys = []
+            for key in stream.iter_object():
+                keys.append(key)
+                stream.skip()
+        assert keys == ["export_info", "scene_data"]
+
+        path.write_text('{"export_info": {}, "scene_data": {"meshes": [1, 2', "utf-8")
+        errors = SchemaValidator().validate_file(str(path))
+        assert any("Malformed JSON" in error for error in errors), errors
+
+    print("✓ Streamed results match in-memory validation")
+
+
+def run_all_tests():
+    """Run all schema validator tests"""
+    print("\n" + "=" * 60)
+    print("Running Schema Validator Tests")
+    print("=" * 60)
+
+    tests = [
+        test_valid_exports,
+        test_error_paths,
+        test_streaming_matches,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"✗ ERROR: {e}")
+            import traceback
+
+            traceback.print_exc()
+            failed += 1
+
+    print("\n" + "=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
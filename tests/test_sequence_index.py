@@ -0,0 +1,120 @@
+import sys
+import os
+from pathlib import Path
+import tempfile
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "maya_side"))
+
+from sequence_index import SequenceIndex, expand_pattern, frame_path, frame_ranges
+
+
+SETTINGS = {
+    "frame_padding": 4,
+    "image_format": "exr",
+    "image_prefix": "",
+    "output_path": "/renders",
+    "start_frame": 1.0,
+    "end_frame": 10.0,
+    "by_frame": 1.0,
+}
+
+
+def test_expand_pattern():
+    """Test prefix token expansion"""
+    print("\n=== Test: Expand Pattern ===")
+
+    diffuse = {"name": "aiAOV_diffuse", "type": "diffuse", "output_path": "/renders"}
+    beauty = {"name": "beauty", "type": "RGBA", "output_path": "/renders"}
+
+    pattern = expand_pattern(diffuse, SETTINGS)
+    assert pattern == os.path.join("/renders", "diffuse.####.exr"), pattern
+
+    settings = dict(SETTINGS, image_prefix="<RenderLayer>/<RenderPass>/<Scene>")
+    pattern = expand_pattern(diffuse, settings, layer="bg", scene="shot010")
+    assert pattern == os.path.join("/renders", "bg/diffuse/shot010.####.exr"), pattern
+
+    settings = dict(SETTINGS, image_prefix="<Scene>", frame_padding=3)
+    assert expand_pattern(diffuse, settings, scene="s").endswith("s_diffuse.###.exr")
+    assert expand_pattern(beauty, settings, scene="s").endswith("s.###.exr")
+
+    assert frame_path("/r/diffuse.####.exr", 12) == "/r/diffuse.0012.exr"
+    assert frame_ranges([1, 2, 3, 5, 7, 8]) == "1-3,5,7-8"
+
+    print(f"✓ {pattern}")
+
+
+def test_index_frames():
+    """Test present/missing/zero-byte detection and the folder cache"""
+    print("\n=== Test: Index Frames ===")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for frame in (1, 2, 3, 5):
+            Path(temp_dir, f"diffuse.{frame:04d}.exr").write_bytes(b"x" * 10)
+        Path(temp_dir, "diffuse.0004.exr").write_bytes(b"")
+
+        render_passes = {
+            "render_settings": dict(SETTINGS, end_frame=6.0),
+            "aovs": [{"name": "diffuse", "type": "diffuse", "output_path": temp_dir}],
+        }
+
+        index = SequenceIndex()
+        report = index.index_render_passes(render_passes)["diffuse"]
+
+        assert report["present"] == [1, 2, 3, 5], report["present"]
+        assert report["missing"] == [6], report["missing"]
+        assert report["zero_byte"] == [4], report["zero_byte"]
+        assert not report["complete"], "Sequence should be incomplete"
+
+        # Frame 4 finishes writing: folder mtime is unchanged but size is rechecked
+        Path(temp_dir, "diffuse.0004.exr").write_bytes(b"x" * 10)
+        report = index.index_render_passes(render_passes)["diffuse"]
+        assert index.scans == 1, "Unchanged folder should not be rescanned"
+        assert report["zero_byte"] == [], "Finished frame should no longer be zero-byte"
+
+        Path(temp_dir, "diffuse.0006.exr").write_bytes(b"x" * 10)
+        os.utime(temp_dir, ns=(0, os.stat(temp_dir).st_mtime_ns + 10**9))
+        report = index.index_render_passes(render_passes)["diffuse"]
+        assert index.scans == 2, "Changed folder should be rescanned"
+        assert report["complete"], "All frames should be present"
+
+        print(f"✓ {index.scans} scans, {index.hits} cache hits")
+
+
+def run_all_tests():
+    """Run all sequence index tests"""
+    print("\n" + "=" * 60)
+    print("Running Sequence Index Tests")
+    print("=" * 60)
+
+    tests = [
+        test_expand_pattern,
+        test_index_frames,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"✗ ERROR: {e}")
+            import traceback
+
+            traceback.print_exc()
+            failed += 1
+
+    print("\n" + "=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -7,6 +7,7 @@ import tempfile
 sys.path.insert(0, str(Path(__file__).parent.parent / "maya_side"))
 
 from serializer import SceneSerializer
+from records import GeometryRecord, MeshRecord
 
 
 def test_serializer_write():
@@ -135,6 +136,148 @@ def test_json_format():
             temp_path.unlink()
 
 
+def _kitbash_scene(count=50):
+    """Scene where most materials share properties, textures and objects"""
+    return {
+        "schema_version": "0.2.0",
+        "scene_info": {},
+        "cameras": [],
+        "meshes": [
+            {
+                "name": f"rock{i}",
+                "full_path": f"|env|rocks|rock{i}",
+                "shape_name": f"rock{i}Shape",
+                "material": f"rockMat{i % 5}",
+            }
+            for i in range(count)
+        ],
+        "materials": [
+            {
+                "name": f"rockMat{i}",
+                "shading_engine": f"rockMat{i}SG",
+                "type": "aiStandardSurface",
+                "assigned_objects": [f"rock{j}" for j in range(i, count, 5)],
+                "properties": {
+                    "color": [0.5, 0.5, 0.5],
+                    "textures": {"color": "sourceimages/rock_diffuse.<UDIM>.exr"},
+                },
+            }
+            for i in range(5)
+        ],
+        "textures": [{"node": "file1", "path": "sourceimages/rock_diffuse.<UDIM>.exr"}],
+    }
+
+
+def test_interned_round_trip():
+    """Test interned exports are smaller and rehydrate to the original data"""
+    print("\n=== Test: Interned Round Trip ===")
+
+    serializer = SceneSerializer()
+    scene_data = _kitbash_scene()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        plain_path = Path(temp_dir) / "plain.json"
+        interned_path = Path(temp_dir) / "interned.json"
+
+        serializer.write(scene_data, plain_path)
+        stats = serializer.write(scene_data, interned_path, intern=True)
+
+        assert stats["property_blocks"] == 1, "Identical blocks should be stored once"
+        assert stats["bytes"] < plain_path.stat().st_size, "Interning should shrink"
+        assert "tables" not in scene_data, "Input scene data must not be modified"
+
+        raw = serializer.read(interned_path, rehydrate=False)
+        assert isinstance(raw["scene_data"]["meshes"][0]["name"], int)
+
+        loaded = serializer.read(interned_path)["scene_data"]
+        assert serializer.validate_schema({"scene_data": loaded})
+        assert list(loaded["meshes"]) == scene_data["meshes"], "Meshes differ"
+        assert list(loaded["materials"]) == scene_data["materials"], "Materials differ"
+        assert loaded["textures"][-1] == scene_data["textures"][-1]
+
+        reduction = 1 - stats["bytes"] / plain_path.stat().st_size
+        print(f"✓ Interned export {reduction:.0%} smaller")
+
+
+def test_record_export():
+    """Test slotted records export exactly like the equivalent dicts"""
+    print("\n=== Test: Record Export ===")
+
+    serializer = SceneSerializer()
+    mesh = {
+        "name": "rock",
+        "full_path": "|env|rock",
+        "shape_name": "rockShape",
+        "transform": [1.0, 0, 0, 0, 0, 1.0, 0, 0, 0, 0, 1.0, 0, 2.5, 0, 0, 1.0],
+        "geometry": {
+            "vertex_count": 8,
+            "face_count": 6,
+            "triangle_count": 12,
+            "uv_sets": ["map1"],
+            "has_uvs": True,
+        },
+        "material": "rockMat",
+        "visible": True,
+    }
+    record = MeshRecord(**dict(mesh, geometry=GeometryRecord(**mesh["geometry"])))
+    record["instances"] = []
+    mesh["instances"] = []
+
+    assert not hasattr(record, "__dict__"), "Records should not carry a __dict__"
+    assert record["transform"][12] == 2.5 and record["geometry"]["has_uvs"]
+    assert record.to_dict() == mesh, "Record should convert to the same dict"
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "records.json"
+        serializer.write({"schema_version": "0.2.0", "meshes": [record]}, path)
+        loaded = serializer.read(path)["scene_data"]["meshes"][0]
+        assert loaded == mesh, "Record should serialize like a dict"
+
+        serializer.write({"meshes": [record]}, path, intern=True)
+        assert serializer.read(path)["scene_data"]["meshes"][0] == mesh
+
+    print("✓ Records serialize like plain dicts")
+
+
+def test_columnar_layout():
+    """Test columnar meshes/lights round-trip as rows or columns"""
+    print("\n=== Test: Columnar Layout ===")
+
+    serializer = SceneSerializer()
+    scene_data = _kitbash_scene(10)
+    for i, mesh in enumerate(scene_data["meshes"]):
+        mesh["transform"] = [1.0, 0, 0, 0, 0, 1.0, 0, 0, 0, 0, 1.0, 0, i, 0, 0, 1.0]
+    scene_data["lights"] = [
+        {"name": "key", "type": "spotLight", "intensity": 2.0, "cone_angle": 40.0},
+        {"name": "dome", "type": "aiSkyDomeLight", "intensity": 1.0},
+    ]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "columnar.json"
+
+        for intern in (False, True):
+            serializer.write(scene_data, path, intern=intern, layout="columnar")
+
+            raw = serializer.read(path, rehydrate=False, columns=True)
+            meshes = raw["scene_data"]["meshes"]
+            assert meshes["count"] == 10 and meshes["strides"] == {"transform": 16}
+            assert len(meshes["columns"]["transform"]) == 160, "Transforms are flat"
+            assert serializer.validate_schema(raw), "Columnar data should validate"
+
+            loaded = serializer.read(path)["scene_data"]
+            assert serializer.validate_schema({"scene_data": loaded})
+            assert list(loaded["meshes"]) == scene_data["meshes"], "Meshes differ"
+            assert loaded["lights"] == scene_data["lights"], "Missing fields stay out"
+
+            columns = serializer.read(path, columns=True)["scene_data"]["meshes"]
+            assert columns["columns"]["name"][3] == "rock3", "Strings are resolved"
+
+        meshes["columns"]["name"].pop()
+        assert not serializer.validate_schema(raw), "Short columns should fail"
+
+    print("✓ Columnar layout round-trips as rows and columns")
+
+
 def run_all_tests():
     """Run all serializer tests"""
     print("\n" + "=" * 60)
@@ -146,6 +289,9 @@ def run_all_tests():
         test_serializer_read,
         test_serializer_validation,
         test_json_format,
+        test_interned_round_trip,
+        test_record_export,
+        test_columnar_layout,
     ]
 
     passed = 0
@@ -0,0 +1,236 @@
+import os
+import struct
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "maya_side"))
+
+from startup import (
+    StartupProfile,
+    format_report,
+    plan_plugins,
+    process_age,
+    scene_requirements,
+)
+
+
+ASCII_SCENE = """//Maya ASCII 2024 scene
+//Name: shot.ma
+file -rdi 1 -ns "set" -rfn "setRN" "/proj/set.ma";
+requires maya "2024";
+requires -nodeType "aiOptions" -nodeType "aiAOV" -nodeType "aiAOVDriver"
+\t\t "mtoa" "5.3.1";
+requires -dataType "pxrUsdStageData" "mayaUsdPlugin" "0.25.0";
+requires "stereoCamera" "10.0";
+requires "mtoa" "5.3.1";
+currentUnit -l centimeter -a degree -t film;
+fileInfo "application" "maya";
+requires "notAPlugin" "1.0";
+createNode transform -n "persp";
+"""
+
+
+def _binary_scene(plugins):
+    """A minimal Maya binary header with one PLUG chunk per plugin"""
+    chunks = b""
+    for name, version in [("maya", "2024")] + plugins:
+        data = f"{name}\0{version}\0".encode()
+        data += b"\0" * (-len(data) % 4)
+        chunks += b"PLUG" + struct.pack(">I", len(data)) + data
+    head = b"HEAD" + chunks
+    return b"FOR4" + struct.pack(">I", len(head) + 4) + b"Maya" + head
+
+
+def test_ascii_requirements():
+    """Test plugin names are parsed from .ma requires statements"""
+    print("\n=== Test: ASCII Requirements ===")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "shot.ma"
+        path.write_text(ASCII_SCENE, encoding="utf-8")
+        plugins = scene_requirements(str(path))
+
+    assert plugins == ["mtoa", "mayaUsdPlugin", "stereoCamera"], plugins
+
+    print(f"✓ {plugins}")
+
+
+def test_binary_requirements():
+    """Test plugin names are found in .mb PLUG chunks"""
+    print("\n=== Test: Binary Requirements ===")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "shot.mb"
+        path.write_bytes(
+            _binary_scene([("mtoa", "5.3.1"), ("AbcImport", "1.0"), ("mtoa", "5")])
+        )
+        plugins = scene_requirements(str(path))
+
+    assert plugins == ["mtoa", "AbcImport"], plugins
+
+    print(f"✓ {plugins}")
+
+
+def test_plan_plugins():
+    """Test renderer plugins are deferred unless a section needs them"""
+    print("\n=== Test: Plan Plugins ===")
+
+    required = ["mtoa", "mayaUsdPlugin", "redshift4maya"]
+
+    load, deferred = plan_plugins(required, [])
+    assert load == ["mayaUsdPlugin"] and deferred == ["mtoa", "redshift4maya"]
+
+    load, deferred = plan_plugins(required, ["aovs"])
+    assert load == required and deferred == []
+
+    load, deferred = plan_plugins(required, ["render"], extra=["mtoa", "bifrostGraph"])
+    assert load == required + ["bifrostGraph"]
+
+    load, deferred = plan_plugins(required, [], extra=["redshift4maya"])
+    assert load == ["mayaUsdPlugin", "redshift4maya"] and deferred == ["mtoa"]
+
+    print("✓ Camera-only exports skip renderer plugins")
+
+
+def test_isolated_prefs():
+    """Test the profile points Maya at an empty prefs folder"""
+    print("\n=== Test: Isolated Prefs ===")
+
+    names = [
+        "MAYA_APP_DIR",
+        "MAYA_MODULE_PATH",
+        "MAYA_SKIP_USERSETUP_PY",
+        "MAYA_LOCATION",
+        "MAYA_PLUG_IN_PATH",
+        "RS_LICENSE_HOST",
+        "ARNOLD_LICENSE_HOST",
+    ]
+    saved = {name: os.environ.get(name) for name in names}
+    try:
+        with tempfile.TemporaryDirectory() as user_dir:
+            (Path(user_dir) / "modules").mkdir()
+            (Path(user_dir) / "2024").mkdir()
+            (Path(user_dir) / "2024" / "Maya.env").write_text(
+                "// Studio setup\n"
+                "MAYA_PLUG_IN_PATH = $MAYA_APP_DIR/plug-ins\n"
+                "RS_LICENSE_HOST=license01\n"
+                "ARNOLD_LICENSE_HOST = ignored\n",
+                encoding="utf-8",
+            )
+            (Path(user_dir) / "Maya.env").write_text(
+                "RS_LICENSE_HOST = shared\n", encoding="utf-8"
+            )
+            os.environ["MAYA_APP_DIR"] = user_dir
+            os.environ["MAYA_MODULE_PATH"] = "/studio/modules"
+            os.environ["MAYA_LOCATION"] = "/usr/autodesk/maya2024"
+            os.environ["MAYA_PLUG_IN_PATH"] = "/studio/plug-ins"
+            os.environ["ARNOLD_LICENSE_HOST"] = "license02"
+            os.environ.pop("RS_LICENSE_HOST", None)
+
+            profile = StartupProfile("shot.ma", sections=[])
+            profile._isolate_prefs()
+            app_dir = os.environ["MAYA_APP_DIR"]
+
+            assert app_dir != user_dir and not os.listdir(app_dir)
+            assert os.environ["MAYA_MODULE_PATH"].split(os.pathsep) == [
+                str(Path(user_dir) / "modules"),
+                "/studio/modules",
+            ]
+            assert os.environ["MAYA_SKIP_USERSETUP_PY"] == "1"
+
+            # The versioned Maya.env is applied, expanded with the user's
+            # folder; set variables win and path lists are appended to
+            assert os.environ["MAYA_PLUG_IN_PATH"].split(os.pathsep) == [
+                "/studio/plug-ins",
+                f"{user_dir}/plug-ins",
+            ]
+            assert os.environ["RS_LICENSE_HOST"] == "license01"
+            assert os.environ["ARNOLD_LICENSE_HOST"] == "license02"
+
+            profile.close()
+            assert not os.path.exists(app_dir), "Prefs folder removed"
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+    print("✓ Empty MAYA_APP_DIR, Maya.env applied, user modules kept")
+
+
+def test_report():
+    """Test the timing breakdown and its printed form"""
+    print("\n=== Test: Report ===")
+
+    age = process_age()
+    if sys.platform.startswith("linux") or sys.platform == "win32":
+        assert age is not None and 0.0 < age < 3600.0, age
+
+    profile = StartupProfile("shot.ma", sections=["aovs"])
+    profile.timings.update(
+        {
+            "interpreter": 0.5,
+            "standalone": 2.0,
+            "requirements": 0.01,
+            "plugins": {"mtoa": 1.5, "stereoCamera": 0.1},
+            "scene_open": 3.0,
+        }
+    )
+    profile.deferred = ["redshift4maya"]
+    profile.loaded = ["mtoa", "stereoCamera"]
+    report = profile.report()
+    assert abs(report["timings"]["total"] - 7.11) < 1e-9, report["timings"]
+
+    lines = format_report(report)
+    assert any("plugin mtoa" in line and "1.50" in line for line in lines), lines
+    assert lines[-1].endswith("redshift4maya")
+
+    profile.loaded.append("redshift4maya")
+    assert format_report(profile.report())[-1].endswith("anyway: redshift4maya")
+
+    print("\n".join(lines))
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("\n" + "=" * 60)
+    print("Running Startup Profile Tests")
+    print("=" * 60)
+
+    tests = [
+        test_ascii_requirements,
+        test_binary_requirements,
+        test_plan_plugins,
+        test_isolated_prefs,
+        test_report,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"✗ ERROR: {e}")
+            import traceback
+
+            traceback.print_exc()
+            failed += 1
+
+    print("\n" + "=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
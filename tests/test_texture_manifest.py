@@ -0,0 +1,145 @@
+import json
+import os
+import sys
+from pathlib import Path
+import tempfile
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "maya_side"))
+
+from serializer import SceneSerializer
+from texture_manifest import TextureManifest, load_textures, token_pattern
+
+
+def test_token_expansion():
+    """Test UDIM, UV tile and frame tokens match the files they stand for"""
+    print("\n=== Test: Token Expansion ===")
+
+    assert token_pattern("brick.exr") is None, "Plain names have no pattern"
+    assert token_pattern("brick.<UDIM>.exr").match("brick.1001.exr")
+    assert not token_pattern("brick.<UDIM>.exr").match("brick.101.exr")
+    assert token_pattern("leaf_u<U>_v<V>.tx").match("leaf_u1_v2.tx")
+    assert token_pattern("fire.####.png").match("fire.0012.png")
+    assert token_pattern("fire.%04d.png").match("fire.0012.png")
+    assert not token_pattern("a+b.<udim>.exr").match("aab.1001.exr"), (
+        "Literal parts must be escaped"
+    )
+
+    print("✓ Tokens expand to the expected patterns")
+
+
+def test_manifest():
+    """Test tiles are found, missing files reported and hashes cached"""
+    print("\n=== Test: Texture Manifest ===")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        images = root / "sourceimages"
+        images.mkdir()
+        for tile in (1001, 1002, 1011):
+            (images / f"brick.{tile}.exr").write_bytes(bytes([tile % 256]) * 100)
+        (images / "wood.png").write_bytes(b"wood")
+
+        textures = [
+            {"node": "file1", "path": "sourceimages/brick.<UDIM>.exr"},
+            {"node": "file2", "path": "sourceimages/wood.png"},
+            {"node": "file3", "path": "sourceimages/missing.png"},
+        ]
+        cache = str(root / "hashes.json")
+
+        manifest = TextureManifest(str(root), cache, workers=4).build(textures)
+        entries = {e["node"]: e for e in manifest["textures"]}
+
+        assert len(entries["file1"]["files"]) == 3, "Should find three UDIM tiles"
+        assert manifest["missing"] == ["sourceimages/missing.png"]
+        assert manifest["total_bytes"] == 304, "Should total file sizes"
+        assert manifest["hashed"] == 4, "First run hashes every file"
+
+        again = TextureManifest(str(root), cache, workers=4).build(textures)
+        assert again["hashed"] == 0 and again["cached"] == 4, "Hashes should be reused"
+        assert [f["hash"] for f in again["textures"][0]["files"]] == [
+            f["hash"] for f in manifest["textures"][0]["files"]
+        ]
+
+        tile = images / "brick.1002.exr"
+        tile.write_bytes(b"changed")
+        os.utime(tile, ns=(0, 10**9))
+        changed = TextureManifest(str(root), cache).build(textures)
+        assert changed["hashed"] == 1, "Only the changed tile is re-hashed"
+
+        print(f"✓ {manifest['files']} files, {manifest['total_bytes']} bytes")
+
+
+def test_interned_export():
+    """Test texture paths of an interned export are read back as strings"""
+    print("\n=== Test: Interned Export ===")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        (root / "sourceimages").mkdir()
+        (root / "sourceimages" / "wood.png").write_bytes(b"wood")
+
+        path = "sourceimages/wood.png"
+        export_path = root / "interned.json"
+        SceneSerializer().write(
+            {
+                "schema_version": "0.2.0",
+                "meshes": [],
+                "textures": [
+                    {"node": "file1", "path": path},
+                    {"node": "file2", "path": path},
+                ],
+            },
+            export_path,
+            intern=True,
+        )
+        with open(export_path, "r", encoding="utf-8") as f:
+            raw = json.load(f)["scene_data"]["textures"]
+        assert isinstance(raw[0]["path"], int), "Paths are string table ids"
+
+        textures = load_textures(str(export_path))
+        assert [t["path"] for t in textures] == [path, path]
+        manifest = TextureManifest(str(root), workers=1).build(textures)
+        assert manifest["missing"] == [] and manifest["files"] == 1
+
+    print("✓ Interned paths resolved through the string table")
+
+
+def run_all_tests():
+    """Run all texture manifest tests"""
+    print("\n" + "=" * 60)
+    print("Running Texture Manifest Tests")
+    print("=" * 60)
+
+    tests = [
+        test_token_expansion,
+        test_manifest,
+        test_interned_export,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"✗ ERROR: {e}")
+            import traceback
+
+            traceback.print_exc()
+            failed += 1
+
+    print("\n" + "=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)